@@ -419,6 +419,11 @@ def main():
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Logging level (default: INFO)",
     )
+    serve_parser.add_argument(
+        "--no-ws-deflate",
+        action="store_true",
+        help="Disable permessage-deflate compression on dashboard WebSockets",
+    )
 
     # squadron deploy
     deploy_parser = subparsers.add_parser("deploy", help="Deploy Squadron to Azure Container Apps")
@@ -532,7 +537,13 @@ def main():
     from squadron.server import create_app
 
     app = create_app(repo_root=args.repo_root)
-    uvicorn.run(app, host=args.host, port=args.port, log_level=args.log_level.lower())
+    uvicorn.run(
+        app,
+        host=args.host,
+        port=args.port,
+        log_level=args.log_level.lower(),
+        ws_per_message_deflate=not args.no_ws_deflate,
+    )
 
 
 if __name__ == "__main__":
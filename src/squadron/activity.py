@@ -17,14 +17,16 @@ Event Types:
 from __future__ import annotations
 
 import asyncio
+import bisect
 import enum
 import json
 import logging
+from collections import OrderedDict, deque
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
 import aiosqlite
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 if TYPE_CHECKING:
     pass
@@ -102,8 +104,14 @@ class ActivityEvent(BaseModel):
     issue_number: int | None = None
     pr_number: int | None = None
 
+    # Serialized forms, built once on first use (see to_sse_frame)
+    _sse_data: str | None = PrivateAttr(default=None)
+    _sse_frame: bytes | None = PrivateAttr(default=None)
+
     def to_sse_data(self) -> str:
-        """Format for Server-Sent Events."""
+        """Format for Server-Sent Events (JSON, cached after the first call)."""
+        if self._sse_data is not None:
+            return self._sse_data
         data = {
             "id": self.id,
             "agent_id": self.agent_id,
@@ -138,7 +146,21 @@ class ActivityEvent(BaseModel):
         if self.pr_number:
             data["pr_number"] = self.pr_number
 
-        return json.dumps(data)
+        self._sse_data = json.dumps(data)
+        return self._sse_data
+
+    def to_sse_frame(self) -> bytes:
+        """Complete ``event: activity`` SSE frame (``id:`` + ``data:``) as bytes.
+
+        Encoded once and cached on the event, so broadcasting to N dashboard
+        subscribers costs one serialization rather than N.  The event must
+        not be mutated after the first call (``log()`` assigns ``id`` before
+        broadcasting).
+        """
+        if self._sse_frame is None:
+            id_line = f"id: {self.id}\n" if self.id is not None else ""
+            self._sse_frame = f"event: activity\n{id_line}data: {self.to_sse_data()}\n\n".encode()
+        return self._sse_frame
 
 
 # ── Database Schema ──────────────────────────────────────────────────────────
@@ -181,10 +203,25 @@ CREATE INDEX IF NOT EXISTS idx_activity_timestamp ON agent_activity(timestamp DE
 # ── Activity Logger ──────────────────────────────────────────────────────────
 
 
+# Maximum number of per-agent recent windows kept in memory (LRU)
+_MAX_AGENT_WINDOWS = 256
+
+
 class ActivityLogger:
-    """SQLite-backed activity logger with SSE broadcast support."""
+    """SQLite-backed activity logger with SSE broadcast support.
+
+    The newest ``recent_window`` events are also kept in memory — globally
+    and per agent — so dashboard hydration (and reconnect storms after a
+    deploy) is served from RAM.  SQLite is only queried for filtered
+    requests or ones reaching past the window.
+
+    Window invariant: each window holds exactly the newest events (by
+    timestamp) for its scope, up to ``recent_window``.  The global window is
+    loaded in ``initialize()``; a per-agent window is loaded from SQLite on
+    first use and then kept current by ``log()``.
+    """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, recent_window: int = 500):
         self.db_path = db_path
         self._db: aiosqlite.Connection | None = None
         # Per-agent broadcast queues for SSE streaming
@@ -192,6 +229,10 @@ class ActivityLogger:
         # Global broadcast for dashboard (all agents)
         self._global_subscribers: list[asyncio.Queue[ActivityEvent]] = []
         self._lock = asyncio.Lock()
+        # In-memory recent windows, oldest → newest
+        self.recent_window = recent_window
+        self._recent: deque[ActivityEvent] = deque(maxlen=recent_window)
+        self._recent_by_agent: OrderedDict[str, deque[ActivityEvent]] = OrderedDict()
 
     async def initialize(self) -> None:
         """Open database and create tables."""
@@ -200,6 +241,9 @@ class ActivityLogger:
         await self._db.execute("PRAGMA journal_mode=WAL")
         await self._db.executescript(ACTIVITY_SCHEMA)
         await self._db.commit()
+        # Warm the global window so the first dashboard connects skip SQLite
+        newest = await self._query_recent(limit=self.recent_window)
+        self._recent = deque(reversed(newest), maxlen=self.recent_window)
         logger.info("Activity logger initialized: %s", self.db_path)
 
     async def close(self) -> None:
@@ -242,6 +286,9 @@ class ActivityLogger:
         await self.db.commit()
         event.id = cursor.lastrowid
 
+        async with self._lock:
+            self._remember(event)
+
         # Broadcast to subscribers (non-blocking)
         await self._broadcast(event)
 
@@ -250,27 +297,54 @@ class ActivityLogger:
     async def _broadcast(self, event: ActivityEvent) -> None:
         """Broadcast event to all subscribers."""
         async with self._lock:
-            # Per-agent subscribers
-            if event.agent_id in self._subscribers:
-                dead_queues = []
-                for queue in self._subscribers[event.agent_id]:
-                    try:
-                        queue.put_nowait(event)
-                    except asyncio.QueueFull:
-                        dead_queues.append(queue)
-                # Remove full queues (client disconnected or too slow)
-                for q in dead_queues:
-                    self._subscribers[event.agent_id].remove(q)
-
-            # Global subscribers (dashboard)
-            dead_global = []
+            if self._global_subscribers or self._subscribers.get(event.agent_id):
+                # Serialize once up front; every subscriber shares the frame
+                event.to_sse_frame()
+
+            # Per-agent subscribers, then global subscribers (dashboard).
+            # A subscriber that has fallen behind loses its oldest queued
+            # event rather than its subscription: its SSE or WebSocket
+            # consumer is still waiting on the queue.
+            for queue in self._subscribers.get(event.agent_id, ()):
+                _put_drop_oldest(queue, event)
             for queue in self._global_subscribers:
-                try:
-                    queue.put_nowait(event)
-                except asyncio.QueueFull:
-                    dead_global.append(queue)
-            for q in dead_global:
-                self._global_subscribers.remove(q)
+                _put_drop_oldest(queue, event)
+
+    # ── Recent-event windows ─────────────────────────────────────────────────
+
+    def _remember(self, event: ActivityEvent) -> None:
+        """Add a freshly logged event to the in-memory windows (lock held)."""
+        _window_insert(self._recent, event)
+        window = self._recent_by_agent.get(event.agent_id)
+        if window is not None:
+            _window_insert(window, event)
+
+    async def _agent_window(self, agent_id: str) -> deque[ActivityEvent]:
+        """Return the agent's recent window, loading it from SQLite on a miss."""
+        window = self._recent_by_agent.get(agent_id)
+        if window is not None:
+            self._recent_by_agent.move_to_end(agent_id)
+            return window
+        async with self._lock:
+            window = self._recent_by_agent.get(agent_id)
+            if window is None:
+                # Loaded under the lock so _remember() cannot run between the
+                # query and the window being published.  An event committed
+                # before the query but remembered after it is deduplicated by
+                # _window_insert.
+                newest = await self._query_recent(limit=self.recent_window, agent_id=agent_id)
+                window = deque(reversed(newest), maxlen=self.recent_window)
+                self._recent_by_agent[agent_id] = window
+                while len(self._recent_by_agent) > _MAX_AGENT_WINDOWS:
+                    self._recent_by_agent.popitem(last=False)
+            return window
+
+    def _from_window(
+        self, window: deque[ActivityEvent], limit: int, offset: int
+    ) -> list[ActivityEvent]:
+        """Newest-first slice of a window."""
+        newest_first = list(reversed(window))
+        return newest_first[offset : offset + limit]
 
     # ── Subscription ─────────────────────────────────────────────────────────
 
@@ -306,7 +380,14 @@ class ActivityLogger:
         offset: int = 0,
         event_types: list[ActivityEventType] | None = None,
     ) -> list[ActivityEvent]:
-        """Get activity events for a specific agent."""
+        """Get activity events for a specific agent.
+
+        Served from the in-memory window when unfiltered and within it.
+        """
+        if not event_types and offset + limit <= self.recent_window:
+            window = await self._agent_window(agent_id)
+            return self._from_window(window, limit, offset)
+
         query = "SELECT * FROM agent_activity WHERE agent_id = ?"
         params: list[Any] = [agent_id]
 
@@ -329,7 +410,28 @@ class ActivityLogger:
         agent_id: str | None = None,
         event_types: list[ActivityEventType] | None = None,
     ) -> list[ActivityEvent]:
-        """Get recent activity across all agents (or filtered by agent)."""
+        """Get recent activity across all agents (or filtered by agent).
+
+        Served from the in-memory window when unfiltered and within it.
+        """
+        if not event_types and offset + limit <= self.recent_window:
+            if agent_id:
+                window = await self._agent_window(agent_id)
+            else:
+                window = self._recent
+            return self._from_window(window, limit, offset)
+        return await self._query_recent(
+            limit=limit, offset=offset, agent_id=agent_id, event_types=event_types
+        )
+
+    async def _query_recent(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        agent_id: str | None = None,
+        event_types: list[ActivityEventType] | None = None,
+    ) -> list[ActivityEvent]:
+        """Newest-first activity straight from SQLite."""
         query = "SELECT * FROM agent_activity"
         params: list[Any] = []
         conditions = []
@@ -391,6 +493,11 @@ class ActivityLogger:
             (cutoff.isoformat(),),
         )
         await self.db.commit()
+        # Drop pruned events from the windows too (they are oldest-first)
+        async with self._lock:
+            for window in (self._recent, *self._recent_by_agent.values()):
+                while window and window[0].timestamp < cutoff:
+                    window.popleft()
         return cursor.rowcount
 
     def _row_to_event(self, row: aiosqlite.Row) -> ActivityEvent:
@@ -415,6 +522,40 @@ class ActivityLogger:
 # ── Helper Functions ─────────────────────────────────────────────────────────
 
 
+def _put_drop_oldest(queue: asyncio.Queue, item: object) -> None:
+    """Queue ``item``, discarding the oldest queued item if the queue is full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+def _window_insert(window: deque[ActivityEvent], event: ActivityEvent) -> None:
+    """Insert into a bounded oldest → newest window, keeping timestamp order.
+
+    Events almost always arrive in order (plain append).  An event already
+    present (same id) is skipped, as is one older than everything in a full
+    window — it would not be among the newest ``maxlen`` anyway.
+    """
+    if (
+        event.id is not None
+        and window
+        and window[-1].id is not None
+        and event.id <= window[-1].id
+        and any(e.id == event.id for e in window)
+    ):
+        return
+    if not window or window[-1].timestamp <= event.timestamp:
+        window.append(event)
+        return
+    if len(window) == window.maxlen and event.timestamp < window[0].timestamp:
+        return
+    items = list(window)
+    pos = bisect.bisect_right([e.timestamp for e in items], event.timestamp)
+    items.insert(pos, event)
+    window.clear()
+    window.extend(items[-window.maxlen :] if window.maxlen else items)
+
+
 def create_lifecycle_event(
     agent_id: str,
     event_type: ActivityEventType,
@@ -0,0 +1,182 @@
+"""Adaptive Concurrency — sizes the agent admission limit from live resource pressure.
+
+Provides:
+- AdaptiveConcurrency: polls ``ResourceMonitor.pressure()`` (available
+  memory, process count vs. nproc limit, load per CPU, event-loop lag)
+  and moves ``AdmissionScheduler.limit`` between ``min_agents`` and
+  ``max_agents``.
+
+Design Notes:
+- AIMD: the limit grows by one after ``raise_after`` consecutive samples
+  with headroom on every signal while agents are queued, and shrinks
+  multiplicatively as soon as any signal crosses its pressure watermark.
+- Hysteresis: pressure and headroom use separate watermarks, so a signal
+  hovering near one threshold only holds the limit steady.  Decreases are
+  also spaced by ``cooldown`` so agents admitted earlier can wind down
+  before the next cut takes effect.
+- Lowering the limit never stops running agents — it only defers new
+  spawns and wakes until enough of them finish.
+- Starts from ``max_concurrent_agents`` (clamped to the bounds).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from squadron.config import AdaptiveConcurrencyConfig
+
+if TYPE_CHECKING:
+    from squadron.admission import AdmissionScheduler
+    from squadron.resource_monitor import PressureSample, ResourceMonitor
+
+logger = logging.getLogger(__name__)
+
+PRESSURE = "pressure"
+HEADROOM = "headroom"
+STEADY = "steady"
+
+
+class AdaptiveConcurrency:
+    """Background controller for the agent concurrency limit."""
+
+    def __init__(
+        self,
+        config: AdaptiveConcurrencyConfig,
+        scheduler: AdmissionScheduler,
+        monitor: ResourceMonitor,
+        initial_limit: int,
+    ) -> None:
+        self.config = config
+        self.scheduler = scheduler
+        self.monitor = monitor
+        self._initial_limit = initial_limit
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self._headroom_streak = 0
+        self._last_decrease = -math.inf
+        self.state = STEADY
+        self.reasons: list[str] = []
+        self.sample: PressureSample | None = None
+        self._stats = {"raises": 0, "decreases": 0}
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        initial = self._initial_limit if self._initial_limit > 0 else self.config.max_agents
+        self.scheduler.set_limit(self._clamp(initial))
+        self._running = True
+        self._task = asyncio.create_task(self._control_loop(), name="adaptive-concurrency")
+        logger.info(
+            "Adaptive concurrency started (limit=%d, bounds=%d..%d)",
+            self.scheduler.limit,
+            self.config.min_agents,
+            self.config.max_agents,
+        )
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Adaptive concurrency stopped (limit=%d)", self.scheduler.limit)
+
+    async def _control_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.config.interval)
+                self.update(await self.monitor.pressure())
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Adaptive concurrency error")
+
+    # ── Control ──────────────────────────────────────────────────────────
+
+    def _clamp(self, limit: int) -> int:
+        return max(self.config.min_agents, min(self.config.max_agents, limit))
+
+    def classify(self, sample: PressureSample) -> tuple[str, list[str]]:
+        """Classify a sample and list the signals under pressure.
+
+        Pressure if any signal is past its pressure watermark, headroom if
+        every signal is inside its headroom watermark, else steady.
+        """
+        c = self.config
+        over = []
+        if sample.memory_available_percent < c.memory_available_low:
+            over.append(f"memory available {sample.memory_available_percent:.0f}%")
+        if sample.process_percent > c.process_high:
+            over.append(f"processes {sample.process_percent:.0f}% of nproc")
+        if sample.load_per_cpu > c.load_high:
+            over.append(f"load {sample.load_per_cpu:.2f}/cpu")
+        if sample.loop_lag > c.loop_lag_high:
+            over.append(f"event-loop lag {sample.loop_lag:.2f}s")
+        if over:
+            return PRESSURE, over
+        if (
+            sample.memory_available_percent > c.memory_available_high
+            and sample.process_percent < c.process_low
+            and sample.load_per_cpu < c.load_low
+            and sample.loop_lag < c.loop_lag_low
+        ):
+            return HEADROOM, []
+        return STEADY, []
+
+    def update(self, sample: PressureSample) -> None:
+        """Apply one pressure sample to the admission limit."""
+        self.sample = sample
+        self.state, self.reasons = self.classify(sample)
+        limit = self.scheduler.limit
+
+        if self.state == PRESSURE:
+            self._headroom_streak = 0
+            now = time.monotonic()
+            if now - self._last_decrease < self.config.cooldown:
+                return
+            new_limit = self._clamp(min(limit - 1, int(limit * self.config.decrease_factor)))
+            if new_limit < limit:
+                self._last_decrease = now
+                self._stats["decreases"] += 1
+                self.scheduler.set_limit(new_limit)
+                logger.warning(
+                    "Resource pressure (%s) — agent limit %d → %d",
+                    ", ".join(self.reasons),
+                    limit,
+                    new_limit,
+                )
+            return
+
+        if self.state != HEADROOM:
+            self._headroom_streak = 0
+            return
+        self._headroom_streak += 1
+        # Only grow when the current limit is actually the bottleneck
+        if self._headroom_streak < self.config.raise_after:
+            return
+        if not self.scheduler.occupancy()["waiting"]:
+            return
+        self._headroom_streak = 0
+        new_limit = self._clamp(limit + 1)
+        if new_limit > limit:
+            self._stats["raises"] += 1
+            self.scheduler.set_limit(new_limit)
+            logger.info("Resource headroom — agent limit %d → %d", limit, new_limit)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "limit": self.scheduler.limit,
+            "state": self.state,
+            "reasons": self.reasons,
+            "signals": (
+                {k: round(v, 2) for k, v in asdict(self.sample).items()} if self.sample else None
+            ),
+            **self._stats,
+        }
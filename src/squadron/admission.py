@@ -0,0 +1,269 @@
+"""Admission Scheduler — priority and fair-share access to agent concurrency slots.
+
+Provides:
+- AdmissionScheduler: replaces the plain ``asyncio.Semaphore`` that capped
+  concurrently running agents.  Spawns and wakes queue here when every slot
+  is taken; freed slots go to the most important waiter rather than the
+  oldest one.
+
+Design Notes:
+- A waiter's priority is the highest of its role priority and the
+  priorities of its issue's labels (``runtime.admission``).  Higher wins.
+- Within one priority, roles share slots by weight: the waiter whose role
+  holds the fewest slots relative to its weight goes next, then FIFO.
+  One busy role can therefore not starve the others.
+- Slots are held per agent id, so releasing twice (or releasing an agent
+  that never held a slot, e.g. one that was already sleeping) is a no-op.
+- Preemption (opt-in): when a waiter outranks the lowest-priority holder,
+  the scheduler asks the owner (AgentManager) to checkpoint and sleep that
+  agent.  Its slot is handed over once the agent releases it, and the
+  preempted agent re-queues at its original priority.
+- ``stats()`` exposes holders, the live wait queue and per-priority-class
+  wait-time metrics for the dashboard.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from squadron.config import AdmissionConfig
+
+logger = logging.getLogger(__name__)
+
+# agent_id → True if the agent will yield its slot
+PreemptCallback = Callable[[str], bool]
+
+
+@dataclass
+class _Holder:
+    role: str
+    priority: int
+    admitted_at: float
+
+
+@dataclass
+class _Waiter:
+    agent_id: str
+    role: str
+    priority: int
+    seq: int
+    future: asyncio.Future[None]
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+@dataclass
+class _ClassStats:
+    admitted: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+    def record(self, waited: float) -> None:
+        self.admitted += 1
+        self.total_wait += waited
+        self.max_wait = max(self.max_wait, waited)
+
+
+class AdmissionScheduler:
+    """Priority-ordered, weighted fair-share admission of agents."""
+
+    def __init__(
+        self,
+        limit: int,
+        config: AdmissionConfig,
+        preempt: PreemptCallback | None = None,
+    ) -> None:
+        self.limit = limit  # 0 = unlimited
+        self.config = config
+        self._preempt = preempt
+        self._holders: dict[str, _Holder] = {}
+        self._waiters: list[_Waiter] = []
+        self._by_role: Counter[str] = Counter()
+        self._preempting: set[str] = set()
+        # Priority a preempted agent had, restored when it re-queues
+        self._resume_priority: dict[str, int] = {}
+        self._seq = itertools.count()
+        self._class_stats: dict[int, _ClassStats] = {}
+        self._preemptions = 0
+
+    # ── Policy ───────────────────────────────────────────────────────────
+
+    def priority_for(self, role: str, labels: Iterable[str] = ()) -> int:
+        """Priority class for a role working on an issue with ``labels``."""
+        priority = self.config.role_priorities.get(role, self.config.default_priority)
+        for label in labels:
+            if label in self.config.label_priorities:
+                priority = max(priority, self.config.label_priorities[label])
+        return priority
+
+    def _weight(self, role: str) -> float:
+        return max(self.config.role_weights.get(role, 1.0), 1e-6)
+
+    def set_limit(self, limit: int) -> None:
+        """Change the slot count.
+
+        Raising it admits waiters immediately; lowering it below ``in_use``
+        defers new admissions until running agents finish.
+        """
+        self.limit = limit
+        self._dispatch()
+
+    def _has_free_slot(self) -> bool:
+        return self.limit <= 0 or len(self._holders) < self.limit
+
+    # ── Acquire / release ────────────────────────────────────────────────
+
+    async def acquire(self, agent_id: str, role: str, labels: Iterable[str] = ()) -> None:
+        """Wait for a concurrency slot for ``agent_id``.
+
+        Returns immediately if the agent already holds one.  Cancelling the
+        wait leaves the queue (and returns the slot if it was just granted).
+        """
+        if agent_id in self._holders:
+            return
+        priority = self.priority_for(role, labels)
+        if agent_id in self._resume_priority:
+            priority = max(priority, self._resume_priority.pop(agent_id))
+        if self._has_free_slot() and not self._waiters:
+            self._admit(agent_id, role, priority, waited=0.0)
+            return
+
+        waiter = _Waiter(
+            agent_id=agent_id,
+            role=role,
+            priority=priority,
+            seq=next(self._seq),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._waiters.append(waiter)
+        logger.warning(
+            "Agent concurrency limit reached — queueing %s (priority=%d, position=%d)",
+            agent_id,
+            priority,
+            len(self._waiters),
+        )
+        self._dispatch()
+        self._maybe_preempt()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            elif agent_id in self._holders:
+                self.release(agent_id)
+            raise
+
+    def release(self, agent_id: str) -> bool:
+        """Give back ``agent_id``'s slot.  Returns False if it held none."""
+        holder = self._holders.pop(agent_id, None)
+        if holder is None:
+            # Final cleanup of a sleeping agent: it will not re-queue
+            self._resume_priority.pop(agent_id, None)
+            return False
+        self._by_role[holder.role] -= 1
+        if agent_id in self._preempting:
+            self._preempting.discard(agent_id)
+            self._resume_priority[agent_id] = holder.priority
+        self._dispatch()
+        return True
+
+    def _admit(self, agent_id: str, role: str, priority: int, waited: float) -> None:
+        self._holders[agent_id] = _Holder(role, priority, time.monotonic())
+        self._by_role[role] += 1
+        self._class_stats.setdefault(priority, _ClassStats()).record(waited)
+
+    def _next_waiter(self) -> _Waiter:
+        return min(
+            self._waiters,
+            key=lambda w: (-w.priority, self._by_role[w.role] / self._weight(w.role), w.seq),
+        )
+
+    def _dispatch(self) -> None:
+        while self._waiters and self._has_free_slot():
+            waiter = self._next_waiter()
+            self._waiters.remove(waiter)
+            waited = time.monotonic() - waiter.enqueued_at
+            self._admit(waiter.agent_id, waiter.role, waiter.priority, waited)
+            waiter.future.set_result(None)
+            logger.debug(
+                "Admitted %s after %.1fs (priority=%d)", waiter.agent_id, waited, waiter.priority
+            )
+
+    # ── Preemption ───────────────────────────────────────────────────────
+
+    def _maybe_preempt(self) -> None:
+        """Ask low-priority holders to yield for higher-priority waiters."""
+        if not self.config.preemption or self._preempt is None:
+            return
+        for waiter in sorted(self._waiters, key=lambda w: (-w.priority, w.seq)):
+            # Slots already being vacated for this priority or above cover earlier waiters
+            covered = sum(
+                1
+                for agent_id in self._preempting
+                if agent_id in self._holders and self._holders[agent_id].priority < waiter.priority
+            )
+            outranking = sum(1 for w in self._waiters if w.priority >= waiter.priority)
+            if covered >= outranking:
+                continue
+            victim = self._pick_victim(waiter.priority)
+            if victim is None:
+                return
+            self._preempting.add(victim)
+            if self._preempt(victim):
+                self._preemptions += 1
+                logger.info(
+                    "Preempting %s (priority=%d) for %s (priority=%d)",
+                    victim,
+                    self._holders[victim].priority,
+                    waiter.agent_id,
+                    waiter.priority,
+                )
+            else:
+                self._preempting.discard(victim)
+                return
+
+    def _pick_victim(self, below: int) -> str | None:
+        """Lowest-priority holder under ``below``; most recently admitted first."""
+        candidates = [
+            (holder.priority, -holder.admitted_at, agent_id)
+            for agent_id, holder in self._holders.items()
+            if holder.priority < below and agent_id not in self._preempting
+        ]
+        return min(candidates)[2] if candidates else None
+
+    # ── Introspection ────────────────────────────────────────────────────
+
+    def occupancy(self) -> dict[str, int]:
+        """Cheap summary for the overview gauge."""
+        return {"limit": self.limit, "in_use": len(self._holders), "waiting": len(self._waiters)}
+
+    def stats(self) -> dict[str, Any]:
+        now = time.monotonic()
+        return {
+            **self.occupancy(),
+            "holders_by_role": {role: n for role, n in self._by_role.items() if n > 0},
+            "preempting": sorted(self._preempting),
+            "preemptions": self._preemptions,
+            "queue": [
+                {
+                    "agent_id": w.agent_id,
+                    "role": w.role,
+                    "priority": w.priority,
+                    "waited_seconds": round(now - w.enqueued_at, 1),
+                }
+                for w in sorted(self._waiters, key=lambda w: (-w.priority, w.seq))
+            ],
+            "wait_by_priority": {
+                str(priority): {
+                    "admitted": s.admitted,
+                    "avg_wait_seconds": round(s.total_wait / s.admitted, 2),
+                    "max_wait_seconds": round(s.max_wait, 2),
+                }
+                for priority, s in sorted(self._class_stats.items(), reverse=True)
+            },
+        }
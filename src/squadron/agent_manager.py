@@ -16,19 +16,25 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-import threading
+import shutil
+import subprocess
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
+from squadron.activity import ActivityEventType
+from squadron.admission import AdmissionScheduler
 from squadron.copilot import (
     CopilotAgent,
     build_agent_env,
     build_resume_config,
     build_session_config,
 )
+from squadron.copilot_pool import CopilotPool
 from squadron.dashboard_security import DASHBOARD_API_KEY_ENV
+from squadron.git_fetcher import GitFetcher
 from squadron.models import (
     AgentRecord,
     AgentStatus,
@@ -38,8 +44,13 @@ from squadron.models import (
     SquadronEvent,
     SquadronEventType,
 )
+from squadron.role_artifacts import RoleArtifactCache, RoleArtifacts, compile_prompt
 from squadron.sandbox.manager import SandboxManager
+from squadron.session_keepalive import PREEMPTED, SessionKeepAlive, blocker_type
+from squadron.supervisor import AgentSupervisor
+from squadron.tool_events import ToolEventRecorder
 from squadron.tools.squadron_tools import SquadronTools
+from squadron.worktree_pool import WorktreePool
 
 if TYPE_CHECKING:
     from squadron.activity import ActivityLogger
@@ -53,10 +64,68 @@ if TYPE_CHECKING:
     from squadron.pipeline import PipelineEngine
     from squadron.pipeline.gates import PipelineContext
     from squadron.registry import AgentRegistry
+    from squadron.resource_monitor import ResourceMonitor
 
 logger = logging.getLogger(__name__)
 
 
+def _issue_labels(event: SquadronEvent | None) -> list[str]:
+    """Label names of the issue (or PR) in a webhook-derived event, for admission priority."""
+    if event is None:
+        return []
+    payload = event.data.get("payload", {})
+    subject = payload.get("issue") or payload.get("pull_request") or {}
+    return [label["name"] for label in subject.get("labels", []) if "name" in label]
+
+
+def _open_pidfd(process: subprocess.Popen) -> int | None:
+    """pidfd for a real child process, or None where pidfds are unavailable."""
+    if not isinstance(process, subprocess.Popen) or not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(process.pid)
+    except OSError:
+        return None
+
+
+async def _wait_for_process_exit(process: Any, poll_interval: float) -> int:
+    """Wait for a CLI subprocess to exit and return its exit code.
+
+    The SDK spawns the CLI with ``subprocess.Popen`` (not an asyncio
+    subprocess), so the loop's child watcher never sees it.  On Linux the
+    process is instead watched through a pidfd registered with the event
+    loop: the exit is observed the moment it happens, with no periodic
+    wakeups.  Elsewhere (and for test doubles) fall back to polling.
+    """
+    exit_code = process.poll()
+    if exit_code is not None:
+        return exit_code
+
+    pidfd = _open_pidfd(process)
+    if pidfd is not None:
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        try:
+            loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+        except NotImplementedError:  # loop without fd readers (e.g. proactor)
+            os.close(pidfd)
+        else:
+            try:
+                # Exited (and reaped) between poll() and pidfd_open: the
+                # pidfd may not refer to our child, so trust poll() instead
+                if process.poll() is None:
+                    await exited
+            finally:
+                loop.remove_reader(pidfd)
+                os.close(pidfd)
+            # The child is a zombie now — reaping it does not block
+            return process.wait()
+
+    while (exit_code := process.poll()) is None:
+        await asyncio.sleep(poll_interval)
+    return exit_code
+
+
 class AgentManager:
     """Manages the lifecycle of all agent instances."""
 
@@ -102,11 +171,57 @@ class AgentManager:
         # Per-agent CopilotAgent instances (one CLI subprocess each)
         self._copilot_agents: dict[str, CopilotAgent] = {}
 
+        # Warm pool of pre-started CLI clients handed out on spawn/wake
+        self._copilot_pool: CopilotPool | None = (
+            CopilotPool(
+                config=config.runtime.copilot_pool,
+                runtime_config=config.runtime,
+                working_directory=str(repo_root),
+                env_factory=self._build_agent_env,
+            )
+            if config.runtime.copilot_pool.enabled
+            else None
+        )
+
+        # Sleeping agents' CLI clients kept running for quick wakes
+        self._keepalive = SessionKeepAlive(config.runtime.session_keepalive)
+        # agent_id → (monotonic wake start, woke with a hot client)
+        self._wake_started: dict[str, tuple[float, bool]] = {}
+
+        # Keeps origin/* fresh so spawn-time ref checks stay local
+        self._git_fetcher = GitFetcher(
+            repo_root, self._run_git_in, interval=config.runtime.ref_fetch_interval
+        )
+
+        # Pool of pre-materialized worktrees recycled across agents
+        self._worktree_pool: WorktreePool | None = (
+            WorktreePool(
+                config=config.runtime.worktree_pool,
+                repo_root=repo_root,
+                pool_dir=self._worktree_base().parent / "worktree-pool",
+                default_branch=config.project.default_branch,
+                run_git=self._run_git_in,
+                sparse_checkout=config.runtime.sparse_checkout,
+            )
+            if config.runtime.worktree_pool.enabled
+            else None
+        )
+
+        # Detached checkouts of PR heads for command gates (PR → oldest first)
+        self._gate_checkouts: dict[int, list[Path]] = {}
+        self._gate_checkout_locks: dict[int, asyncio.Lock] = {}
+
         # Track active agent tasks
         self._agent_tasks: dict[str, asyncio.Task] = {}
 
-        # Per-agent duration watchdog tasks (D-10: background timer enforcement)
-        self._watchdog_tasks: dict[str, asyncio.Task] = {}
+        # Writes tool-call activity and counters off the hooks' critical path
+        self._tool_events = ToolEventRecorder(registry, activity_logger)
+
+        # Per-role prompt / session inputs, compiled once per definition + config
+        self._role_artifacts = RoleArtifactCache(self._compile_role)
+
+        # Duration watchdogs that have fired and are escalating their agent (D-10)
+        self._watchdog_runs: set[asyncio.Task] = set()
 
         # Sandbox manager (issue #85: sandboxed worktree execution)
         sandbox_config = config.get_sandbox_config()
@@ -118,10 +233,14 @@ class AgentManager:
             repo=config.project.repo,
         )
 
-        # Per-agent heartbeat threads (emit AGENT_HEARTBEAT every 60s during send_and_wait).
-        # Uses threading.Event rather than asyncio.Task so heartbeats fire even when
-        # the event loop is blocked by send_and_wait (Bug #1 fix).
-        self._heartbeat_stops: dict[str, "threading.Event"] = {}
+        # One supervisor thread for every agent's heartbeat and duration watchdog.
+        # A thread rather than asyncio tasks so heartbeats fire even when the
+        # event loop is blocked by send_and_wait (Bug #1 fix).
+        self._supervisor = AgentSupervisor(
+            registry,
+            on_watchdog=self._on_watchdog_expired,
+            on_no_activity=self._log_no_activity,
+        )
 
         # Track watchdog success/failure for monitoring (fix for issue #51)
         self._watchdog_enforced: set[str] = set()
@@ -134,16 +253,30 @@ class AgentManager:
         # Pipeline engine (set via set_pipeline_engine before start())
         self._pipeline_engine: PipelineEngine | None = None
 
-        # Agent concurrency limiter
-        max_concurrent = config.runtime.max_concurrent_agents
-        self._agent_semaphore: asyncio.Semaphore | None = (
-            asyncio.Semaphore(max_concurrent) if max_concurrent > 0 else None
+        # Agent concurrency limiter: priority / fair-share admission into
+        # max_concurrent_agents slots (0 = unlimited)
+        self._admission = AdmissionScheduler(
+            config.runtime.max_concurrent_agents,
+            config.runtime.admission,
+            preempt=self._preempt_agent,
         )
+        # Agents cancelled by the scheduler to free their slot — their task's
+        # CancelledError handler checkpoints and sleeps instead of cleaning up
+        self._preempted: set[str] = set()
+
+    @property
+    def admission(self) -> AdmissionScheduler:
+        """Scheduler that owns the agent concurrency slots."""
+        return self._admission
 
     def set_pipeline_engine(self, engine: PipelineEngine) -> None:
         """Attach the pipeline engine for event-driven orchestration."""
         self._pipeline_engine = engine
 
+    def set_resource_monitor(self, monitor: ResourceMonitor) -> None:
+        """Attach the resource monitor (memory pressure evicts hot sleeping sessions)."""
+        self._keepalive.set_resource_monitor(monitor)
+
     async def _log_activity(
         self,
         agent_id: str,
@@ -181,6 +314,16 @@ class AgentManager:
 
         # Start sandbox infrastructure (auth broker, audit log)
         await self._sandbox.start()
+        await self._supervisor.start()
+        await self._tool_events.start()
+
+        if self._copilot_pool:
+            await self._copilot_pool.start()
+        await self._keepalive.start()
+        await self._git_fetcher.start()
+        if self._worktree_pool:
+            await self._worktree_pool.start()
+        await self._sweep_gate_checkouts()
 
         # Register pipeline event handler (AD-019: replaces legacy triggers)
         self._register_pipeline_handlers()
@@ -200,6 +343,13 @@ class AgentManager:
         self.router.on(SquadronEventType.PR_REVIEW_SUBMITTED, self._handle_pr_review_submitted)
         self.router.on(SquadronEventType.PR_REVIEW_COMMENT, self._handle_pr_review_comment)
 
+        # Refresh origin/* refs whenever branches move on GitHub
+        self.router.on(SquadronEventType.PUSH, self._git_fetcher.handle_event)
+        self.router.on(SquadronEventType.BRANCH_CREATED, self._git_fetcher.handle_event)
+
+        # Drop command-gate checkouts of closed/merged PRs
+        self.router.on(SquadronEventType.PR_CLOSED, self._handle_pr_closed_gate_checkouts)
+
         logger.info("Agent manager started")
 
     async def stop(self) -> None:
@@ -223,14 +373,23 @@ class AgentManager:
                 await self.registry.update_agent(agent)
 
         # Cancel all watchdog timers
-        for agent_id, watchdog in list(self._watchdog_tasks.items()):
+        for watchdog in list(self._watchdog_runs):
             watchdog.cancel()
-        self._watchdog_tasks.clear()
+        self._watchdog_runs.clear()
+        await self._supervisor.stop()
+        await self._tool_events.stop()
 
         # Stop all CopilotAgent instances (CLI subprocesses)
         for agent_id, copilot in list(self._copilot_agents.items()):
             await copilot.stop()
         self._copilot_agents.clear()
+        await self._keepalive.stop()
+
+        if self._copilot_pool:
+            await self._copilot_pool.stop()
+        if self._worktree_pool:
+            await self._worktree_pool.stop()
+        await self._git_fetcher.stop()
 
         self._agent_tasks.clear()
 
@@ -269,9 +428,11 @@ class AgentManager:
                         defn.trigger.event,
                     )
 
-            # Also register for reactive event types
+            # Also register for reactive event types (on_events and the
+            # events that re-evaluate gates, e.g. CI completing)
             if defn:
-                for event_str in defn.on_events:
+                reactive = set(defn.on_events) | self._pipeline_engine.reactive_event_types(name)
+                for event_str in reactive:
                     internal_type = EVENT_MAP.get(event_str)
                     if internal_type:
                         trigger_event_types.add(internal_type)
@@ -433,12 +594,7 @@ class AgentManager:
         self.agent_mail_queues[agent_id] = []
 
         # Create CopilotAgent
-        copilot = CopilotAgent(
-            runtime_config=self.config.runtime,
-            working_directory=str(self.repo_root),
-            env=self._build_agent_env(),
-        )
-        await copilot.start()
+        copilot = await self._start_copilot(role, self.repo_root)
         self._copilot_agents[agent_id] = copilot
 
         # Build trigger event with pipeline metadata
@@ -628,6 +784,98 @@ class AgentManager:
         except Exception:
             logger.exception("Pipeline notification failed: target=%s", target)
 
+    async def pipeline_checkout_callback(self, context: "PipelineContext") -> str:
+        """Check out a PR's head commit for ``command`` gates.
+
+        Conforms to :class:`~squadron.pipeline.gates.CheckoutResolver`.
+
+        Each head commit gets its own detached worktree, so commands for
+        different PRs (or pushes) never share a directory.  The previous
+        head's checkout is kept for commands still running there; older
+        ones are removed, and all of a PR's are removed when it closes.
+
+        Gate commands run unsandboxed, so heads from forks (or deleted
+        forks) are refused rather than checked out.
+        """
+        pr = await context.get_pull_request()
+        head = pr.get("head") or {}
+        head_sha = head.get("sha")
+        if not head_sha:
+            raise RuntimeError(f"PR #{context.pr_number} has no head SHA")
+        head_repo = (head.get("repo") or {}).get("full_name")
+        base_repo = ((pr.get("base") or {}).get("repo") or {}).get("full_name")
+        if not head_repo or head_repo != base_repo:
+            raise RuntimeError(
+                f"PR #{context.pr_number} head is from fork {head_repo or '(deleted)'}; "
+                "refusing to run gate commands on it"
+            )
+        checkout = self._gate_checkout_dir() / f"pr-{context.pr_number}-{head_sha[:12]}"
+
+        lock = self._gate_checkout_locks.setdefault(context.pr_number, asyncio.Lock())
+        async with lock:
+            if checkout.exists():
+                return str(checkout)
+            checkout.parent.mkdir(parents=True, exist_ok=True)
+            if await self._git_fetcher.resolve(head_sha) is None:
+                # Not fetched yet (a push the fetcher has not caught up with)
+                await self._run_git_in(
+                    self.repo_root,
+                    "fetch",
+                    "--quiet",
+                    "origin",
+                    f"pull/{context.pr_number}/head",
+                    timeout=120,
+                    auth=True,
+                )
+            rc, _, stderr = await self._run_git(
+                "worktree", "add", "--detach", str(checkout), head_sha, timeout=120
+            )
+            if rc != 0:
+                raise RuntimeError(f"git worktree add failed: {stderr.strip()}")
+            logger.info("Checked out PR #%d head %s for gates", context.pr_number, head_sha[:12])
+
+            previous = self._gate_checkouts.setdefault(context.pr_number, [])
+            previous.append(checkout)
+            while len(previous) > 2:
+                await self._remove_gate_checkout(previous.pop(0))
+        return str(checkout)
+
+    def _gate_checkout_dir(self) -> Path:
+        """Directory holding the per-PR-head checkouts of command gates."""
+        return self._worktree_base().parent / "gate-checkouts"
+
+    async def _remove_gate_checkout(self, checkout: Path) -> None:
+        rc, _, stderr = await self._run_git(
+            "worktree", "remove", "--force", str(checkout), timeout=30
+        )
+        if rc != 0:
+            logger.warning("Failed to remove gate checkout %s: %s", checkout, stderr.strip())
+
+    async def _handle_pr_closed_gate_checkouts(self, event: SquadronEvent) -> None:
+        """Remove a closed (or merged) PR's command-gate checkouts."""
+        if event.pr_number is None:
+            return
+        lock = self._gate_checkout_locks.setdefault(event.pr_number, asyncio.Lock())
+        async with lock:
+            self._gate_checkouts.pop(event.pr_number, None)
+            # Globbed so checkouts made before a restart are found too
+            for checkout in sorted(self._gate_checkout_dir().glob(f"pr-{event.pr_number}-*")):
+                await self._remove_gate_checkout(checkout)
+
+    async def _sweep_gate_checkouts(self) -> None:
+        """Drop command-gate checkouts left by a previous run (none are in use yet)."""
+        gate_dir = self._gate_checkout_dir()
+        if gate_dir.exists():
+            await asyncio.to_thread(shutil.rmtree, gate_dir, ignore_errors=True)
+            logger.info("Removed stale gate checkouts under %s", gate_dir)
+        # Forget worktree metadata of checkouts whose directories are gone
+        try:
+            rc, _, stderr = await self._run_git("worktree", "prune", timeout=30)
+        except Exception as e:
+            rc, stderr = 1, str(e)
+        if rc != 0:
+            logger.debug("git worktree prune failed: %s", stderr.strip())
+
     # ── WIP Commit (3.1 — save work before sleep) ──────────────────────
 
     async def _wip_commit_and_push(self, agent: AgentRecord) -> None:
@@ -757,8 +1005,6 @@ class AgentManager:
         2. No worktree — uses repo root
         3. Start session, run to completion, destroy
         """
-        import time
-
         role_config = self.config.agent_roles.get(role)
         is_ephemeral = role_config.is_ephemeral if role_config else False
 
@@ -797,16 +1043,8 @@ class AgentManager:
                 )
                 await self.registry.delete_agent(stale.agent_id)
 
-        # Check concurrency limit
-        if self._agent_semaphore is not None:
-            if self._agent_semaphore.locked():
-                logger.warning("Agent concurrency limit reached — queueing %s", agent_id)
-            await self._agent_semaphore.acquire()
-            logger.debug(
-                "Agent semaphore acquired for %s (%d slots remaining)",
-                agent_id,
-                self._agent_semaphore._value,  # noqa: SLF001
-            )
+        # Wait for a concurrency slot (priority / fair-share ordered)
+        await self._admission.acquire(agent_id, role, _issue_labels(trigger_event))
 
         # Determine branch name (ephemeral agents don't need branches)
         # For non-ephemeral agents, check if an existing open PR already targets
@@ -893,13 +1131,9 @@ class AgentManager:
         )
 
         # Create CopilotAgent instance (one CLI subprocess per agent)
-        # Pass sanitized env to prevent secret leakage via bash tool (#117)
-        copilot = CopilotAgent(
-            runtime_config=self.config.runtime,
-            working_directory=str(sandbox_working_dir),
-            env=self._build_agent_env(),
+        copilot = await self._start_copilot(
+            role, sandbox_working_dir, sandboxed=self._sandbox.get_session(agent_id) is not None
         )
-        await copilot.start()
         self._copilot_agents[agent_id] = copilot
 
         # Start agent task
@@ -943,11 +1177,15 @@ class AgentManager:
             logger.warning("Agent %s is not sleeping (status=%s)", agent_id, agent.status)
             return
 
-        # Check concurrency limit before waking
-        if self._agent_semaphore is not None:
-            if self._agent_semaphore.locked():
-                logger.warning("Agent concurrency limit reached — queueing wake for %s", agent_id)
-            await self._agent_semaphore.acquire()
+        # Wait for a concurrency slot before waking
+        await self._admission.acquire(agent_id, agent.role, _issue_labels(trigger_event))
+
+        # Re-check: the agent may have been completed or woken while queued
+        agent = await self.registry.get_agent(agent_id)
+        if agent is None or agent.status != AgentStatus.SLEEPING:
+            self._admission.release(agent_id)
+            logger.info("Agent %s no longer sleeping after admission — skipping wake", agent_id)
+            return
 
         # Transition to ACTIVE
         agent.status = AgentStatus.ACTIVE
@@ -963,6 +1201,13 @@ class AgentManager:
             self.agent_mail_queues[agent_id] = []
 
         # Ensure CopilotAgent instance exists (may need restart after server restart)
+        if agent.worktree_path and not Path(agent.worktree_path).exists():
+            self._keepalive.discard(agent_id)  # recreated below with a fresh client
+        hot_copilot = self._keepalive.take(agent_id)
+        if hot_copilot is not None:
+            self._copilot_agents[agent_id] = hot_copilot
+        # Published only once the task that clears it is about to start
+        wake_started = (time.monotonic(), hot_copilot is not None)
         if agent_id not in self._copilot_agents:
             # Check if agent has a worktree path and if it exists
             working_directory = self.repo_root
@@ -992,15 +1237,15 @@ class AgentManager:
                 else:
                     working_directory = worktree_path
 
-            copilot = CopilotAgent(
-                runtime_config=self.config.runtime,
-                working_directory=str(working_directory),
-                env=self._build_agent_env(),
+            copilot = await self._start_copilot(
+                agent.role,
+                working_directory,
+                sandboxed=self._sandbox.get_session(agent_id) is not None,
             )
-            await copilot.start()
             self._copilot_agents[agent_id] = copilot
 
         # Start agent task (resume session)
+        self._wake_started[agent_id] = wake_started
         agent_task = asyncio.create_task(
             self._run_agent(agent, trigger_event, resume=True),
             name=f"agent-{agent_id}",
@@ -1089,9 +1334,10 @@ class AgentManager:
         *request* futures — it does NOT fire the notification-based
         ``SESSION_IDLE`` that send_and_wait is listening for.
 
-        This wrapper runs a concurrent polling loop that checks whether the CLI
-        process is still alive.  If it exits, we cancel the send_and_wait task
-        immediately and raise an informative error with stderr output.
+        This wrapper watches the CLI process concurrently (a pidfd registered
+        with the event loop where available, else polling every
+        ``poll_interval`` seconds).  If it exits, we cancel the send_and_wait
+        task immediately and raise an informative error with stderr output.
         """
         # Reach into SDK internals to get the subprocess.Popen handle.
         # Access path: CopilotAgent._client (CopilotClient)
@@ -1121,37 +1367,33 @@ class AgentManager:
         process_died = asyncio.Event()
         process_error_msg: list[str] = []  # mutable container for error info
 
-        async def _poll_process():
-            """Poll CLI process until it exits or we're cancelled."""
-            while True:
-                exit_code = cli_process.poll()
-                if exit_code is not None:
-                    stderr = copilot.get_cli_stderr()
-                    msg = (
-                        f"CLI process exited with code {exit_code} during "
-                        f"send_and_wait for agent {agent_id}. "
-                        f"stderr: {stderr[:2000] if stderr else '(empty)'}"
-                    )
-                    logger.error(
-                        "Agent %s: CLI process exited (code=%s) while send_and_wait "
-                        "was in progress. stderr=%s",
-                        agent_id,
-                        exit_code,
-                        stderr[:2000] if stderr else "(empty)",
-                    )
-                    process_error_msg.append(msg)
-                    process_died.set()
-                    return
-                await asyncio.sleep(poll_interval)
+        async def _watch_process():
+            """Wait for the CLI process to exit (or for cancellation)."""
+            exit_code = await _wait_for_process_exit(cli_process, poll_interval)
+            stderr = copilot.get_cli_stderr()
+            msg = (
+                f"CLI process exited with code {exit_code} during "
+                f"send_and_wait for agent {agent_id}. "
+                f"stderr: {stderr[:2000] if stderr else '(empty)'}"
+            )
+            logger.error(
+                "Agent %s: CLI process exited (code=%s) while send_and_wait "
+                "was in progress. stderr=%s",
+                agent_id,
+                exit_code,
+                stderr[:2000] if stderr else "(empty)",
+            )
+            process_error_msg.append(msg)
+            process_died.set()
 
         # Launch send_and_wait as a task
         send_task = asyncio.create_task(session.send_and_wait({"prompt": prompt}, timeout=timeout))
-        poll_task = asyncio.create_task(_poll_process())
+        watch_task = asyncio.create_task(_watch_process())
 
         try:
             # Wait for whichever finishes first
             done, pending = await asyncio.wait(
-                {send_task, poll_task},
+                {send_task, watch_task},
                 return_when=asyncio.FIRST_COMPLETED,
             )
 
@@ -1163,7 +1405,7 @@ class AgentManager:
                 except (asyncio.CancelledError, Exception):
                     pass
 
-            # If the poll task detected a dead process, raise immediately
+            # If the watch task detected a dead process, raise immediately
             if process_died.is_set():
                 # Also cancel send_task if it's somehow still going
                 if not send_task.done():
@@ -1183,7 +1425,7 @@ class AgentManager:
 
         finally:
             # Ensure both tasks are cleaned up
-            for task in (send_task, poll_task):
+            for task in (send_task, watch_task):
                 if not task.done():
                     task.cancel()
                     try:
@@ -1221,70 +1463,21 @@ class AgentManager:
             logger.error("No CopilotAgent instance for: %s", record.agent_id)
             return
 
-        # Check lifecycle type for this role
-        role_config = self.config.agent_roles.get(record.role)
-        is_ephemeral = role_config.is_ephemeral if role_config else False
-
-        # Interpolate template variables in agent definition prompt
-        raw_prompt = agent_def.prompt or agent_def.raw_content
-        system_message = self._interpolate_agent_def(raw_prompt, record, trigger_event)
+        # Role-level inputs are compiled once; only per-issue values are bound here
+        artifacts = self._role_artifacts_for(record.role)
+        is_ephemeral = artifacts.is_ephemeral
+        system_message = artifacts.render_prompt(self._issue_prompt_values(record, trigger_event))
 
         # Resolve circuit breaker limits for this role
-        cb_limits = self.config.circuit_breakers.for_role(record.role)
+        cb_limits = artifacts.cb_limits
         max_duration = cb_limits.max_active_duration  # seconds
 
         # Build hooks for Layer 1 circuit breaker (tool call counting)
         hooks = self._build_hooks(record, cb_limits)
 
-        # Build custom_agents and MCP servers from agent definition
-        custom_agents = self._build_custom_agents(agent_def)
-        mcp_servers = self._build_mcp_servers(agent_def)
-
-        # ── Tool selection: .md frontmatter is the single source of truth ──
-        # The frontmatter `tools:` list contains BOTH custom Squadron tools and
-        # SDK built-in tools.  We pass the full list as available_tools (allowlist)
-        # to the SDK, which forwards it as `availableTools` in session.create.
-        # The CLI uses this to filter which tools the model can see.
-        #
-        # Custom tools are ALSO registered via tools= (their definitions) so the
-        # CLI knows how to dispatch them.  The availableTools list ensures the
-        # model can see both the registered custom tools AND the allowed builtins.
-        #
-        # This is the correct allowlist approach: frontmatter defines exactly
-        # which tools an agent may use — no deny-lists, no inversions.
-        from squadron.tools.squadron_tools import ALL_TOOL_NAMES_SET
-
-        if agent_def.tools is not None:
-            custom_tool_names = [t for t in agent_def.tools if t in ALL_TOOL_NAMES_SET]
-            # The full frontmatter list is the allowlist — both custom and SDK names
-            sdk_available_tools = list(agent_def.tools) if agent_def.tools else None
-        else:
-            custom_tool_names = None  # → no Squadron tools (must be in frontmatter)
-            sdk_available_tools = None  # → all tools visible (no filtering)
-
-        tools = self._tools.get_tools(
-            record.agent_id,
-            names=custom_tool_names,
-        )
-
-        # Resolve skill directories for this agent's assigned skills.
-        # `or None` converts an empty list to None so the SDK omits the
-        # skill_directories key entirely rather than passing an empty list.
-        skill_directories = self._resolve_skill_directories(agent_def) or None
-
-        session_config = build_session_config(
-            role=record.role,
-            issue_number=record.issue_number,
-            system_message=system_message,
-            working_directory=str(record.worktree_path or self.repo_root),
-            runtime_config=self.config.runtime,
-            tools=tools,
-            hooks=hooks,
-            custom_agents=custom_agents,
-            mcp_servers=mcp_servers,
-            skill_directories=skill_directories,
-            available_tools=sdk_available_tools,
-        )
+        # Squadron tools from the frontmatter allowlist, bound to this agent
+        tools = self._tools.get_tools(record.agent_id, names=artifacts.custom_tool_names)
+        working_directory = str(record.worktree_path or self.repo_root)
 
         # Start heartbeat BEFORE session creation so that hangs during
         # resume_session / create_session are also visible (Bug #4 fix).
@@ -1301,18 +1494,24 @@ class AgentManager:
                 resume_config = build_resume_config(
                     role=record.role,
                     system_message=system_message,
-                    working_directory=str(record.worktree_path or self.repo_root),
+                    working_directory=working_directory,
                     runtime_config=self.config.runtime,
                     tools=tools,
                     hooks=hooks,
-                    custom_agents=custom_agents,
-                    mcp_servers=mcp_servers,
-                    skill_directories=skill_directories,
-                    available_tools=sdk_available_tools,
-                )
-                session = await copilot.resume_session(
-                    record.session_id or record.agent_id, resume_config
+                    custom_agents=artifacts.custom_agents,
+                    mcp_servers=artifacts.mcp_servers,
+                    skill_directories=artifacts.skill_directories,
+                    available_tools=artifacts.available_tools,
                 )
+                # Clear the wake marker even when resume raises
+                try:
+                    session = await copilot.resume_session(
+                        record.session_id or record.agent_id, resume_config
+                    )
+                finally:
+                    wake = self._wake_started.pop(record.agent_id, None)
+                if wake is not None:
+                    self._keepalive.record_wake(wake[1], time.monotonic() - wake[0])
                 prompt = await self._build_wake_prompt(record, trigger_event)
             else:
                 logger.info(
@@ -1321,7 +1520,20 @@ class AgentManager:
                     record.issue_number,
                     record.branch,
                     record.session_id,
-                    role_config.lifecycle if role_config else "persistent",
+                    artifacts.lifecycle,
+                )
+                session_config = build_session_config(
+                    role=record.role,
+                    issue_number=record.issue_number,
+                    system_message=system_message,
+                    working_directory=working_directory,
+                    runtime_config=self.config.runtime,
+                    tools=tools,
+                    hooks=hooks,
+                    custom_agents=artifacts.custom_agents,
+                    mcp_servers=artifacts.mcp_servers,
+                    skill_directories=artifacts.skill_directories,
+                    available_tools=artifacts.available_tools,
                 )
                 session = await copilot.create_session(session_config)
                 await self._log_activity(
@@ -1373,13 +1585,18 @@ class AgentManager:
                     content="Sending prompt to model via send_and_wait",
                     timeout_seconds=max_duration,
                 )
-                result = await self._send_and_wait_with_health_check(
-                    session,
-                    copilot,
-                    prompt,
-                    timeout=max_duration,
-                    agent_id=record.agent_id,
-                )
+                try:
+                    result = await self._send_and_wait_with_health_check(
+                        session,
+                        copilot,
+                        prompt,
+                        timeout=max_duration,
+                        agent_id=record.agent_id,
+                    )
+                finally:
+                    # The turn's tool events and counters land before the
+                    # lifecycle writes below
+                    await self._tool_events.flush()
             except asyncio.TimeoutError:
                 self._stop_heartbeat(record.agent_id)
                 logger.warning(
@@ -1464,17 +1681,12 @@ class AgentManager:
                 # Cancel watchdog — sleeping agents don't have active timers
                 self._cancel_watchdog(record.agent_id)
                 # Release concurrency slot — sleeping agents don't count
-                self._release_semaphore()
-                # Stop CopilotClient process to free system resources (issue #103).
-                # The session state is preserved in the SDK; wake_agent() will
-                # recreate the CopilotAgent and resume the session when needed.
-                agent_copilot = self._copilot_agents.pop(record.agent_id, None)
-                if agent_copilot:
-                    try:
-                        await agent_copilot.stop()
-                        logger.debug("Stopped CopilotClient for sleeping agent %s", record.agent_id)
-                    except Exception:
-                        logger.warning("Failed to stop CopilotClient for %s", record.agent_id)
+                self._admission.release(record.agent_id)
+                # Stop CopilotClient process to free system resources (issue #103)
+                # unless the keep-alive policy expects a quick wake.  The session
+                # state is preserved in the SDK; wake_agent() will reuse the hot
+                # client or recreate the CopilotAgent and resume the session.
+                await self._sleep_copilot(record.agent_id, blocker_type(updated))
 
                 # Notify pipeline engine of agent completion (SLEEPING = stage done)
                 if self._pipeline_engine:
@@ -1516,8 +1728,11 @@ class AgentManager:
                 )
 
         except asyncio.CancelledError:
+            if record.agent_id in self._preempted:
+                await self._checkpoint_and_sleep(record)
+                raise
             logger.info("Agent %s cancelled", record.agent_id)
-            # Best-effort cleanup on cancellation to avoid semaphore leak
+            # Best-effort cleanup on cancellation to avoid a leaked concurrency slot
             try:
                 await self._cleanup_agent(
                     record.agent_id,
@@ -1576,6 +1791,9 @@ class AgentManager:
             except Exception:
                 logger.warning("Failed to delete session %s for agent %s", session_id, agent_id)
 
+        self._keepalive.discard(agent_id)
+        self._wake_started.pop(agent_id, None)
+
         # Stop CopilotAgent process
         # Capture CLI stderr for post-mortem diagnostics before stopping.
         # The CLI's stderr often contains auth errors, model API failures,
@@ -1655,32 +1873,128 @@ class AgentManager:
                     "Refusing to remove worktree %s — it is the main repo root", worktree
                 )
             elif worktree.exists():
-                try:
-                    await self._run_git(
-                        "worktree",
-                        "remove",
-                        "--force",
-                        str(worktree),
-                        timeout=30,
-                    )
-                    logger.info("Removed worktree %s for agent %s", worktree, agent_id)
-                except Exception:
-                    logger.warning("Failed to remove worktree %s for agent %s", worktree, agent_id)
+                if self._worktree_pool and await self._worktree_pool.release(worktree):
+                    logger.info("Returned worktree %s for agent %s to the pool", worktree, agent_id)
+                else:
+                    try:
+                        await self._run_git(
+                            "worktree",
+                            "remove",
+                            "--force",
+                            str(worktree),
+                            timeout=30,
+                        )
+                        logger.info("Removed worktree %s for agent %s", worktree, agent_id)
+                    except Exception:
+                        logger.warning(
+                            "Failed to remove worktree %s for agent %s", worktree, agent_id
+                        )
 
         # Release concurrency slot
-        self._release_semaphore()
+        self._admission.release(agent_id)
 
         logger.info("Cleaned up agent %s", agent_id)
 
-    def _release_semaphore(self) -> None:
-        """Release one concurrency slot (if semaphore is active)."""
-        if self._agent_semaphore is not None:
-            self._agent_semaphore.release()
+    def concurrency_stats(self) -> dict[str, int] | None:
+        """Concurrency slot occupancy, or None when concurrency is unlimited."""
+        if self._admission.limit <= 0:
+            return None
+        return self._admission.occupancy()
+
+    def admission_stats(self) -> dict[str, Any]:
+        """Admission wait queue, holders by role and per-priority wait times."""
+        return self._admission.stats()
+
+    def copilot_pool_stats(self) -> dict[str, Any] | None:
+        """Warm client pool occupancy and hit rate, or None when disabled."""
+        if self._copilot_pool is None:
+            return None
+        return self._copilot_pool.stats()
+
+    def git_fetch_stats(self) -> dict[str, Any]:
+        """Background fetcher counters and last successful fetch time."""
+        return self._git_fetcher.stats()
+
+    def worktree_pool_stats(self) -> dict[str, Any] | None:
+        """Worktree pool occupancy, target size and hit counts, or None when disabled."""
+        if self._worktree_pool is None:
+            return None
+        return self._worktree_pool.stats()
+
+    # ── Preemption ───────────────────────────────────────────────────────
+
+    def _preempt_agent(self, agent_id: str) -> bool:
+        """Admission callback: make a running agent yield its slot.
+
+        Cancels the agent's task; its CancelledError handler then runs
+        ``_checkpoint_and_sleep``.  Returns False when the agent has no
+        running task to interrupt (e.g. it is still being set up).
+        """
+        task = self._agent_tasks.get(agent_id)
+        if task is None or task.done() or agent_id in self._preempted:
+            return False
+        self._preempted.add(agent_id)
+        task.cancel()
+        return True
+
+    async def _checkpoint_and_sleep(self, record: AgentRecord) -> None:
+        """Put a preempted agent to sleep and queue it to wake again.
+
+        Work in progress is committed and pushed, the session is preserved
+        and the CLI process stopped — the same end state as report_blocked —
+        then a wake is queued behind the higher-priority work.
+        """
+        agent_id = record.agent_id
+        self._preempted.discard(agent_id)
+        self._cancel_watchdog(agent_id)
+        self._stop_heartbeat(agent_id)
+        self._agent_tasks.pop(agent_id, None)
+        try:
+            await self._wip_commit_and_push(record)
+            record.status = AgentStatus.SLEEPING
+            record.sleeping_since = datetime.now(timezone.utc)
+            await self.registry.update_agent(record)
+        except Exception:
+            logger.exception("Checkpoint failed for preempted agent %s", agent_id)
+        finally:
+            self._admission.release(agent_id)
+
+        await self._sleep_copilot(agent_id, PREEMPTED)
+
+        logger.info("AGENT PREEMPTED — %s checkpointed and sleeping", agent_id)
+        await self._log_activity(
+            agent_id=agent_id,
+            event_type="agent_sleeping",
+            issue_number=record.issue_number,
+            pr_number=record.pr_number,
+            content="Agent preempted by higher-priority work — will resume when a slot frees",
+        )
+
+        if self._running:
+            wake_event = SquadronEvent(
+                event_type=SquadronEventType.WAKE_AGENT,
+                issue_number=record.issue_number,
+                pr_number=record.pr_number,
+                agent_id=agent_id,
+                data={"reason": "preempted"},
+            )
+            asyncio.create_task(self.wake_agent(agent_id, wake_event), name=f"wake-{agent_id}")
+
+    async def _sleep_copilot(self, agent_id: str, blocker: str) -> None:
+        """Park a sleeping agent's CLI client in the keep-alive set, or stop it."""
+        agent_copilot = self._copilot_agents.pop(agent_id, None)
+        if agent_copilot is None or self._keepalive.park(agent_id, agent_copilot, blocker):
+            return
+        try:
+            await agent_copilot.stop()
+            logger.debug("Stopped CopilotClient for sleeping agent %s", agent_id)
+        except Exception:
+            logger.warning("Failed to stop CopilotClient for %s", agent_id)
 
     # ── Duration Watchdog (D-10) ─────────────────────────────────────────
 
     def _start_watchdog(self, agent_id: str, role: str) -> None:
-        """Start a background duration timer for an agent.
+        """Arm the duration timer for an agent.
 
         When max_active_duration is exceeded, the framework cancels the agent
         task directly — regardless of what the agent is doing. This is the
@@ -1691,149 +2005,79 @@ class AgentManager:
         if max_duration <= 0:
             return
 
-        # Cancel any existing watchdog for this agent
-        self._cancel_watchdog(agent_id)
-
-        watchdog = asyncio.create_task(
-            self._duration_watchdog(agent_id, max_duration),
-            name=f"watchdog-{agent_id}",
-        )
-        self._watchdog_tasks[agent_id] = watchdog
+        # Re-arming replaces any existing deadline for this agent
+        self._supervisor.arm_watchdog(agent_id, max_duration)
         logger.debug(
-            "Started duration watchdog for %s (max_active_duration=%ds)",
+            "Armed duration watchdog for %s (max_active_duration=%ds)",
             agent_id,
             max_duration,
         )
 
     def _cancel_watchdog(self, agent_id: str) -> None:
-        """Cancel the duration watchdog for an agent (if running)."""
-        watchdog = self._watchdog_tasks.pop(agent_id, None)
-        if watchdog and not watchdog.done():
-            watchdog.cancel()
+        """Disarm the duration watchdog for an agent (if armed)."""
+        self._supervisor.disarm_watchdog(agent_id)
+
+    def _on_watchdog_expired(self, agent_id: str, max_seconds: int) -> None:
+        """Supervisor callback (on the event loop): escalate a timed-out agent."""
+        watchdog = asyncio.create_task(
+            self._duration_watchdog(agent_id, max_seconds),
+            name=f"watchdog-{agent_id}",
+        )
+        self._watchdog_runs.add(watchdog)
+        watchdog.add_done_callback(self._watchdog_runs.discard)
 
     # ── Heartbeat (diagnostic visibility during send_and_wait) ───────────
 
     def _start_heartbeat(self, record: "AgentRecord") -> None:
-        """Start a periodic heartbeat for an agent during send_and_wait.
+        """Track an agent's liveness during send_and_wait.
 
-        Runs on a **dedicated daemon thread** so that heartbeats fire even when
-        the asyncio event loop is blocked by the SDK's ``send_and_wait`` call.
-        The thread schedules ``_log_activity`` coroutines back onto the event
-        loop via ``call_soon_threadsafe`` + ``asyncio.run_coroutine_threadsafe``.
+        The supervisor thread refreshes the agent's ``agent_liveness`` row
+        every 60s from the live record, even while the event loop is
+        blocked, and raises a NO-ACTIVITY ALERT if the agent has made no
+        tool calls or turns after 120s.
         """
-        self._stop_heartbeat(record.agent_id)  # ensure no stale thread
-        stop_event = threading.Event()
-        self._heartbeat_stops[record.agent_id] = stop_event
-        loop = asyncio.get_running_loop()
-        t = threading.Thread(
-            target=self._heartbeat_thread,
-            args=(record.agent_id, record.issue_number, record.pr_number, stop_event, loop),
-            name=f"heartbeat-{record.agent_id}",
-            daemon=True,
-        )
-        t.start()
+        self._supervisor.track(record)
 
     def _stop_heartbeat(self, agent_id: str) -> None:
-        """Signal the heartbeat thread to stop."""
-        stop_event = self._heartbeat_stops.pop(agent_id, None)
-        if stop_event is not None:
-            stop_event.set()
+        """Stop liveness tracking for an agent (no-op if untracked)."""
+        self._supervisor.untrack(agent_id)
 
-    def _heartbeat_thread(
-        self,
-        agent_id: str,
-        issue_number: int | None,
-        pr_number: int | None,
-        stop_event: threading.Event,
-        loop: asyncio.AbstractEventLoop,
-    ) -> None:
-        """Background thread that emits AGENT_HEARTBEAT every 60s until stopped.
+    async def _log_no_activity(self, record: "AgentRecord", elapsed: int) -> None:
+        """Record a NO-ACTIVITY ALERT in the activity feed (called by the supervisor)."""
+        await self._log_activity(
+            record.agent_id,
+            "agent_heartbeat",
+            issue_number=record.issue_number,
+            pr_number=record.pr_number,
+            content=(
+                f"NO-ACTIVITY ALERT — 0 tool calls, 0 turns after {elapsed}s. "
+                "CLI may be unable to authenticate with model API."
+            ),
+            elapsed_seconds=elapsed,
+            tool_call_count=0,
+            turn_count=0,
+            no_activity_alert=True,
+        )
 
-        Uses ``threading.Event.wait(timeout=60)`` so it is not affected by
-        event-loop starvation.  Schedules the async ``_log_activity`` call back
-        onto *loop* via ``run_coroutine_threadsafe``.
+    def supervisor_stats(self) -> dict[str, Any]:
+        """Tracked heartbeats, armed watchdogs and agents with no activity."""
+        return self._supervisor.stats()
 
-        Includes a "no-activity" early warning: if after 120s the agent still
-        has 0 tool calls and 0 turns, a WARNING is logged indicating the CLI
-        may be failing to reach the model API (e.g. missing auth token).
-        """
-        import time
+    def tool_event_stats(self) -> dict[str, Any]:
+        """Backlog, drops and write lag of the tool-call activity writer."""
+        return self._tool_events.stats()
 
-        start = time.monotonic()
-        no_activity_warned = False
-        while not stop_event.wait(timeout=60):
-            elapsed = int(time.monotonic() - start)
-            # Read fresh metadata from the registry (best-effort, non-blocking)
-            try:
-                future = asyncio.run_coroutine_threadsafe(self.registry.get_agent(agent_id), loop)
-                fresh = future.result(timeout=5)
-            except Exception:
-                fresh = None
-            tool_call_count = fresh.tool_call_count if fresh else 0
-            turn_count = fresh.turn_count if fresh else 0
-
-            # Early warning: if 120s have passed with zero activity, the CLI
-            # is likely unable to reach the model API (auth failure, network
-            # issue, or sandbox problem).
-            if (
-                not no_activity_warned
-                and elapsed >= 120
-                and tool_call_count == 0
-                and turn_count == 0
-            ):
-                no_activity_warned = True
-                logger.warning(
-                    "NO-ACTIVITY ALERT — agent %s has 0 tool calls and 0 turns "
-                    "after %ds. The Copilot CLI may be unable to authenticate "
-                    "with the model API. Check CLI stderr and COPILOT_GITHUB_TOKEN.",
-                    agent_id,
-                    elapsed,
-                )
-                try:
-                    asyncio.run_coroutine_threadsafe(
-                        self._log_activity(
-                            agent_id,
-                            "agent_heartbeat",
-                            issue_number=issue_number,
-                            pr_number=pr_number,
-                            content=(
-                                f"NO-ACTIVITY ALERT — 0 tool calls, 0 turns after {elapsed}s. "
-                                "CLI may be unable to authenticate with model API."
-                            ),
-                            elapsed_seconds=elapsed,
-                            tool_call_count=0,
-                            turn_count=0,
-                            no_activity_alert=True,
-                        ),
-                        loop,
-                    )
-                except Exception:
-                    pass
-
-            try:
-                asyncio.run_coroutine_threadsafe(
-                    self._log_activity(
-                        agent_id,
-                        "agent_heartbeat",
-                        issue_number=issue_number,
-                        pr_number=pr_number,
-                        content=f"Agent alive — model thinking for {elapsed}s",
-                        elapsed_seconds=elapsed,
-                        tool_call_count=tool_call_count,
-                        turn_count=turn_count,
-                    ),
-                    loop,
-                )
-            except Exception:
-                # Loop may be closed during shutdown — exit quietly
-                return
+    def session_keepalive_stats(self) -> dict[str, Any]:
+        """Hot sleeping sessions, evictions and hot vs. cold wake latency."""
+        return self._keepalive.stats()
 
     async def _duration_watchdog(self, agent_id: str, max_seconds: int) -> None:
-        """Background timer that kills an agent when max_active_duration is exceeded.
+        """Kill an agent whose max_active_duration deadline has passed.
 
-        This is the primary circuit breaker enforcement mechanism. It runs
-        independently of the agent's tool calls or reasoning — if the timer
-        fires, the agent is cancelled and escalated.
+        This is the primary circuit breaker enforcement mechanism. The
+        supervisor tracks the deadline independently of the agent's tool
+        calls or reasoning — when it fires, the agent is cancelled and
+        escalated here.
 
         Fix for issue #46: Bounded timeouts on all cleanup operations and
         proper cancellation waiting to prevent race conditions.
@@ -1841,11 +2085,6 @@ class AgentManager:
         # Timeout for cleanup operations (30s is generous but bounded)
         CLEANUP_TIMEOUT = 30
 
-        try:
-            await asyncio.sleep(max_seconds)
-        except asyncio.CancelledError:
-            return  # Agent completed normally, watchdog was cancelled
-
         # Timer expired — kill the agent
         logger.warning(
             "WATCHDOG FIRED (layer 1) — agent %s exceeded max_active_duration (%ds), cancelling",
@@ -1980,6 +2219,41 @@ class AgentManager:
         """
         from collections import defaultdict
 
+        values = defaultdict(
+            str,
+            {
+                **self._role_prompt_values(record.role),
+                **self._issue_prompt_values(record, trigger_event),
+            },
+        )
+
+        try:
+            return raw_content.format_map(values)
+        except (KeyError, ValueError, IndexError):
+            logger.warning(
+                "Failed to interpolate agent def for %s — using raw content", record.agent_id
+            )
+            return raw_content
+
+    def _role_prompt_values(
+        self, role: str, cb_limits: CircuitBreakerDefaults | None = None
+    ) -> dict[str, str]:
+        """Template values that depend only on the role and config."""
+        # Get circuit breaker limits for default values
+        cb_limits = cb_limits or self.config.circuit_breakers.for_role(role)
+        return {
+            "project_name": self.config.project.name,
+            "base_branch": self.config.project.default_branch,
+            "max_iterations": str(cb_limits.max_iterations),
+            "max_tool_calls": str(cb_limits.max_tool_calls),
+            "max_turns": str(cb_limits.max_turns),
+        }
+
+    @staticmethod
+    def _issue_prompt_values(
+        record: AgentRecord, trigger_event: SquadronEvent | None
+    ) -> dict[str, str]:
+        """Template values bound per agent at spawn / wake time."""
         # Extract issue metadata from trigger event payload
         issue_title = ""
         issue_body = ""
@@ -1994,32 +2268,67 @@ class AgentManager:
             if trigger_event.pr_number:
                 pr_number = str(trigger_event.pr_number)
 
-        # Get circuit breaker limits for default values
-        cb_limits = self.config.circuit_breakers.for_role(record.role)
+        return {
+            "issue_number": str(record.issue_number or ""),
+            "issue_title": issue_title,
+            "issue_body": issue_body,
+            "branch_name": record.branch or "",
+            "pr_number": pr_number,
+        }
 
-        values = defaultdict(
-            str,
-            {
-                "project_name": self.config.project.name,
-                "issue_number": str(record.issue_number or ""),
-                "issue_title": issue_title,
-                "issue_body": issue_body,
-                "branch_name": record.branch or "",
-                "base_branch": self.config.project.default_branch,
-                "max_iterations": str(cb_limits.max_iterations),
-                "max_tool_calls": str(cb_limits.max_tool_calls),
-                "max_turns": str(cb_limits.max_turns),
-                "pr_number": pr_number,
-            },
+    def _role_artifacts_for(self, role: str) -> RoleArtifacts:
+        """Compiled per-role session inputs (rebuilt when definition or config change)."""
+        return self._role_artifacts.get(role, self.agent_definitions, self.config)
+
+    def _compile_role(self, role: str, fingerprint: str) -> RoleArtifacts:
+        agent_def = self.agent_definitions[role]
+        role_config = self.config.agent_roles.get(role)
+        cb_limits = self.config.circuit_breakers.for_role(role)
+
+        # ── Tool selection: .md frontmatter is the single source of truth ──
+        # The frontmatter `tools:` list contains BOTH custom Squadron tools and
+        # SDK built-in tools.  We pass the full list as available_tools (allowlist)
+        # to the SDK, which forwards it as `availableTools` in session.create.
+        # The CLI uses this to filter which tools the model can see.
+        #
+        # Custom tools are ALSO registered via tools= (their definitions) so the
+        # CLI knows how to dispatch them.  The availableTools list ensures the
+        # model can see both the registered custom tools AND the allowed builtins.
+        #
+        # This is the correct allowlist approach: frontmatter defines exactly
+        # which tools an agent may use — no deny-lists, no inversions.
+        from squadron.tools.squadron_tools import ALL_TOOL_NAMES_SET
+
+        if agent_def.tools is not None:
+            custom_tool_names = [t for t in agent_def.tools if t in ALL_TOOL_NAMES_SET]
+            # The full frontmatter list is the allowlist — both custom and SDK names
+            sdk_available_tools = list(agent_def.tools) if agent_def.tools else None
+        else:
+            custom_tool_names = None  # → no Squadron tools (must be in frontmatter)
+            sdk_available_tools = None  # → all tools visible (no filtering)
+
+        prompt_template = agent_def.prompt or agent_def.raw_content
+        return RoleArtifacts(
+            role=role,
+            fingerprint=fingerprint,
+            prompt_template=prompt_template,
+            prompt_values=self._role_prompt_values(role, cb_limits),
+            interpolate=compile_prompt(prompt_template, role),
+            cb_limits=cb_limits,
+            is_ephemeral=role_config.is_ephemeral if role_config else False,
+            lifecycle=role_config.lifecycle if role_config else "persistent",
+            custom_agents=self._build_custom_agents(agent_def),
+            mcp_servers=self._build_mcp_servers(agent_def),
+            # `or None` converts an empty list to None so the SDK omits the
+            # skill_directories key entirely rather than passing an empty list.
+            skill_directories=self._resolve_skill_directories(agent_def) or None,
+            custom_tool_names=custom_tool_names,
+            available_tools=sdk_available_tools,
         )
 
-        try:
-            return raw_content.format_map(values)
-        except (KeyError, ValueError, IndexError):
-            logger.warning(
-                "Failed to interpolate agent def for %s — using raw content", record.agent_id
-            )
-            return raw_content
+    def role_artifact_stats(self) -> dict[str, Any]:
+        """Compiled roles and cache hits / compiles."""
+        return self._role_artifacts.stats()
 
     def _build_hooks(
         self,
@@ -2030,14 +2339,17 @@ class AgentManager:
 
         The on_pre_tool_use hook increments tool_call_count on the
         AgentRecord and denies tool use if the limit is exceeded.
-        Both hooks log activity events for real-time observability.
+        Both hooks hand their activity events (and periodic counter
+        persistence) to the ToolEventRecorder and return without awaiting
+        any I/O — they sit on the critical path of every tool call.
 
         Hook signature matches SDK PreToolUseHandler:
           (PreToolUseHookInput, dict[str, str]) -> PreToolUseHookOutput | None
         """
         registry = self.registry
         max_tool_calls = cb_limits.max_tool_calls
-        activity_logger = self.activity_logger
+        warning_at = int(max_tool_calls * cb_limits.warning_threshold)
+        tool_events = self._tool_events
 
         # Track tool start times for duration calculation
         tool_start_times: dict[str, float] = {}
@@ -2051,41 +2363,14 @@ class AgentManager:
                 hook_input: PreToolUseHookInput with toolName, toolArgs, timestamp, cwd.
                 context: Session context metadata (key-value pairs).
             """
-            import time
-
             tool_name = hook_input.get("toolName", "unknown")
-            tool_args = hook_input.get("toolArgs", {})
-            tool_id = hook_input.get("toolUseId", str(time.time()))
+            now = time.monotonic()
+            tool_id = hook_input.get("toolUseId") or str(now)
             record.tool_call_count += 1
 
             # Track start time for duration calculation
-            tool_start_times[tool_id] = time.time()
-
-            # Log tool call start activity
-            if activity_logger:
-                try:
-                    from squadron.activity import ActivityEvent, ActivityEventType
-
-                    # Truncate large tool args for logging
-                    logged_args = tool_args
-                    if isinstance(tool_args, dict):
-                        logged_args = {
-                            k: (v[:500] + "..." if isinstance(v, str) and len(v) > 500 else v)
-                            for k, v in tool_args.items()
-                        }
-
-                    event = ActivityEvent(
-                        agent_id=record.agent_id,
-                        event_type=ActivityEventType.TOOL_CALL_START,
-                        tool_name=tool_name,
-                        tool_args=logged_args,
-                        issue_number=record.issue_number,
-                        pr_number=record.pr_number,
-                        metadata={"tool_call_count": record.tool_call_count},
-                    )
-                    await activity_logger.log(event)
-                except Exception:
-                    logger.debug("Failed to log tool_call_start activity", exc_info=True)
+            tool_start_times[tool_id] = now
+            tool_events.tool_started(record, tool_name, hook_input.get("toolArgs", {}))
 
             if record.tool_call_count > max_tool_calls:
                 logger.warning(
@@ -2095,25 +2380,15 @@ class AgentManager:
                     max_tool_calls,
                     tool_name,
                 )
+                # Rare state transition — persisted before the deny takes effect
                 record.status = AgentStatus.ESCALATED
                 await registry.update_agent(record)
-
-                # Log circuit breaker triggered
-                if activity_logger:
-                    try:
-                        from squadron.activity import ActivityEvent, ActivityEventType
-
-                        event = ActivityEvent(
-                            agent_id=record.agent_id,
-                            event_type=ActivityEventType.CIRCUIT_BREAKER_TRIGGERED,
-                            content=f"Tool call limit exceeded ({record.tool_call_count}/{max_tool_calls})",
-                            issue_number=record.issue_number,
-                            metadata={"trigger": "max_tool_calls", "tool_name": tool_name},
-                        )
-                        await activity_logger.log(event)
-                    except Exception:
-                        pass
-
+                tool_events.log(
+                    record,
+                    ActivityEventType.CIRCUIT_BREAKER_TRIGGERED,
+                    f"Tool call limit exceeded ({record.tool_call_count}/{max_tool_calls})",
+                    {"trigger": "max_tool_calls", "tool_name": tool_name},
+                )
                 return {
                     "permissionDecision": "deny",
                     "permissionDecisionReason": f"Tool call limit exceeded ({max_tool_calls})",
@@ -2121,11 +2396,10 @@ class AgentManager:
 
             # Persist counter periodically (every 10 calls to avoid DB thrashing)
             if record.tool_call_count % 10 == 0:
-                await registry.update_agent(record)
+                tool_events.persist(record)
 
             # Log at warning threshold
-            threshold = int(max_tool_calls * cb_limits.warning_threshold)
-            if record.tool_call_count == threshold:
+            if record.tool_call_count == warning_at:
                 logger.warning(
                     "CIRCUIT BREAKER L1 WARNING — agent %s at %d%% of tool call limit (%d/%d)",
                     record.agent_id,
@@ -2133,62 +2407,25 @@ class AgentManager:
                     record.tool_call_count,
                     max_tool_calls,
                 )
-
-                # Log circuit breaker warning
-                if activity_logger:
-                    try:
-                        from squadron.activity import ActivityEvent, ActivityEventType
-
-                        event = ActivityEvent(
-                            agent_id=record.agent_id,
-                            event_type=ActivityEventType.CIRCUIT_BREAKER_WARNING,
-                            content=f"Approaching tool call limit ({record.tool_call_count}/{max_tool_calls})",
-                            issue_number=record.issue_number,
-                            metadata={"threshold_percent": cb_limits.warning_threshold * 100},
-                        )
-                        await activity_logger.log(event)
-                    except Exception:
-                        pass
+                tool_events.log(
+                    record,
+                    ActivityEventType.CIRCUIT_BREAKER_WARNING,
+                    f"Approaching tool call limit ({record.tool_call_count}/{max_tool_calls})",
+                    {"threshold_percent": cb_limits.warning_threshold * 100},
+                )
 
             return {"permissionDecision": "allow"}
 
         async def on_post_tool_use(hook_input: dict[str, Any], context: dict[str, str]) -> None:
             """Called after each tool invocation — logs completion with duration."""
-            import time
-
-            tool_name = hook_input.get("toolName", "unknown")
-            tool_result = hook_input.get("result", "")
-            tool_error = hook_input.get("error")
-            tool_id = hook_input.get("toolUseId", "")
-
-            # Calculate duration
-            start_time = tool_start_times.pop(tool_id, None)
-            duration_ms = int((time.time() - start_time) * 1000) if start_time else None
-
-            # Log tool call end activity
-            if activity_logger:
-                try:
-                    from squadron.activity import ActivityEvent, ActivityEventType
-
-                    # Truncate large results for logging
-                    logged_result = tool_result
-                    if isinstance(tool_result, str) and len(tool_result) > 1000:
-                        logged_result = tool_result[:1000] + "... (truncated)"
-
-                    event = ActivityEvent(
-                        agent_id=record.agent_id,
-                        event_type=ActivityEventType.TOOL_CALL_END,
-                        tool_name=tool_name,
-                        tool_result=logged_result,
-                        tool_success=tool_error is None,
-                        tool_duration_ms=duration_ms,
-                        issue_number=record.issue_number,
-                        pr_number=record.pr_number,
-                        metadata={"error": str(tool_error)} if tool_error else {},
-                    )
-                    await activity_logger.log(event)
-                except Exception:
-                    logger.debug("Failed to log tool_call_end activity", exc_info=True)
+            start_time = tool_start_times.pop(hook_input.get("toolUseId", ""), None)
+            tool_events.tool_finished(
+                record,
+                hook_input.get("toolName", "unknown"),
+                hook_input.get("result", ""),
+                hook_input.get("error"),
+                int((time.monotonic() - start_time) * 1000) if start_time else None,
+            )
 
         return {
             "on_pre_tool_use": on_pre_tool_use,
@@ -2289,6 +2526,12 @@ class AgentManager:
                     "`check_for_events` to see details."
                 )
 
+            if trigger_event.data.get("reason") == "preempted":
+                lines.append(
+                    "\n**Preempted:** Your previous turn was paused for higher-priority "
+                    "work. Your changes were committed and pushed — continue where you left off."
+                )
+
             # Include resolved blocker info
             resolved = trigger_event.data.get("resolved_issue")
             if resolved:
@@ -3160,6 +3403,12 @@ class AgentManager:
             (stderr_bytes or b"").decode(),
         )
 
+    def _worktree_base(self) -> Path:
+        """Directory holding per-issue agent worktrees."""
+        if self.config.runtime.worktree_dir:
+            return Path(self.config.runtime.worktree_dir)
+        return self.repo_root / ".squadron-data" / "worktrees"
+
     async def _create_worktree(self, record: AgentRecord) -> Path:
         """Create a git worktree for an agent's branch.
 
@@ -3175,28 +3424,36 @@ class AgentManager:
                 f"Cannot create worktree for agent {record.agent_id}: branch is not set"
             )
 
-        worktree_base = (
-            Path(self.config.runtime.worktree_dir)
-            if self.config.runtime.worktree_dir
-            else self.repo_root / ".squadron-data" / "worktrees"
-        )
-        worktree_dir = worktree_base / f"issue-{record.issue_number}"
+        worktree_dir = self._worktree_base() / f"issue-{record.issue_number}"
         worktree_dir.parent.mkdir(parents=True, exist_ok=True)
 
         if worktree_dir.exists():
             logger.info("Worktree already exists: %s", worktree_dir)
             return worktree_dir
 
+        # Decide from local refs (kept fresh by the background fetcher)
+        # whether the branch already exists on the remote.  A branch we did
+        # not generate is an existing PR's head and must exist there, so a
+        # local miss is worth waiting one fetch for; a miss on our own branch
+        # name is confirmed with a targeted fetch of just that branch.
+        remote_exists = await self._git_fetcher.has_remote_branch(
+            record.branch,
+            expected=record.pr_number is not None
+            or record.branch != self._branch_name(record.role, record.issue_number),
+        )
+
+        if self._worktree_pool and await self._worktree_pool.acquire(
+            record.branch, worktree_dir, track_remote=remote_exists
+        ):
+            return worktree_dir
+
         try:
             # Create or track the branch:
             # - If this branch already exists on the remote (e.g. an existing PR's
             #   head branch), track it so we start from the existing work.
             # - Otherwise, create a fresh branch from the default branch.
             default_branch = self.config.project.default_branch
-            remote_ref_rc, _, _ = await self._run_git(
-                "ls-remote", "--exit-code", "--heads", "origin", record.branch
-            )
-            if remote_ref_rc == 0:
+            if remote_exists:
                 # Branch exists on remote — track it
                 await self._run_git(
                     "branch",
@@ -3304,6 +3561,32 @@ class AgentManager:
             (stderr_bytes or b"").decode(),
         )
 
+    async def _start_copilot(
+        self, role: str, working_directory: Path, *, sandboxed: bool = False
+    ) -> CopilotAgent:
+        """Return a started CopilotAgent, from the warm pool when possible.
+
+        Pooled clients were started from the repo root; the agent's real
+        working directory reaches the CLI through the session config.  A
+        sandboxed agent never gets a pooled client: its CLI must be started
+        inside the sandbox overlay, not merely pointed at it.
+        """
+        # Hot sleeping sessions only use slots nobody is running in
+        self._keepalive.make_room(self._admission.occupancy()["in_use"], self._admission.limit)
+        if self._copilot_pool and not sandboxed:
+            copilot = self._copilot_pool.checkout(role)
+            if copilot is not None:
+                copilot.working_directory = str(working_directory)
+                return copilot
+        # Pass sanitized env to prevent secret leakage via bash tool (#117)
+        copilot = CopilotAgent(
+            runtime_config=self.config.runtime,
+            working_directory=str(working_directory),
+            env=self._build_agent_env(),
+        )
+        await copilot.start()
+        return copilot
+
     def _build_agent_env(self) -> dict[str, str]:
         """Build a sanitized environment for agent CLI subprocesses.
 
@@ -168,17 +168,125 @@ class ModelOverride(BaseModel):
     reasoning_effort: str | None = None
 
 
+class LogArchiveConfig(BaseModel):
+    """On-disk archive behind the in-memory log ring buffer."""
+
+    enabled: bool = True
+    max_disk_mb: int = 512  # total compressed size kept; oldest segments deleted first
+    segment_mb: int = 16  # rotate to a new segment at this compressed size
+    flush_interval: float = 2.0  # seconds between background writes
+
+
+class CopilotPoolConfig(BaseModel):
+    """Warm pool of pre-started Copilot CLI clients for agent spawn/wake."""
+
+    enabled: bool = False
+    size: int = 2  # idle clients kept per provider/model profile
+    max_idle_seconds: int = 900  # idle clients older than this are recycled
+    health_check_interval: float = 30.0  # seconds between idle-client pings
+
+
+class WorktreePoolConfig(BaseModel):
+    """Pre-materialized git worktrees recycled across agents."""
+
+    enabled: bool = False
+    min_size: int = 1  # idle worktrees kept even when no agents are spawning
+    max_size: int = 4
+    rate_window: int = 1800  # seconds of spawn history that sets the pool size
+    interval: float = 30.0  # seconds between resize passes
+
+
+class SessionKeepAliveConfig(BaseModel):
+    """Keep a sleeping agent's CLI running for a while so a quick wake skips the cold start.
+
+    Blocker types: ``pr_review`` (the agent owns a PR — a review reply wakes
+    it), ``preempted`` (re-queued for the next free slot), ``issue`` (blocked
+    on another issue) and ``other``.
+    """
+
+    enabled: bool = False
+    max_sessions: int = 4  # sleeping agents whose CLI is kept running
+    idle_ttl: int = 300  # seconds a sleeping agent's CLI stays hot (blocker types not listed)
+    blocker_ttls: dict[str, int] = Field(
+        default_factory=lambda: {"pr_review": 900, "preempted": 600, "issue": 0}
+    )  # blocker type → seconds; 0 stops the CLI on sleep
+    memory_available_low: float = 15.0  # % available — evict hot sessions below this
+    interval: float = 15.0  # seconds between TTL / memory checks
+
+
+class AdmissionConfig(BaseModel):
+    """Priority and fair-share admission of agents into concurrency slots."""
+
+    default_priority: int = 0
+    role_priorities: dict[str, int] = Field(default_factory=dict)  # role → priority
+    label_priorities: dict[str, int] = Field(default_factory=dict)  # issue label → priority
+    role_weights: dict[str, float] = Field(default_factory=dict)  # fair-share weight (default 1)
+    preemption: bool = False  # checkpoint + sleep lower-priority agents for queued work
+
+
+class AdaptiveConcurrencyConfig(BaseModel):
+    """Drive the agent concurrency limit from live resource pressure.
+
+    Each signal has a pressure watermark and a lower headroom watermark; the
+    gap between them (plus ``raise_after`` and ``cooldown``) keeps the limit
+    from flapping.
+    """
+
+    enabled: bool = False
+    min_agents: int = 1
+    max_agents: int = 20
+    interval: float = 5.0  # seconds between pressure samples
+    raise_after: int = 3  # consecutive headroom samples before the limit grows by one
+    decrease_factor: float = 0.75  # limit multiplier under pressure
+    cooldown: float = 30.0  # seconds between decreases
+    memory_available_low: float = 10.0  # % available — pressure below this
+    memory_available_high: float = 25.0  # % available — headroom above this
+    process_high: float = 85.0  # % of nproc limit — pressure above this
+    process_low: float = 60.0
+    load_high: float = 1.5  # 1-min load per CPU — pressure above this
+    load_low: float = 0.75
+    loop_lag_high: float = 0.5  # seconds — pressure above this
+    loop_lag_low: float = 0.1
+
+
+class CommandGatesConfig(BaseModel):
+    """Executor for ``command`` gate checks — without it command gates always fail."""
+
+    enabled: bool = False
+    max_concurrent: int = 2  # gate commands running at once; the rest queue
+    cache_size: int = 128  # results kept per (command, PR checkout, git tree hash)
+    cwd: str | None = None  # directory for commands without a PR (default: repo root)
+
+
+class PipelineWorkersConfig(BaseModel):
+    """Run pipeline stage work on a worker pool instead of inline in event routing."""
+
+    enabled: bool = False
+    workers: int = 4  # runs whose stage work may execute at once (one job per run at a time)
+
+
 class RuntimeConfig(BaseModel):
     default_model: str = "claude-sonnet-4.6"
     default_reasoning_effort: str | None = None
     models: dict[str, ModelOverride] = Field(default_factory=dict)
     provider: ProviderConfig = Field(default_factory=ProviderConfig)
     reconciliation_interval: int = 300  # seconds
+    ref_fetch_interval: int = 600  # seconds between fallback `git fetch` runs
     max_concurrent_agents: int = 10  # max agents running simultaneously (0 = unlimited)
     sparse_checkout: bool = False  # use git sparse-checkout for worktrees
     worktree_dir: str | None = (
         None  # override worktree base path (default: .squadron-data/worktrees)
     )
+    log_archive: LogArchiveConfig = Field(default_factory=LogArchiveConfig)
+    copilot_pool: CopilotPoolConfig = Field(default_factory=CopilotPoolConfig)
+    worktree_pool: WorktreePoolConfig = Field(default_factory=WorktreePoolConfig)
+    session_keepalive: SessionKeepAliveConfig = Field(default_factory=SessionKeepAliveConfig)
+    admission: AdmissionConfig = Field(default_factory=AdmissionConfig)
+    adaptive_concurrency: AdaptiveConcurrencyConfig = Field(
+        default_factory=AdaptiveConcurrencyConfig
+    )
+    pipeline_workers: PipelineWorkersConfig = Field(default_factory=PipelineWorkersConfig)
+    command_gates: CommandGatesConfig = Field(default_factory=CommandGatesConfig)
 
 
 class EscalationConfig(BaseModel):
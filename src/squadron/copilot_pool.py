@@ -0,0 +1,231 @@
+"""Warm pool of pre-started Copilot CLI clients.
+
+Provides:
+- CopilotPool: idle, already-started ``CopilotAgent`` instances keyed by
+  provider/model profile.  ``create_agent``, ``wake_agent`` and pipeline
+  agent spawns check one out instead of paying for ``CopilotAgent.start()``
+  (CLI subprocess spawn, ping verification, retries) on the critical path.
+
+Design Notes:
+- The CLI process is not tied to a worktree — every session carries its own
+  ``working_directory`` in the SDK session config — so pooled clients are
+  started from the repo root and handed to any agent of the same profile.
+- Refills run in the background, one client at a time per profile, so a
+  burst of checkouts does not turn into a burst of concurrent CLI spawns
+  (the resource contention behind Issue #38).
+- A maintenance loop pings idle clients, stops unhealthy ones and recycles
+  clients idle longer than ``max_idle_seconds``.  Profiles other than the
+  default are only refilled while they keep seeing demand.
+- A miss is never an error: callers fall back to starting a fresh client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from squadron.config import CopilotPoolConfig, RuntimeConfig
+from squadron.copilot import CopilotAgent
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on a single health-check ping
+PING_TIMEOUT = 10.0
+
+
+@dataclass
+class _IdleClient:
+    agent: CopilotAgent
+    idle_since: float = field(default_factory=time.monotonic)
+
+
+class CopilotPool:
+    """Pre-started CopilotAgent instances, checked out by spawning agents."""
+
+    def __init__(
+        self,
+        config: CopilotPoolConfig,
+        runtime_config: RuntimeConfig,
+        working_directory: str,
+        env_factory: Callable[[], dict[str, str]],
+    ) -> None:
+        self.config = config
+        self.runtime_config = runtime_config
+        self.working_directory = working_directory
+        self._env_factory = env_factory
+        self._idle: dict[str, deque[_IdleClient]] = {}
+        # profile → monotonic time of the last checkout attempt
+        self._demand: dict[str, float] = {}
+        self._refill_tasks: dict[str, asyncio.Task] = {}
+        self._evictions: set[asyncio.Task] = set()
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self._stats = {"hits": 0, "misses": 0, "started": 0, "evicted": 0, "failed": 0}
+
+    @property
+    def default_profile(self) -> str:
+        return self._profile(self.runtime_config.default_model)
+
+    def profile_for(self, role: str) -> str:
+        """The pool key for agents of ``role`` (provider type + model)."""
+        override = self.runtime_config.models.get(role)
+        return self._profile(override.model if override else self.runtime_config.default_model)
+
+    def _profile(self, model: str) -> str:
+        return f"{self.runtime_config.provider.type}/{model}"
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        self._running = True
+        self._demand[self.default_profile] = time.monotonic()
+        self._schedule_refill(self.default_profile)
+        self._task = asyncio.create_task(self._maintenance_loop(), name="copilot-pool")
+        logger.info(
+            "Copilot client pool started (size=%d per profile, max_idle=%ds)",
+            self.config.size,
+            self.config.max_idle_seconds,
+        )
+
+    async def stop(self) -> None:
+        self._running = False
+        tasks = [t for t in (self._task, *self._refill_tasks.values()) if t]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await asyncio.gather(*self._evictions, return_exceptions=True)
+        self._refill_tasks.clear()
+        for entries in self._idle.values():
+            while entries:
+                await entries.popleft().agent.stop()
+        logger.info("Copilot client pool stopped")
+
+    # ── Checkout ─────────────────────────────────────────────────────────
+
+    def checkout(self, role: str) -> CopilotAgent | None:
+        """Take a started client for ``role``, or None on a pool miss.
+
+        Either way a background refill is scheduled for the profile.
+        """
+        profile = self.profile_for(role)
+        self._demand[profile] = time.monotonic()
+        entries = self._idle.get(profile)
+        agent: CopilotAgent | None = None
+        while entries:
+            candidate = entries.popleft().agent
+            if self._is_connected(candidate):
+                agent = candidate
+                break
+            self._evict(candidate, "disconnected")
+        if agent is None:
+            self._stats["misses"] += 1
+        else:
+            self._stats["hits"] += 1
+        if self._running:
+            self._schedule_refill(profile)
+        return agent
+
+    @staticmethod
+    def _is_connected(agent: CopilotAgent) -> bool:
+        try:
+            return agent.client.get_state() == "connected"
+        except Exception:
+            return False
+
+    # ── Refill ───────────────────────────────────────────────────────────
+
+    def _schedule_refill(self, profile: str) -> None:
+        task = self._refill_tasks.get(profile)
+        if task is None or task.done():
+            self._refill_tasks[profile] = asyncio.create_task(
+                self._refill(profile), name=f"copilot-pool-refill-{profile}"
+            )
+
+    async def _refill(self, profile: str) -> None:
+        entries = self._idle.setdefault(profile, deque())
+        while self._running and len(entries) < self.config.size:
+            agent = CopilotAgent(
+                runtime_config=self.runtime_config,
+                working_directory=self.working_directory,
+                env=self._env_factory(),
+            )
+            try:
+                await agent.start()
+            except asyncio.CancelledError:
+                await agent.stop()
+                raise
+            except Exception:
+                # Leave the profile short; the next checkout or health
+                # check schedules another attempt.
+                self._stats["failed"] += 1
+                logger.warning("Copilot pool failed to pre-start a client for %s", profile)
+                await agent.stop()
+                return
+            self._stats["started"] += 1
+            entries.append(_IdleClient(agent))
+
+    # ── Health checks and eviction ───────────────────────────────────────
+
+    async def _maintenance_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.config.health_check_interval)
+                await self._check_idle()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Copilot pool maintenance error")
+
+    async def _check_idle(self) -> None:
+        now = time.monotonic()
+        for profile, entries in list(self._idle.items()):
+            for entry in list(entries):
+                if now - entry.idle_since > self.config.max_idle_seconds:
+                    reason = "max idle"
+                elif not await self._ping(entry.agent):
+                    reason = "health check failed"
+                else:
+                    continue
+                # A checkout may have taken the entry while we were pinging
+                if entry in entries:
+                    entries.remove(entry)
+                    self._evict(entry.agent, reason)
+
+            wanted = profile == self.default_profile or (
+                now - self._demand.get(profile, 0.0) <= self.config.max_idle_seconds
+            )
+            if wanted:
+                self._schedule_refill(profile)
+            elif not entries:
+                self._idle.pop(profile, None)
+                self._demand.pop(profile, None)
+
+    @staticmethod
+    async def _ping(agent: CopilotAgent) -> bool:
+        try:
+            await asyncio.wait_for(agent.client.ping(), timeout=PING_TIMEOUT)
+            return True
+        except Exception:
+            return False
+
+    def _evict(self, agent: CopilotAgent, reason: str) -> None:
+        self._stats["evicted"] += 1
+        logger.info("Copilot pool evicting idle client (%s)", reason)
+        task = asyncio.create_task(agent.stop())
+        self._evictions.add(task)
+        task.add_done_callback(self._evictions.discard)
+
+    # ── Metrics ──────────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        checkouts = self._stats["hits"] + self._stats["misses"]
+        return {
+            "size": self.config.size,
+            "idle": {profile: len(entries) for profile, entries in self._idle.items()},
+            **self._stats,
+            "hit_rate": round(self._stats["hits"] / checkouts, 3) if checkouts else None,
+        }
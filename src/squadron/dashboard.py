@@ -10,12 +10,16 @@ Endpoints:
     - GET /dashboard/logs/stream - Real-time log stream (filtered by level/name)
     - GET /dashboard/pipelines/stream - Real-time pipeline event stream
 
+    WebSocket:
+    - WS /dashboard/ws - Multiplexed activity/log/pipeline stream with
+      server-side filters and batched frames
+
     REST Queries:
     - GET /dashboard/agents/{agent_id}/activity - Historical activity for one agent
     - GET /dashboard/agents/{agent_id}/stats - Summary statistics for one agent
     - GET /dashboard/activity - Recent activity across all agents
     - GET /dashboard/agents - List all active agents with status
-    - GET /dashboard/logs - Query in-memory log ring buffer
+    - GET /dashboard/logs - Query the log ring buffer plus on-disk archive
 
     Pipeline Visibility (AD-019):
     - GET /dashboard/pipelines - List pipeline definitions
@@ -25,10 +29,13 @@ Endpoints:
 
     Status:
     - GET /dashboard/status - Server and security status
+    - GET /dashboard/overview - In-memory overview snapshot (long-poll with ?since_version=)
+    - GET /dashboard/admission - Agent admission queue and per-priority wait times
 
 Security:
     All endpoints respect SQUADRON_DASHBOARD_API_KEY when configured.
-    SSE streams accept token via query parameter (?token=...) for EventSource compatibility.
+    SSE streams and the WebSocket accept token via query parameter (?token=...)
+    for EventSource compatibility.
 """
 
 from __future__ import annotations
@@ -36,18 +43,30 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections import deque
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
 from fastapi.responses import FileResponse, StreamingResponse
 
 from squadron.activity import ActivityEventType
 from squadron.dashboard_security import require_api_key, validate_sse_token, get_security_config
+from squadron.log_buffer import entry_matches, parse_level
 
 if TYPE_CHECKING:
     from squadron.activity import ActivityLogger
     from squadron.log_buffer import LogBuffer
+    from squadron.overview import DashboardOverview
     from squadron.pipeline.engine import PipelineEngine
     from squadron.pipeline.registry import PipelineRegistry
     from squadron.registry import AgentRegistry
@@ -65,9 +84,21 @@ _registry: "AgentRegistry | None" = None
 _log_buffer: "LogBuffer | None" = None
 _pipeline_engine: "PipelineEngine | None" = None
 _pipeline_registry: "PipelineRegistry | None" = None
+_overview: "DashboardOverview | None" = None
+_admission_stats: "Callable[[], dict[str, Any]] | None" = None
+
+
+class _PipelineEvent(NamedTuple):
+    """A published pipeline event, serialized once for every consumer."""
+
+    event_type: str
+    data: dict
+    payload: str  # JSON, shared by WebSocket clients
+    frame: bytes  # Complete SSE frame, shared by SSE clients
 
-# Pipeline SSE subscribers (queues that receive pipeline events)
-_pipeline_subscribers: list[asyncio.Queue] = []
+
+# Pipeline subscribers (queues that receive pipeline events)
+_pipeline_subscribers: list[asyncio.Queue[_PipelineEvent]] = []
 
 
 def configure(
@@ -76,14 +107,19 @@ def configure(
     log_buffer: "LogBuffer | None" = None,
     pipeline_engine: "PipelineEngine | None" = None,
     pipeline_registry: "PipelineRegistry | None" = None,
+    overview: "DashboardOverview | None" = None,
+    admission_stats: "Callable[[], dict[str, Any]] | None" = None,
 ) -> None:
     """Configure the dashboard router with required dependencies."""
     global _activity_logger, _registry, _log_buffer, _pipeline_engine, _pipeline_registry
+    global _overview, _admission_stats
     _activity_logger = activity_logger
     _registry = registry
     _log_buffer = log_buffer
     _pipeline_engine = pipeline_engine
     _pipeline_registry = pipeline_registry
+    _overview = overview
+    _admission_stats = admission_stats
     logger.info(
         "Dashboard router configured (log_buffer=%s, pipelines=%s)",
         "yes" if log_buffer else "no",
@@ -109,6 +145,17 @@ async def dashboard_ui():
 # Number of history events to send on initial connection
 _HYDRATION_LIMIT = 200
 
+# Static SSE frames, pre-encoded.  Every generator yields bytes: event frames
+# are serialized once at publish time and the same buffer is written to every
+# subscriber, so per-broadcast CPU does not grow with the number of clients.
+_SSE_CONNECTED = b'event: connected\ndata: {"status": "connected"}\n\n'
+_SSE_HYDRATED = b'event: hydrated\ndata: {"status": "hydrated"}\n\n'
+_SSE_HEARTBEAT = b"event: heartbeat\ndata: {}\n\n"
+
+
+def _sse_error(message: str) -> bytes:
+    return f"event: error\ndata: {json.dumps({'error': message})}\n\n".encode()
+
 
 async def _sse_generator(agent_id: str | None = None):
     """Generate SSE events for activity stream.
@@ -121,7 +168,7 @@ async def _sse_generator(agent_id: str | None = None):
         agent_id: If set, only stream events for this agent. If None, stream all events.
     """
     if _activity_logger is None:
-        yield 'event: error\ndata: {"error": "Activity logger not configured"}\n\n'
+        yield _sse_error("Activity logger not configured")
         return
 
     # Subscribe BEFORE fetching history so we don't miss events that arrive
@@ -129,7 +176,7 @@ async def _sse_generator(agent_id: str | None = None):
     queue = await _activity_logger.subscribe(agent_id)
 
     try:
-        yield 'event: connected\ndata: {"status": "connected"}\n\n'
+        yield _SSE_CONNECTED
 
         # ── History hydration ────────────────────────────────────────────────
         # Fetch recent events (newest-first from DB) and send oldest-first so
@@ -140,21 +187,21 @@ async def _sse_generator(agent_id: str | None = None):
             history = await _activity_logger.get_recent_activity(limit=_HYDRATION_LIMIT)
 
         for event in reversed(history):
-            yield f"event: activity\ndata: {event.to_sse_data()}\n\n"
+            yield event.to_sse_frame()
 
         # Signal that history hydration is complete; the client can mark all
         # previously received events as 'historical'.
-        yield 'event: hydrated\ndata: {"status": "hydrated"}\n\n'
+        yield _SSE_HYDRATED
 
         # ── Live stream ──────────────────────────────────────────────────────
         while True:
             try:
                 # Wait for next event with timeout (heartbeat every 30s)
                 event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                yield f"event: activity\ndata: {event.to_sse_data()}\n\n"
+                yield event.to_sse_frame()
             except asyncio.TimeoutError:
                 # Send heartbeat to keep connection alive
-                yield "event: heartbeat\ndata: {}\n\n"
+                yield _SSE_HEARTBEAT
             except asyncio.CancelledError:
                 break
     finally:
@@ -358,6 +405,18 @@ async def get_recent_activity(
     }
 
 
+def _liveness_to_dict(row: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Heartbeat fields of an ``agent_liveness`` row, or None if it never beat."""
+    if row is None:
+        return None
+    return {
+        "last_beat": row["last_beat"],
+        "elapsed_seconds": row["elapsed_seconds"],
+        "turn_count": row["turn_count"],
+        "no_activity_alert": row["no_activity_alert"],
+    }
+
+
 @router.get("/agents")
 async def list_agents(
     _: bool = Depends(require_api_key),
@@ -369,6 +428,9 @@ async def list_agents(
     # Get all active agents
     active = await _registry.get_all_active_agents()
 
+    # Latest supervisor heartbeat per active agent ("alive" visibility)
+    liveness = await _registry.get_all_liveness() if active else {}
+
     # Get recent completed agents (for historical context)
     recent = await _registry.get_recent_agents(limit=20)
 
@@ -387,6 +449,7 @@ async def list_agents(
                 "blocked_by": list(a.blocked_by) if a.blocked_by else [],
                 "tool_call_count": a.tool_call_count,
                 "iteration_count": a.iteration_count,
+                "liveness": _liveness_to_dict(liveness.get(a.agent_id)),
             }
             for a in active
         ],
@@ -418,13 +481,49 @@ async def get_status(
         "log_buffer": _log_buffer is not None,
         "log_buffer_size": _log_buffer.size if _log_buffer else 0,
         "log_buffer_capacity": _log_buffer.maxlen if _log_buffer else 0,
+        "log_archive": _log_buffer.archive.stats() if _log_buffer and _log_buffer.archive else None,
         "pipeline_engine": _pipeline_engine is not None,
         "pipeline_registry": _pipeline_registry is not None,
+        "websocket": dict(_ws_stats),
+        "overview_version": _overview.version if _overview else None,
         "security": security,
         "client_ip": request.client.host if request.client else None,
     }
 
 
+@router.get("/overview")
+async def get_overview(
+    since_version: int | None = Query(
+        default=None,
+        description="Long-poll: wait until the overview version exceeds this value",
+    ),
+    timeout: float = Query(default=25.0, ge=0, le=60),
+    _: bool = Depends(require_api_key),
+):
+    """Dashboard overview snapshot, maintained in memory on state transitions.
+
+    Agent counts by status and role, active pipelines, semaphore occupancy,
+    event-queue depth, GitHub API budget and resource usage.  Without
+    ``since_version`` the current snapshot is returned immediately; with it
+    the request blocks (up to ``timeout`` seconds) until something changes.
+    Clients pass back the ``version`` they last saw.
+    """
+    if _overview is None:
+        raise HTTPException(status_code=503, detail="Overview not available")
+    if since_version is None:
+        return _overview.snapshot()
+    return await _overview.wait_for_change(since_version, timeout)
+
+
+@router.get("/admission")
+async def get_admission(_: bool = Depends(require_api_key)):
+    """Agent admission queue: slot holders by role, queued spawns/wakes in
+    priority order with time waited so far, and per-priority wait times."""
+    if _admission_stats is None:
+        raise HTTPException(status_code=503, detail="Admission scheduler not available")
+    return _admission_stats()
+
+
 # ── Log Buffer Endpoints ─────────────────────────────────────────────────────
 
 
@@ -438,31 +537,48 @@ async def get_logs(
         default=None,
         description="Logger name prefix filter (e.g. squadron.agent_manager)",
     ),
+    since: str | None = Query(
+        default=None,
+        description="Only entries at or after this ISO-8601 timestamp",
+    ),
+    until: str | None = Query(
+        default=None,
+        description="Only entries before this ISO-8601 timestamp",
+    ),
     limit: int = Query(default=500, ge=1, le=5000),
     _: bool = Depends(require_api_key),
 ):
-    """Query the in-memory log ring buffer.
+    """Query the log ring buffer and, beyond it, the on-disk log archive.
 
-    Returns log entries from the ring buffer (newest first).
-    The ring buffer holds the last 20,000 log lines — no disk I/O,
-    no container log access required.
+    Returns log entries newest first.  The ring buffer holds the last
+    20,000 log lines in memory; when an archive is configured, older
+    entries are read from its compressed segments transparently — no
+    container log access required.
 
     Filters:
     - ``level``: Minimum log level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
       Records at or above this level are returned.
     - ``name``: Logger name prefix (e.g. ``squadron.agent_manager``).
       Uses startswith matching.
+    - ``since`` / ``until``: ISO-8601 time range (inclusive / exclusive);
+      a ``Z`` suffix is accepted and naive values are taken as UTC.
     """
     if _log_buffer is None:
         raise HTTPException(status_code=503, detail="Log buffer not configured")
 
-    entries = _log_buffer.query(level=level, name=name, limit=limit)
+    try:
+        entries = await _log_buffer.search(
+            level=level, name=name, limit=limit, since=since, until=until
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid time range: {e}")
 
     return {
         "count": len(entries),
         "buffer_size": _log_buffer.size,
         "buffer_capacity": _log_buffer.maxlen,
-        "filters": {"level": level, "name": name},
+        "archive": _log_buffer.archive.stats() if _log_buffer.archive else None,
+        "filters": {"level": level, "name": name, "since": since, "until": until},
         "entries": entries,
     }
 
@@ -478,37 +594,33 @@ async def _log_sse_generator(
     Supports the same level/name filters as the REST endpoint.
     """
     if _log_buffer is None:
-        yield 'event: error\ndata: {"error": "Log buffer not configured"}\n\n'
+        yield _sse_error("Log buffer not configured")
         return
 
     # Subscribe BEFORE fetching history (same pattern as activity SSE)
     queue = await _log_buffer.subscribe()
 
     try:
-        yield 'event: connected\ndata: {"status": "connected"}\n\n'
+        yield _SSE_CONNECTED
 
         # ── History hydration (last 200 matching entries, oldest first) ──
-        level_num = getattr(logging, level.upper(), None) if level else None
+        level_num = parse_level(level)
         history = _log_buffer.query(level=level, name=name, limit=200)
         for entry in reversed(history):  # oldest first
-            yield f"event: log\ndata: {json.dumps(entry)}\n\n"
+            yield entry.to_sse_frame()
 
-        yield 'event: hydrated\ndata: {"status": "hydrated"}\n\n'
+        yield _SSE_HYDRATED
 
         # ── Live stream ──────────────────────────────────────────────────
         while True:
             try:
                 entry = await asyncio.wait_for(queue.get(), timeout=30.0)
                 # Apply filters to live entries
-                if level_num is not None:
-                    entry_level = getattr(logging, entry.get("level", "DEBUG"), logging.DEBUG)
-                    if entry_level < level_num:
-                        continue
-                if name is not None and not entry.get("name", "").startswith(name):
+                if not entry_matches(entry, level_num=level_num, name=name):
                     continue
-                yield f"event: log\ndata: {json.dumps(entry)}\n\n"
+                yield entry.to_sse_frame()
             except asyncio.TimeoutError:
-                yield "event: heartbeat\ndata: {}\n\n"
+                yield _SSE_HEARTBEAT
             except asyncio.CancelledError:
                 break
     finally:
@@ -558,16 +670,26 @@ async def stream_logs(
 
 
 def _publish_pipeline_event(event_type: str, data: dict) -> None:
-    """Publish a pipeline event to all SSE subscribers."""
+    """Publish a pipeline event to all SSE and WebSocket subscribers.
+
+    The event is encoded once here and the same buffers are queued for
+    every subscriber.  A subscriber that has fallen behind loses its oldest
+    queued event rather than its subscription, so its SSE or WebSocket
+    consumer keeps receiving new events.
+    """
+    if not _pipeline_subscribers:
+        return
     payload = json.dumps({"event_type": event_type, **data})
-    dead: list[asyncio.Queue] = []
+    event = _PipelineEvent(
+        event_type=event_type,
+        data=data,
+        payload=payload,
+        frame=f"event: {event_type}\ndata: {payload}\n\n".encode(),
+    )
     for q in _pipeline_subscribers:
-        try:
-            q.put_nowait({"event_type": event_type, "payload": payload})
-        except asyncio.QueueFull:
-            dead.append(q)
-    for q in dead:
-        _pipeline_subscribers.remove(q)
+        if q.full():
+            q.get_nowait()
+        q.put_nowait(event)
 
 
 def _pipeline_run_to_dict(run) -> dict:
@@ -803,30 +925,30 @@ async def _pipeline_sse_generator():
     Hydrates with current active runs on connect.
     """
     if _pipeline_registry is None:
-        yield 'event: error\ndata: {"error": "Pipeline registry not configured"}\n\n'
+        yield _sse_error("Pipeline registry not configured")
         return
 
-    queue: asyncio.Queue = asyncio.Queue(maxsize=256)
+    queue: asyncio.Queue[_PipelineEvent] = asyncio.Queue(maxsize=256)
     _pipeline_subscribers.append(queue)
 
     try:
-        yield 'event: connected\ndata: {"status": "connected"}\n\n'
+        yield _SSE_CONNECTED
 
         # Hydrate with active pipeline runs
         active_runs = await _pipeline_registry.get_active_pipeline_runs()
         for run in active_runs:
             data = json.dumps(_pipeline_run_to_dict(run))
-            yield f"event: pipeline_run\ndata: {data}\n\n"
+            yield f"event: pipeline_run\ndata: {data}\n\n".encode()
 
-        yield 'event: hydrated\ndata: {"status": "hydrated"}\n\n'
+        yield _SSE_HYDRATED
 
         # Live stream
         while True:
             try:
                 event = await asyncio.wait_for(queue.get(), timeout=30.0)
-                yield f"event: {event['event_type']}\ndata: {event['payload']}\n\n"
+                yield event.frame
             except asyncio.TimeoutError:
-                yield "event: heartbeat\ndata: {}\n\n"
+                yield _SSE_HEARTBEAT
             except asyncio.CancelledError:
                 break
     finally:
@@ -864,3 +986,301 @@ async def stream_pipeline_events(
             "X-Accel-Buffering": "no",
         },
     )
+
+
+# ── Multiplexed WebSocket Stream ─────────────────────────────────────────────
+
+# Seconds between batched frames sent to each WebSocket client
+_WS_TICK = 0.25
+# Queued events per client between ticks; beyond this the oldest are dropped
+_WS_MAX_PENDING = 5000
+_WS_STREAMS = ("activity", "logs", "pipelines")
+
+# Aggregate counters, exposed via /dashboard/status
+_ws_stats: dict[str, int] = {
+    "clients": 0,
+    "subscriptions": 0,
+    "frames_sent": 0,
+    "events_sent": 0,
+    "events_filtered": 0,
+    "events_dropped": 0,
+    "bytes_sent": 0,
+}
+
+
+class _WsClient:
+    """One multiplexed dashboard WebSocket connection.
+
+    Each subscription runs a pump task that reads its source queue, applies
+    the subscription's predicate server-side and appends matching events
+    (as pre-encoded JSON fragments) to a per-client outbox.  The sender
+    flushes the outbox as one batched frame per tick, so a client only pays
+    bandwidth and CPU for the events it actually watches.
+    """
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.ws = websocket
+        self._outbox: deque[str] = deque(maxlen=_WS_MAX_PENDING)
+        self._dropped = 0
+        self._wakeup = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        self._subs: dict[str, asyncio.Task] = {}
+        self._roles: dict[str, str | None] = {}
+
+    # ── Connection loop ──────────────────────────────────────────────────
+
+    async def run(self) -> None:
+        sender = asyncio.create_task(self._send_loop())
+        _ws_stats["clients"] += 1
+        try:
+            while True:
+                try:
+                    raw = await self.ws.receive_text()
+                except WebSocketDisconnect:
+                    break
+                try:
+                    message = json.loads(raw)
+                    if not isinstance(message, dict):
+                        raise ValueError("message must be a JSON object")
+                    await self._handle(message)
+                except ValueError as e:
+                    await self._send_control({"type": "error", "error": str(e)})
+        finally:
+            _ws_stats["clients"] -= 1
+            for sub_id in list(self._subs):
+                await self._unsubscribe(sub_id)
+            sender.cancel()
+            try:
+                await sender
+            except (asyncio.CancelledError, WebSocketDisconnect, RuntimeError):
+                pass
+
+    async def _handle(self, message: dict[str, Any]) -> None:
+        op = message.get("op")
+        sub_id = str(message.get("id") or "")
+        if op == "subscribe":
+            stream = message.get("stream")
+            if stream not in _WS_STREAMS:
+                raise ValueError(f"unknown stream: {stream!r}")
+            if not sub_id:
+                raise ValueError("subscribe requires an id")
+            flt = message.get("filter") or {}
+            if not isinstance(flt, dict):
+                raise ValueError("filter must be an object")
+            await self._subscribe(sub_id, stream, flt, bool(message.get("hydrate", False)))
+            await self._send_control({"type": "subscribed", "id": sub_id, "stream": stream})
+        elif op == "unsubscribe":
+            await self._unsubscribe(sub_id)
+            await self._send_control({"type": "unsubscribed", "id": sub_id})
+        else:
+            raise ValueError(f"unknown op: {op!r}")
+
+    async def _subscribe(self, sub_id: str, stream: str, flt: dict, hydrate: bool) -> None:
+        if sub_id in self._subs:
+            await self._unsubscribe(sub_id)
+        sub_key = json.dumps(sub_id)
+        if stream == "activity":
+            if _activity_logger is None:
+                raise ValueError("activity logger not configured")
+            pump = self._pump_activity(sub_key, flt, hydrate)
+        elif stream == "logs":
+            if _log_buffer is None:
+                raise ValueError("log buffer not configured")
+            pump = self._pump_logs(sub_key, flt, hydrate)
+        else:
+            if _pipeline_registry is None:
+                raise ValueError("pipeline registry not configured")
+            pump = self._pump_pipelines(sub_key, flt, hydrate)
+        self._subs[sub_id] = asyncio.create_task(pump, name=f"dashboard-ws-{stream}")
+        _ws_stats["subscriptions"] += 1
+
+    async def _unsubscribe(self, sub_id: str) -> None:
+        task = self._subs.pop(sub_id, None)
+        if task is None:
+            return
+        _ws_stats["subscriptions"] -= 1
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.exception("Dashboard WebSocket pump failed (sub=%s)", sub_id)
+
+    # ── Outbox / batching ────────────────────────────────────────────────
+
+    def _emit(self, sub_key: str, stream: str, data_json: str) -> None:
+        if len(self._outbox) == self._outbox.maxlen:
+            self._dropped += 1
+            _ws_stats["events_dropped"] += 1
+        self._outbox.append(f'{{"sub":{sub_key},"stream":"{stream}","data":{data_json}}}')
+        self._wakeup.set()
+
+    def _emit_hydrated(self, sub_key: str, stream: str) -> None:
+        """Mark the end of a subscription's history, in order with its events."""
+        self._outbox.append(f'{{"sub":{sub_key},"stream":"{stream}","hydrated":true}}')
+        self._wakeup.set()
+
+    async def _send_loop(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            # Coalesce everything arriving within one tick into a single frame
+            await asyncio.sleep(_WS_TICK)
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._outbox and not self._dropped:
+            return
+        fragments = list(self._outbox)
+        self._outbox.clear()
+        dropped, self._dropped = self._dropped, 0
+        frame = f'{{"type":"batch","dropped":{dropped},"events":[{",".join(fragments)}]}}'
+        async with self._send_lock:
+            await self.ws.send_text(frame)
+        _ws_stats["frames_sent"] += 1
+        _ws_stats["events_sent"] += len(fragments)
+        _ws_stats["bytes_sent"] += len(frame)
+
+    async def _send_control(self, message: dict[str, Any]) -> None:
+        async with self._send_lock:
+            await self.ws.send_text(json.dumps(message))
+
+    # ── Pumps ────────────────────────────────────────────────────────────
+
+    async def _agent_role(self, agent_id: str) -> str | None:
+        if agent_id not in self._roles:
+            record = await _registry.get_agent(agent_id) if _registry else None
+            self._roles[agent_id] = record.role if record else None
+        return self._roles[agent_id]
+
+    async def _pump_activity(self, sub_key: str, flt: dict, hydrate: bool) -> None:
+        agent_id = flt.get("agent_id") or None
+        event_types = set(flt.get("event_types") or ()) or None
+        roles = set(flt.get("roles") or ()) or None
+
+        async def matches(event) -> bool:
+            if event_types is not None and event.event_type.value not in event_types:
+                return False
+            if roles is not None and await self._agent_role(event.agent_id) not in roles:
+                return False
+            return True
+
+        # Per-agent subscriptions use the per-agent queue, so other agents'
+        # events never reach this client at all.
+        queue = await _activity_logger.subscribe(agent_id)
+        try:
+            if hydrate:
+                if agent_id:
+                    history = await _activity_logger.get_agent_activity(
+                        agent_id, limit=_HYDRATION_LIMIT
+                    )
+                else:
+                    history = await _activity_logger.get_recent_activity(limit=_HYDRATION_LIMIT)
+                for event in reversed(history):
+                    if await matches(event):
+                        self._emit(sub_key, "activity", event.to_sse_data())
+                self._emit_hydrated(sub_key, "activity")
+            while True:
+                event = await queue.get()
+                if await matches(event):
+                    self._emit(sub_key, "activity", event.to_sse_data())
+                else:
+                    _ws_stats["events_filtered"] += 1
+        finally:
+            await _activity_logger.unsubscribe(queue, agent_id)
+
+    async def _pump_logs(self, sub_key: str, flt: dict, hydrate: bool) -> None:
+        level = flt.get("level") or None
+        name = flt.get("name") or None
+        level_num = parse_level(level)
+
+        queue = await _log_buffer.subscribe()
+        try:
+            if hydrate:
+                for entry in reversed(_log_buffer.query(level=level, name=name, limit=200)):
+                    self._emit(sub_key, "logs", entry.to_json())
+                self._emit_hydrated(sub_key, "logs")
+            while True:
+                entry = await queue.get()
+                if entry_matches(entry, level_num=level_num, name=name):
+                    self._emit(sub_key, "logs", entry.to_json())
+                else:
+                    _ws_stats["events_filtered"] += 1
+        finally:
+            await _log_buffer.unsubscribe(queue)
+
+    async def _pump_pipelines(self, sub_key: str, flt: dict, hydrate: bool) -> None:
+        event_types = set(flt.get("event_types") or ()) or None
+        run_id = flt.get("run_id") or None
+        pipeline_name = flt.get("pipeline_name") or None
+
+        def matches(event_type: str, data: dict) -> bool:
+            if event_types is not None and event_type not in event_types:
+                return False
+            if run_id is not None and data.get("run_id") != run_id:
+                return False
+            if pipeline_name is not None and data.get("pipeline_name") != pipeline_name:
+                return False
+            return True
+
+        queue: asyncio.Queue[_PipelineEvent] = asyncio.Queue(maxsize=256)
+        _pipeline_subscribers.append(queue)
+        try:
+            if hydrate:
+                for run in await _pipeline_registry.get_active_pipeline_runs():
+                    data = _pipeline_run_to_dict(run)
+                    if matches("pipeline_run", data):
+                        payload = json.dumps({"event_type": "pipeline_run", **data})
+                        self._emit(sub_key, "pipelines", payload)
+                self._emit_hydrated(sub_key, "pipelines")
+            while True:
+                event = await queue.get()
+                if matches(event.event_type, event.data):
+                    self._emit(sub_key, "pipelines", event.payload)
+                else:
+                    _ws_stats["events_filtered"] += 1
+        finally:
+            if queue in _pipeline_subscribers:
+                _pipeline_subscribers.remove(queue)
+
+
+@router.websocket("/ws")
+async def dashboard_websocket(
+    websocket: WebSocket,
+    token: str | None = Query(default=None, description="API key for authentication"),
+):
+    """Multiplexed dashboard stream — one WebSocket per client.
+
+    Client → server messages (JSON)::
+
+        {"op": "subscribe", "id": "a1", "stream": "activity",
+         "filter": {"agent_id": "...", "event_types": [...], "roles": [...]},
+         "hydrate": true}
+        {"op": "subscribe", "id": "l1", "stream": "logs",
+         "filter": {"level": "WARNING", "name": "squadron.agent_manager"}}
+        {"op": "subscribe", "id": "p1", "stream": "pipelines",
+         "filter": {"event_types": [...], "run_id": "...", "pipeline_name": "..."}}
+        {"op": "unsubscribe", "id": "a1"}
+
+    Server → client messages::
+
+        {"type": "subscribed" | "unsubscribed", "id": ...}
+        {"type": "error", "error": "..."}
+        {"type": "batch", "dropped": 0, "events": [{"sub": id, "stream": ..., "data": {...}}]}
+
+    With ``hydrate``, the history is followed by a ``{"sub": id, "stream":
+    ..., "hydrated": true}`` entry (no ``data``) before live events.
+
+    Filters are applied server-side and matching events are batched into
+    one frame per tick.  permessage-deflate is negotiated by uvicorn
+    (disable with ``squadron serve --no-ws-deflate``).
+    """
+    try:
+        validate_sse_token(token)
+    except HTTPException:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    await _WsClient(websocket).run()
@@ -56,6 +56,10 @@ EVENT_MAP: dict[str, SquadronEventType] = {
     "pull_request_review.submitted": SquadronEventType.PR_REVIEW_SUBMITTED,
     "pull_request_review_comment.created": SquadronEventType.PR_REVIEW_COMMENT,
     "push": SquadronEventType.PUSH,
+    "create": SquadronEventType.BRANCH_CREATED,
+    "check_run.completed": SquadronEventType.CHECK_RUN_COMPLETED,
+    "check_suite.completed": SquadronEventType.CHECK_SUITE_COMPLETED,
+    "status": SquadronEventType.COMMIT_STATUS,
 }
 
 # Reverse map: SquadronEventType → GitHub event type string.
@@ -172,6 +176,11 @@ class EventRouter:
         # issue_comment events on PRs have both issue and pull_request
         if event.payload.get("issue", {}).get("pull_request"):
             pr_number = event.payload["issue"]["number"]
+        # CI events list the PRs whose head they ran on (none for fork heads)
+        for key in ("check_run", "check_suite"):
+            prs = (event.payload.get(key) or {}).get("pull_requests") or []
+            if pr_number is None and prs:
+                pr_number = prs[0].get("number")
 
         # Parse @squadron-dev command syntax from comment body
         command: ParsedCommand | None = None
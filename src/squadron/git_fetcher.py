@@ -0,0 +1,192 @@
+"""Git Fetcher — keeps the main clone's ``origin/*`` refs fresh in the background.
+
+Provides:
+- GitFetcher: coalescing ``git fetch --prune origin`` driven by ``push`` /
+  ``create`` webhooks plus a slow periodic fallback, and local ref lookups
+  used at spawn time instead of ``git ls-remote`` round trips.
+
+Design Notes:
+- Fetch requests coalesce: at most one fetch runs at a time, and every
+  request made while it runs is satisfied by a single follow-up fetch.
+  A burst of push webhooks therefore costs two fetches, not N.
+- ``request()`` returns a future for callers that must see refs at least
+  as new as the moment they asked; webhook handlers fire and forget.
+- Spawn-time branch checks read ``refs/remotes/origin/*`` first.  A branch
+  that is known to exist remotely (an open PR's head) but has not been
+  fetched yet awaits one full fetch; any other local miss costs a single
+  targeted ``git fetch origin <branch>`` so a branch pushed since the last
+  fetch is tracked instead of recreated from the default branch.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+if TYPE_CHECKING:
+    from squadron.models import SquadronEvent
+
+logger = logging.getLogger(__name__)
+
+# (cwd, *git_args, timeout=, auth=) → (returncode, stdout, stderr)
+GitRunner = Callable[..., Awaitable[tuple[int, str, str]]]
+
+FETCH_TIMEOUT = 120  # seconds
+
+
+class GitFetcher:
+    """Background, coalescing fetcher for the main repository clone."""
+
+    def __init__(self, repo_root: Path, run_git: GitRunner, interval: float = 600.0) -> None:
+        self.repo_root = repo_root
+        self.interval = interval
+        self._run_git = run_git
+        self._pending: asyncio.Future[bool] | None = None
+        self._fetch_task: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self.last_fetch_time: str | None = None
+        self._stats = {"requests": 0, "fetches": 0, "failures": 0, "branch_fetches": 0}
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        # No fetch here: the startup clone/pull has just refreshed origin/*
+        self._running = True
+        self._task = asyncio.create_task(self._periodic_loop(), name="git-fetcher")
+        logger.info("Git fetcher started (fallback interval=%.0fs)", self.interval)
+
+    async def stop(self) -> None:
+        self._running = False
+        for task in (self._task, self._fetch_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        if self._pending and not self._pending.done():
+            self._pending.set_result(False)
+        logger.info("Git fetcher stopped")
+
+    async def _periodic_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.interval)
+                self.request()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Git fetcher periodic loop error")
+
+    # ── Fetching ─────────────────────────────────────────────────────────
+
+    async def handle_event(self, event: SquadronEvent) -> None:
+        """Router handler for ``push`` / ``create`` webhooks."""
+        self.request()
+
+    def request(self) -> asyncio.Future[bool]:
+        """Ask for a fetch that starts no earlier than now.
+
+        Returns a future resolving to whether that fetch succeeded.
+        """
+        self._stats["requests"] += 1
+        if self._pending is None:
+            self._pending = asyncio.get_running_loop().create_future()
+        future = self._pending
+        if self._running and (self._fetch_task is None or self._fetch_task.done()):
+            self._fetch_task = asyncio.create_task(self._drain(), name="git-fetch")
+        return future
+
+    async def fetch(self) -> bool:
+        """Request a fetch and wait for it (False when the fetcher is stopped)."""
+        if not self._running:
+            return False
+        return await asyncio.shield(self.request())
+
+    async def _drain(self) -> None:
+        while self._pending is not None:
+            future, self._pending = self._pending, None
+            ok = False
+            try:
+                ok = await self._fetch_once()
+            finally:
+                if not future.done():
+                    future.set_result(ok)
+
+    async def _fetch_once(self) -> bool:
+        self._stats["fetches"] += 1
+        try:
+            rc, _, stderr = await self._run_git(
+                self.repo_root,
+                "fetch",
+                "--prune",
+                "--quiet",
+                "origin",
+                timeout=FETCH_TIMEOUT,
+                auth=True,
+            )
+        except Exception:
+            logger.warning("git fetch failed", exc_info=True)
+            rc, stderr = 1, ""
+        if rc != 0:
+            self._stats["failures"] += 1
+            if stderr:
+                logger.warning("git fetch failed: %s", stderr.strip())
+            return False
+        self.last_fetch_time = datetime.now(timezone.utc).isoformat()
+        return True
+
+    async def fetch_branch(self, branch: str) -> bool:
+        """Fetch only ``origin/<branch>``; False if it is missing or the fetch fails."""
+        self._stats["branch_fetches"] += 1
+        try:
+            rc, _, stderr = await self._run_git(
+                self.repo_root,
+                "fetch",
+                "--quiet",
+                "origin",
+                f"+refs/heads/{branch}:refs/remotes/origin/{branch}",
+                timeout=FETCH_TIMEOUT,
+                auth=True,
+            )
+        except Exception:
+            logger.warning("git fetch of %s failed", branch, exc_info=True)
+            return False
+        if rc != 0 and "couldn't find remote ref" not in stderr:
+            logger.warning("git fetch of %s failed: %s", branch, stderr.strip())
+        return rc == 0
+
+    # ── Local ref lookups ────────────────────────────────────────────────
+
+    async def resolve(self, ref: str) -> str | None:
+        """Commit SHA for ``ref`` in the local clone, or None if unknown."""
+        rc, stdout, _ = await self._run_git(
+            self.repo_root, "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}"
+        )
+        return stdout.strip() if rc == 0 else None
+
+    async def has_remote_branch(self, branch: str, expected: bool = False) -> bool:
+        """Whether ``origin/<branch>`` exists, preferring the local ref.
+
+        With ``expected=True`` (the branch is known to exist on GitHub, e.g.
+        an open PR's head) a local miss waits for one fetch and re-checks.
+        Otherwise a miss is confirmed with a targeted fetch of that branch,
+        since the local refs may predate its push.
+        """
+        ref = f"refs/remotes/origin/{branch}"
+        if await self.resolve(ref) is not None:
+            return True
+        if expected:
+            return await self.fetch() and await self.resolve(ref) is not None
+        return await self.fetch_branch(branch)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **self._stats,
+            "in_flight": self._fetch_task is not None and not self._fetch_task.done(),
+            "last_fetch_time": self.last_fetch_time,
+        }
@@ -174,6 +174,14 @@ class GitHubClient:
 
     # ── Rate Limit Tracking ──────────────────────────────────────────────
 
+    def rate_limit_status(self) -> dict[str, int | float]:
+        """Last observed API budget (from response headers)."""
+        return {
+            "remaining": self._rate_limit_remaining,
+            "reset_at": self._rate_limit_reset,
+            "reserve": self._rate_limit_reserve,
+        }
+
     def _update_rate_limit(self, response: httpx.Response) -> None:
         """Track rate limits from response headers."""
         remaining = response.headers.get("X-RateLimit-Remaining")
@@ -349,6 +357,11 @@ class GitHubClient:
         resp = await self._request("GET", f"/repos/{owner}/{repo}/pulls/{pr_number}")
         return resp.json()
 
+    async def list_pull_requests_for_commit(self, owner: str, repo: str, sha: str) -> list[dict]:
+        """List pull requests associated with a commit (open and closed)."""
+        resp = await self._request("GET", f"/repos/{owner}/{repo}/commits/{sha}/pulls")
+        return resp.json()
+
     async def create_pull_request(
         self,
         owner: str,
@@ -0,0 +1,393 @@
+"""On-disk Log Archive — rotated, compressed segments behind the log ring buffer.
+
+Provides:
+- LogArchive: an append-only archive of captured log records, written in the
+  background as gzip-compressed JSONL segments with a sparse time index.
+
+Layout (under ``archive_dir``)::
+
+    segment-000042.log.gz   concatenated gzip members, one per flushed block
+    segment-000042.idx      JSONL, one line per block:
+                            {"first_ts", "last_ts", "offset", "length", "count"}
+
+Design Notes:
+- ``append()`` is called from ``LogBuffer.push`` which may run on any thread,
+  so it only appends to a bounded ``collections.deque`` (thread-safe, no lock).
+  A background asyncio task drains the deque every ``flush_interval`` seconds
+  and writes via ``asyncio.to_thread`` — the event loop never touches disk.
+- Every flushed block is its own gzip member, so a reader can seek straight to
+  a block's byte offset and decompress it in isolation.  The per-block
+  ``first_ts``/``last_ts`` entries form the sparse time index used to skip
+  blocks (and whole segments) outside a requested time range.
+- Segments rotate at ``segment_max_bytes`` (compressed).  Once the archive
+  exceeds ``max_total_bytes`` the oldest segments are deleted, so disk usage
+  stays bounded.  A new segment is always started on process start so a
+  partially written member from a crash is never appended to.
+- Timestamps are the ISO-8601 UTC strings produced by ``_record_to_dict``,
+  which sort lexicographically.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from squadron.log_buffer import LogRecord, entry_matches, parse_level
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_PREFIX = "segment-"
+_SEGMENT_SUFFIX = ".log.gz"
+_INDEX_SUFFIX = ".idx"
+
+
+@dataclass
+class _Block:
+    """Sparse index entry for one gzip member inside a segment."""
+
+    first_ts: str
+    last_ts: str
+    offset: int
+    length: int
+    count: int
+
+
+@dataclass
+class _Segment:
+    """One rotated archive file plus its in-memory block index."""
+
+    seq: int
+    path: Path
+    index_path: Path
+    blocks: list[_Block] = field(default_factory=list)
+    size: int = 0
+
+    @property
+    def first_ts(self) -> str:
+        return min(b.first_ts for b in self.blocks) if self.blocks else ""
+
+    @property
+    def last_ts(self) -> str:
+        return max(b.last_ts for b in self.blocks) if self.blocks else ""
+
+
+class LogArchive:
+    """Background-written, size-bounded on-disk archive of log records.
+
+    Parameters
+    ----------
+    archive_dir:
+        Directory holding segment and index files (created if missing).
+    max_total_bytes:
+        Upper bound on compressed bytes kept on disk (oldest segments are
+        deleted first).  The segment being written is never deleted.
+    segment_max_bytes:
+        Compressed size at which the current segment is closed and a new
+        one started.
+    flush_interval:
+        Seconds between background flushes.
+    block_max_entries:
+        Maximum records per gzip member — bounds how much must be
+        decompressed to serve a time-range seek.
+    max_pending:
+        Bound on records buffered in memory between flushes.  If the disk
+        falls this far behind, the oldest pending records are dropped.
+    """
+
+    def __init__(
+        self,
+        archive_dir: Path,
+        *,
+        max_total_bytes: int = 512 * 1024 * 1024,
+        segment_max_bytes: int = 16 * 1024 * 1024,
+        flush_interval: float = 2.0,
+        block_max_entries: int = 1000,
+        max_pending: int = 100_000,
+    ) -> None:
+        self.archive_dir = Path(archive_dir)
+        self.max_total_bytes = max_total_bytes
+        self.segment_max_bytes = segment_max_bytes
+        self.flush_interval = flush_interval
+        self.block_max_entries = max(1, block_max_entries)
+        self._pending: deque[LogRecord] = deque(maxlen=max_pending)
+        self._segments: list[_Segment] = []
+        self._current: _Segment | None = None
+        # Guards _segments/_current: flushes and queries both run in worker threads.
+        self._lock = threading.Lock()
+        # Serializes writers (background loop vs. final flush on stop).
+        self._write_lock = threading.Lock()
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self._loaded = False
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        """Load the existing index from disk and start the background flusher."""
+        await asyncio.to_thread(self.load)
+        self._running = True
+        self._task = asyncio.create_task(self._flush_loop(), name="log-archive-flush")
+        logger.info(
+            "Log archive started (dir=%s, segments=%d, max=%d MB)",
+            self.archive_dir,
+            len(self._segments),
+            self.max_total_bytes // (1024 * 1024),
+        )
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write out anything still pending."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await asyncio.to_thread(self.flush)
+        logger.info("Log archive stopped")
+
+    def load(self) -> None:
+        """Scan ``archive_dir`` and rebuild the in-memory segment index.
+
+        Index lines pointing past the end of their segment (a crash between
+        the data write and the index write) are discarded.
+        """
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        segments: list[_Segment] = []
+        for path in sorted(self.archive_dir.glob(f"{_SEGMENT_PREFIX}*{_SEGMENT_SUFFIX}")):
+            seq_str = path.name[len(_SEGMENT_PREFIX) : -len(_SEGMENT_SUFFIX)]
+            if not seq_str.isdigit():
+                continue
+            seg = _Segment(
+                seq=int(seq_str),
+                path=path,
+                index_path=path.with_name(f"{_SEGMENT_PREFIX}{seq_str}{_INDEX_SUFFIX}"),
+            )
+            try:
+                seg.size = path.stat().st_size
+            except OSError:
+                continue
+            seg.blocks = self._read_index(seg.index_path, seg.size)
+            segments.append(seg)
+        segments.sort(key=lambda s: s.seq)
+        with self._lock:
+            self._segments = segments
+            self._current = None
+        self._loaded = True
+
+    @staticmethod
+    def _read_index(index_path: Path, data_size: int) -> list[_Block]:
+        blocks: list[_Block] = []
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        raw = json.loads(line)
+                        block = _Block(
+                            first_ts=raw["first_ts"],
+                            last_ts=raw["last_ts"],
+                            offset=int(raw["offset"]),
+                            length=int(raw["length"]),
+                            count=int(raw["count"]),
+                        )
+                    except (ValueError, KeyError, TypeError):
+                        continue
+                    if block.offset + block.length <= data_size:
+                        blocks.append(block)
+        except OSError:
+            pass
+        return blocks
+
+    # ── Write path ───────────────────────────────────────────────────────
+
+    def append(self, entry: LogRecord) -> None:
+        """Queue a record for the next background flush (any thread)."""
+        self._pending.append(entry)
+
+    async def _flush_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.flush_interval)
+                await asyncio.to_thread(self.flush)
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Log archive flush failed")
+
+    def flush(self) -> int:
+        """Write all pending records to disk. Returns the number written.
+
+        Blocking — call via ``asyncio.to_thread`` from async code.
+        """
+        with self._write_lock:
+            if not self._loaded:
+                self.load()
+            batch: list[LogRecord] = []
+            while True:
+                try:
+                    batch.append(self._pending.popleft())
+                except IndexError:
+                    break
+            if not batch:
+                return 0
+            for i in range(0, len(batch), self.block_max_entries):
+                self._write_block(batch[i : i + self.block_max_entries])
+            self._enforce_retention()
+            return len(batch)
+
+    def _write_block(self, block: list[LogRecord]) -> None:
+        seg = self._writable_segment()
+        payload = "".join(
+            json.dumps(entry, separators=(",", ":"), default=str) + "\n" for entry in block
+        )
+        data = gzip.compress(payload.encode("utf-8"), compresslevel=6)
+        timestamps = [str(entry.get("timestamp") or "") for entry in block]
+
+        with open(seg.path, "ab") as f:
+            f.seek(0, os.SEEK_END)
+            offset = f.tell()
+            f.write(data)
+        index_entry = _Block(
+            first_ts=min(timestamps),
+            last_ts=max(timestamps),
+            offset=offset,
+            length=len(data),
+            count=len(block),
+        )
+        with open(seg.index_path, "a", encoding="utf-8") as f:
+            f.write(
+                json.dumps(
+                    {
+                        "first_ts": index_entry.first_ts,
+                        "last_ts": index_entry.last_ts,
+                        "offset": index_entry.offset,
+                        "length": index_entry.length,
+                        "count": index_entry.count,
+                    }
+                )
+                + "\n"
+            )
+        with self._lock:
+            seg.blocks.append(index_entry)
+            seg.size = offset + len(data)
+
+    def _writable_segment(self) -> _Segment:
+        """Return the segment to append to, rotating when it is full."""
+        with self._lock:
+            current = self._current
+            if current is not None and current.size < self.segment_max_bytes:
+                return current
+            seq = (self._segments[-1].seq + 1) if self._segments else 1
+            name = f"{_SEGMENT_PREFIX}{seq:06d}"
+            seg = _Segment(
+                seq=seq,
+                path=self.archive_dir / f"{name}{_SEGMENT_SUFFIX}",
+                index_path=self.archive_dir / f"{name}{_INDEX_SUFFIX}",
+            )
+            self._segments.append(seg)
+            self._current = seg
+            return seg
+
+    def _enforce_retention(self) -> None:
+        """Delete the oldest closed segments until under ``max_total_bytes``."""
+        with self._lock:
+            doomed: list[_Segment] = []
+            total = sum(s.size for s in self._segments)
+            while total > self.max_total_bytes and len(self._segments) > 1:
+                oldest = self._segments[0]
+                if oldest is self._current:
+                    break
+                self._segments.pop(0)
+                total -= oldest.size
+                doomed.append(oldest)
+        for seg in doomed:
+            for path in (seg.path, seg.index_path):
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    logger.warning("Failed to delete log archive file %s", path)
+            logger.debug("Log archive retention removed %s", seg.path.name)
+
+    # ── Query path ───────────────────────────────────────────────────────
+
+    def query(
+        self,
+        *,
+        level: str | None = None,
+        name: str | None = None,
+        limit: int = 500,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[LogRecord]:
+        """Return matching archived records, newest first.
+
+        ``since`` is inclusive and ``until`` exclusive (ISO-8601 strings).
+        Only blocks whose indexed time span overlaps the range are read.
+
+        Blocking — call via ``asyncio.to_thread`` from async code.
+        """
+        level_num = parse_level(level)
+        with self._lock:
+            snapshot = [(seg.path, list(seg.blocks)) for seg in reversed(self._segments)]
+
+        results: list[LogRecord] = []
+        for path, blocks in snapshot:
+            for block in reversed(blocks):
+                if until is not None and block.first_ts >= until:
+                    continue
+                if since is not None and block.last_ts < since:
+                    continue
+                for entry in reversed(self._read_block(path, block)):
+                    if not entry_matches(
+                        entry, level_num=level_num, name=name, since=since, until=until
+                    ):
+                        continue
+                    results.append(entry)
+                    if len(results) >= limit:
+                        return results
+        return results
+
+    @staticmethod
+    def _read_block(path: Path, block: _Block) -> list[LogRecord]:
+        try:
+            with open(path, "rb") as f:
+                f.seek(block.offset)
+                data = f.read(block.length)
+            text = gzip.decompress(data).decode("utf-8")
+        except (OSError, EOFError, gzip.BadGzipFile):
+            # Segment rotated away mid-query or torn write — skip the block
+            return []
+        entries: list[LogRecord] = []
+        for line in text.splitlines():
+            try:
+                entries.append(LogRecord(json.loads(line)))
+            except ValueError:
+                continue
+        return entries
+
+    # ── Introspection ────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, object]:
+        """Segment count, disk usage and covered time span."""
+        with self._lock:
+            segments = list(self._segments)
+        populated = [s for s in segments if s.blocks]
+        return {
+            "segments": len(segments),
+            "disk_bytes": sum(s.size for s in segments),
+            "max_disk_bytes": self.max_total_bytes,
+            "entries": sum(b.count for s in segments for b in s.blocks),
+            "pending": len(self._pending),
+            "oldest_timestamp": populated[0].first_ts if populated else None,
+            "newest_timestamp": populated[-1].last_ts if populated else None,
+        }
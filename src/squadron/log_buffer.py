@@ -8,7 +8,10 @@ Provides:
 
 Design Notes:
 - Ring buffer is fixed at ``maxlen`` entries (default 20,000). Oldest entries
-  are silently discarded when the buffer is full — no disk I/O.
+  are discarded when the buffer is full.  When a ``LogArchive`` is attached,
+  every entry is also handed to it and written to disk in the background, and
+  ``search()`` transparently continues into the archive once the ring is
+  exhausted.
 - Each captured record is stored as a structured dict for JSON serialization.
 - Pub/sub uses the same asyncio.Queue pattern as ActivityLogger._subscribers
   so the SSE log stream works identically to the activity stream.
@@ -17,9 +20,15 @@ Design Notes:
 from __future__ import annotations
 
 import asyncio
+import itertools
+import json
 import logging
-from collections import deque
-from datetime import datetime, timezone
+from collections import Counter, deque
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from squadron.log_archive import LogArchive
 
 
 class LogRecord(dict):
@@ -28,7 +37,20 @@ class LogRecord(dict):
     Keys: timestamp, level, name, message, agent_id (optional).
     """
 
-    pass
+    _json: str | None = None
+    _sse_frame: bytes | None = None
+
+    def to_json(self) -> str:
+        """JSON encoding of the record, built once and cached."""
+        if self._json is None:
+            self._json = json.dumps(self)
+        return self._json
+
+    def to_sse_frame(self) -> bytes:
+        """Complete ``event: log`` SSE frame as bytes, encoded once and cached."""
+        if self._sse_frame is None:
+            self._sse_frame = f"event: log\ndata: {self.to_json()}\n\n".encode()
+        return self._sse_frame
 
 
 def _extract_agent_id(record: logging.LogRecord) -> str | None:
@@ -52,6 +74,68 @@ def _record_to_dict(record: logging.LogRecord) -> LogRecord:
     )
 
 
+def parse_level(level: str | None) -> int | None:
+    """Resolve a level name (e.g. ``"warning"``) to its numeric value."""
+    return getattr(logging, level.upper(), None) if level else None
+
+
+def normalize_timestamp(value: str | None) -> str | None:
+    """Normalize an ISO-8601 time bound to the stored timestamp format.
+
+    Stored timestamps are UTC ``datetime.isoformat()`` strings ending in
+    ``+00:00``, so bounds are compared as strings only after being parsed
+    and re-rendered the same way. A trailing ``Z`` is accepted and naive
+    values are taken as UTC. Raises ``ValueError`` for anything else.
+    """
+    if value is None:
+        return None
+    text = value.strip()
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    parsed = datetime.fromisoformat(text)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).isoformat()
+
+
+def _just_after(timestamp: str) -> str:
+    """The next representable normalized timestamp (an inclusive bound as exclusive)."""
+    try:
+        moment = datetime.fromisoformat(timestamp)
+    except ValueError:
+        return timestamp
+    return (moment + timedelta(microseconds=1)).isoformat()
+
+
+def entry_matches(
+    entry: LogRecord,
+    *,
+    level_num: int | None = None,
+    name: str | None = None,
+    since: str | None = None,
+    until: str | None = None,
+) -> bool:
+    """Apply the shared level / logger-name / time-range filters to an entry.
+
+    ``since`` is inclusive and ``until`` exclusive; both must already be
+    normalized (see ``normalize_timestamp``) so that they sort
+    chronologically against the stored timestamps.
+    """
+    if level_num is not None:
+        entry_level = getattr(logging, entry.get("level", "DEBUG"), logging.DEBUG)
+        if entry_level < level_num:
+            return False
+    if name is not None and not entry.get("name", "").startswith(name):
+        return False
+    if since is not None or until is not None:
+        ts = entry.get("timestamp") or ""
+        if since is not None and ts < since:
+            return False
+        if until is not None and ts >= until:
+            return False
+    return True
+
+
 class RingBufferHandler(logging.Handler):
     """A logging.Handler that pushes records into a LogBuffer ring buffer.
 
@@ -91,6 +175,21 @@ class LogBuffer:
         # thread (e.g. logging calls from SDK background threads).  Lazily
         # captured on first call to ``attach_loop`` or ``push``.
         self._loop: asyncio.AbstractEventLoop | None = None
+        # Optional on-disk archive that receives every entry (write-behind).
+        self._archive: LogArchive | None = None
+
+    def attach_archive(self, archive: "LogArchive") -> None:
+        """Attach an on-disk archive so history survives ring eviction.
+
+        Called from ``server.py`` during startup once the data directory is
+        known.  Entries pushed before this call are not archived.
+        """
+        self._archive = archive
+
+    @property
+    def archive(self) -> "LogArchive | None":
+        """The attached on-disk archive, if any."""
+        return self._archive
 
     def attach_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """Explicitly set the event loop used for broadcast scheduling.
@@ -116,6 +215,8 @@ class LogBuffer:
         if ``attach_loop`` was not called.
         """
         self._buffer.append(entry)
+        if self._archive is not None:
+            self._archive.append(entry)
         # Fire-and-forget broadcast to SSE subscribers
         loop = self._loop
         if loop is None:
@@ -131,14 +232,16 @@ class LogBuffer:
 
     def _sync_broadcast(self, entry: LogRecord) -> None:
         """Non-async broadcast called via call_soon_threadsafe."""
-        dead: list[asyncio.Queue[LogRecord]] = []
+        if not self._subscribers:
+            return
+        # Serialize once up front; every subscriber shares the frame
+        entry.to_sse_frame()
+        # A subscriber that has fallen behind loses its oldest queued entry
+        # rather than its subscription (its stream is still waiting on it)
         for queue in self._subscribers:
-            try:
-                queue.put_nowait(entry)
-            except asyncio.QueueFull:
-                dead.append(queue)
-        for q in dead:
-            self._subscribers.remove(q)
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(entry)
 
     # ── Query path (called from dashboard REST endpoint) ─────────────────
 
@@ -148,6 +251,8 @@ class LogBuffer:
         level: str | None = None,
         name: str | None = None,
         limit: int = 500,
+        since: str | None = None,
+        until: str | None = None,
     ) -> list[LogRecord]:
         """Return matching log entries from the ring buffer (newest first).
 
@@ -161,17 +266,71 @@ class LogBuffer:
             Uses startswith matching.
         limit:
             Maximum number of entries to return (default 500).
+        since, until:
+            Optional ISO-8601 time range (``since`` inclusive, ``until``
+            exclusive). Raises ``ValueError`` if either is not ISO-8601.
         """
-        level_num = getattr(logging, level.upper(), None) if level else None
+        level_num = parse_level(level)
+        since, until = normalize_timestamp(since), normalize_timestamp(until)
 
         results: list[LogRecord] = []
         # Iterate newest-first
         for entry in reversed(self._buffer):
-            if level_num is not None:
-                entry_level = getattr(logging, entry.get("level", "DEBUG"), logging.DEBUG)
-                if entry_level < level_num:
-                    continue
-            if name is not None and not entry.get("name", "").startswith(name):
+            if not entry_matches(entry, level_num=level_num, name=name, since=since, until=until):
+                continue
+            results.append(entry)
+            if len(results) >= limit:
+                break
+        return results
+
+    async def search(
+        self,
+        *,
+        level: str | None = None,
+        name: str | None = None,
+        limit: int = 500,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[LogRecord]:
+        """Query the ring buffer, then the on-disk archive for older entries.
+
+        The archive also holds everything currently in the ring. Its part of
+        the query therefore ends at the oldest ring timestamp, inclusively so
+        that evicted entries sharing that timestamp are not lost, and the
+        entries still in the ring at that timestamp are dropped from it.
+        Archive reads run in a worker thread.
+        Raises ``ValueError`` if ``since`` or ``until`` is not ISO-8601.
+        """
+        since, until = normalize_timestamp(since), normalize_timestamp(until)
+        results = self.query(level=level, name=name, limit=limit, since=since, until=until)
+        if self._archive is None or len(results) >= limit:
+            return results
+
+        archive_until = until
+        in_ring: Counter[str] = Counter()
+        if self._buffer:
+            oldest_in_ring = self._buffer[0].get("timestamp") or ""
+            boundary = _just_after(oldest_in_ring)
+            if archive_until is None or boundary < archive_until:
+                archive_until = boundary
+                in_ring.update(
+                    entry.to_json()
+                    for entry in itertools.takewhile(
+                        lambda e: e.get("timestamp") == oldest_in_ring, self._buffer
+                    )
+                )
+
+        older = await asyncio.to_thread(
+            self._archive.query,
+            level=level,
+            name=name,
+            limit=limit - len(results) + in_ring.total(),
+            since=since,
+            until=archive_until,
+        )
+        for entry in older:
+            if in_ring[entry.to_json()] > 0:
+                in_ring[entry.to_json()] -= 1
                 continue
             results.append(entry)
             if len(results) >= limit:
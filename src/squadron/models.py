@@ -216,6 +216,10 @@ class SquadronEventType(str, enum.Enum):
     PR_REVIEW_COMMENT = "pr.review_comment"  # Inline comment on PR diff
     PR_SYNCHRONIZED = "pr.synchronized"
     PUSH = "push"
+    BRANCH_CREATED = "branch.created"
+    CHECK_RUN_COMPLETED = "ci.check_run_completed"
+    CHECK_SUITE_COMPLETED = "ci.check_suite_completed"
+    COMMIT_STATUS = "ci.status"
 
     # Framework-internal
     AGENT_BLOCKED = "agent.blocked"
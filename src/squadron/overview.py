@@ -0,0 +1,247 @@
+"""Dashboard Overview — incrementally maintained in-memory status snapshot.
+
+Provides:
+- DashboardOverview: agent counts by status and role, active pipeline runs
+  and operational gauges (agent semaphore, event queue, GitHub API budget,
+  resource usage), kept current by change notifications instead of being
+  recomputed from SQLite on every dashboard poll.
+
+Design Notes:
+- ``AgentRegistry`` and ``PipelineRegistry`` listeners call
+  ``agent_changed`` / ``pipeline_changed`` after each write (with ``None``
+  for a deletion), so the counters move in O(1) per state transition.
+- Gauges are cheap attribute reads registered with ``add_gauge``.  A
+  background loop samples them every ``interval`` seconds and only bumps
+  the version when a value actually changed.
+- Every change increments ``version``.  ``snapshot()`` rebuilds its dict at
+  most once per version, so serving it is O(1); ``wait_for_change`` lets
+  clients long-poll for the next version.
+- ``agents.version`` is the version of the last agent status/role change,
+  so a client holding a per-agent list refetches it only when that moves,
+  not on every gauge tick.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable
+
+from squadron.models import AgentRecord, AgentStatus
+
+if TYPE_CHECKING:
+    from squadron.pipeline.models import PipelineRun
+    from squadron.pipeline.registry import PipelineRegistry
+    from squadron.registry import AgentRegistry
+
+logger = logging.getLogger(__name__)
+
+# Statuses counted as "live" for the per-role breakdown
+_LIVE_STATUSES = frozenset({AgentStatus.CREATED, AgentStatus.ACTIVE, AgentStatus.SLEEPING})
+_ACTIVE_PIPELINE_STATUSES = frozenset({"pending", "running"})
+
+
+class DashboardOverview:
+    """In-memory overview model served to dashboard pollers."""
+
+    def __init__(self, interval: float = 5.0) -> None:
+        self.interval = interval
+        self._version = 0
+        self._changed = asyncio.Condition()
+        self._notify_task: asyncio.Task | None = None
+        # agent_id → (role, status)
+        self._agents: dict[str, tuple[str, AgentStatus]] = {}
+        self._by_status: Counter[str] = Counter()
+        self._by_role: Counter[str] = Counter()
+        # Overview version of the last agent change (clients refetch lists on it)
+        self._agents_version = 0
+        # run_id → summary, pending/running runs only
+        self._pipelines: dict[str, dict[str, Any]] = {}
+        self._gauges: dict[str, Any] = {}
+        self._samplers: dict[str, Callable[[], Any]] = {}
+        self._updated_at: str | None = None
+        self._snapshot: dict[str, Any] | None = None
+        self._task: asyncio.Task | None = None
+        self._running = False
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def load(
+        self,
+        registry: "AgentRegistry | None" = None,
+        pipeline_registry: "PipelineRegistry | None" = None,
+    ) -> None:
+        """Seed the model from the registries (once, at startup)."""
+        if registry is not None:
+            for status in AgentStatus:
+                for record in await registry.get_agents_by_status(status):
+                    self._apply_agent(record.agent_id, record)
+        if pipeline_registry is not None:
+            for run in await pipeline_registry.get_active_pipeline_runs():
+                self._apply_pipeline(run)
+        self._sample_gauges()
+        self._bump()
+
+    async def start(self) -> None:
+        self._running = True
+        self._task = asyncio.create_task(self._sample_loop(), name="dashboard-overview")
+        logger.info("Dashboard overview started (interval=%.1fs)", self.interval)
+
+    async def stop(self) -> None:
+        self._running = False
+        for task in (self._task, self._notify_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        logger.info("Dashboard overview stopped")
+
+    async def _sample_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.interval)
+                if self._sample_gauges():
+                    self._bump()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Dashboard overview sampling error")
+
+    # ── Change notifications ─────────────────────────────────────────────
+
+    def agent_changed(self, agent_id: str, record: AgentRecord | None) -> None:
+        """Registry listener — ``record`` is None when the agent was deleted."""
+        if self._apply_agent(agent_id, record):
+            self._bump()
+            self._agents_version = self._version
+
+    def pipeline_changed(self, run_id: str, run: "PipelineRun | None") -> None:
+        """Pipeline registry listener — ``run`` is None when the run was deleted."""
+        if run is None:
+            changed = self._pipelines.pop(run_id, None) is not None
+        else:
+            changed = self._apply_pipeline(run)
+        if changed:
+            self._bump()
+
+    def add_gauge(self, name: str, sampler: Callable[[], Any]) -> None:
+        """Register a cheap, synchronous gauge sampled every ``interval`` seconds."""
+        self._samplers[name] = sampler
+        self._gauges[name] = self._safe_sample(name, sampler)
+        self._bump()
+
+    def _apply_agent(self, agent_id: str, record: AgentRecord | None) -> bool:
+        previous = self._agents.get(agent_id)
+        current = (record.role, record.status) if record is not None else None
+        if previous == current:
+            return False
+        if previous is not None:
+            role, status = previous
+            self._by_status[status.value] -= 1
+            if status in _LIVE_STATUSES:
+                self._by_role[role] -= 1
+        if current is not None:
+            role, status = current
+            self._agents[agent_id] = current
+            self._by_status[status.value] += 1
+            if status in _LIVE_STATUSES:
+                self._by_role[role] += 1
+        else:
+            self._agents.pop(agent_id, None)
+        return True
+
+    def _apply_pipeline(self, run: "PipelineRun") -> bool:
+        if run.status.value not in _ACTIVE_PIPELINE_STATUSES:
+            return self._pipelines.pop(run.run_id, None) is not None
+        summary = {
+            "run_id": run.run_id,
+            "pipeline_name": run.pipeline_name,
+            "status": run.status.value,
+            "current_stage_id": run.current_stage_id,
+            "issue_number": run.issue_number,
+            "pr_number": run.pr_number,
+        }
+        if self._pipelines.get(run.run_id) == summary:
+            return False
+        self._pipelines[run.run_id] = summary
+        return True
+
+    def _sample_gauges(self) -> bool:
+        changed = False
+        for name, sampler in self._samplers.items():
+            value = self._safe_sample(name, sampler)
+            if self._gauges.get(name) != value:
+                self._gauges[name] = value
+                changed = True
+        return changed
+
+    @staticmethod
+    def _safe_sample(name: str, sampler: Callable[[], Any]) -> Any:
+        try:
+            return sampler()
+        except Exception:
+            logger.debug("Overview gauge %s failed", name, exc_info=True)
+            return None
+
+    def _bump(self) -> None:
+        self._version += 1
+        self._snapshot = None
+        self._updated_at = datetime.now(timezone.utc).isoformat()
+        # Wake long-pollers.  Notification needs the condition's lock, so it
+        # is scheduled rather than done inline (callers are synchronous).
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._notify_task is None or self._notify_task.done():
+            self._notify_task = loop.create_task(self._notify_waiters())
+
+    async def _notify_waiters(self) -> None:
+        async with self._changed:
+            self._changed.notify_all()
+
+    # ── Read path ────────────────────────────────────────────────────────
+
+    def snapshot(self) -> dict[str, Any]:
+        """The current overview; rebuilt at most once per version."""
+        if self._snapshot is None:
+            self._snapshot = {
+                "version": self._version,
+                "updated_at": self._updated_at,
+                "agents": {
+                    "version": self._agents_version,
+                    "total": len(self._agents),
+                    "by_status": {k: v for k, v in self._by_status.items() if v},
+                    "by_role": {k: v for k, v in self._by_role.items() if v},
+                },
+                "pipelines": {
+                    "active_count": len(self._pipelines),
+                    "active": list(self._pipelines.values()),
+                },
+                **{name: value for name, value in self._gauges.items()},
+            }
+        return self._snapshot
+
+    async def wait_for_change(self, since_version: int, timeout: float) -> dict[str, Any]:
+        """Return the snapshot once ``version`` exceeds ``since_version``.
+
+        Returns the current snapshot after ``timeout`` seconds regardless.
+        """
+        if self._version <= since_version:
+            try:
+                async with self._changed:
+                    await asyncio.wait_for(
+                        self._changed.wait_for(lambda: self._version > since_version),
+                        timeout=timeout,
+                    )
+            except asyncio.TimeoutError:
+                pass
+        return self.snapshot()
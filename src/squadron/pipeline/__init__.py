@@ -6,11 +6,17 @@ and Workflow Engine v2. See docs/design/unified-pipeline-system.md.
 Key exports:
     PipelineEngine — Core execution engine
     PipelineRegistry — SQLite persistence
+    StageWorkerPool — Per-run serialized stage execution off the routing path
+    DefinitionCache — Parsed run definition snapshots
     GateCheckRegistry — Pluggable gate condition checks
     PipelineDefinition — Pipeline config model
     PipelineRun, StageRun — Runtime state models
 """
 
+from squadron.pipeline.active_index import ActiveRunIndex
+from squadron.pipeline.commands import CommandExecutor
+from squadron.pipeline.compiled import CompiledPipeline, DefinitionCache
+from squadron.pipeline.gate_cache import GateResultCache
 from squadron.pipeline.engine import (
     ActionCallback,
     NotifyCallback,
@@ -25,6 +31,7 @@ from squadron.pipeline.gates import (
     GateCheck,
     GateCheckRegistry,
     GateCheckResult,
+    GateFetchContext,
     HumanApprovedCheck,
     LabelPresentCheck,
     NoChangesRequestedCheck,
@@ -43,6 +50,7 @@ from squadron.pipeline.models import (
     HumanWaitType,
     JoinStrategy,
     ParallelBranch,
+    ParallelCounters,
     PipelineDefinition,
     PipelineRun,
     PipelineRunStatus,
@@ -57,6 +65,8 @@ from squadron.pipeline.models import (
     WebhookRequestConfig,
 )
 from squadron.pipeline.registry import PipelineRegistry
+from squadron.pipeline.trigger_index import TriggerIndex
+from squadron.pipeline.workers import StageWorkerPool
 
 __all__ = [
     # Engine
@@ -66,10 +76,20 @@ __all__ = [
     "NotifyCallback",
     # Registry
     "PipelineRegistry",
+    # Compiled definitions
+    "CompiledPipeline",
+    "DefinitionCache",
+    "TriggerIndex",
+    "ActiveRunIndex",
+    # Stage execution
+    "StageWorkerPool",
+    "CommandExecutor",
     # Gates
     "GateCheck",
     "GateCheckRegistry",
     "GateCheckResult",
+    "GateFetchContext",
+    "GateResultCache",
     "PipelineContext",
     "BranchUpToDateCheck",
     "CiStatusCheck",
@@ -99,6 +119,7 @@ __all__ = [
     "PipelineRunStatus",
     "PipelineScope",
     "StageRun",
+    "ParallelCounters",
     "StageRunStatus",
     "GateCheckRecord",
     "HumanStageState",
@@ -0,0 +1,204 @@
+"""Active run index — in-memory lookup of pending/running pipeline runs.
+
+Reactive webhooks used to cost a PR query, a PR-association join and an
+issue query before the engine could even tell whether any waiting stage
+cared about the event. The index answers "which active runs for this PR or
+issue react to this event type?" from memory, so an irrelevant event costs
+no queries at all.
+
+Key exports:
+    ActiveRunIndex — Active runs keyed by PR (direct and associated), issue
+        and the event types their current stage reacts to.
+
+Design Notes:
+- Kept coherent by ``PipelineRegistry`` listeners: every run write passes
+  the new run state, and ``add_pr_association`` reports multi-PR links.
+- A run's event types are its ``on_events`` keys plus those of its current
+  stage (gate condition checks, human wait type), taken from the compiled
+  definition, so they change whenever a stage transition is persisted.
+- The index only narrows the candidates. The engine re-reads each candidate
+  run before acting on it, so a stale entry costs a query, never a wrong action.
+- Seeded once from the registry; writes seen while seeding win over the
+  (older) seeded rows.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from squadron.pipeline.compiled import DefinitionCache
+from squadron.pipeline.models import PipelineRun, PipelineRunStatus
+
+logger = logging.getLogger("squadron.pipeline.active_index")
+
+_ACTIVE_STATUSES = frozenset({PipelineRunStatus.PENDING, PipelineRunStatus.RUNNING})
+
+
+@dataclass(frozen=True)
+class _ActiveRun:
+    seq: int
+    pipeline_name: str
+    status: PipelineRunStatus
+    pr_number: int | None
+    issue_number: int | None
+    events: frozenset[str]
+
+
+class ActiveRunIndex:
+    """Pending/running runs by PR, issue and reactive event type."""
+
+    def __init__(self, definitions: DefinitionCache) -> None:
+        self._definitions = definitions
+        self._runs: dict[str, _ActiveRun] = {}
+        self._by_pr: dict[int, set[str]] = {}
+        self._by_issue: dict[int, set[str]] = {}
+        self._by_event: dict[str, set[str]] = {}
+        # run_id → PRs linked via pipeline_pr_associations
+        self._associations: dict[str, set[int]] = {}
+        self._seq = itertools.count()
+        self._loaded = False
+        # Runs written while seeding (their listener state is newer)
+        self._touched: set[str] | None = None
+        self._stats = {"lookups": 0, "skipped": 0}
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    # ── Seeding ──────────────────────────────────────────────────────────
+
+    def begin_load(self) -> None:
+        """Start recording writes that must win over the rows being seeded."""
+        self._touched = set()
+
+    def load(self, runs: Iterable[PipelineRun], associations: Iterable[tuple[str, int]]) -> None:
+        """Seed from the registry's active runs and their PR associations."""
+        touched = self._touched or set()
+        for run in runs:
+            if run.run_id not in touched:
+                self._apply(run.run_id, run)
+        for run_id, pr_number in associations:
+            if run_id in self._runs:
+                self._associate(run_id, pr_number)
+        self._touched = None
+        self._loaded = True
+        logger.info("Active pipeline run index loaded (%d runs)", len(self._runs))
+
+    # ── Registry listeners ───────────────────────────────────────────────
+
+    def run_changed(self, run_id: str, run: PipelineRun | None) -> None:
+        """Pipeline registry listener — ``run`` is None when the run was deleted."""
+        if self._touched is not None:
+            self._touched.add(run_id)
+        self._apply(run_id, run)
+
+    def pr_associated(self, run_id: str, pr_number: int) -> None:
+        """PR association listener for multi-PR pipelines."""
+        if run_id in self._runs:
+            self._associate(run_id, pr_number)
+
+    # ── Lookups ──────────────────────────────────────────────────────────
+
+    def pipeline_names_for_pr(self, pr_number: int) -> set[str]:
+        """Names of pipelines with an active run for a PR (direct or associated)."""
+        return {self._runs[run_id].pipeline_name for run_id in self._by_pr.get(pr_number, ())}
+
+    def has_listeners(self, event_type: str) -> bool:
+        """Whether any active run currently reacts to ``event_type``."""
+        return bool(self._by_event.get(event_type))
+
+    def lookup(
+        self,
+        event_type: str,
+        *,
+        pr_number: int | None = None,
+        issue_number: int | None = None,
+    ) -> list[str]:
+        """Active runs for the PR/issue whose current stage reacts to ``event_type``.
+
+        Matches the routing rules: any active run for the PR, but only
+        running runs for the issue. Returned oldest first.
+        """
+        self._stats["lookups"] += 1
+        reacting = self._by_event.get(event_type)
+        if not reacting:
+            self._stats["skipped"] += 1
+            return []
+        hits: set[str] = set()
+        if pr_number:
+            hits |= self._by_pr.get(pr_number, set()) & reacting
+        if issue_number:
+            hits |= {
+                run_id
+                for run_id in self._by_issue.get(issue_number, set()) & reacting
+                if self._runs[run_id].status == PipelineRunStatus.RUNNING
+            }
+        if not hits:
+            self._stats["skipped"] += 1
+        return sorted(hits, key=lambda run_id: self._runs[run_id].seq)
+
+    def stats(self) -> dict[str, Any]:
+        return {"active_runs": len(self._runs), "event_types": len(self._by_event), **self._stats}
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    def _apply(self, run_id: str, run: PipelineRun | None) -> None:
+        previous = self._runs.pop(run_id, None)
+        if previous is not None:
+            self._unlink(run_id, previous)
+        if run is None or run.status not in _ACTIVE_STATUSES:
+            self._associations.pop(run_id, None)
+            return
+        entry = _ActiveRun(
+            seq=previous.seq if previous else next(self._seq),
+            pipeline_name=run.pipeline_name,
+            status=run.status,
+            pr_number=run.pr_number,
+            issue_number=run.issue_number,
+            events=self._reactive_events(run),
+        )
+        self._runs[run_id] = entry
+        if entry.pr_number:
+            self._by_pr.setdefault(entry.pr_number, set()).add(run_id)
+        for pr_number in self._associations.get(run_id, ()):
+            self._by_pr.setdefault(pr_number, set()).add(run_id)
+        if entry.issue_number:
+            self._by_issue.setdefault(entry.issue_number, set()).add(run_id)
+        for event_type in entry.events:
+            self._by_event.setdefault(event_type, set()).add(run_id)
+
+    def _associate(self, run_id: str, pr_number: int) -> None:
+        self._associations.setdefault(run_id, set()).add(pr_number)
+        self._by_pr.setdefault(pr_number, set()).add(run_id)
+
+    def _unlink(self, run_id: str, entry: _ActiveRun) -> None:
+        prs = set(self._associations.get(run_id, ()))
+        if entry.pr_number:
+            prs.add(entry.pr_number)
+        for pr_number in prs:
+            _discard(self._by_pr, pr_number, run_id)
+        if entry.issue_number:
+            _discard(self._by_issue, entry.issue_number, run_id)
+        for event_type in entry.events:
+            _discard(self._by_event, event_type, run_id)
+
+    def _reactive_events(self, run: PipelineRun) -> frozenset[str]:
+        try:
+            compiled = self._definitions.get(run.definition_snapshot, run.definition_hash)
+        except Exception:
+            # Routing skips runs whose snapshot cannot be parsed
+            return frozenset()
+        stage_events = compiled.reactive_events.get(run.current_stage_id or "", frozenset())
+        return stage_events | frozenset(compiled.definition.on_events)
+
+
+def _discard(mapping: dict[Any, set[str]], key: Any, run_id: str) -> None:
+    members = mapping.get(key)
+    if members is not None:
+        members.discard(run_id)
+        if not members:
+            del mapping[key]
@@ -0,0 +1,272 @@
+"""Command executor — bounded, cached runner for ``command`` gate checks.
+
+Every ``command`` gate used to get its own subprocess with no cap, so twenty
+PRs reaching a test gate meant twenty concurrent full test runs, and the
+same commit was tested again on every re-evaluation.
+
+Key exports:
+    CommandExecutor — ``CommandRunner`` implementation with a concurrency
+        limit, per-command queueing, output streaming and a result cache.
+
+Design Notes:
+- At most ``max_concurrent`` commands run at once. Calls for the same
+  command in the same checkout queue behind each other, so a duplicate
+  waits for the run in progress and is then answered from the cache.
+- Results are cached by (command, cwd, tree hash), where ``cwd`` is the
+  per-PR checkout the caller passed and the tree hash is
+  ``git rev-parse HEAD^{tree}`` there. Nothing is cached when the directory
+  is not a git checkout or has uncommitted changes. Timeouts and spawn
+  errors are raised, never cached.
+- Calls without a ``cwd`` run in the executor's default directory, which
+  is shared by every PR and may be on any commit: they are neither queued
+  behind each other nor cached.
+- Commands get a sanitized environment (secrets stripped by the caller) and
+  their own process group, so a timeout kills the whole tree of processes.
+- Output is streamed to ``on_output`` in batches of lines while the command
+  runs; the returned stdout/stderr are capped at ``max_output_bytes``.
+- Queue wait and run time are tracked as bucketed histograms.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import signal
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger("squadron.pipeline.commands")
+
+# (command, stream, text) — stream is "stdout" or "stderr"
+OutputCallback = Callable[[str, str, str], Awaitable[None]]
+
+CommandResult = tuple[int, str, str]
+
+# Histogram bucket upper bounds, in seconds
+_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0)
+
+# Lines per on_output call while a command is running
+_OUTPUT_BATCH_LINES = 50
+_READ_CHUNK = 16_384
+
+
+class _Histogram:
+    def __init__(self) -> None:
+        self._counts = [0] * (len(_BUCKETS) + 1)
+        self._total = 0.0
+        self._max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        index = next((i for i, bound in enumerate(_BUCKETS) if seconds <= bound), len(_BUCKETS))
+        self._counts[index] += 1
+        self._total += seconds
+        self._max = max(self._max, seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        count = sum(self._counts)
+        labels = [f"le_{bound:g}s" for bound in _BUCKETS] + ["inf"]
+        return {
+            "count": count,
+            "mean_s": round(self._total / count, 3) if count else 0.0,
+            "max_s": round(self._max, 3),
+            "buckets": dict(zip(labels, self._counts)),
+        }
+
+
+@dataclass
+class _CommandQueue:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    users: int = 0
+
+
+class CommandExecutor:
+    """Runs gate commands with a concurrency cap and a tree-hash result cache."""
+
+    def __init__(
+        self,
+        *,
+        max_concurrent: int = 2,
+        cwd: str | None = None,
+        env: dict[str, str] | None = None,
+        cache_size: int = 128,
+        max_output_bytes: int = 64_000,
+        on_output: OutputCallback | None = None,
+    ) -> None:
+        self.max_concurrent = max(1, max_concurrent)
+        self._cwd = cwd
+        self._env = env
+        self._cache_size = cache_size
+        self._max_output_bytes = max_output_bytes
+        self._on_output = on_output
+        self._slots = asyncio.Semaphore(self.max_concurrent)
+        # Calls for one (command, cwd) run one at a time
+        self._queues: dict[tuple[str, str | None], _CommandQueue] = {}
+        self._cache: OrderedDict[tuple[str, str | None, str], CommandResult] = OrderedDict()
+        self._processes: set[asyncio.subprocess.Process] = set()
+        self._waiting = 0
+        self._queue_wait = _Histogram()
+        self._run_time = _Histogram()
+        self._stats = {"runs": 0, "cache_hits": 0, "timeouts": 0, "errors": 0}
+
+    async def __call__(
+        self,
+        command: str,
+        *,
+        cwd: str | None = None,
+        timeout: int = 300,
+    ) -> CommandResult:
+        shared = cwd is None
+        cwd = cwd or self._cwd
+        key = (command, cwd)
+        # Shared directory: a private queue, so the call neither waits for
+        # nor is answered by a run on another PR's code
+        queue = _CommandQueue() if shared else self._queues.setdefault(key, _CommandQueue())
+        queue.users += 1
+        queued = time.monotonic()
+        self._waiting += 1
+        running = False
+        try:
+            async with queue.lock:
+                tree = None if shared else await self._tree_hash(cwd)
+                cache_key = (command, cwd, tree) if tree else None
+                if cache_key in self._cache:
+                    self._cache.move_to_end(cache_key)
+                    self._stats["cache_hits"] += 1
+                    return self._cache[cache_key]
+                async with self._slots:
+                    self._waiting -= 1
+                    running = True
+                    self._queue_wait.observe(time.monotonic() - queued)
+                    result = await self._run(command, cwd, timeout)
+                if cache_key:
+                    self._cache[cache_key] = result
+                    while len(self._cache) > self._cache_size:
+                        self._cache.popitem(last=False)
+                return result
+        finally:
+            if not running:
+                self._waiting -= 1
+            queue.users -= 1
+            if not queue.users and not shared:
+                del self._queues[key]
+
+    async def stop(self) -> None:
+        """Kill commands still running (server shutdown)."""
+        for process in list(self._processes):
+            _kill_group(process)
+        self._processes.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "running": len(self._processes),
+            "queued": self._waiting,
+            "cache_entries": len(self._cache),
+            **self._stats,
+            "queue_wait": self._queue_wait.snapshot(),
+            "run_time": self._run_time.snapshot(),
+        }
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    async def _run(self, command: str, cwd: str | None, timeout: int) -> CommandResult:
+        started = time.monotonic()
+        try:
+            process = await asyncio.create_subprocess_shell(
+                command,
+                cwd=cwd,
+                env=self._env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+        except Exception:
+            self._stats["errors"] += 1
+            raise
+        self._processes.add(process)
+        self._stats["runs"] += 1
+        logger.info("Running gate command: %s", command)
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                asyncio.gather(
+                    self._pump(command, "stdout", process.stdout),
+                    self._pump(command, "stderr", process.stderr),
+                ),
+                timeout,
+            )
+            exit_code = await process.wait()
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            _kill_group(process)
+            await process.wait()
+            raise TimeoutError(f"Command timed out after {timeout}s") from None
+        except asyncio.CancelledError:
+            _kill_group(process)
+            raise
+        finally:
+            self._processes.discard(process)
+            self._run_time.observe(time.monotonic() - started)
+        return exit_code, stdout, stderr
+
+    async def _pump(self, command: str, stream: str, reader: asyncio.StreamReader | None) -> str:
+        """Read a stream to the end, forwarding batches of lines to on_output."""
+        if reader is None:
+            return ""
+        kept: list[bytes] = []
+        kept_bytes = 0
+        pending = b""
+        while chunk := await reader.read(_READ_CHUNK):
+            if kept_bytes < self._max_output_bytes:
+                kept.append(chunk)
+                kept_bytes += len(chunk)
+            pending += chunk
+            if pending.count(b"\n") >= _OUTPUT_BATCH_LINES:
+                complete, _, pending = pending.rpartition(b"\n")
+                await self._emit(command, stream, complete + b"\n")
+        if pending:
+            await self._emit(command, stream, pending)
+        return b"".join(kept)[: self._max_output_bytes].decode(errors="replace")
+
+    async def _emit(self, command: str, stream: str, output: bytes) -> None:
+        if self._on_output is None:
+            return
+        try:
+            await self._on_output(command, stream, output.decode(errors="replace"))
+        except Exception:
+            logger.debug("Gate command output callback failed", exc_info=True)
+
+    async def _tree_hash(self, cwd: str | None) -> str | None:
+        """Tree hash of a clean git checkout, else None (results not cacheable)."""
+        code, tree = await _git(cwd, "rev-parse", "HEAD^{tree}")
+        if code != 0 or not tree:
+            return None
+        code, status = await _git(cwd, "status", "--porcelain", "--untracked-files=no")
+        if code != 0 or status:
+            return None
+        return tree
+
+
+async def _git(cwd: str | None, *args: str) -> tuple[int, str]:
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "git",
+            *args,
+            cwd=cwd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        stdout, _ = await process.communicate()
+    except OSError:
+        return 1, ""
+    return process.returncode or 0, stdout.decode().strip()
+
+
+def _kill_group(process: asyncio.subprocess.Process) -> None:
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
@@ -0,0 +1,159 @@
+"""Compiled pipeline definitions — parsed once per snapshot, shared by all runs.
+
+Every pipeline run stores the JSON snapshot of the definition it was started
+with. Routing a webhook, finishing an agent stage or joining a parallel stage
+all need that definition back, and re-validating a multi-KB blob through
+pydantic on each of those paths made per-event cost grow with definition size.
+
+Key exports:
+    CompiledPipeline — Parsed definition plus precomputed lookup tables
+        (stage index, successors, reactive event types per stage).
+    DefinitionCache — Bounded LRU of CompiledPipeline keyed by snapshot hash.
+    snapshot_hash() — Content hash of a definition snapshot.
+
+Design Notes:
+- Entries are keyed by content hash, so runs started from the same config
+  version share one parsed definition, and a config reload that changes a
+  pipeline simply produces a new key.
+- Compiled definitions are read-only; the engine never mutates a definition
+  after it has been parsed.
+- A stage's reactive event types come from the gate checks it references,
+  so the cache is dropped whenever the gate registry changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from squadron.pipeline.gates import GateCheckRegistry
+from squadron.pipeline.models import (
+    HUMAN_WAIT_EVENTS,
+    PipelineDefinition,
+    StageDefinition,
+    StageType,
+)
+
+# Distinct definition snapshots kept parsed
+DEFAULT_MAX_ENTRIES = 256
+
+
+def snapshot_hash(snapshot: str) -> str:
+    """Content hash identifying a definition snapshot."""
+    return hashlib.sha256(snapshot.encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CompiledPipeline:
+    """A parsed pipeline definition with O(1) stage lookups."""
+
+    definition_hash: str
+    definition: PipelineDefinition
+    stage_index: dict[str, int]
+    successors: dict[str, str | None]
+    reactive_events: dict[str, frozenset[str]]
+
+    def stage(self, stage_id: str | None) -> StageDefinition | None:
+        """Look up a stage by ID."""
+        idx = self.stage_index.get(stage_id) if stage_id else None
+        return None if idx is None else self.definition.stages[idx]
+
+    def next_stage(self, stage_id: str) -> StageDefinition | None:
+        """The stage after ``stage_id`` in sequence, if any."""
+        return self.stage(self.successors.get(stage_id))
+
+    def reacts_to(self, stage_id: str | None, event_type: str) -> bool:
+        """Whether a run waiting in ``stage_id`` must look at ``event_type``.
+
+        True when the pipeline has an ``on_events`` entry for the event or
+        the stage (gate conditions, human wait) re-evaluates on it.
+        """
+        if event_type in self.definition.on_events:
+            return True
+        return bool(stage_id) and event_type in self.reactive_events.get(stage_id, ())
+
+
+def compile_definition(
+    definition: PipelineDefinition,
+    gate_registry: GateCheckRegistry,
+    definition_hash: str = "",
+) -> CompiledPipeline:
+    """Precompute the lookup tables for ``definition``."""
+    stages = definition.stages
+    stage_index = {stage.id: i for i, stage in enumerate(stages)}
+    successors = {
+        stage.id: stages[i + 1].id if i + 1 < len(stages) else None
+        for i, stage in enumerate(stages)
+    }
+    reactive_events = {stage.id: _stage_reactive_events(stage, gate_registry) for stage in stages}
+    return CompiledPipeline(
+        definition_hash=definition_hash,
+        definition=definition,
+        stage_index=stage_index,
+        successors=successors,
+        reactive_events=reactive_events,
+    )
+
+
+def _stage_reactive_events(stage: StageDefinition, gate_registry: GateCheckRegistry) -> frozenset:
+    """Event types that can change the outcome of a waiting stage."""
+    if stage.type == StageType.GATE:
+        events: set[str] = set()
+        for cond in stage.conditions + (stage.any_of or []):
+            if gate_registry.has(cond.check):
+                events |= gate_registry.get(cond.check).reactive_events
+        return frozenset(events)
+    if stage.type == StageType.HUMAN and stage.human:
+        expected = HUMAN_WAIT_EVENTS.get(stage.human.wait_for)
+        return frozenset({expected}) if expected else frozenset()
+    return frozenset()
+
+
+class DefinitionCache:
+    """Bounded LRU of compiled definitions keyed by snapshot hash."""
+
+    def __init__(
+        self, gate_registry: GateCheckRegistry, *, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        self._gate_registry = gate_registry
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CompiledPipeline] = OrderedDict()
+        self._gate_generation = gate_registry.generation
+        self._stats = {"hits": 0, "misses": 0, "evicted": 0}
+
+    def get(self, snapshot: str, definition_hash: str | None = None) -> CompiledPipeline:
+        """Return the compiled definition for a snapshot, parsing it on a miss.
+
+        ``definition_hash`` is the snapshot's stored hash, when known, so the
+        snapshot does not have to be hashed again.
+
+        Raises pydantic.ValidationError if the snapshot is not a valid
+        definition; invalid snapshots are not cached.
+        """
+        if self._gate_generation != self._gate_registry.generation:
+            self.clear()
+            self._gate_generation = self._gate_registry.generation
+
+        key = definition_hash or snapshot_hash(snapshot)
+        compiled = self._entries.get(key)
+        if compiled is not None:
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return compiled
+
+        self._stats["misses"] += 1
+        definition = PipelineDefinition.model_validate_json(snapshot)
+        compiled = compile_definition(definition, self._gate_registry, key)
+        self._entries[key] = compiled
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._stats["evicted"] += 1
+        return compiled
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {"entries": len(self._entries), "max_entries": self._max_entries, **self._stats}
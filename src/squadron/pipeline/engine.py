@@ -13,16 +13,29 @@ Key exports:
 from __future__ import annotations
 
 import asyncio
+import dataclasses
+import functools
 import json
 import logging
 import uuid
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Protocol
 
-from squadron.pipeline.gates import GateCheckRegistry, GateCheckResult, PipelineContext
+from squadron.pipeline.active_index import ActiveRunIndex
+from squadron.pipeline.compiled import CompiledPipeline, DefinitionCache, compile_definition
+from squadron.pipeline.gate_cache import GateResultCache
+from squadron.pipeline.gates import (
+    CheckoutResolver,
+    GateCheckRegistry,
+    GateCheckResult,
+    GateFetchContext,
+    PipelineContext,
+)
 from squadron.pipeline.templates import TemplateResolver
 from squadron.pipeline.models import (
+    HUMAN_WAIT_EVENTS,
     GateCheckRecord,
+    GateConditionConfig,
     GateTimeoutConfig,
     HumanStageState,
     HumanWaitType,
@@ -39,6 +52,8 @@ from squadron.pipeline.models import (
     _parse_duration_seconds,
 )
 from squadron.pipeline.registry import PipelineRegistry
+from squadron.pipeline.trigger_index import TriggerIndex
+from squadron.pipeline.workers import StageJob, StageWorkerPool
 
 if TYPE_CHECKING:
     from squadron.github_client import GitHubClient
@@ -49,6 +64,13 @@ logger = logging.getLogger("squadron.pipeline.engine")
 # Maximum sub-pipeline nesting depth
 MAX_NESTING_DEPTH = 3
 
+# Parallel branches launched at once when a stage sets no max_parallel
+DEFAULT_PARALLEL_FAN_OUT = 4
+
+_BRANCH_DONE_STATUSES = (StageRunStatus.COMPLETED, StageRunStatus.FAILED, StageRunStatus.SKIPPED)
+
+_ACTIVE_RUN_STATUSES = (PipelineRunStatus.PENDING, PipelineRunStatus.RUNNING)
+
 # Mapping from HumanWaitType to the set of valid completion action strings
 _HUMAN_WAIT_ACTIONS: dict[HumanWaitType, set[str]] = {
     HumanWaitType.APPROVAL: {"approved", "approval"},
@@ -57,14 +79,6 @@ _HUMAN_WAIT_ACTIONS: dict[HumanWaitType, set[str]] = {
     HumanWaitType.DISMISS: {"dismissed", "dismiss"},
 }
 
-# Mapping from HumanWaitType to the GitHub event that satisfies it
-_HUMAN_WAIT_EVENT_MAP: dict[HumanWaitType, str] = {
-    HumanWaitType.APPROVAL: "pull_request_review.submitted",
-    HumanWaitType.COMMENT: "issue_comment.created",
-    HumanWaitType.LABEL: "pull_request.labeled",
-    HumanWaitType.DISMISS: "pull_request_review.dismissed",
-}
-
 
 # ── Callback Protocols ───────────────────────────────────────────────────────
 
@@ -164,11 +178,28 @@ class PipelineEngine:
 
         # Pipeline definitions (name → definition)
         self._pipelines: dict[str, PipelineDefinition] = {}
+        # Event type → triggered pipelines; rebuilt lazily after definitions change
+        self._trigger_index: TriggerIndex | None = None
+
+        # Parsed run snapshots (snapshot hash → compiled definition)
+        self._definitions = DefinitionCache(gate_registry)
+
+        # Active runs by PR / issue / reactive event type, fed by registry writes
+        self._active_runs = ActiveRunIndex(self._definitions)
+        registry.add_listener(self._active_runs.run_changed)
+        registry.add_pr_association_listener(self._active_runs.pr_associated)
+
+        # Gate check results reused while their declared inputs are unchanged
+        self._gate_results = GateResultCache()
+
+        # Stage work runs here when set and started; inline otherwise
+        self._worker_pool: StageWorkerPool | None = None
 
         # Callbacks (set by AgentManager)
         self._spawn_agent: SpawnAgentCallback | None = None
         self._action_callback: ActionCallback | None = None
         self._notify_callback: NotifyCallback | None = None
+        self._checkout_callback: CheckoutResolver | None = None
 
         # Track running async tasks for delay stages
         self._delay_tasks: dict[str, asyncio.Task] = {}
@@ -184,6 +215,17 @@ class PipelineEngine:
     def add_pipeline(self, name: str, definition: PipelineDefinition) -> None:
         """Register a pipeline definition."""
         self._pipelines[name] = definition
+        self._trigger_index = None
+
+    def clear_pipelines(self) -> None:
+        """Unregister all pipeline definitions (e.g. before a config reload)."""
+        self._pipelines.clear()
+        self._trigger_index = None
+
+    def _triggers(self) -> TriggerIndex:
+        if self._trigger_index is None:
+            self._trigger_index = TriggerIndex(self._pipelines)
+        return self._trigger_index
 
     def get_pipeline(self, name: str) -> PipelineDefinition | None:
         """Look up a pipeline definition by name."""
@@ -193,6 +235,59 @@ class PipelineEngine:
         """Return the names of all registered pipeline definitions."""
         return list(self._pipelines.keys())
 
+    def reactive_event_types(self, name: str) -> set[str]:
+        """GitHub event types that can change a waiting stage of a pipeline."""
+        defn = self._pipelines.get(name)
+        if defn is None:
+            return set()
+        compiled = compile_definition(defn, self._gate_registry)
+        return set().union(*compiled.reactive_events.values())
+
+    def _compiled(self, run: PipelineRun) -> CompiledPipeline:
+        """Parsed definition a run was started with (raises if invalid)."""
+        return self._definitions.get(run.definition_snapshot, run.definition_hash)
+
+    def definition_cache_stats(self) -> dict[str, Any]:
+        """Hit/miss counters of the compiled definition cache."""
+        return self._definitions.stats()
+
+    def worker_stats(self) -> dict[str, Any] | None:
+        """Saturation and queue wait of the stage worker pool (None when inline)."""
+        return self._worker_pool.stats() if self._worker_pool else None
+
+    def gate_cache_stats(self) -> dict[str, Any]:
+        """Gate result cache size and hit rates per check type."""
+        return self._gate_results.stats()
+
+    def active_run_stats(self) -> dict[str, Any]:
+        """Size of the active run index and how many routed events it skipped."""
+        return self._active_runs.stats()
+
+    async def _ensure_active_runs(self) -> None:
+        """Seed the active run index from the registry on first use."""
+        if self._active_runs.loaded:
+            return
+        self._active_runs.begin_load()
+        runs = await self._registry.get_active_pipeline_runs()
+        associations = await self._registry.get_active_pr_associations()
+        self._active_runs.load(runs, associations)
+
+    def set_worker_pool(self, pool: StageWorkerPool | None) -> None:
+        """Run stage work on ``pool`` instead of inline in the caller."""
+        self._worker_pool = pool
+
+    async def _submit(self, run_id: str, job: StageJob, name: str = "") -> None:
+        """Run stage work for a run — queued on the worker pool, else inline.
+
+        With a running pool this returns immediately; the pool runs jobs for
+        one run in submission order.
+        """
+        pool = self._worker_pool
+        if pool is not None and pool.running:
+            pool.submit(run_id, job, name)
+        else:
+            await job()
+
     def set_spawn_callback(self, callback: SpawnAgentCallback) -> None:
         """Set the callback for spawning agents."""
         self._spawn_agent = callback
@@ -205,6 +300,10 @@ class PipelineEngine:
         """Set the callback for delivering notifications (PR comments, labels, etc.)."""
         self._notify_callback = callback
 
+    def set_checkout_callback(self, callback: CheckoutResolver) -> None:
+        """Set the callback that checks out a PR's head for command gates."""
+        self._checkout_callback = callback
+
     def validate_all_pipelines(self) -> list[str]:
         """Validate all registered pipelines. Returns list of error messages."""
         errors: list[str] = []
@@ -268,33 +367,32 @@ class PipelineEngine:
         started_run: PipelineRun | None = None
 
         # 1. Check trigger-based activation (new pipelines)
-        for name, defn in self._pipelines.items():
-            if defn.trigger and defn.trigger.matches(event_type, payload):
-                # Extract context from event
-                issue_number = _extract_issue_number(payload)
-                pr_number = _extract_pr_number(payload)
-
-                # Dedup: don't start a duplicate pipeline for the same trigger
-                if pr_number:
-                    existing = await self._registry.get_running_pipelines_for_pr(pr_number)
-                    if any(r.pipeline_name == name for r in existing):
-                        logger.info(
-                            "Pipeline '%s' already running for PR #%s, skipping",
-                            name,
-                            pr_number,
-                        )
-                        continue
-
-                run = await self._start_pipeline(
-                    name,
-                    defn,
-                    event_type=event_type,
-                    payload=payload,
-                    issue_number=issue_number,
-                    pr_number=pr_number,
-                    delivery_id=(squadron_event.source_delivery_id if squadron_event else None),
-                )
-                started_run = run
+        for name, defn in self._triggers().matching(event_type, payload):
+            # Extract context from event
+            issue_number = _extract_issue_number(payload)
+            pr_number = _extract_pr_number(payload)
+
+            # Dedup: don't start a duplicate pipeline for the same trigger
+            if pr_number:
+                await self._ensure_active_runs()
+                if name in self._active_runs.pipeline_names_for_pr(pr_number):
+                    logger.info(
+                        "Pipeline '%s' already running for PR #%s, skipping",
+                        name,
+                        pr_number,
+                    )
+                    continue
+
+            run = await self._start_pipeline(
+                name,
+                defn,
+                event_type=event_type,
+                payload=payload,
+                issue_number=issue_number,
+                pr_number=pr_number,
+                delivery_id=(squadron_event.source_delivery_id if squadron_event else None),
+            )
+            started_run = run
 
         # 2. Route reactive events to running pipelines
         await self._route_reactive_event(event_type, payload)
@@ -367,7 +465,11 @@ class PipelineEngine:
 
         # Execute the first stage
         if definition.stages:
-            await self._execute_stage(run, definition, definition.stages[0])
+            await self._submit(
+                run_id,
+                functools.partial(self._execute_stage, run, definition, definition.stages[0]),
+                "start",
+            )
 
         return run
 
@@ -511,12 +613,13 @@ class PipelineEngine:
             return False
 
         try:
-            defn = PipelineDefinition.model_validate_json(run.definition_snapshot)
+            compiled = self._compiled(run)
         except Exception:
             logger.error("Failed to parse definition for pipeline %s", run_id)
             return False
 
-        stage = defn.get_stage(stage_id)
+        defn = compiled.definition
+        stage = compiled.stage(stage_id)
         if not stage or stage.type != StageType.HUMAN:
             logger.warning(
                 "complete_human_stage: stage '%s' not found or not a human stage", stage_id
@@ -744,35 +847,23 @@ class PipelineEngine:
         stage: StageDefinition,
         stage_run: StageRun,
     ) -> None:
-        """Execute a gate stage — evaluate all conditions."""
+        """Execute a gate stage — evaluate all conditions.
+
+        Conditions are evaluated concurrently and share one GitHub fetch
+        context, so the PR, its reviews and check runs are read at most once.
+        With ``any_of`` the remaining checks are cancelled as soon as one passes.
+        """
         ctx = self._build_context(run)
+        ctx.fetch = GateFetchContext()
         conditions = stage.conditions
         use_any = bool(stage.any_of)
         if use_any:
             conditions = stage.any_of or []
 
-        all_results: list[GateCheckResult] = []
-        for cond in conditions:
-            check = self._gate_registry.get(cond.check)
-
-            # Cross-PR gate targeting: override context pr_number if condition has `pr`
-            eval_ctx = ctx
-            if cond.pr is not None:
-                target_pr = self._resolve_pr_target(cond.pr, run)
-                if target_pr is not None:
-                    eval_ctx = PipelineContext(
-                        pr_number=target_pr,
-                        issue_number=ctx.issue_number,
-                        owner=ctx.owner,
-                        repo=ctx.repo,
-                        pipeline_run_id=ctx.pipeline_run_id,
-                        context=ctx.context,
-                        github_client=ctx.github_client,
-                    )
+        evaluated = await self._evaluate_conditions(run, ctx, conditions, short_circuit=use_any)
 
-            config = cond.get_config()
-            config.pop("pr", None)  # Don't pass `pr` to the check itself
-            result = await check.evaluate(config, eval_ctx)
+        all_results: list[GateCheckResult] = []
+        for cond, result in evaluated:
             all_results.append(result)
 
             # Record each check
@@ -816,6 +907,67 @@ class PipelineEngine:
                 run.run_id,
             )
 
+    async def _evaluate_conditions(
+        self,
+        run: PipelineRun,
+        ctx: PipelineContext,
+        conditions: list[GateConditionConfig],
+        *,
+        short_circuit: bool = False,
+    ) -> list[tuple[GateConditionConfig, GateCheckResult]]:
+        """Evaluate gate conditions concurrently; results are in condition order.
+
+        With ``short_circuit`` the first passing result cancels the checks still
+        running, and only the conditions that finished are returned. A check
+        that raises cancels the others and the exception propagates.
+        """
+        tasks = [
+            asyncio.create_task(self._evaluate_condition(run, ctx, cond)) for cond in conditions
+        ]
+        try:
+            pending: set[asyncio.Task[GateCheckResult]] = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                results = [task.result() for task in done]
+                if short_circuit and any(result.passed for result in results):
+                    break
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return [
+            (cond, task.result()) for cond, task in zip(conditions, tasks) if not task.cancelled()
+        ]
+
+    async def _evaluate_condition(
+        self,
+        run: PipelineRun,
+        ctx: PipelineContext,
+        cond: GateConditionConfig,
+    ) -> GateCheckResult:
+        check = self._gate_registry.get(cond.check)
+
+        # Cross-PR gate targeting: override context pr_number if condition has `pr`
+        eval_ctx = ctx
+        if cond.pr is not None:
+            target_pr = self._resolve_pr_target(cond.pr, run)
+            if target_pr is not None:
+                eval_ctx = dataclasses.replace(ctx, pr_number=target_pr)
+
+        config = cond.get_config()
+        config.pop("pr", None)  # Don't pass `pr` to the check itself
+
+        key = await self._gate_results.key(cond.check, check, config, eval_ctx)
+        if key is not None:
+            cached = self._gate_results.get(key)
+            if cached is not None:
+                return cached
+        result = await check.evaluate(config, eval_ctx)
+        if key is not None:
+            self._gate_results.put(key, check, result)
+        return result
+
     async def _execute_action_stage(
         self,
         run: PipelineRun,
@@ -1217,17 +1369,34 @@ class PipelineEngine:
         stage: StageDefinition,
         stage_run: StageRun,
     ) -> None:
-        """Execute a parallel stage — spawn branches of various types.
+        """Execute a parallel stage — launch branches of various types concurrently.
 
         Supported branch types:
         - ``agent``: Spawn an agent (requires spawn callback).
         - ``pipeline``: Start a sub-pipeline as a branch.
         - ``action``: Execute a built-in action as a branch.
+
+        Stage runs for all branches, skipped or launched, are inserted in one
+        batch before any branch starts, so a branch that finishes early sees
+        all of its siblings. At most ``max_parallel`` branches launch at once;
+        a branch whose launch raises is marked FAILED without affecting the
+        others.
         """
         stage_run.status = StageRunStatus.WAITING
         await self._registry.update_stage_run(stage_run)
 
+        now = datetime.now(timezone.utc)
+        branch_runs: list[StageRun] = []
+        launches: list[tuple[ParallelBranch, StageRun]] = []
         for branch in stage.branches:
+            branch_run = StageRun(
+                run_id=run.run_id,
+                stage_id=f"{stage.id}/{branch.id}",
+                status=StageRunStatus.RUNNING,
+                branch_id=branch.id,
+                parent_stage_id=stage.id,
+                started_at=now,
+            )
             # Evaluate branch condition using the full condition evaluator
             if branch.condition and not self._eval_condition(branch.condition, run):
                 logger.info(
@@ -1235,72 +1404,105 @@ class PipelineEngine:
                     branch.id,
                     run.run_id,
                 )
-                # Create a SKIPPED stage run for tracking
-                skipped_stage_id = f"{stage.id}/{branch.id}"
-                skipped_run = StageRun(
-                    run_id=run.run_id,
-                    stage_id=skipped_stage_id,
-                    status=StageRunStatus.SKIPPED,
-                    branch_id=branch.id,
-                    parent_stage_id=stage.id,
-                    started_at=datetime.now(timezone.utc),
-                    completed_at=datetime.now(timezone.utc),
-                )
-                await self._registry.create_stage_run(skipped_run)
+                # Keep a SKIPPED stage run for tracking
+                branch_run.status = StageRunStatus.SKIPPED
+                branch_run.completed_at = now
+            elif self._parallel_branch_launchable(run, branch):
+                launches.append((branch, branch_run))
+            else:
                 continue
+            branch_runs.append(branch_run)
 
-            branch_stage_id = f"{stage.id}/{branch.id}"
+        ids = await self._registry.create_parallel_branches(stage_run, branch_runs)
+        for branch_run, sr_id in zip(branch_runs, ids):
+            branch_run.id = sr_id
 
-            if branch.type == StageType.AGENT and branch.agent:
-                await self._execute_parallel_agent_branch(run, stage, branch, branch_stage_id)
-            elif branch.type == StageType.PIPELINE and branch.pipeline:
-                await self._execute_parallel_pipeline_branch(run, stage, branch, branch_stage_id)
-            elif branch.type == StageType.ACTION and branch.action:
-                await self._execute_parallel_action_branch(
-                    run, definition, stage, branch, branch_stage_id
-                )
-            else:
-                logger.warning(
-                    "Unsupported or misconfigured parallel branch '%s' (type=%s)",
-                    branch.id,
-                    branch.type.value,
-                )
+        fan_out = asyncio.Semaphore(stage.max_parallel or DEFAULT_PARALLEL_FAN_OUT)
+
+        async def launch(branch: ParallelBranch, branch_run: StageRun) -> None:
+            async with fan_out:
+                await self._launch_parallel_branch(run, stage, branch, branch_run)
+
+        await asyncio.gather(*(launch(branch, branch_run) for branch, branch_run in launches))
 
         logger.info(
-            "Parallel stage '%s' launched branches (pipeline %s)",
+            "Parallel stage '%s' launched %d branches (pipeline %s)",
             stage.id,
+            len(launches),
             run.run_id,
         )
 
-    async def _execute_parallel_agent_branch(
+        # Action branches and failed launches finish during launch
+        finished = [r for _, r in launches if r.status in _BRANCH_DONE_STATUSES]
+        if finished:
+            await self._check_parallel_completion(finished[-1])
+
+    def _parallel_branch_launchable(self, run: PipelineRun, branch: ParallelBranch) -> bool:
+        """Whether a branch is well-formed enough to get a stage run and launch."""
+        if branch.type == StageType.AGENT and branch.agent:
+            return True
+        if branch.type == StageType.ACTION and branch.action:
+            return True
+        if branch.type == StageType.PIPELINE and branch.pipeline:
+            if branch.pipeline not in self._pipelines:
+                logger.error(
+                    "Unknown sub-pipeline '%s' in parallel branch '%s'", branch.pipeline, branch.id
+                )
+                return False
+            if run.nesting_depth >= MAX_NESTING_DEPTH:
+                logger.error(
+                    "Sub-pipeline nesting depth exceeded in parallel branch '%s'", branch.id
+                )
+                return False
+            return True
+        logger.warning(
+            "Unsupported or misconfigured parallel branch '%s' (type=%s)",
+            branch.id,
+            branch.type.value,
+        )
+        return False
+
+    async def _launch_parallel_branch(
         self,
         run: PipelineRun,
         stage: StageDefinition,
         branch: ParallelBranch,
-        branch_stage_id: str,
+        branch_stage_run: StageRun,
+    ) -> None:
+        """Launch one branch, recording an exception as that branch's failure."""
+        try:
+            if branch.type == StageType.AGENT:
+                await self._execute_parallel_agent_branch(run, branch, branch_stage_run)
+            elif branch.type == StageType.PIPELINE:
+                await self._execute_parallel_pipeline_branch(run, branch, branch_stage_run)
+            else:
+                await self._execute_parallel_action_branch(run, branch, branch_stage_run)
+        except Exception as exc:
+            logger.exception(
+                "Parallel branch '%s' failed to launch (pipeline %s)", branch.id, run.run_id
+            )
+            branch_stage_run.status = StageRunStatus.FAILED
+            branch_stage_run.error_message = str(exc) or type(exc).__name__
+            branch_stage_run.completed_at = datetime.now(timezone.utc)
+            await self._registry.update_stage_run(branch_stage_run)
+
+    async def _execute_parallel_agent_branch(
+        self,
+        run: PipelineRun,
+        branch: ParallelBranch,
+        branch_stage_run: StageRun,
     ) -> None:
         """Spawn an agent for a parallel branch."""
         if not self._spawn_agent:
             msg = "No spawn agent callback configured"
             raise RuntimeError(msg)
 
-        branch_stage_run = StageRun(
-            run_id=run.run_id,
-            stage_id=branch_stage_id,
-            status=StageRunStatus.RUNNING,
-            branch_id=branch.id,
-            parent_stage_id=stage.id,
-            started_at=datetime.now(timezone.utc),
-        )
-        branch_id = await self._registry.create_stage_run(branch_stage_run)
-        branch_stage_run.id = branch_id
-
         agent_id = await self._spawn_agent(
             branch.agent,  # type: ignore[arg-type]
             run.issue_number,
             pr_number=run.pr_number,
             pipeline_run_id=run.run_id,
-            stage_id=branch_stage_id,
+            stage_id=branch_stage_run.stage_id,
             action=branch.action,
             context=run.context,
         )
@@ -1317,44 +1519,20 @@ class PipelineEngine:
     async def _execute_parallel_pipeline_branch(
         self,
         run: PipelineRun,
-        stage: StageDefinition,
         branch: ParallelBranch,
-        branch_stage_id: str,
+        branch_stage_run: StageRun,
     ) -> None:
         """Start a sub-pipeline for a parallel branch."""
         pipeline_name = branch.pipeline
-        if not pipeline_name:
-            return
-
-        child_def = self._pipelines.get(pipeline_name)
-        if not child_def:
-            logger.error(
-                "Unknown sub-pipeline '%s' in parallel branch '%s'", pipeline_name, branch.id
-            )
-            return
-
-        if run.nesting_depth >= MAX_NESTING_DEPTH:
-            logger.error("Sub-pipeline nesting depth exceeded in parallel branch '%s'", branch.id)
-            return
-
-        branch_stage_run = StageRun(
-            run_id=run.run_id,
-            stage_id=branch_stage_id,
-            status=StageRunStatus.RUNNING,
-            branch_id=branch.id,
-            parent_stage_id=stage.id,
-            started_at=datetime.now(timezone.utc),
-        )
-        sr_id = await self._registry.create_stage_run(branch_stage_run)
-        branch_stage_run.id = sr_id
+        child_def = self._pipelines[pipeline_name]  # type: ignore[index]
 
         child_run = await self._start_pipeline(
-            pipeline_name,
+            pipeline_name,  # type: ignore[arg-type]
             child_def,
             issue_number=run.issue_number,
             pr_number=run.pr_number,
             parent_run_id=run.run_id,
-            parent_stage_id=branch_stage_id,
+            parent_stage_id=branch_stage_run.stage_id,
             nesting_depth=run.nesting_depth + 1,
             extra_context=branch.context,
         )
@@ -1366,23 +1544,10 @@ class PipelineEngine:
     async def _execute_parallel_action_branch(
         self,
         run: PipelineRun,
-        definition: PipelineDefinition,
-        stage: StageDefinition,
         branch: ParallelBranch,
-        branch_stage_id: str,
+        branch_stage_run: StageRun,
     ) -> None:
         """Execute an action for a parallel branch."""
-        branch_stage_run = StageRun(
-            run_id=run.run_id,
-            stage_id=branch_stage_id,
-            status=StageRunStatus.RUNNING,
-            branch_id=branch.id,
-            parent_stage_id=stage.id,
-            started_at=datetime.now(timezone.utc),
-        )
-        sr_id = await self._registry.create_stage_run(branch_stage_run)
-        branch_stage_run.id = sr_id
-
         ctx = self._build_context(run)
         if self._action_callback:
             try:
@@ -1405,9 +1570,6 @@ class PipelineEngine:
         branch_stage_run.completed_at = datetime.now(timezone.utc)
         await self._registry.update_stage_run(branch_stage_run)
 
-        # Immediately check parallel completion since action branches complete synchronously
-        await self._check_parallel_completion(branch_stage_run)
-
     async def _execute_pipeline_stage(
         self,
         run: PipelineRun,
@@ -1649,49 +1811,93 @@ class PipelineEngine:
         payload: dict[str, Any],
     ) -> None:
         """Route a reactive event to all running pipelines that care about it."""
-        pr_number = _extract_pr_number(payload)
+        await self._ensure_active_runs()
+        pr_numbers = _extract_pr_numbers(payload)
+        if not pr_numbers and self._active_runs.has_listeners(event_type):
+            pr_numbers = await self._prs_for_head_sha(payload)
         issue_number = _extract_issue_number(payload)
 
-        if not pr_number and not issue_number:
+        # Cached gate results this event may have made stale
+        for pr_number in pr_numbers or [None]:
+            self._gate_results.invalidate(event_type, self._owner, self._repo, pr_number)
+
+        if not pr_numbers and not issue_number:
             return
 
-        # Find running pipelines for this PR/issue
-        running: list[PipelineRun] = []
-        if pr_number:
-            running.extend(await self._registry.get_running_pipelines_for_pr(pr_number))
-        if issue_number:
-            running.extend(
-                await self._registry.get_pipeline_runs_by_issue(
-                    issue_number, status=PipelineRunStatus.RUNNING
+        # Active runs for these PRs/issue whose on_events or current stage react
+        run_ids = list(
+            dict.fromkeys(
+                run_id
+                for pr_number in pr_numbers or [None]
+                for run_id in self._active_runs.lookup(
+                    event_type, pr_number=pr_number, issue_number=issue_number
                 )
             )
+        )
 
-        # Dedup
-        seen: set[str] = set()
-        unique_runs: list[PipelineRun] = []
-        for r in running:
-            if r.run_id not in seen:
-                seen.add(r.run_id)
-                unique_runs.append(r)
+        for run_id in run_ids:
+            await self._submit(
+                run_id,
+                functools.partial(self._react_to_event, run_id, event_type, payload),
+                event_type,
+            )
 
-        for run in unique_runs:
-            # Load the definition from snapshot
-            try:
-                defn = PipelineDefinition.model_validate_json(run.definition_snapshot)
-            except Exception:
-                logger.warning(
-                    "Failed to parse definition snapshot for pipeline %s",
-                    run.run_id,
-                )
-                continue
+    async def _prs_for_head_sha(self, payload: dict[str, Any]) -> list[int]:
+        """Open PRs whose head is the commit a CI payload reports on.
 
-            # Check on_events config
-            reactive_config = defn.on_events.get(event_type)
-            if reactive_config:
-                await self._handle_reactive_action(run, defn, reactive_config)
+        ``status`` payloads carry no PR at all, and ``check_run`` /
+        ``check_suite`` ones list none for fork heads.
+        """
+        sha = _extract_head_sha(payload)
+        if not sha or not self._github_client:
+            return []
+        try:
+            prs = await self._github_client.list_pull_requests_for_commit(
+                self._owner, self._repo, sha
+            )
+        except Exception:
+            logger.warning("Failed to list PRs for commit %s", sha, exc_info=True)
+            return []
+        return [
+            pr["number"]
+            for pr in prs
+            if pr.get("state") == "open" and (pr.get("head") or {}).get("sha") == sha
+        ]
 
-            # Always re-evaluate gates/human stages on relevant events
-            await self._reevaluate_waiting_stages(run, defn, event_type, payload)
+    async def _react_to_event(
+        self,
+        run_id: str,
+        event_type: str,
+        payload: dict[str, Any],
+    ) -> None:
+        """Apply a routed reactive event to one run (re-read, it may have moved on)."""
+        run = await self._registry.get_pipeline_run(run_id)
+        if not run or run.status not in _ACTIVE_RUN_STATUSES:
+            return
+
+        # Load the definition from snapshot
+        try:
+            compiled = self._compiled(run)
+        except Exception:
+            logger.warning(
+                "Failed to parse definition snapshot for pipeline %s",
+                run.run_id,
+            )
+            return
+
+        # Neither on_events nor the current stage care about this event
+        if not compiled.reacts_to(run.current_stage_id, event_type):
+            return
+
+        defn = compiled.definition
+
+        # Check on_events config
+        reactive_config = defn.on_events.get(event_type)
+        if reactive_config:
+            await self._handle_reactive_action(run, defn, reactive_config)
+
+        # Always re-evaluate gates/human stages on relevant events
+        await self._reevaluate_waiting_stages(run, defn, event_type, payload)
 
     async def _handle_reactive_action(
         self,
@@ -1871,7 +2077,7 @@ class PipelineEngine:
             if not human_config:
                 return
 
-            expected_event = _HUMAN_WAIT_EVENT_MAP.get(human_config.wait_for)
+            expected_event = HUMAN_WAIT_EVENTS.get(human_config.wait_for)
             if expected_event != event_type:
                 return
 
@@ -1920,6 +2126,17 @@ class PipelineEngine:
             logger.debug("No pipeline stage found for agent %s", agent_id)
             return
 
+        await self._submit(
+            stage_run.run_id,
+            functools.partial(self._complete_agent_stage, stage_run, outputs),
+            "agent_complete",
+        )
+
+    async def _complete_agent_stage(
+        self,
+        stage_run: StageRun,
+        outputs: dict[str, Any] | None,
+    ) -> None:
         stage_run.status = StageRunStatus.COMPLETED
         stage_run.completed_at = datetime.now(timezone.utc)
         if outputs:
@@ -1940,12 +2157,13 @@ class PipelineEngine:
             return
 
         try:
-            defn = PipelineDefinition.model_validate_json(run.definition_snapshot)
+            compiled = self._compiled(run)
         except Exception:
             logger.error("Failed to parse definition for pipeline %s", run.run_id)
             return
 
-        stage = defn.get_stage(stage_run.stage_id)
+        defn = compiled.definition
+        stage = compiled.stage(stage_run.stage_id)
         if not stage:
             return
 
@@ -1993,6 +2211,13 @@ class PipelineEngine:
         if not stage_run:
             return
 
+        await self._submit(
+            stage_run.run_id,
+            functools.partial(self._fail_agent_stage, stage_run, error),
+            "agent_error",
+        )
+
+    async def _fail_agent_stage(self, stage_run: StageRun, error: str) -> None:
         stage_run.status = StageRunStatus.FAILED
         stage_run.error_message = error
         stage_run.completed_at = datetime.now(timezone.utc)
@@ -2008,11 +2233,12 @@ class PipelineEngine:
             return
 
         try:
-            defn = PipelineDefinition.model_validate_json(run.definition_snapshot)
+            compiled = self._compiled(run)
         except Exception:
             return
 
-        stage = defn.get_stage(stage_run.stage_id)
+        defn = compiled.definition
+        stage = compiled.stage(stage_run.stage_id)
         if stage:
             await self._handle_stage_error(run, defn, stage, error)
 
@@ -2022,13 +2248,21 @@ class PipelineEngine:
         Join strategies:
         - ``all`` (default): Wait for all branches to finish.
         - ``any``: Advance as soon as any branch succeeds.
+
+        Reads the stage's branch counters, which the registry updates with
+        every branch status change, so the check does not depend on the
+        number of branches. Resolving the parallel stage run only succeeds
+        while it is still WAITING, so of several branches finishing at once
+        exactly one advances the pipeline.
         """
         if not completed_branch.parent_stage_id:
             return
 
-        # Get all branch stage runs for this parallel stage
-        all_stages = await self._registry.get_stage_runs_for_pipeline(completed_branch.run_id)
-        branches = [s for s in all_stages if s.parent_stage_id == completed_branch.parent_stage_id]
+        counters = await self._registry.get_parallel_counters(
+            completed_branch.run_id, completed_branch.parent_stage_id
+        )
+        if not counters:
+            return
 
         # Load definition to determine join strategy
         run = await self._registry.get_pipeline_run(completed_branch.run_id)
@@ -2036,82 +2270,45 @@ class PipelineEngine:
             return
 
         try:
-            defn = PipelineDefinition.model_validate_json(run.definition_snapshot)
+            compiled = self._compiled(run)
         except Exception:
             return
 
-        stage = defn.get_stage(completed_branch.parent_stage_id)
+        defn = compiled.definition
+        stage = compiled.stage(completed_branch.parent_stage_id)
         if not stage:
             return
 
         join = stage.join or JoinStrategy.ALL
-
-        # Find the parent stage run
-        parent_runs = [
-            s
-            for s in all_stages
-            if s.stage_id == completed_branch.parent_stage_id and s.parent_stage_id is None
-        ]
-        if not parent_runs:
-            return
-        parent_stage_run = parent_runs[-1]
+        error: str | None = None
 
         if join == JoinStrategy.ANY:
-            # Advance as soon as any branch completes successfully
-            any_succeeded = any(s.status == StageRunStatus.COMPLETED for s in branches)
-            if any_succeeded:
-                parent_stage_run.status = StageRunStatus.COMPLETED
-                parent_stage_run.completed_at = datetime.now(timezone.utc)
-                await self._registry.update_stage_run(parent_stage_run)
-                await self._advance_after_stage(run, defn, stage, "complete")
-                return
-
-            # If all branches are done and none succeeded, fail
-            all_done = all(
-                s.status
-                in (StageRunStatus.COMPLETED, StageRunStatus.FAILED, StageRunStatus.SKIPPED)
-                for s in branches
-            )
-            if all_done:
-                parent_stage_run.status = StageRunStatus.FAILED
-                parent_stage_run.error_message = "All parallel branches failed (join: any)"
-                parent_stage_run.completed_at = datetime.now(timezone.utc)
-                await self._registry.update_stage_run(parent_stage_run)
-                if stage.on_any_reject:
-                    target = stage.on_any_reject.get("goto")
-                    if target:
-                        await self._transition_to(run, defn, target)
-                        return
-                await self._handle_stage_error(
-                    run, defn, stage, "All parallel branches failed (join: any)"
-                )
+            # Advance as soon as any branch completes successfully; fail
+            # once all branches are done and none succeeded
+            if not counters.succeeded:
+                if counters.pending:
+                    return
+                error = "All parallel branches failed (join: any)"
         else:
             # join: all — wait for every branch to finish
-            all_done = all(
-                s.status
-                in (StageRunStatus.COMPLETED, StageRunStatus.FAILED, StageRunStatus.SKIPPED)
-                for s in branches
-            )
-            if not all_done:
+            if counters.pending:
                 return
+            if counters.failed:
+                error = "One or more parallel branches failed"
 
-            any_failed = any(s.status == StageRunStatus.FAILED for s in branches)
-
-            parent_stage_run.completed_at = datetime.now(timezone.utc)
-            if any_failed:
-                parent_stage_run.status = StageRunStatus.FAILED
-                parent_stage_run.error_message = "One or more parallel branches failed"
-            else:
-                parent_stage_run.status = StageRunStatus.COMPLETED
-
-            await self._registry.update_stage_run(parent_stage_run)
+        status = StageRunStatus.FAILED if error else StageRunStatus.COMPLETED
+        if not await self._registry.resolve_stage_run(counters.stage_run_id, status, error):
+            return  # Already resolved by another branch
 
-            if any_failed and stage.on_any_reject:
-                target = stage.on_any_reject.get("goto")
-                if target:
-                    await self._transition_to(run, defn, target)
-                    return
-            await self._advance_after_stage(run, defn, stage, "complete")
+        if error and stage.on_any_reject:
+            target = stage.on_any_reject.get("goto")
+            if target:
+                await self._transition_to(run, defn, target)
+                return
+        if error and join == JoinStrategy.ANY:
+            await self._handle_stage_error(run, defn, stage, error)
+            return
+        await self._advance_after_stage(run, defn, stage, "complete")
 
     async def _on_sub_pipeline_complete(self, child_run: PipelineRun) -> None:
         """Handle completion of a sub-pipeline — advance the parent.
@@ -2123,6 +2320,15 @@ class PipelineEngine:
         if not child_run.parent_run_id or not child_run.parent_stage_id:
             return
 
+        await self._submit(
+            child_run.parent_run_id,
+            functools.partial(self._resume_parent, child_run),
+            "sub_pipeline_complete",
+        )
+
+    async def _resume_parent(self, child_run: PipelineRun) -> None:
+        if not child_run.parent_run_id or not child_run.parent_stage_id:
+            return
         parent_run = await self._registry.get_pipeline_run(child_run.parent_run_id)
         if not parent_run or parent_run.status != PipelineRunStatus.RUNNING:
             return
@@ -2156,11 +2362,12 @@ class PipelineEngine:
             await self._registry.update_stage_run(latest)
 
         try:
-            defn = PipelineDefinition.model_validate_json(parent_run.definition_snapshot)
+            compiled = self._compiled(parent_run)
         except Exception:
             return
 
-        stage = defn.get_stage(child_run.parent_stage_id)
+        defn = compiled.definition
+        stage = compiled.stage(child_run.parent_stage_id)
         if stage:
             if child_run.status == PipelineRunStatus.COMPLETED:
                 await self._advance_after_stage(parent_run, defn, stage, "complete")
@@ -2187,7 +2394,7 @@ class PipelineEngine:
               - label: "pipeline-done"
         """
         try:
-            defn = PipelineDefinition.model_validate_json(run.definition_snapshot)
+            defn = self._compiled(run).definition
         except Exception:
             return
 
@@ -2420,6 +2627,7 @@ class PipelineEngine:
             pipeline_run_id=run.run_id,
             context=run.context,
             github_client=self._github_client,
+            checkout_resolver=self._checkout_callback,
         )
 
     @staticmethod
@@ -2458,6 +2666,7 @@ class PipelineEngine:
 
         Returns the number of pipelines recovered.
         """
+        await self._ensure_active_runs()
         active = await self._registry.get_active_pipeline_runs()
         recovered = 0
 
@@ -2466,7 +2675,7 @@ class PipelineEngine:
                 continue
 
             try:
-                PipelineDefinition.model_validate_json(run.definition_snapshot)
+                self._compiled(run)
             except Exception:
                 logger.warning(
                     "Cannot recover pipeline %s — invalid definition snapshot",
@@ -2507,11 +2716,32 @@ class PipelineEngine:
 
 def _extract_pr_number(payload: dict[str, Any]) -> int | None:
     """Extract PR number from a GitHub webhook payload."""
+    numbers = _extract_pr_numbers(payload)
+    return numbers[0] if numbers else None
+
+
+def _extract_pr_numbers(payload: dict[str, Any]) -> list[int]:
+    """Extract every PR number a GitHub webhook payload refers to."""
     pr = payload.get("pull_request")
     if pr:
-        return pr.get("number")
+        return [pr["number"]] if pr.get("number") else []
     # Some events (e.g. pull_request_target) carry the number at top level
-    return payload.get("number")
+    if payload.get("number"):
+        return [payload["number"]]
+    # check_run / check_suite list the PRs whose head they ran on
+    for key in ("check_run", "check_suite"):
+        if key in payload:
+            prs = (payload[key] or {}).get("pull_requests") or []
+            return [p["number"] for p in prs if p.get("number")]
+    return []
+
+
+def _extract_head_sha(payload: dict[str, Any]) -> str | None:
+    """Commit SHA a CI webhook payload (check_run, check_suite, status) reports on."""
+    for key in ("check_run", "check_suite"):
+        if key in payload:
+            return (payload[key] or {}).get("head_sha")
+    return payload.get("sha")
 
 
 def _extract_issue_number(payload: dict[str, Any]) -> int | None:
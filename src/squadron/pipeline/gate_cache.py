@@ -0,0 +1,171 @@
+"""Gate result cache — memoized gate check results keyed by their inputs.
+
+A reactive event re-evaluates every condition of a waiting gate, even the
+ones whose inputs cannot have changed: ``ci_status`` on the same head SHA
+with no new ``check_run`` event, or ``approval_count`` with no new review. Checks
+declare the inputs their result depends on (``GateCheck.cache_inputs``) and
+results are reused while those inputs are unchanged.
+
+Key exports:
+    GateResultCache — LRU of gate check results with per-check-type hit rates.
+
+Design Notes:
+- The key is the check name, its config, the target PR and the current
+  values of the declared inputs: ``head_sha``, ``labels`` (the PR's label
+  set) and ``reviews`` (review ids and states). Input values are read
+  through the evaluation's ``GateFetchContext``, so they cost no extra API
+  calls when another condition reads the same data.
+- Results also depend on data outside the key (check runs, mergeability),
+  so an entry is dropped whenever an event in its check's
+  ``reactive_events`` arrives for its PR (or for no particular PR), and
+  only then.
+- Checks without declared inputs, evaluations without a PR, and results
+  carrying ``data["error"]`` (transient fetch/exec failures) or a non-empty
+  ``data["pending"]`` (e.g. CI runs still in progress) are not cached.
+  Nothing else would drop a provisional result whose settling event never
+  reaches the engine.
+- ``command`` results are not cached here: the command runs against a
+  checkout, not the PR head, and ``CommandExecutor`` keys its own cache by
+  that checkout's tree.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+from squadron.pipeline.gates import GateCheck, GateCheckResult, PipelineContext
+
+logger = logging.getLogger("squadron.pipeline.gate_cache")
+
+DEFAULT_MAX_ENTRIES = 1024
+
+# (owner, repo, pr_number)
+_PrKey = tuple[str, str, int]
+# (pr key, check name, config json, input values)
+GateResultKey = tuple[_PrKey, str, str, tuple[Any, ...]]
+
+
+@dataclass
+class _Entry:
+    result: GateCheckResult
+    events: frozenset[str]
+
+
+class GateResultCache:
+    """Gate check results by (check, config, PR, input values)."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[GateResultKey, _Entry] = OrderedDict()
+        self._by_pr: dict[_PrKey, set[GateResultKey]] = {}
+        self._per_check: dict[str, dict[str, int]] = {}
+        self._stats = {"invalidated": 0, "evicted": 0}
+
+    async def key(
+        self,
+        name: str,
+        check: GateCheck,
+        config: dict[str, Any],
+        context: PipelineContext,
+    ) -> GateResultKey | None:
+        """Cache key for one evaluation, or None when it is not cacheable."""
+        inputs = check.cache_inputs
+        if not inputs or not context.pr_number or context.github_client is None:
+            return None
+        try:
+            values = await _input_values(inputs, context)
+            config_json = json.dumps(config, sort_keys=True, default=str)
+        except Exception:
+            logger.debug("Gate '%s' inputs unavailable, not caching", name, exc_info=True)
+            return None
+        return ((context.owner, context.repo, context.pr_number), name, config_json, values)
+
+    def get(self, key: GateResultKey) -> GateCheckResult | None:
+        counters = self._per_check.setdefault(key[1], {"hits": 0, "misses": 0})
+        entry = self._entries.get(key)
+        if entry is None:
+            counters["misses"] += 1
+            return None
+        counters["hits"] += 1
+        self._entries.move_to_end(key)
+        return entry.result
+
+    def put(self, key: GateResultKey, check: GateCheck, result: GateCheckResult) -> None:
+        if result.data.get("error") or result.data.get("pending"):
+            return
+        self._entries[key] = _Entry(result, frozenset(check.reactive_events))
+        self._entries.move_to_end(key)
+        self._by_pr.setdefault(key[0], set()).add(key)
+        while len(self._entries) > self.max_entries:
+            old, _ = self._entries.popitem(last=False)
+            self._unlink(old)
+            self._stats["evicted"] += 1
+
+    def invalidate(self, event_type: str, owner: str, repo: str, pr_number: int | None) -> int:
+        """Drop the PR's entries whose check reacts to ``event_type``.
+
+        Without a PR number (e.g. ``check_run`` and ``status`` payloads) the
+        entries of every PR in the repo are candidates.
+        """
+        if pr_number:
+            keys: set[GateResultKey] = self._by_pr.get((owner, repo, pr_number), set())
+        else:
+            keys = {k for pr, ks in self._by_pr.items() if pr[:2] == (owner, repo) for k in ks}
+        stale = [k for k in keys if event_type in self._entries[k].events]
+        for k in stale:
+            del self._entries[k]
+            self._unlink(k)
+        self._stats["invalidated"] += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._by_pr.clear()
+
+    def stats(self) -> dict[str, Any]:
+        checks = {}
+        for name, counters in sorted(self._per_check.items()):
+            lookups = counters["hits"] + counters["misses"]
+            checks[name] = {
+                **counters,
+                "hit_rate": round(counters["hits"] / lookups, 3) if lookups else 0.0,
+            }
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            **self._stats,
+            "checks": checks,
+        }
+
+    def _unlink(self, key: GateResultKey) -> None:
+        keys = self._by_pr.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_pr[key[0]]
+
+
+async def _input_values(inputs: set[str], context: PipelineContext) -> tuple[Any, ...]:
+    values: list[Any] = []
+    if "head_sha" in inputs or "labels" in inputs:
+        pr = await context.get_pull_request()
+        if "head_sha" in inputs:
+            head_sha = (pr.get("head") or {}).get("sha")
+            if not head_sha:
+                raise ValueError("PR has no head SHA")
+            values.append(("head_sha", head_sha))
+        if "labels" in inputs:
+            labels = sorted(lbl.get("name", "") for lbl in pr.get("labels", []))
+            values.append(("labels", tuple(labels)))
+    if "reviews" in inputs:
+        reviews = await context.get_pr_reviews()
+        review_set = tuple(
+            (r.get("id"), (r.get("user") or {}).get("login", ""), r.get("state", ""))
+            for r in reviews
+        )
+        values.append(("reviews", review_set))
+    return tuple(values)
@@ -6,6 +6,7 @@ Key exports:
     GateCheck — Abstract base class for all gate checks
     GateCheckResult — Result of a gate check evaluation
     GateCheckRegistry — Registry that maps check names to GateCheck classes
+    GateFetchContext — GitHub reads memoized across one gate evaluation
     Built-in checks: CommandCheck, FileExistsCheck, PrApprovalsMetCheck,
         CiStatusCheck, LabelPresentCheck, NoChangesRequestedCheck,
         HumanApprovedCheck, BranchUpToDateCheck
@@ -13,9 +14,11 @@ Key exports:
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Protocol
@@ -41,6 +44,34 @@ class GateCheckResult:
 # ── Pipeline Context (passed to gate checks) ────────────────────────────────
 
 
+class GateFetchContext:
+    """GitHub reads shared by the conditions of one gate evaluation.
+
+    Conditions run concurrently, and several of them read the same PR,
+    reviews or check runs. The first caller for a key starts the request;
+    concurrent and later callers await the same result (or exception).
+    A caller being cancelled (``any_of`` short-circuit) never cancels a
+    request another condition is waiting on.
+    """
+
+    def __init__(self) -> None:
+        self._requests: dict[tuple[Any, ...], asyncio.Future[Any]] = {}
+        self.fetches = 0
+        self.hits = 0
+
+    async def get(self, key: tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        request = self._requests.get(key)
+        if request is None:
+            self.fetches += 1
+            request = asyncio.ensure_future(fetch())
+            # Mark a failure as retrieved even if every waiter was cancelled
+            request.add_done_callback(lambda f: f.cancelled() or f.exception())
+            self._requests[key] = request
+        else:
+            self.hits += 1
+        return await asyncio.shield(request)
+
+
 @dataclass
 class PipelineContext:
     """Contextual information available to gate checks during evaluation."""
@@ -54,6 +85,59 @@ class PipelineContext:
 
     # Injected dependencies (set by engine before evaluation)
     github_client: GitHubClient | None = None
+    checkout_resolver: CheckoutResolver | None = None
+    # Memoized GitHub reads for the current gate evaluation (None = no sharing)
+    fetch: GateFetchContext | None = None
+
+    async def _read(self, key: tuple[Any, ...], fetch: Callable[[], Awaitable[Any]]) -> Any:
+        if self.fetch is None:
+            return await fetch()
+        return await self.fetch.get((self.owner, self.repo, *key), fetch)
+
+    def _client(self) -> GitHubClient:
+        if self.github_client is None:
+            raise RuntimeError("No GitHub client available")
+        return self.github_client
+
+    def _pr(self) -> int:
+        if not self.pr_number:
+            raise RuntimeError("No PR number available")
+        return self.pr_number
+
+    async def get_pull_request(self) -> dict[str, Any]:
+        """The PR under evaluation."""
+        client, pr_number = self._client(), self._pr()
+        return await self._read(
+            ("pr", pr_number),
+            lambda: client.get_pull_request(self.owner, self.repo, pr_number),
+        )
+
+    async def get_pr_reviews(self) -> list[dict[str, Any]]:
+        """Reviews of the PR under evaluation."""
+        client, pr_number = self._client(), self._pr()
+        return await self._read(
+            ("reviews", pr_number),
+            lambda: client.get_pr_reviews(self.owner, self.repo, pr_number),
+        )
+
+    async def list_check_runs(self, ref: str) -> list[dict[str, Any]]:
+        """Check runs for a commit."""
+        client = self._client()
+        return await self._read(
+            ("check_runs", ref),
+            lambda: client.list_check_runs(self.owner, self.repo, ref),
+        )
+
+    async def get_checkout(self) -> str | None:
+        """Checkout of the PR head that commands run in.
+
+        None when there is no PR or no resolver, i.e. commands run in the
+        runner's default directory. Raises when the checkout cannot be made.
+        """
+        if not self.pr_number or self.checkout_resolver is None:
+            return None
+        resolver, pr_number = self.checkout_resolver, self.pr_number
+        return await self._read(("checkout", pr_number), lambda: resolver(self))
 
 
 # ── Command Runner Protocol ──────────────────────────────────────────────────
@@ -71,6 +155,14 @@ class CommandRunner(Protocol):
     ) -> tuple[int, str, str]: ...
 
 
+class CheckoutResolver(Protocol):
+    """Protocol for materializing a PR's head commit (for CommandCheck)."""
+
+    async def __call__(self, context: PipelineContext) -> str:
+        """Path of a checkout at the head of ``context.pr_number``."""
+        ...
+
+
 # ── Abstract Gate Check ─────────────────────────────────────────────────────
 
 
@@ -82,12 +174,21 @@ class GateCheck(ABC):
           trigger re-evaluation of this check.
         - Implement `evaluate()` which receives check-specific config and
           pipeline context.
+
+    Subclasses may set `cache_inputs` to the PR inputs their result depends
+    on ("head_sha", "labels", "reviews"). The engine then reuses a result
+    while those inputs are unchanged and none of `reactive_events` has
+    arrived for the PR. Results with `data["error"]` (transient failure) or
+    a non-empty `data["pending"]` (outcome not settled yet) are never reused.
     """
 
     # Which GitHub events should trigger re-evaluation of this check.
     # Empty set = only evaluated on stage entry (no reactive re-eval).
     reactive_events: set[str] = set()
 
+    # PR inputs that key cached results. Empty set = never cached.
+    cache_inputs: set[str] = set()
+
     @abstractmethod
     async def evaluate(
         self,
@@ -116,6 +217,9 @@ class CommandCheck(GateCheck):
     Config:
         run: str — command to execute
         expect: str — "success" (default) or "failure"
+
+    For a PR the command runs in a checkout of the PR head (see
+    ``PipelineContext.get_checkout``), never in a directory shared by PRs.
     """
 
     reactive_events: set[str] = set()  # Manual only
@@ -138,7 +242,16 @@ class CommandCheck(GateCheck):
         expect = config.get("expect", "success")
 
         try:
-            exit_code, stdout, stderr = await self._command_runner(command, timeout=300)
+            cwd = await context.get_checkout()
+        except Exception as exc:
+            return GateCheckResult(
+                passed=False,
+                message=f"Could not check out PR #{context.pr_number}: {exc}",
+                data={"error": str(exc)},
+            )
+
+        try:
+            exit_code, stdout, stderr = await self._command_runner(command, cwd=cwd, timeout=300)
         except Exception as exc:
             return GateCheckResult(
                 passed=False,
@@ -198,6 +311,7 @@ class PrApprovalsMetCheck(GateCheck):
         "pull_request_review.submitted",
         "pull_request_review.dismissed",
     }
+    cache_inputs: set[str] = {"reviews"}
 
     async def evaluate(
         self,
@@ -212,13 +326,12 @@ class PrApprovalsMetCheck(GateCheck):
         bot_username = context.context.get("bot_username", "squadron-dev[bot]")
 
         try:
-            reviews = await context.github_client.get_pr_reviews(
-                context.owner, context.repo, context.pr_number
-            )
+            reviews = await context.get_pr_reviews()
         except Exception as exc:
             return GateCheckResult(
                 passed=False,
                 message=f"Failed to fetch PR reviews: {exc}",
+                data={"error": str(exc)},
             )
 
         # Build latest review state per user (last review wins)
@@ -262,6 +375,7 @@ class CiStatusCheck(GateCheck):
     """
 
     reactive_events: set[str] = {"check_suite.completed", "check_run.completed", "status"}
+    cache_inputs: set[str] = {"head_sha"}
 
     async def evaluate(
         self,
@@ -273,21 +387,24 @@ class CiStatusCheck(GateCheck):
 
         try:
             # Get the PR to find the head SHA
-            pr = await context.github_client.get_pull_request(
-                context.owner, context.repo, context.pr_number
-            )
+            pr = await context.get_pull_request()
             head_sha = pr.get("head", {}).get("sha", "")
             if not head_sha:
                 return GateCheckResult(passed=False, message="Could not determine head SHA")
 
-            check_runs = await context.github_client.list_check_runs(
-                context.owner, context.repo, head_sha
-            )
+            check_runs = await context.list_check_runs(head_sha)
         except Exception as exc:
-            return GateCheckResult(passed=False, message=f"Failed to fetch CI status: {exc}")
+            return GateCheckResult(
+                passed=False,
+                message=f"Failed to fetch CI status: {exc}",
+                data={"error": str(exc)},
+            )
 
         required_workflows = config.get("workflows", [])
         expect = config.get("expect", "success")
+        # Runs that have not concluded yet (or not been created): the result
+        # is provisional and must not outlive the next CI event.
+        pending = [cr["name"] for cr in check_runs if cr.get("status") != "completed"]
 
         if required_workflows:
             # Check specific workflows
@@ -297,7 +414,7 @@ class CiStatusCheck(GateCheck):
                 return GateCheckResult(
                     passed=False,
                     message=f"Missing CI checks: {', '.join(missing)}",
-                    data={"missing": missing},
+                    data={"missing": missing, "pending": missing},
                 )
             failed = []
             for name in required_workflows:
@@ -307,10 +424,11 @@ class CiStatusCheck(GateCheck):
                     failed.append(f"{name}: {conclusion}")
 
             if failed:
+                pending = [name for name in required_workflows if name in pending]
                 return GateCheckResult(
                     passed=False,
                     message=f"CI checks not passing: {', '.join(failed)}",
-                    data={"failed": failed},
+                    data={"failed": failed, "pending": pending},
                 )
         else:
             # All checks must pass
@@ -326,7 +444,7 @@ class CiStatusCheck(GateCheck):
                 return GateCheckResult(
                     passed=False,
                     message=f"CI checks not passing: {', '.join(failed)}",
-                    data={"failed": failed},
+                    data={"failed": failed, "pending": pending},
                 )
 
         return GateCheckResult(
@@ -344,6 +462,7 @@ class LabelPresentCheck(GateCheck):
     """
 
     reactive_events: set[str] = {"pull_request.labeled", "pull_request.unlabeled"}
+    cache_inputs: set[str] = {"labels"}
 
     async def evaluate(
         self,
@@ -358,11 +477,11 @@ class LabelPresentCheck(GateCheck):
             return GateCheckResult(passed=False, message="No label specified")
 
         try:
-            pr = await context.github_client.get_pull_request(
-                context.owner, context.repo, context.pr_number
-            )
+            pr = await context.get_pull_request()
         except Exception as exc:
-            return GateCheckResult(passed=False, message=f"Failed to fetch PR: {exc}")
+            return GateCheckResult(
+                passed=False, message=f"Failed to fetch PR: {exc}", data={"error": str(exc)}
+            )
 
         labels = [lbl.get("name", "") for lbl in pr.get("labels", [])]
         passed = required_label in labels
@@ -387,6 +506,7 @@ class NoChangesRequestedCheck(GateCheck):
         "pull_request_review.submitted",
         "pull_request_review.dismissed",
     }
+    cache_inputs: set[str] = {"reviews"}
 
     async def evaluate(
         self,
@@ -397,11 +517,11 @@ class NoChangesRequestedCheck(GateCheck):
             return GateCheckResult(passed=False, message="No PR number or GitHub client available")
 
         try:
-            reviews = await context.github_client.get_pr_reviews(
-                context.owner, context.repo, context.pr_number
-            )
+            reviews = await context.get_pr_reviews()
         except Exception as exc:
-            return GateCheckResult(passed=False, message=f"Failed to fetch reviews: {exc}")
+            return GateCheckResult(
+                passed=False, message=f"Failed to fetch reviews: {exc}", data={"error": str(exc)}
+            )
 
         # Build latest review state per user
         latest: dict[str, str] = {}
@@ -432,6 +552,7 @@ class HumanApprovedCheck(GateCheck):
     """
 
     reactive_events: set[str] = {"pull_request_review.submitted"}
+    cache_inputs: set[str] = {"reviews"}
 
     async def evaluate(
         self,
@@ -444,11 +565,11 @@ class HumanApprovedCheck(GateCheck):
         required = config.get("count", 1)
 
         try:
-            reviews = await context.github_client.get_pr_reviews(
-                context.owner, context.repo, context.pr_number
-            )
+            reviews = await context.get_pr_reviews()
         except Exception as exc:
-            return GateCheckResult(passed=False, message=f"Failed to fetch reviews: {exc}")
+            return GateCheckResult(
+                passed=False, message=f"Failed to fetch reviews: {exc}", data={"error": str(exc)}
+            )
 
         latest: dict[str, str] = {}
         for review in reviews:
@@ -492,11 +613,11 @@ class BranchUpToDateCheck(GateCheck):
             return GateCheckResult(passed=False, message="No PR number or GitHub client available")
 
         try:
-            pr = await context.github_client.get_pull_request(
-                context.owner, context.repo, context.pr_number
-            )
+            pr = await context.get_pull_request()
         except Exception as exc:
-            return GateCheckResult(passed=False, message=f"Failed to fetch PR: {exc}")
+            return GateCheckResult(
+                passed=False, message=f"Failed to fetch PR: {exc}", data={"error": str(exc)}
+            )
 
         # GitHub's mergeable_state tells us if branch is behind
         mergeable_state = pr.get("mergeable_state", "unknown")
@@ -536,6 +657,8 @@ class GateCheckRegistry:
     def __init__(self, command_runner: CommandRunner | None = None):
         self._checks: dict[str, GateCheck] = {}
         self._command_runner = command_runner
+        # Bumped on every registration so caches derived from checks can invalidate
+        self._generation = 0
         self._register_builtins()
 
     def _register_builtins(self) -> None:
@@ -558,6 +681,7 @@ class GateCheckRegistry:
             msg = f"Gate check '{name}' already registered"
             raise ValueError(msg)
         self._checks[name] = check
+        self._generation += 1
 
     def load_custom_gates(self, gate_configs: list[dict[str, Any]]) -> None:
         """Load custom gate checks from user-specified Python modules.
@@ -634,6 +758,11 @@ class GateCheckRegistry:
                 mapping.setdefault(event, set()).add(name)
         return mapping
 
+    @property
+    def generation(self) -> int:
+        """Counter that changes whenever a check is registered."""
+        return self._generation
+
     @property
     def check_names(self) -> list[str]:
         """Return sorted list of all registered check names."""
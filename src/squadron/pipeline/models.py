@@ -62,6 +62,15 @@ class HumanWaitType(str, Enum):
     DISMISS = "dismiss"
 
 
+# GitHub event that satisfies each HumanWaitType
+HUMAN_WAIT_EVENTS: dict[HumanWaitType, str] = {
+    HumanWaitType.APPROVAL: "pull_request_review.submitted",
+    HumanWaitType.COMMENT: "issue_comment.created",
+    HumanWaitType.LABEL: "pull_request.labeled",
+    HumanWaitType.DISMISS: "pull_request_review.dismissed",
+}
+
+
 class PipelineScope(str, Enum):
     """Scope of a pipeline run."""
 
@@ -260,6 +269,7 @@ class StageDefinition(BaseModel):
     # Parallel stage fields
     join: JoinStrategy | None = None
     branches: list[ParallelBranch] = []
+    max_parallel: int | None = Field(None, ge=1)  # Branches launched at once
 
     # Delay stage fields
     duration: str | None = None
@@ -458,6 +468,7 @@ class PipelineRun(BaseModel):
     run_id: str
     pipeline_name: str
     definition_snapshot: str = "{}"  # JSON-serialized PipelineDefinition
+    definition_hash: str | None = None  # pipeline_definitions key, set on insert
 
     # Trigger context
     trigger_event: str | None = None
@@ -525,6 +536,24 @@ class StageRun(BaseModel):
         return None
 
 
+class ParallelCounters(BaseModel):
+    """Branch tallies of one parallel stage execution.
+
+    Maintained by the registry in the same transaction as each branch's
+    status change; ``pending`` counts branches not yet completed, failed
+    or skipped.
+    """
+
+    run_id: str
+    stage_id: str
+    stage_run_id: int  # The parallel stage's own stage run
+
+    pending: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
 class GateCheckRecord(BaseModel):
     """Record of a single gate check evaluation."""
 
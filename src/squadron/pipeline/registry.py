@@ -4,8 +4,14 @@ AD-019: Unified registry replacing both AgentRegistry workflow tables and Workfl
 
 Key exports:
     PipelineRegistry — All CRUD operations for pipeline_runs, pipeline_stage_runs,
-        pipeline_gate_checks, pipeline_human_stage_state, pipeline_pr_associations,
-        pr_review_requirements, pr_approvals, pr_sequence_state.
+        pipeline_parallel_counters, pipeline_gate_checks, pipeline_human_stage_state,
+        pipeline_pr_associations, pr_review_requirements, pr_approvals,
+        pr_sequence_state.
+
+Definition snapshots are content-addressed: each distinct snapshot is stored
+once in pipeline_definitions and runs reference it by hash, so the hot
+pipeline_runs table holds only run state. Snapshots are few and immutable,
+so they are kept in memory once read.
 """
 
 from __future__ import annotations
@@ -13,13 +19,15 @@ from __future__ import annotations
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 import aiosqlite
 
+from squadron.pipeline.compiled import snapshot_hash
 from squadron.pipeline.models import (
     GateCheckRecord,
     HumanStageState,
+    ParallelCounters,
     PipelineRun,
     PipelineRunStatus,
     PipelineScope,
@@ -29,6 +37,13 @@ from squadron.pipeline.models import (
 
 logger = logging.getLogger("squadron.pipeline.registry")
 
+_BRANCH_DONE_STATUSES = (StageRunStatus.COMPLETED, StageRunStatus.FAILED, StageRunStatus.SKIPPED)
+
+# Called after every pipeline run write with (run_id, run); run is None on delete
+PipelineRunListener = Callable[[str, "PipelineRun | None"], None]
+# Called after a PR is associated with a pipeline run, with (run_id, pr_number)
+PrAssociationListener = Callable[[str, int], None]
+
 
 class PipelineRegistry:
     """SQLite-backed persistence for the unified pipeline system.
@@ -39,21 +54,126 @@ class PipelineRegistry:
 
     def __init__(self, db: aiosqlite.Connection):
         self._db = db
+        self._listeners: list[PipelineRunListener] = []
+        self._association_listeners: list[PrAssociationListener] = []
+        # Definition snapshots by hash (immutable, so never invalidated)
+        self._definitions: dict[str, str] = {}
+
+    def add_listener(self, listener: PipelineRunListener) -> None:
+        """Register a synchronous callback invoked after each pipeline run write."""
+        self._listeners.append(listener)
+
+    def _notify(self, run_id: str, run: PipelineRun | None) -> None:
+        for listener in self._listeners:
+            try:
+                listener(run_id, run)
+            except Exception:
+                logger.exception("Pipeline registry listener failed for %s", run_id)
+
+    def add_pr_association_listener(self, listener: PrAssociationListener) -> None:
+        """Register a synchronous callback invoked after each PR association."""
+        self._association_listeners.append(listener)
 
     async def initialize(self) -> None:
         """Create all pipeline tables if they don't exist."""
         await self._db.executescript(_SCHEMA_SQL)
+        await self._migrate_definition_snapshots()
         await self._db.commit()
         logger.info("Pipeline registry tables initialized")
 
+    async def _migrate_definition_snapshots(self) -> None:
+        """Move inline ``definition_snapshot`` columns into pipeline_definitions.
+
+        Databases created before snapshots were content-addressed keep a full
+        JSON copy on every run row. Each distinct snapshot is moved into
+        pipeline_definitions, the rows are pointed at it by hash and the old
+        column is dropped.
+        """
+        cursor = await self._db.execute("PRAGMA table_info(pipeline_runs)")
+        columns = {row[1] for row in await cursor.fetchall()}
+        if "definition_snapshot" not in columns:
+            return
+        if "definition_hash" not in columns:
+            await self._db.execute("ALTER TABLE pipeline_runs ADD COLUMN definition_hash TEXT")
+
+        cursor = await self._db.execute(
+            "SELECT run_id, definition_snapshot FROM pipeline_runs WHERE definition_hash IS NULL"
+        )
+        rows = await cursor.fetchall()
+        hashes: dict[str, str] = {}
+        updates: list[tuple[str, str]] = []
+        for run_id, snapshot in rows:
+            snapshot = snapshot or "{}"
+            digest = hashes.setdefault(snapshot, snapshot_hash(snapshot))
+            updates.append((digest, run_id))
+        await self._db.executemany(
+            "INSERT OR IGNORE INTO pipeline_definitions (hash, json) VALUES (?, ?)",
+            [(digest, snapshot) for snapshot, digest in hashes.items()],
+        )
+        await self._db.executemany(
+            "UPDATE pipeline_runs SET definition_hash = ? WHERE run_id = ?", updates
+        )
+        try:
+            await self._db.execute("ALTER TABLE pipeline_runs DROP COLUMN definition_snapshot")
+        except aiosqlite.OperationalError:
+            # SQLite < 3.35 cannot drop columns; blank the copies instead
+            await self._db.execute("UPDATE pipeline_runs SET definition_snapshot = ''")
+        logger.info(
+            "Migrated %d pipeline run(s) to %d content-addressed definition(s)",
+            len(updates),
+            len(hashes),
+        )
+
+    # ── Definition Snapshots ─────────────────────────────────────────────────
+
+    async def store_definition(self, snapshot: str) -> str:
+        """Store a definition snapshot (once per content) and return its hash."""
+        digest = snapshot_hash(snapshot)
+        # Always written: the caller's transaction may not have committed a
+        # previous insert of the same snapshot
+        await self._db.execute(
+            "INSERT OR IGNORE INTO pipeline_definitions (hash, json) VALUES (?, ?)",
+            (digest, snapshot),
+        )
+        self._definitions[digest] = snapshot
+        return digest
+
+    async def get_definition(self, definition_hash: str) -> str | None:
+        """Fetch a definition snapshot by hash."""
+        snapshot = self._definitions.get(definition_hash)
+        if snapshot is None:
+            await self._load_definitions({definition_hash})
+            snapshot = self._definitions.get(definition_hash)
+        return snapshot
+
+    async def _load_definitions(self, hashes: set[str]) -> None:
+        missing = [h for h in hashes if h and h not in self._definitions]
+        if not missing:
+            return
+        placeholders = ", ".join("?" for _ in missing)
+        cursor = await self._db.execute(
+            f"SELECT hash, json FROM pipeline_definitions WHERE hash IN ({placeholders})",
+            missing,
+        )
+        for row in await cursor.fetchall():
+            self._definitions[row["hash"]] = row["json"]
+
+    async def _rows_to_runs(self, rows: list[aiosqlite.Row]) -> list[PipelineRun]:
+        """Convert run rows, attaching their definition snapshots."""
+        await self._load_definitions({r["definition_hash"] for r in rows})
+        return [
+            _row_to_pipeline_run(r, self._definitions.get(r["definition_hash"], "{}")) for r in rows
+        ]
+
     # ── Pipeline Run CRUD ────────────────────────────────────────────────────
 
     async def create_pipeline_run(self, run: PipelineRun) -> None:
         """Insert a new pipeline run."""
+        run.definition_hash = await self.store_definition(run.definition_snapshot)
         await self._db.execute(
             """
             INSERT INTO pipeline_runs (
-                run_id, pipeline_name, definition_snapshot,
+                run_id, pipeline_name, definition_hash,
                 trigger_event, trigger_delivery_id, issue_number, pr_number, scope,
                 parent_run_id, parent_stage_id, nesting_depth,
                 status, current_stage_id, context,
@@ -64,7 +184,7 @@ class PipelineRegistry:
             (
                 run.run_id,
                 run.pipeline_name,
-                run.definition_snapshot,
+                run.definition_hash,
                 run.trigger_event,
                 run.trigger_delivery_id,
                 run.issue_number,
@@ -84,6 +204,7 @@ class PipelineRegistry:
             ),
         )
         await self._db.commit()
+        self._notify(run.run_id, run)
 
     async def get_pipeline_run(self, run_id: str) -> PipelineRun | None:
         """Fetch a pipeline run by ID."""
@@ -91,7 +212,7 @@ class PipelineRegistry:
         row = await cursor.fetchone()
         if not row:
             return None
-        return _row_to_pipeline_run(row)
+        return (await self._rows_to_runs([row]))[0]
 
     async def get_pipeline_runs_by_pr(
         self, pr_number: int, *, status: PipelineRunStatus | None = None
@@ -109,7 +230,7 @@ class PipelineRegistry:
                 (pr_number,),
             )
         rows = await cursor.fetchall()
-        return [_row_to_pipeline_run(r) for r in rows]
+        return await self._rows_to_runs(list(rows))
 
     async def get_pipeline_runs_by_issue(
         self, issue_number: int, *, status: PipelineRunStatus | None = None
@@ -127,7 +248,7 @@ class PipelineRegistry:
                 (issue_number,),
             )
         rows = await cursor.fetchall()
-        return [_row_to_pipeline_run(r) for r in rows]
+        return await self._rows_to_runs(list(rows))
 
     async def get_active_pipeline_runs(self) -> list[PipelineRun]:
         """Get all pipeline runs with status pending or running."""
@@ -136,7 +257,7 @@ class PipelineRegistry:
             (PipelineRunStatus.PENDING.value, PipelineRunStatus.RUNNING.value),
         )
         rows = await cursor.fetchall()
-        return [_row_to_pipeline_run(r) for r in rows]
+        return await self._rows_to_runs(list(rows))
 
     async def get_recent_pipeline_runs(
         self,
@@ -163,7 +284,7 @@ class PipelineRegistry:
         params.extend([limit, offset])
         cursor = await self._db.execute(query, params)
         rows = await cursor.fetchall()
-        return [_row_to_pipeline_run(r) for r in rows]
+        return await self._rows_to_runs(list(rows))
 
     async def count_pipeline_runs(
         self,
@@ -192,7 +313,7 @@ class PipelineRegistry:
             (parent_run_id,),
         )
         rows = await cursor.fetchall()
-        return [_row_to_pipeline_run(r) for r in rows]
+        return await self._rows_to_runs(list(rows))
 
     async def get_running_pipelines_for_pr(self, pr_number: int) -> list[PipelineRun]:
         """Get running pipelines for a specific PR (including via PR associations)."""
@@ -201,8 +322,8 @@ class PipelineRegistry:
             "SELECT * FROM pipeline_runs WHERE pr_number = ? AND status IN (?, ?)",
             (pr_number, PipelineRunStatus.PENDING.value, PipelineRunStatus.RUNNING.value),
         )
-        rows = await cursor.fetchall()
-        direct = {r["run_id"]: _row_to_pipeline_run(r) for r in rows}
+        rows = list(await cursor.fetchall())
+        seen = {r["run_id"] for r in rows}
 
         # Via associations (multi-PR pipelines)
         cursor = await self._db.execute(
@@ -213,13 +334,12 @@ class PipelineRegistry:
             """,
             (pr_number, PipelineRunStatus.PENDING.value, PipelineRunStatus.RUNNING.value),
         )
-        rows = await cursor.fetchall()
-        for r in rows:
-            rid = r["run_id"]
-            if rid not in direct:
-                direct[rid] = _row_to_pipeline_run(r)
+        for r in await cursor.fetchall():
+            if r["run_id"] not in seen:
+                seen.add(r["run_id"])
+                rows.append(r)
 
-        return list(direct.values())
+        return await self._rows_to_runs(rows)
 
     async def update_pipeline_run(self, run: PipelineRun) -> None:
         """Update a pipeline run's mutable fields."""
@@ -243,6 +363,7 @@ class PipelineRegistry:
             ),
         )
         await self._db.commit()
+        self._notify(run.run_id, run)
 
     async def delete_pipeline_run(self, run_id: str) -> None:
         """Delete a pipeline run and all associated records (cascading)."""
@@ -252,39 +373,138 @@ class PipelineRegistry:
         )
         await self._db.execute("DELETE FROM pipeline_runs WHERE run_id = ?", (run_id,))
         await self._db.commit()
+        self._notify(run_id, None)
 
     # ── Stage Run CRUD ───────────────────────────────────────────────────────
 
     async def create_stage_run(self, stage_run: StageRun) -> int:
         """Insert a new stage run. Returns the auto-increment ID."""
         cursor = await self._db.execute(
+            f"{_INSERT_STAGE_RUN} VALUES {_STAGE_RUN_ROW}",
+            _stage_run_row(stage_run),
+        )
+        await self._db.commit()
+        return cursor.lastrowid  # type: ignore[return-value]
+
+    async def create_parallel_branches(
+        self, parallel_stage_run: StageRun, branch_runs: list[StageRun]
+    ) -> list[int]:
+        """Insert a parallel stage's branch runs and reset its counters.
+
+        Both writes are committed together. From then on the counters follow
+        every branch status change (see ``trg_parallel_branch_status``).
+        Returns the branch run IDs in order.
+        """
+        if parallel_stage_run.id is None:
+            msg = "Cannot create branches for a stage run without an ID"
+            raise ValueError(msg)
+        statuses = [branch_run.status for branch_run in branch_runs]
+        await self._db.execute(
             """
-            INSERT INTO pipeline_stage_runs (
-                run_id, stage_id, status, agent_id,
-                branch_id, parent_stage_id, child_pipeline_run_id,
-                outputs, error_message,
-                attempt_number, max_attempts,
-                started_at, completed_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            INSERT OR REPLACE INTO pipeline_parallel_counters (
+                run_id, stage_id, stage_run_id, pending, succeeded, failed, skipped
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
             """,
             (
-                stage_run.run_id,
-                stage_run.stage_id,
-                stage_run.status.value,
-                stage_run.agent_id,
-                stage_run.branch_id,
-                stage_run.parent_stage_id,
-                stage_run.child_pipeline_run_id,
-                json.dumps(stage_run.outputs),
-                stage_run.error_message,
-                stage_run.attempt_number,
-                stage_run.max_attempts,
-                _dt_to_str(stage_run.started_at),
-                _dt_to_str(stage_run.completed_at),
+                parallel_stage_run.run_id,
+                parallel_stage_run.stage_id,
+                parallel_stage_run.id,
+                sum(status not in _BRANCH_DONE_STATUSES for status in statuses),
+                statuses.count(StageRunStatus.COMPLETED),
+                statuses.count(StageRunStatus.FAILED),
+                statuses.count(StageRunStatus.SKIPPED),
             ),
         )
+        ids = await self._insert_stage_runs(branch_runs)
         await self._db.commit()
-        return cursor.lastrowid  # type: ignore[return-value]
+        return ids
+
+    async def get_parallel_counters(self, run_id: str, stage_id: str) -> ParallelCounters | None:
+        """Branch counters of a parallel stage (primary-key lookup)."""
+        query = "SELECT * FROM pipeline_parallel_counters WHERE run_id = ? AND stage_id = ?"
+        cursor = await self._db.execute(query, (run_id, stage_id))
+        row = await cursor.fetchone()
+        if not row and await self._backfill_parallel_counters(run_id, stage_id):
+            cursor = await self._db.execute(query, (run_id, stage_id))
+            row = await cursor.fetchone()
+        if not row:
+            return None
+        return ParallelCounters(
+            run_id=row["run_id"],
+            stage_id=row["stage_id"],
+            stage_run_id=row["stage_run_id"],
+            pending=row["pending"],
+            succeeded=row["succeeded"],
+            failed=row["failed"],
+            skipped=row["skipped"],
+        )
+
+    async def _backfill_parallel_counters(self, run_id: str, stage_id: str) -> bool:
+        """Count the branches of a parallel stage started before counters existed."""
+        cursor = await self._db.execute(
+            "SELECT MAX(id) FROM pipeline_stage_runs "
+            "WHERE run_id = ? AND stage_id = ? AND parent_stage_id IS NULL",
+            (run_id, stage_id),
+        )
+        row = await cursor.fetchone()
+        if not row or row[0] is None:
+            return False
+        await self._db.execute(
+            """
+            INSERT OR IGNORE INTO pipeline_parallel_counters (
+                run_id, stage_id, stage_run_id, pending, succeeded, failed, skipped
+            )
+            SELECT ?, ?, ?,
+                COALESCE(SUM(status NOT IN ('completed', 'failed', 'skipped')), 0),
+                COALESCE(SUM(status = 'completed'), 0),
+                COALESCE(SUM(status = 'failed'), 0),
+                COALESCE(SUM(status = 'skipped'), 0)
+            FROM pipeline_stage_runs
+            WHERE run_id = ? AND parent_stage_id = ? AND id > ?
+            """,
+            (run_id, stage_id, row[0], run_id, stage_id, row[0]),
+        )
+        await self._db.commit()
+        return True
+
+    async def resolve_stage_run(
+        self,
+        stage_run_id: int,
+        status: StageRunStatus,
+        error_message: str | None = None,
+    ) -> bool:
+        """Move a WAITING stage run to a final status.
+
+        Returns False when the stage run is no longer WAITING, so exactly one
+        of several concurrent resolvers wins.
+        """
+        cursor = await self._db.execute(
+            """
+            UPDATE pipeline_stage_runs SET status = ?, error_message = ?, completed_at = ?
+            WHERE id = ? AND status = ?
+            """,
+            (
+                status.value,
+                error_message,
+                _dt_to_str(datetime.now(timezone.utc)),
+                stage_run_id,
+                StageRunStatus.WAITING.value,
+            ),
+        )
+        await self._db.commit()
+        return cursor.rowcount == 1
+
+    async def _insert_stage_runs(self, stage_runs: list[StageRun]) -> list[int]:
+        if not stage_runs:
+            return []
+        params = [value for stage_run in stage_runs for value in _stage_run_row(stage_run)]
+        cursor = await self._db.execute(
+            f"{_INSERT_STAGE_RUN} VALUES {', '.join([_STAGE_RUN_ROW] * len(stage_runs))}",
+            params,
+        )
+        # One INSERT on one connection allocates consecutive rowids
+        last = cursor.lastrowid or 0
+        return list(range(last - len(stage_runs) + 1, last + 1))
 
     async def get_stage_run(self, stage_run_id: int) -> StageRun | None:
         """Fetch a stage run by its auto-increment ID."""
@@ -470,6 +690,11 @@ class PipelineRegistry:
             (pipeline_run_id, pr_number, repo, stage_id, role),
         )
         await self._db.commit()
+        for listener in self._association_listeners:
+            try:
+                listener(pipeline_run_id, pr_number)
+            except Exception:
+                logger.exception("PR association listener failed for %s", pipeline_run_id)
 
     async def get_pr_associations(self, pipeline_run_id: str) -> list[dict[str, Any]]:
         """Get all PR associations for a pipeline run."""
@@ -480,6 +705,18 @@ class PipelineRegistry:
         rows = await cursor.fetchall()
         return [dict(r) for r in rows]
 
+    async def get_active_pr_associations(self) -> list[tuple[str, int]]:
+        """(run_id, pr_number) associations of pending or running pipeline runs."""
+        cursor = await self._db.execute(
+            """
+            SELECT ppa.pipeline_run_id, ppa.pr_number FROM pipeline_pr_associations ppa
+            JOIN pipeline_runs pr ON pr.run_id = ppa.pipeline_run_id
+            WHERE pr.status IN (?, ?)
+            """,
+            (PipelineRunStatus.PENDING.value, PipelineRunStatus.RUNNING.value),
+        )
+        return [(r[0], r[1]) for r in await cursor.fetchall()]
+
     # ── PR Review Requirements ───────────────────────────────────────────────
 
     async def set_pr_requirements(
@@ -646,10 +883,16 @@ class PipelineRegistry:
 # ── SQL Schema ───────────────────────────────────────────────────────────────
 
 _SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS pipeline_definitions (
+    hash TEXT PRIMARY KEY,
+    json TEXT NOT NULL,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE TABLE IF NOT EXISTS pipeline_runs (
     run_id TEXT PRIMARY KEY,
     pipeline_name TEXT NOT NULL,
-    definition_snapshot TEXT NOT NULL DEFAULT '{}',
+    definition_hash TEXT REFERENCES pipeline_definitions(hash),
 
     trigger_event TEXT,
     trigger_delivery_id TEXT UNIQUE,
@@ -711,6 +954,34 @@ CREATE INDEX IF NOT EXISTS idx_pipeline_stage_runs_run
 CREATE INDEX IF NOT EXISTS idx_pipeline_stage_runs_agent
     ON pipeline_stage_runs(agent_id);
 
+-- Branch tallies per parallel stage, kept in step with branch status changes
+CREATE TABLE IF NOT EXISTS pipeline_parallel_counters (
+    run_id TEXT NOT NULL REFERENCES pipeline_runs(run_id) ON DELETE CASCADE,
+    stage_id TEXT NOT NULL,
+    stage_run_id INTEGER NOT NULL,
+
+    pending INTEGER NOT NULL DEFAULT 0,
+    succeeded INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    skipped INTEGER NOT NULL DEFAULT 0,
+
+    PRIMARY KEY (run_id, stage_id)
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_parallel_branch_status
+AFTER UPDATE OF status ON pipeline_stage_runs
+WHEN NEW.parent_stage_id IS NOT NULL AND NEW.status != OLD.status
+BEGIN
+    UPDATE pipeline_parallel_counters SET
+        pending = pending
+            + (NEW.status NOT IN ('completed', 'failed', 'skipped'))
+            - (OLD.status NOT IN ('completed', 'failed', 'skipped')),
+        succeeded = succeeded + (NEW.status = 'completed') - (OLD.status = 'completed'),
+        failed = failed + (NEW.status = 'failed') - (OLD.status = 'failed'),
+        skipped = skipped + (NEW.status = 'skipped') - (OLD.status = 'skipped')
+    WHERE run_id = NEW.run_id AND stage_id = NEW.parent_stage_id;
+END;
+
 CREATE TABLE IF NOT EXISTS pipeline_gate_checks (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     stage_run_id INTEGER NOT NULL REFERENCES pipeline_stage_runs(id) ON DELETE CASCADE,
@@ -784,6 +1055,16 @@ CREATE TABLE IF NOT EXISTS pr_sequence_state (
 );
 """
 
+_INSERT_STAGE_RUN = """
+INSERT INTO pipeline_stage_runs (
+    run_id, stage_id, status, agent_id,
+    branch_id, parent_stage_id, child_pipeline_run_id,
+    outputs, error_message,
+    attempt_number, max_attempts,
+    started_at, completed_at
+)"""
+_STAGE_RUN_ROW = "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
 
 # ── Row-to-Model Converters ─────────────────────────────────────────────────
 
@@ -795,6 +1076,25 @@ def _dt_to_str(dt: datetime | None) -> str | None:
     return dt.isoformat()
 
 
+def _stage_run_row(stage_run: StageRun) -> tuple[Any, ...]:
+    """Insert parameters for a stage run, in ``_INSERT_STAGE_RUN`` column order."""
+    return (
+        stage_run.run_id,
+        stage_run.stage_id,
+        stage_run.status.value,
+        stage_run.agent_id,
+        stage_run.branch_id,
+        stage_run.parent_stage_id,
+        stage_run.child_pipeline_run_id,
+        json.dumps(stage_run.outputs),
+        stage_run.error_message,
+        stage_run.attempt_number,
+        stage_run.max_attempts,
+        _dt_to_str(stage_run.started_at),
+        _dt_to_str(stage_run.completed_at),
+    )
+
+
 def _str_to_dt(s: str | None) -> datetime | None:
     """Parse ISO string from SQLite back to datetime."""
     if not s:
@@ -805,8 +1105,8 @@ def _str_to_dt(s: str | None) -> datetime | None:
         return None
 
 
-def _row_to_pipeline_run(row: aiosqlite.Row) -> PipelineRun:
-    """Convert a database row to a PipelineRun model."""
+def _row_to_pipeline_run(row: aiosqlite.Row, definition_snapshot: str) -> PipelineRun:
+    """Convert a database row (plus its definition snapshot) to a PipelineRun model."""
     context = row["context"]
     if isinstance(context, str):
         context = json.loads(context)
@@ -814,7 +1114,8 @@ def _row_to_pipeline_run(row: aiosqlite.Row) -> PipelineRun:
     return PipelineRun(
         run_id=row["run_id"],
         pipeline_name=row["pipeline_name"],
-        definition_snapshot=row["definition_snapshot"],
+        definition_snapshot=definition_snapshot,
+        definition_hash=row["definition_hash"],
         trigger_event=row["trigger_event"],
         trigger_delivery_id=row["trigger_delivery_id"],
         issue_number=row["issue_number"],
@@ -0,0 +1,94 @@
+"""Trigger index — event type → candidate pipelines for evaluate_event.
+
+Every webhook used to be matched against every registered pipeline's
+trigger, including event types no pipeline listens for. The index buckets
+pipelines by their trigger's event type (``<event>.<action>``) and, within a
+bucket, by the ``label`` and ``base_branch`` conditions, so only pipelines
+that can match are checked with ``TriggerDefinition.matches``.
+
+Key exports:
+    TriggerIndex — Immutable index built from the engine's pipeline definitions.
+
+Design Notes:
+- The index is a prefilter: candidates are still confirmed with
+  ``TriggerDefinition.matches``, so trigger semantics live in one place.
+- Candidates are returned in registration order, which is the order pipelines
+  were started in before the index existed.
+- Built once per change of the definition set; the engine rebuilds it lazily.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from squadron.pipeline.models import PipelineDefinition
+
+# Conditions with a dedicated bucket; the value is read from the payload
+_LABEL = "label"
+_BASE_BRANCH = "base_branch"
+
+
+@dataclass
+class _EventBucket:
+    """Pipelines triggered by one event type, split by prefilterable condition."""
+
+    unfiltered: list[int] = field(default_factory=list)
+    by_label: dict[str, list[int]] = field(default_factory=dict)
+    by_base_branch: dict[str, list[int]] = field(default_factory=dict)
+
+
+class TriggerIndex:
+    """Maps an incoming event to the pipelines whose trigger may match it."""
+
+    def __init__(self, pipelines: dict[str, PipelineDefinition]) -> None:
+        self._entries: list[tuple[str, PipelineDefinition]] = []
+        self._buckets: dict[str, _EventBucket] = {}
+        for name, defn in pipelines.items():
+            if defn.trigger is None:
+                continue  # sub-pipeline only
+            position = len(self._entries)
+            self._entries.append((name, defn))
+            bucket = self._buckets.setdefault(defn.trigger.event, _EventBucket())
+            conditions = defn.trigger.conditions
+            if _LABEL in conditions:
+                bucket.by_label.setdefault(str(conditions[_LABEL]), []).append(position)
+            elif _BASE_BRANCH in conditions:
+                bucket.by_base_branch.setdefault(str(conditions[_BASE_BRANCH]), []).append(position)
+            else:
+                bucket.unfiltered.append(position)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def event_types(self) -> set[str]:
+        return set(self._buckets)
+
+    def candidates(
+        self, event_type: str, payload: dict[str, Any]
+    ) -> list[tuple[str, PipelineDefinition]]:
+        """Pipelines whose trigger may match, in registration order."""
+        bucket = self._buckets.get(event_type)
+        if bucket is None:
+            return []
+        positions = list(bucket.unfiltered)
+        if bucket.by_label:
+            label = (payload.get("label") or {}).get("name", "")
+            positions.extend(bucket.by_label.get(label, ()))
+        if bucket.by_base_branch:
+            pr = payload.get("pull_request") or {}
+            base = (pr.get("base") or {}).get("ref", "")
+            positions.extend(bucket.by_base_branch.get(base, ()))
+        positions.sort()
+        return [self._entries[p] for p in positions]
+
+    def matching(
+        self, event_type: str, payload: dict[str, Any]
+    ) -> list[tuple[str, PipelineDefinition]]:
+        """Pipelines whose trigger matches the event, in registration order."""
+        return [
+            (name, defn)
+            for name, defn in self.candidates(event_type, payload)
+            if defn.trigger and defn.trigger.matches(event_type, payload)
+        ]
@@ -0,0 +1,162 @@
+"""Stage worker pool — runs pipeline stage work off the event routing path.
+
+Gate stages may run a ``CommandCheck`` for minutes and webhook stages may
+wait out HTTP timeouts and retries. Executed inline, that work held up
+``evaluate_event`` and with it every webhook behind it in the router. The
+engine instead submits stage work here and routing returns immediately.
+
+Key exports:
+    StageWorkerPool — Bounded pool of worker tasks with per-key (run)
+        serialization.
+
+Design Notes:
+- Jobs are keyed by pipeline run id. Jobs for one run execute one at a time,
+  in submission order, so stage transitions never interleave; jobs for
+  different runs execute concurrently up to ``workers``.
+- Runs take turns: after one job a run with more pending work goes to the
+  back of the ready queue, so a chatty run cannot starve the others.
+- ``submit`` never blocks. The backlog is unbounded, but it is exposed as
+  ``queued`` together with ``saturation`` and the queue-wait percentiles.
+- A failing job is logged and counted; it never stops its worker or the
+  jobs queued behind it for the same run.
+- Jobs still queued at ``stop`` are dropped. The runs they belong to stay
+  RUNNING in the registry and resume through ``recover_active_pipelines``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger("squadron.pipeline.workers")
+
+StageJob = Callable[[], Awaitable[None]]
+
+# Queue-wait samples kept for the percentiles in stats()
+_WAIT_SAMPLES = 512
+
+
+@dataclass
+class _Job:
+    job: StageJob
+    name: str
+    submitted: float
+
+
+class StageWorkerPool:
+    """Fixed number of worker tasks draining per-run job queues."""
+
+    def __init__(self, workers: int = 4) -> None:
+        self.workers = max(1, workers)
+        self._pending: dict[str, deque[_Job]] = {}
+        # Keys in the ready queue or being worked on (at most once each)
+        self._scheduled: set[str] = set()
+        self._ready: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        self._running = False
+        self._busy = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._waits: deque[float] = deque(maxlen=_WAIT_SAMPLES)
+        self._stats = {"submitted": 0, "completed": 0, "failed": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        self._running = True
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"pipeline-worker-{i}")
+            for i in range(self.workers)
+        ]
+        logger.info("Pipeline worker pool started (workers=%d)", self.workers)
+
+    async def stop(self) -> None:
+        self._running = False
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        dropped = sum(len(jobs) for jobs in self._pending.values())
+        self._pending.clear()
+        self._scheduled.clear()
+        self._ready = asyncio.Queue()
+        self._busy = 0
+        self._idle.set()
+        logger.info("Pipeline worker pool stopped (%d queued jobs dropped)", dropped)
+
+    # ── Submission ───────────────────────────────────────────────────────
+
+    def submit(self, key: str, job: StageJob, name: str = "") -> None:
+        """Queue ``job`` behind any pending work for ``key``."""
+        self._pending.setdefault(key, deque()).append(_Job(job, name, time.monotonic()))
+        self._stats["submitted"] += 1
+        self._idle.clear()
+        if key not in self._scheduled:
+            self._scheduled.add(key)
+            self._ready.put_nowait(key)
+
+    async def drain(self) -> None:
+        """Wait until every submitted job (including ones they submit) has run."""
+        await self._idle.wait()
+
+    # ── Workers ──────────────────────────────────────────────────────────
+
+    async def _worker(self) -> None:
+        while self._running:
+            key = await self._ready.get()
+            jobs = self._pending[key]
+            item = jobs.popleft()
+            self._waits.append(time.monotonic() - item.submitted)
+            self._busy += 1
+            try:
+                await item.job()
+                self._stats["completed"] += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self._stats["failed"] += 1
+                logger.exception("Pipeline job %s failed (run %s)", item.name or "?", key)
+            finally:
+                self._busy -= 1
+            if jobs:
+                self._ready.put_nowait(key)
+            else:
+                del self._pending[key]
+                self._scheduled.discard(key)
+                if not self._pending:
+                    self._idle.set()
+
+    # ── Stats ────────────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        waits = sorted(self._waits)
+        return {
+            "workers": self.workers,
+            "busy": self._busy,
+            "saturation": round(self._busy / self.workers, 2),
+            "queued": sum(len(jobs) for jobs in self._pending.values()),
+            "queued_runs": len(self._pending),
+            **self._stats,
+            "queue_wait_ms": {
+                "count": len(waits),
+                "p50": _percentile_ms(waits, 0.5),
+                "p90": _percentile_ms(waits, 0.9),
+                "max": _percentile_ms(waits, 1.0),
+            },
+        }
+
+
+def _percentile_ms(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return round(sorted_values[index] * 1000, 1)
@@ -93,6 +93,13 @@ class ReconciliationLoop:
         except Exception:
             logger.debug("Failed to prune seen_events")
 
+        try:
+            pruned = await self.registry.prune_liveness()
+            if pruned:
+                logger.info("Pruned %d stale agent_liveness rows", pruned)
+        except Exception:
+            logger.debug("Failed to prune agent_liveness")
+
         logger.debug("Reconciliation pass complete")
 
     async def _check_sleeping_agents(self) -> None:
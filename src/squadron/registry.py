@@ -15,13 +15,20 @@ import json
 import logging
 from collections import deque
 from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterable
 
 import aiosqlite
 
 from squadron.models import AgentRecord, AgentStatus
 
+if TYPE_CHECKING:
+    from squadron.supervisor import Liveness
+
 logger = logging.getLogger(__name__)
 
+# Called after every agent write with (agent_id, record); record is None on delete
+AgentChangeListener = Callable[[str, "AgentRecord | None"], None]
+
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS agents (
     agent_id TEXT PRIMARY KEY,
@@ -48,17 +55,30 @@ CREATE TABLE IF NOT EXISTS seen_events (
     received_at TEXT NOT NULL
 );
 
+CREATE TABLE IF NOT EXISTS agent_liveness (
+    agent_id TEXT PRIMARY KEY,
+    last_beat TEXT NOT NULL,
+    elapsed_seconds INTEGER NOT NULL DEFAULT 0,
+    tool_call_count INTEGER NOT NULL DEFAULT 0,
+    turn_count INTEGER NOT NULL DEFAULT 0,
+    no_activity_alert INTEGER NOT NULL DEFAULT 0
+);
+
 CREATE INDEX IF NOT EXISTS idx_agents_status ON agents(status);
 CREATE INDEX IF NOT EXISTS idx_agents_issue ON agents(issue_number);
 """
 
 
+_TERMINAL_STATUSES = (AgentStatus.COMPLETED, AgentStatus.ESCALATED, AgentStatus.FAILED)
+
+
 class AgentRegistry:
     """SQLite-backed agent registry with async access."""
 
     def __init__(self, db_path: str):
         self.db_path = db_path
         self._db: aiosqlite.Connection | None = None
+        self._listeners: list[AgentChangeListener] = []
 
     async def initialize(self) -> None:
         """Open database and create tables."""
@@ -81,6 +101,17 @@ class AgentRegistry:
             raise RuntimeError("Registry not initialized — call initialize() first")
         return self._db
 
+    def add_listener(self, listener: AgentChangeListener) -> None:
+        """Register a synchronous callback invoked after each agent write."""
+        self._listeners.append(listener)
+
+    def _notify(self, agent_id: str, record: AgentRecord | None) -> None:
+        for listener in self._listeners:
+            try:
+                listener(agent_id, record)
+            except Exception:
+                logger.exception("Agent registry listener failed for %s", agent_id)
+
     # ── CRUD ─────────────────────────────────────────────────────────────
 
     async def create_agent(self, record: AgentRecord) -> AgentRecord:
@@ -116,6 +147,7 @@ class AgentRegistry:
             ),
         )
         await self.db.commit()
+        self._notify(record.agent_id, record)
         logger.info(
             "Created agent: %s (role=%s, issue=#%s)",
             record.agent_id,
@@ -133,7 +165,9 @@ class AgentRegistry:
     async def delete_agent(self, agent_id: str) -> None:
         """Delete an agent record by ID (used to clean up terminal records before re-spawn)."""
         await self.db.execute("DELETE FROM agents WHERE agent_id = ?", (agent_id,))
+        await self.db.execute("DELETE FROM agent_liveness WHERE agent_id = ?", (agent_id,))
         await self.db.commit()
+        self._notify(agent_id, None)
         logger.info("Deleted agent record: %s", agent_id)
 
     async def get_agent_by_issue(self, issue_number: int) -> AgentRecord | None:
@@ -223,7 +257,13 @@ class AgentRegistry:
                 record.agent_id,
             ),
         )
+        if record.status in _TERMINAL_STATUSES:
+            # Liveness only describes running agents
+            await self.db.execute(
+                "DELETE FROM agent_liveness WHERE agent_id = ?", (record.agent_id,)
+            )
         await self.db.commit()
+        self._notify(record.agent_id, record)
 
     # ── Blocker Management ───────────────────────────────────────────────
 
@@ -314,6 +354,65 @@ class AgentRegistry:
 
         return False
 
+    # ── Liveness ─────────────────────────────────────────────────────────
+
+    async def upsert_liveness(self, rows: Iterable[Liveness]) -> None:
+        """Record the latest heartbeat for each agent (one row per agent)."""
+        await self.db.executemany(
+            """INSERT INTO agent_liveness
+               (agent_id, last_beat, elapsed_seconds, tool_call_count, turn_count,
+                no_activity_alert)
+               VALUES (?, ?, ?, ?, ?, ?)
+               ON CONFLICT(agent_id) DO UPDATE SET
+                 last_beat = excluded.last_beat,
+                 elapsed_seconds = excluded.elapsed_seconds,
+                 tool_call_count = excluded.tool_call_count,
+                 turn_count = excluded.turn_count,
+                 no_activity_alert = excluded.no_activity_alert""",
+            [
+                (
+                    r.agent_id,
+                    r.last_beat,
+                    r.elapsed_seconds,
+                    r.tool_call_count,
+                    r.turn_count,
+                    int(r.no_activity_alert),
+                )
+                for r in rows
+            ],
+        )
+        await self.db.commit()
+
+    async def get_liveness(self, agent_id: str) -> dict[str, Any] | None:
+        """Latest heartbeat row for an agent, or None if it never beat."""
+        cursor = await self.db.execute(
+            "SELECT * FROM agent_liveness WHERE agent_id = ?", (agent_id,)
+        )
+        row = await cursor.fetchone()
+        if row is None:
+            return None
+        return {**dict(row), "no_activity_alert": bool(row["no_activity_alert"])}
+
+    async def get_all_liveness(self) -> dict[str, dict[str, Any]]:
+        """Latest heartbeat row of every agent that has beaten, by agent_id."""
+        cursor = await self.db.execute("SELECT * FROM agent_liveness")
+        return {
+            row["agent_id"]: {**dict(row), "no_activity_alert": bool(row["no_activity_alert"])}
+            for row in await cursor.fetchall()
+        }
+
+    async def prune_liveness(self) -> int:
+        """Delete liveness rows of agents that are terminal or gone. Returns rows deleted.
+
+        Catches a heartbeat flush that landed after the agent's terminal update.
+        """
+        cursor = await self.db.execute(
+            """DELETE FROM agent_liveness WHERE agent_id NOT IN
+               (SELECT agent_id FROM agents WHERE status IN ('created', 'active', 'sleeping'))"""
+        )
+        await self.db.commit()
+        return cursor.rowcount
+
     # ── Webhook Deduplication ────────────────────────────────────────────
 
     async def has_seen_event(self, delivery_id: str) -> bool:
@@ -26,6 +26,8 @@ MEMORY_WARNING_PERCENT = 85  # warn when system memory usage exceeds this %
 DISK_WARNING_PERCENT = 90  # warn when disk usage exceeds this %
 WORKTREE_SIZE_WARNING_MB = 500  # warn per worktree exceeding this size
 PROCESS_WARNING_PERCENT = 80  # warn when per-user process count exceeds this % of nproc limit
+LAG_PROBE_INTERVAL = 0.5  # seconds between event-loop lag probes
+LAG_DECAY = 0.8  # per-probe decay of the reported peak lag
 
 
 @dataclass
@@ -53,6 +55,16 @@ class ResourceSnapshot:
     active_agent_count: int = 0
 
 
+@dataclass
+class PressureSample:
+    """Cheap, fast-changing load signals used to size agent concurrency."""
+
+    memory_available_percent: float = 100.0
+    process_percent: float = 0.0  # of the nproc limit (0 when the limit is unknown)
+    load_per_cpu: float = 0.0  # 1-minute load average / CPU count
+    loop_lag: float = 0.0  # seconds; decaying peak of event-loop scheduling delay
+
+
 def _read_system_memory() -> tuple[float, float, float]:
     """Read system memory from /proc/meminfo (Linux) or fallback.
 
@@ -125,6 +137,14 @@ def _read_process_count() -> int:
     return count
 
 
+def _read_load_per_cpu() -> float:
+    """1-minute load average normalised by CPU count (0 if unavailable)."""
+    try:
+        return os.getloadavg()[0] / (os.cpu_count() or 1)
+    except (OSError, AttributeError):
+        return 0.0
+
+
 def _get_dir_size_mb(path: Path) -> float:
     """Get directory size in MB by walking the tree.
 
@@ -175,27 +195,71 @@ class ResourceMonitor:
         self.interval = interval
         self._worktree_dir = worktree_dir
         self._task: asyncio.Task | None = None
+        self._lag_task: asyncio.Task | None = None
         self._latest: ResourceSnapshot = ResourceSnapshot()
+        self._loop_lag = 0.0
         self._running = False
 
     @property
     def latest(self) -> ResourceSnapshot:
         return self._latest
 
+    @property
+    def loop_lag(self) -> float:
+        """Recent peak event-loop lag in seconds (decays between spikes)."""
+        return self._loop_lag
+
     async def start(self) -> None:
         self._running = True
         self._task = asyncio.create_task(self._monitor_loop(), name="resource-monitor")
+        self._lag_task = asyncio.create_task(self._lag_loop(), name="loop-lag-probe")
         logger.info("Resource monitor started (interval=%ds)", self.interval)
 
     async def stop(self) -> None:
         self._running = False
-        if self._task:
-            self._task.cancel()
+        for task in (self._task, self._lag_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        logger.info("Resource monitor stopped")
+
+    async def pressure(self) -> PressureSample:
+        """Sample memory, process, load and loop-lag pressure.
+
+        Unlike ``snapshot()`` this skips the worktree walk, so it is cheap
+        enough to poll every few seconds.
+        """
+        loop = asyncio.get_running_loop()
+        sample = await loop.run_in_executor(None, self._pressure_sync)
+        sample.loop_lag = self._loop_lag
+        return sample
+
+    def _pressure_sync(self) -> PressureSample:
+        """Synchronous pressure sample — runs in thread executor."""
+        sample = PressureSample()
+        total_mb, _, memory_percent = _read_system_memory()
+        if total_mb > 0:
+            sample.memory_available_percent = 100 - memory_percent
+        nproc_limit = _get_nproc_limit()
+        if nproc_limit > 0:
+            sample.process_percent = _read_process_count() / nproc_limit * 100
+        sample.load_per_cpu = _read_load_per_cpu()
+        return sample
+
+    async def _lag_loop(self) -> None:
+        """Measure how late the event loop wakes a short sleep."""
+        loop = asyncio.get_running_loop()
+        while self._running:
             try:
-                await self._task
+                started = loop.time()
+                await asyncio.sleep(LAG_PROBE_INTERVAL)
+                lag = max(0.0, loop.time() - started - LAG_PROBE_INTERVAL)
+                self._loop_lag = max(lag, self._loop_lag * LAG_DECAY)
             except asyncio.CancelledError:
-                pass
-        logger.info("Resource monitor stopped")
+                break
 
     async def snapshot(self) -> ResourceSnapshot:
         """Take a point-in-time resource snapshot.
@@ -0,0 +1,126 @@
+"""Role Artifacts — per-role session configuration compiled once and reused.
+
+Provides:
+- RoleArtifacts: everything ``_run_agent`` needs that depends only on the
+  role (prompt template with role-level values bound, custom agents, MCP
+  servers, skill directories, tool allowlists, circuit-breaker limits).
+- RoleArtifactCache: artifacts keyed by role and a fingerprint of the agent
+  definition plus the config sections they are derived from.
+- role_fingerprint(): that fingerprint.
+
+Design Notes:
+- Only per-issue values (issue number/title/body, branch, PR number) and
+  per-agent objects (hooks, bound tools, working directory) are produced at
+  spawn/wake time.
+- A config reload swaps the definition/config objects; the fingerprint
+  changes and the role is recompiled on its next spawn.  Nothing has to
+  invalidate the cache explicitly.
+- Skill directories are checked on disk at compile time, so a skill
+  directory created later is picked up on the next config change.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from squadron.config import AgentDefinition, CircuitBreakerDefaults, SquadronConfig
+
+logger = logging.getLogger(__name__)
+
+
+def role_fingerprint(
+    role: str, agent_definitions: dict[str, AgentDefinition], config: SquadronConfig
+) -> str:
+    """Hash of every input a role's artifacts are compiled from."""
+    role_config = config.agent_roles.get(role)
+    subagents = role_config.subagents if role_config else []
+    material = {
+        "definition": agent_definitions[role].model_dump(mode="json"),
+        "subagents": {
+            name: agent_definitions[name].model_dump(mode="json")
+            for name in subagents
+            if name in agent_definitions
+        },
+        "role": role_config.model_dump(mode="json") if role_config else None,
+        "circuit_breakers": config.circuit_breakers.model_dump(mode="json"),
+        "skills": config.skills.model_dump(mode="json"),
+        "project": [config.project.name, config.project.default_branch],
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass(frozen=True)
+class RoleArtifacts:
+    """Role-level session inputs, shared by every agent of the role."""
+
+    role: str
+    fingerprint: str
+    prompt_template: str
+    prompt_values: dict[str, str]
+    # False when the template has no placeholders or fails to format
+    interpolate: bool
+    cb_limits: CircuitBreakerDefaults
+    is_ephemeral: bool
+    lifecycle: str
+    custom_agents: list[dict[str, Any]] | None
+    mcp_servers: dict[str, Any] | None
+    skill_directories: list[str] | None
+    custom_tool_names: list[str] | None
+    available_tools: list[str] | None
+
+    def render_prompt(self, issue_values: dict[str, str]) -> str:
+        """System message with the per-issue values bound."""
+        if not self.interpolate:
+            return self.prompt_template
+        return self.prompt_template.format_map(
+            defaultdict(str, {**self.prompt_values, **issue_values})
+        )
+
+
+def compile_prompt(template: str, role: str) -> bool:
+    """Whether ``template`` needs (and survives) interpolation.
+
+    Missing keys become empty strings, so only malformed braces or
+    positional fields fail — checked once here instead of on every spawn.
+    """
+    if "{" not in template and "}" not in template:
+        return False
+    try:
+        template.format_map(defaultdict(str))
+    except (KeyError, ValueError, IndexError, AttributeError):
+        logger.warning("Failed to interpolate agent def for %s — using raw content", role)
+        return False
+    return True
+
+
+class RoleArtifactCache:
+    """Compiled RoleArtifacts per role, rebuilt when the fingerprint changes."""
+
+    def __init__(self, compile_role: Callable[[str, str], RoleArtifacts]) -> None:
+        self._compile_role = compile_role
+        self._artifacts: dict[str, RoleArtifacts] = {}
+        self._stats = {"hits": 0, "compiles": 0}
+
+    def get(
+        self, role: str, agent_definitions: dict[str, AgentDefinition], config: SquadronConfig
+    ) -> RoleArtifacts:
+        fingerprint = role_fingerprint(role, agent_definitions, config)
+        artifacts = self._artifacts.get(role)
+        if artifacts is not None and artifacts.fingerprint == fingerprint:
+            self._stats["hits"] += 1
+            return artifacts
+        artifacts = self._compile_role(role, fingerprint)
+        self._artifacts[role] = artifacts
+        self._stats["compiles"] += 1
+        logger.debug("Compiled session artifacts for role %s (%s)", role, fingerprint[:12])
+        return artifacts
+
+    def stats(self) -> dict[str, Any]:
+        return {"roles": sorted(self._artifacts), **self._stats}
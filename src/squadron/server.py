@@ -29,25 +29,35 @@ from fastapi import FastAPI
 
 import aiosqlite
 
-from squadron.activity import ActivityLogger
+from squadron.activity import ActivityEvent, ActivityEventType, ActivityLogger
+from squadron.adaptive_concurrency import AdaptiveConcurrency
 from squadron.agent_manager import AgentManager
 from squadron.config import (
     SquadronConfig,
     load_agent_definitions,
     load_config,
 )
+from squadron.copilot import build_agent_env
 from squadron.dashboard import configure as configure_dashboard
 from squadron.dashboard import router as dashboard_router
 from squadron.event_router import EventRouter
 from squadron.github_client import GitHubClient
+from squadron.log_archive import LogArchive
 from squadron.log_buffer import LogBuffer, RingBufferHandler
 from squadron.models import AgentStatus, GitHubEvent, SquadronEvent, SquadronEventType
+from squadron.overview import DashboardOverview
 from squadron.reconciliation import ReconciliationLoop
 from squadron.registry import AgentRegistry
 from squadron.resource_monitor import ResourceMonitor
 from squadron.webhook import configure as configure_webhook
 from squadron.webhook import router as webhook_router
-from squadron.pipeline import GateCheckRegistry, PipelineEngine, PipelineRegistry
+from squadron.pipeline import (
+    CommandExecutor,
+    GateCheckRegistry,
+    PipelineEngine,
+    PipelineRegistry,
+    StageWorkerPool,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -70,12 +80,17 @@ class SquadronServer:
         self.agent_manager: AgentManager | None = None
         self.reconciliation: ReconciliationLoop | None = None
         self.resource_monitor: ResourceMonitor | None = None
+        self.adaptive_concurrency: AdaptiveConcurrency | None = None
         self._config_version: str | None = None  # Commit SHA of current config
         self.pipeline_engine: PipelineEngine | None = None
+        self.pipeline_workers: StageWorkerPool | None = None
+        self.command_executor: CommandExecutor | None = None
         self.pipeline_db: aiosqlite.Connection | None = None
         self.pipeline_registry: PipelineRegistry | None = None
         self.activity_logger: ActivityLogger | None = None
         self.log_buffer: LogBuffer = LogBuffer(maxlen=20_000)
+        self.log_archive: LogArchive | None = None
+        self.overview: DashboardOverview = DashboardOverview()
 
     async def start(self) -> None:
         """Initialize all components and start background loops."""
@@ -111,6 +126,7 @@ class SquadronServer:
 
         self.registry = AgentRegistry(db_path)
         await self.registry.initialize()
+        self.registry.add_listener(self.overview.agent_changed)
 
         # 2b. Initialize activity logger (same data dir as registry)
         activity_db_path = str(data_dir / "activity.db")
@@ -124,6 +140,18 @@ class SquadronServer:
         logging.getLogger().addHandler(ring_handler)
         logger.info("Ring-buffer log handler attached (capacity=%d)", self.log_buffer.maxlen)
 
+        # 2d. On-disk log archive behind the ring buffer (rotated gzip segments)
+        archive_cfg = self.config.runtime.log_archive
+        if archive_cfg.enabled:
+            self.log_archive = LogArchive(
+                data_dir / "logs",
+                max_total_bytes=archive_cfg.max_disk_mb * 1024 * 1024,
+                segment_max_bytes=archive_cfg.segment_mb * 1024 * 1024,
+                flush_interval=archive_cfg.flush_interval,
+            )
+            await self.log_archive.start()
+            self.log_buffer.attach_archive(self.log_archive)
+
         # 3. Recover stale agents + reconstruct from GitHub
         await self._recover_agents()
 
@@ -211,8 +239,20 @@ class SquadronServer:
         self.pipeline_db.row_factory = aiosqlite.Row
         self.pipeline_registry = PipelineRegistry(self.pipeline_db)
         await self.pipeline_registry.initialize()
-
-        gate_registry = GateCheckRegistry()
+        self.pipeline_registry.add_listener(self.overview.pipeline_changed)
+
+        command_gates = self.config.runtime.command_gates
+        if command_gates.enabled:
+            api_key_env = self.config.runtime.provider.api_key_env
+            blocked = {api_key_env} if api_key_env else set()
+            self.command_executor = CommandExecutor(
+                max_concurrent=command_gates.max_concurrent,
+                cwd=command_gates.cwd or str(self.repo_root),
+                env=build_agent_env(extra_blocked=blocked),
+                cache_size=command_gates.cache_size,
+                on_output=self._log_gate_command_output,
+            )
+        gate_registry = GateCheckRegistry(command_runner=self.command_executor)
 
         # Load custom gate check plugins from config (AD-019 Phase 5)
         custom_gates = self.config.pipeline_settings.get("custom_gates", [])
@@ -248,20 +288,57 @@ class SquadronServer:
         self.pipeline_engine.set_notify_callback(
             self.agent_manager.pipeline_notify_callback,
         )
+        if self.command_executor:
+            self.pipeline_engine.set_checkout_callback(
+                self.agent_manager.pipeline_checkout_callback,
+            )
         self.agent_manager.set_pipeline_engine(self.pipeline_engine)
 
+        # Run stage work off the event routing path
+        pipeline_workers = self.config.runtime.pipeline_workers
+        if pipeline_workers.enabled:
+            self.pipeline_workers = StageWorkerPool(pipeline_workers.workers)
+            await self.pipeline_workers.start()
+            self.pipeline_engine.set_worker_pool(self.pipeline_workers)
+
         # Recover active pipelines from before restart
         recovered = await self.pipeline_engine.recover_active_pipelines()
         if recovered:
             logger.info("Recovered %d active pipeline(s) from previous run", recovered)
 
-        # 8a. Configure dashboard endpoints (with all dependencies now available)
+        # 8a. Seed the dashboard overview (kept current by registry listeners)
+        await self.overview.load(self.registry, self.pipeline_registry)
+        self.overview.add_gauge("semaphore", self.agent_manager.concurrency_stats)
+        self.overview.add_gauge("copilot_pool", self.agent_manager.copilot_pool_stats)
+        self.overview.add_gauge("worktree_pool", self.agent_manager.worktree_pool_stats)
+        self.overview.add_gauge("git_fetch", self.agent_manager.git_fetch_stats)
+        self.overview.add_gauge("supervisor", self.agent_manager.supervisor_stats)
+        self.overview.add_gauge("tool_events", self.agent_manager.tool_event_stats)
+        self.overview.add_gauge("role_artifacts", self.agent_manager.role_artifact_stats)
+        self.overview.add_gauge("session_keepalive", self.agent_manager.session_keepalive_stats)
+        self.overview.add_gauge("pipeline_definitions", self.pipeline_engine.definition_cache_stats)
+        self.overview.add_gauge("pipeline_active_runs", self.pipeline_engine.active_run_stats)
+        self.overview.add_gauge("pipeline_gate_cache", self.pipeline_engine.gate_cache_stats)
+        if self.command_executor:
+            self.overview.add_gauge("gate_commands", self.command_executor.stats)
+        if self.pipeline_workers:
+            self.overview.add_gauge("pipeline_workers", self.pipeline_workers.stats)
+        event_queue = self.event_queue
+        self.overview.add_gauge(
+            "event_queue",
+            lambda: {"depth": event_queue.qsize(), "capacity": event_queue.maxsize},
+        )
+        self.overview.add_gauge("api_budget", self.github.rate_limit_status)
+
+        # 8b. Configure dashboard endpoints (with all dependencies now available)
         configure_dashboard(
             self.activity_logger,
             self.registry,
             self.log_buffer,
             pipeline_engine=self.pipeline_engine,
             pipeline_registry=self.pipeline_registry,
+            overview=self.overview,
+            admission_stats=self.agent_manager.admission_stats,
         )
 
         # 9. Start background loops
@@ -280,6 +357,22 @@ class SquadronServer:
             self.repo_root, interval=60, worktree_dir=worktree_dir
         )
         await self.resource_monitor.start()
+        self.agent_manager.set_resource_monitor(self.resource_monitor)
+        resource_monitor = self.resource_monitor
+        self.overview.add_gauge("resources", lambda: _resources_summary(resource_monitor))
+
+        # 10b. Size the agent concurrency limit from live resource pressure
+        adaptive = self.config.runtime.adaptive_concurrency
+        if adaptive.enabled:
+            self.adaptive_concurrency = AdaptiveConcurrency(
+                adaptive,
+                self.agent_manager.admission,
+                self.resource_monitor,
+                initial_limit=self.config.runtime.max_concurrent_agents,
+            )
+            await self.adaptive_concurrency.start()
+            self.overview.add_gauge("adaptive_concurrency", self.adaptive_concurrency.stats)
+        await self.overview.start()
 
         logger.info("Squadron server started successfully")
 
@@ -287,10 +380,17 @@ class SquadronServer:
         """Graceful shutdown — stop all components."""
         logger.info("Squadron server shutting down")
 
+        await self.overview.stop()
+        if self.adaptive_concurrency:
+            await self.adaptive_concurrency.stop()
         if self.resource_monitor:
             await self.resource_monitor.stop()
         if self.reconciliation:
             await self.reconciliation.stop()
+        if self.pipeline_workers:
+            await self.pipeline_workers.stop()
+        if self.command_executor:
+            await self.command_executor.stop()
         if self.agent_manager:
             await self.agent_manager.stop()
         if self.router:
@@ -306,6 +406,23 @@ class SquadronServer:
 
         logger.info("Squadron server stopped")
 
+        # Last, so the shutdown log lines above are archived too
+        if self.log_archive:
+            await self.log_archive.stop()
+
+    async def _log_gate_command_output(self, command: str, stream: str, output: str) -> None:
+        """Stream ``command`` gate output into the activity log as it is produced."""
+        if not self.activity_logger:
+            return
+        await self.activity_logger.log(
+            ActivityEvent(
+                agent_id="pipeline-gates",
+                event_type=ActivityEventType.INFO,
+                content=output,
+                metadata={"command": command, "stream": stream},
+            )
+        )
+
     async def _clone_repo(self, repo_url: str) -> None:
         """Clone the repository at startup so we have .squadron/ config and a git repo for worktrees.
 
@@ -546,7 +663,7 @@ class SquadronServer:
         # Update pipeline engine definitions
         if self.pipeline_engine:
             # Clear old definitions and re-register from new config
-            self.pipeline_engine._pipelines.clear()
+            self.pipeline_engine.clear_pipelines()
             for name, defn in new_config.get_pipeline_definitions().items():
                 self.pipeline_engine.add_pipeline(name, defn)
 
@@ -577,6 +694,18 @@ async def lifespan(app: FastAPI):
     await _server.stop()
 
 
+def _resources_summary(monitor: ResourceMonitor) -> dict[str, float | int]:
+    """Headline figures from the resource monitor's latest snapshot."""
+    snap = monitor.latest
+    return {
+        "memory_percent": snap.memory_percent,
+        "disk_percent": snap.disk_percent,
+        "disk_free_mb": snap.disk_free_mb,
+        "active_agent_count": snap.active_agent_count,
+        "process_count": snap.process_count,
+    }
+
+
 def create_app(repo_root: Path | None = None) -> FastAPI:
     """Create the FastAPI application."""
     global _server
@@ -595,27 +724,17 @@ def create_app(repo_root: Path | None = None) -> FastAPI:
 
     @app.get("/health")
     async def health():
-        """Health check endpoint with operational metrics."""
-        agent_counts = {}
-        total_agents = 0
-        if _server.registry:
-            for status in AgentStatus:
-                agents = await _server.registry.get_agents_by_status(status)
-                count = len(agents)
-                if count:
-                    agent_counts[status.value] = count
-                total_agents += count
+        """Health check endpoint with operational metrics.
+
+        Agent counts come from the in-memory overview — no registry queries.
+        """
+        agents = _server.overview.snapshot()["agents"]
+        agent_counts = agents["by_status"]
+        total_agents = agents["total"]
 
         resources = None
         if _server.resource_monitor:
-            snap = _server.resource_monitor.latest
-            resources = {
-                "memory_percent": snap.memory_percent,
-                "disk_percent": snap.disk_percent,
-                "disk_free_mb": snap.disk_free_mb,
-                "active_agent_count": snap.active_agent_count,
-                "process_count": snap.process_count,
-            }
+            resources = _resources_summary(_server.resource_monitor)
 
         # Queue and event metrics
         queue_depth = _server.event_queue.qsize() if _server.event_queue else 0
@@ -0,0 +1,235 @@
+"""Session Keep-Alive — sleeping agents' CLI clients kept hot for quick wakes.
+
+Provides:
+- SessionKeepAlive: parks the ``CopilotAgent`` of an agent going to sleep
+  instead of stopping it, and hands it back on wake so ``resume_session``
+  runs against a live CLI instead of a freshly spawned one.
+- blocker_type(): the sleep reason a record's state predicts.
+
+Design Notes:
+- How long a client stays hot depends on the blocker type: an agent that
+  owns a PR is usually woken by a review reply within minutes, a preempted
+  agent as soon as a slot frees, while one blocked on another issue can
+  sleep for days and is stopped right away (TTL 0).
+- Hot clients hold no admission slot, so they must not crowd out running
+  agents: the least recently parked one is evicted when ``max_sessions``
+  is reached, when starting another agent would push running + hot CLIs
+  past the concurrency limit, and while available memory is below
+  ``memory_available_low``.
+- Wake latency (wake start → session resumed) is sampled separately for
+  hot and cold wakes so the two distributions can be compared.
+- A miss is never an error: the caller starts a client as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from squadron.config import SessionKeepAliveConfig
+
+if TYPE_CHECKING:
+    from squadron.copilot import CopilotAgent
+    from squadron.models import AgentRecord
+    from squadron.resource_monitor import ResourceMonitor
+
+logger = logging.getLogger(__name__)
+
+PR_REVIEW = "pr_review"
+PREEMPTED = "preempted"
+ISSUE = "issue"
+OTHER = "other"
+
+HOT = "hot"
+COLD = "cold"
+
+# Wake latency samples kept per mode
+LATENCY_SAMPLES = 256
+
+
+def blocker_type(record: AgentRecord) -> str:
+    """Predict what a sleeping agent is waiting for."""
+    if record.pr_number:
+        return PR_REVIEW
+    if record.blocked_by:
+        return ISSUE
+    return OTHER
+
+
+@dataclass
+class _HotSession:
+    agent: CopilotAgent
+    blocker: str
+    expires_at: float
+
+
+class SessionKeepAlive:
+    """LRU set of sleeping agents' started CLI clients with per-blocker TTLs."""
+
+    def __init__(self, config: SessionKeepAliveConfig) -> None:
+        self.config = config
+        self._hot: OrderedDict[str, _HotSession] = OrderedDict()
+        self._monitor: ResourceMonitor | None = None
+        self._latency: dict[str, deque[float]] = {
+            HOT: deque(maxlen=LATENCY_SAMPLES),
+            COLD: deque(maxlen=LATENCY_SAMPLES),
+        }
+        self._evictions: set[asyncio.Task] = set()
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self._stats = {"parked": 0, "hits": 0, "expired": 0, "evicted": 0}
+
+    def set_resource_monitor(self, monitor: ResourceMonitor) -> None:
+        """Attach the monitor whose memory pressure triggers eviction."""
+        self._monitor = monitor
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        if not self.config.enabled:
+            return
+        self._running = True
+        self._task = asyncio.create_task(self._maintenance_loop(), name="session-keepalive")
+        logger.info(
+            "Session keep-alive started (max_sessions=%d, idle_ttl=%ds)",
+            self.config.max_sessions,
+            self.config.idle_ttl,
+        )
+
+    async def stop(self) -> None:
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        while self._hot:
+            _, session = self._hot.popitem(last=False)
+            await session.agent.stop()
+        await asyncio.gather(*self._evictions, return_exceptions=True)
+
+    # ── Park / take ──────────────────────────────────────────────────────
+
+    def ttl_for(self, blocker: str) -> int:
+        return self.config.blocker_ttls.get(blocker, self.config.idle_ttl)
+
+    def park(self, agent_id: str, agent: CopilotAgent, blocker: str) -> bool:
+        """Keep ``agent`` running while ``agent_id`` sleeps.
+
+        Returns False when the policy says to stop it now (disabled, TTL 0
+        for this blocker type, or no room); the caller then stops it.
+        """
+        ttl = self.ttl_for(blocker)
+        if not self._running or ttl <= 0 or self.config.max_sessions <= 0:
+            return False
+        self.discard(agent_id)
+        while len(self._hot) >= self.config.max_sessions:
+            self._evict_lru("max sessions")
+        self._hot[agent_id] = _HotSession(agent, blocker, time.monotonic() + ttl)
+        self._stats["parked"] += 1
+        logger.info("Keeping CLI hot for sleeping agent %s (%s, ttl=%ds)", agent_id, blocker, ttl)
+        return True
+
+    def take(self, agent_id: str) -> CopilotAgent | None:
+        """Hand back the hot client for a waking agent, or None."""
+        session = self._hot.pop(agent_id, None)
+        if session is None:
+            return None
+        if not _is_connected(session.agent):
+            self._stop(session.agent, agent_id, "disconnected")
+            return None
+        self._stats["hits"] += 1
+        return session.agent
+
+    def is_hot(self, agent_id: str) -> bool:
+        return agent_id in self._hot
+
+    def discard(self, agent_id: str) -> None:
+        """Stop the hot client of an agent that will not wake (completed, escalated)."""
+        session = self._hot.pop(agent_id, None)
+        if session is not None:
+            self._stop(session.agent, agent_id, "discarded")
+
+    def make_room(self, in_use: int, limit: int) -> None:
+        """Evict hot clients so running (``in_use``) + hot CLIs fit in ``limit``."""
+        if limit <= 0:
+            return
+        while self._hot and in_use + len(self._hot) > limit:
+            self._evict_lru("slot needed")
+
+    # ── Eviction ─────────────────────────────────────────────────────────
+
+    def _evict_lru(self, reason: str) -> None:
+        agent_id, session = self._hot.popitem(last=False)
+        self._stats["evicted"] += 1
+        self._stop(session.agent, agent_id, reason)
+
+    def _stop(self, agent: CopilotAgent, agent_id: str, reason: str) -> None:
+        logger.info("Stopping hot CLI for sleeping agent %s (%s)", agent_id, reason)
+        task = asyncio.create_task(agent.stop())
+        self._evictions.add(task)
+        task.add_done_callback(self._evictions.discard)
+
+    async def _maintenance_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.config.interval)
+                self.expire()
+                if self._hot and await self._under_memory_pressure():
+                    # Halve the hot set per sample until pressure clears
+                    for _ in range(max(1, len(self._hot) // 2)):
+                        self._evict_lru("memory pressure")
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Session keep-alive maintenance error")
+
+    def expire(self) -> None:
+        now = time.monotonic()
+        for agent_id, session in list(self._hot.items()):
+            if session.expires_at <= now:
+                del self._hot[agent_id]
+                self._stats["expired"] += 1
+                self._stop(session.agent, agent_id, "idle ttl")
+
+    async def _under_memory_pressure(self) -> bool:
+        if self._monitor is None:
+            return False
+        sample = await self._monitor.pressure()
+        return sample.memory_available_percent < self.config.memory_available_low
+
+    # ── Metrics ──────────────────────────────────────────────────────────
+
+    def record_wake(self, hot: bool, seconds: float) -> None:
+        self._latency[HOT if hot else COLD].append(seconds)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "hot": {agent_id: s.blocker for agent_id, s in self._hot.items()},
+            **self._stats,
+            "wake_latency_ms": {mode: _summary(samples) for mode, samples in self._latency.items()},
+        }
+
+
+def _summary(samples: deque[float]) -> dict[str, Any]:
+    if not samples:
+        return {"count": 0}
+    ordered = sorted(samples)
+
+    def pct(p: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(len(ordered) * p))] * 1000, 1)
+
+    return {"count": len(ordered), "p50": pct(0.5), "p90": pct(0.9), "max": pct(1.0)}
+
+
+def _is_connected(agent: CopilotAgent) -> bool:
+    try:
+        return agent.client.get_state() == "connected"
+    except Exception:
+        return False
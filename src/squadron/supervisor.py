@@ -0,0 +1,263 @@
+"""Agent Supervisor — one thread for every agent's heartbeat and duration watchdog.
+
+Provides:
+- AgentSupervisor: a single daemon thread driving a deadline heap.  It
+  replaces a heartbeat thread plus a watchdog task per agent.
+
+Design Notes:
+- Heartbeats update an in-memory liveness table from the live
+  ``AgentRecord`` (which the tool hooks mutate), so a beat costs no
+  registry read.  Dirty rows are upserted into ``agent_liveness`` in one
+  coalesced write instead of appending an activity row per agent per
+  minute.
+- The thread waits on a ``threading.Condition`` rather than the event
+  loop, so liveness and the NO-ACTIVITY alert keep working while the
+  loop is blocked (e.g. inside the SDK's ``send_and_wait``).
+- Watchdog deadlines fire on time from the thread and hand enforcement to
+  the loop via ``call_soon_threadsafe`` — cancelling an agent task needs
+  the loop anyway.
+- Heap entries are never removed in place: re-arming or cancelling
+  replaces the per-(kind, agent) generation and stale entries are skipped
+  on pop (or compacted away when they pile up).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+if TYPE_CHECKING:
+    from squadron.models import AgentRecord
+    from squadron.registry import AgentRegistry
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_INTERVAL = 60.0  # seconds between liveness updates
+NO_ACTIVITY_AFTER = 120.0  # seconds with 0 tool calls and 0 turns before alerting
+
+_HEARTBEAT = "heartbeat"
+_WATCHDOG = "watchdog"
+
+# (agent_id, max_seconds) → None, called on the event loop
+WatchdogCallback = Callable[[str, int], None]
+# (record, elapsed_seconds) → coroutine logging the alert activity event
+AlertCallback = Callable[["AgentRecord", int], Awaitable[None]]
+
+
+@dataclass
+class Liveness:
+    """Latest heartbeat for one agent."""
+
+    agent_id: str
+    started: float  # monotonic
+    last_beat: str | None = None  # ISO timestamp
+    elapsed_seconds: int = 0
+    tool_call_count: int = 0
+    turn_count: int = 0
+    no_activity_alert: bool = False
+
+
+class AgentSupervisor:
+    """Deadline-heap supervisor for agent heartbeats and watchdogs."""
+
+    def __init__(
+        self,
+        registry: AgentRegistry,
+        on_watchdog: WatchdogCallback,
+        on_no_activity: AlertCallback | None = None,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+        no_activity_after: float = NO_ACTIVITY_AFTER,
+    ) -> None:
+        self.registry = registry
+        self.heartbeat_interval = heartbeat_interval
+        self.no_activity_after = no_activity_after
+        self._on_watchdog = on_watchdog
+        self._on_no_activity = on_no_activity
+        self._cond = threading.Condition()
+        # (deadline, seq, kind, agent_id); an entry is live while seq is the
+        # latest generation recorded for (kind, agent_id)
+        self._heap: list[tuple[float, int, str, str]] = []
+        self._seq = itertools.count()
+        self._generation: dict[tuple[str, str], int] = {}
+        self._records: dict[str, AgentRecord] = {}
+        self._liveness: dict[str, Liveness] = {}
+        self._watchdog_limits: dict[str, int] = {}
+        self._dirty: set[str] = set()
+        self._flush_pending = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._running = False
+        self._watchdogs_fired = 0
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="agent-supervisor", daemon=True)
+        self._thread.start()
+        logger.info("Agent supervisor started (heartbeat=%.0fs)", self.heartbeat_interval)
+
+    async def stop(self) -> None:
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread:
+            await asyncio.to_thread(self._thread.join, 5)
+        await self.flush()
+        logger.info("Agent supervisor stopped")
+
+    # ── Registration ─────────────────────────────────────────────────────
+
+    def track(self, record: AgentRecord) -> None:
+        """Start heartbeats for an agent that is about to talk to the model."""
+        with self._cond:
+            self._records[record.agent_id] = record
+            self._liveness[record.agent_id] = Liveness(record.agent_id, time.monotonic())
+            self._push(_HEARTBEAT, record.agent_id, self.heartbeat_interval)
+
+    def untrack(self, agent_id: str) -> None:
+        """Stop heartbeats for an agent (no-op if untracked)."""
+        with self._cond:
+            self._records.pop(agent_id, None)
+            self._liveness.pop(agent_id, None)
+            self._generation.pop((_HEARTBEAT, agent_id), None)
+
+    def arm_watchdog(self, agent_id: str, max_seconds: int) -> None:
+        """(Re)arm the duration watchdog; fires ``on_watchdog`` after ``max_seconds``."""
+        with self._cond:
+            self._watchdog_limits[agent_id] = max_seconds
+            self._push(_WATCHDOG, agent_id, max_seconds)
+
+    def disarm_watchdog(self, agent_id: str) -> None:
+        with self._cond:
+            self._watchdog_limits.pop(agent_id, None)
+            self._generation.pop((_WATCHDOG, agent_id), None)
+
+    def has_watchdog(self, agent_id: str) -> bool:
+        return agent_id in self._watchdog_limits
+
+    def _push(self, kind: str, agent_id: str, delay: float) -> None:
+        seq = next(self._seq)
+        self._generation[(kind, agent_id)] = seq
+        heapq.heappush(self._heap, (time.monotonic() + delay, seq, kind, agent_id))
+        if len(self._heap) > 64 and len(self._heap) > 4 * len(self._generation):
+            # Drop superseded entries (e.g. watchdogs re-armed on every wake)
+            self._heap = [e for e in self._heap if self._generation.get((e[2], e[3])) == e[1]]
+            heapq.heapify(self._heap)
+        self._cond.notify()
+
+    # ── Supervisor thread ────────────────────────────────────────────────
+
+    def _run(self) -> None:
+        with self._cond:
+            while self._running:
+                now = time.monotonic()
+                while self._heap and self._heap[0][0] <= now:
+                    _, seq, kind, agent_id = heapq.heappop(self._heap)
+                    if self._generation.get((kind, agent_id)) != seq:
+                        continue  # re-armed or cancelled since it was pushed
+                    del self._generation[(kind, agent_id)]
+                    try:
+                        if kind == _HEARTBEAT:
+                            self._beat(agent_id)
+                        else:
+                            self._fire_watchdog(agent_id)
+                    except Exception:
+                        logger.exception("Agent supervisor %s failed for %s", kind, agent_id)
+                if self._dirty and not self._flush_pending:
+                    self._schedule_flush()
+                timeout = self._heap[0][0] - now if self._heap else None
+                self._cond.wait(timeout)
+
+    def _beat(self, agent_id: str) -> None:
+        record = self._records.get(agent_id)
+        live = self._liveness.get(agent_id)
+        if record is None or live is None:
+            return
+        live.elapsed_seconds = int(time.monotonic() - live.started)
+        live.tool_call_count = record.tool_call_count
+        live.turn_count = record.turn_count
+        live.last_beat = datetime.now(timezone.utc).isoformat()
+        self._dirty.add(agent_id)
+
+        # Early warning: no tool calls and no turns after a while usually
+        # means the CLI cannot reach the model API (auth, network, sandbox).
+        if (
+            not live.no_activity_alert
+            and live.elapsed_seconds >= self.no_activity_after
+            and live.tool_call_count == 0
+            and live.turn_count == 0
+        ):
+            live.no_activity_alert = True
+            logger.warning(
+                "NO-ACTIVITY ALERT — agent %s has 0 tool calls and 0 turns "
+                "after %ds. The Copilot CLI may be unable to authenticate "
+                "with the model API. Check CLI stderr and COPILOT_GITHUB_TOKEN.",
+                agent_id,
+                live.elapsed_seconds,
+            )
+            if self._on_no_activity is not None:
+                self._submit(self._on_no_activity(record, live.elapsed_seconds))
+
+        self._push(_HEARTBEAT, agent_id, self.heartbeat_interval)
+
+    def _fire_watchdog(self, agent_id: str) -> None:
+        max_seconds = self._watchdog_limits.pop(agent_id, None)
+        if max_seconds is None or self._loop is None:
+            return
+        self._watchdogs_fired += 1
+        try:
+            self._loop.call_soon_threadsafe(self._on_watchdog, agent_id, max_seconds)
+        except RuntimeError:
+            pass  # loop closed during shutdown
+
+    def _submit(self, coro: Awaitable[Any]) -> None:
+        try:
+            asyncio.run_coroutine_threadsafe(coro, self._loop)  # type: ignore[arg-type]
+        except RuntimeError:
+            coro.close()  # type: ignore[attr-defined]
+
+    # ── Liveness table ───────────────────────────────────────────────────
+
+    def _schedule_flush(self) -> None:
+        if self._loop is None:
+            return
+        self._flush_pending = True
+        self._submit(self.flush())
+
+    async def flush(self) -> None:
+        """Upsert dirty liveness rows in a single registry write."""
+        with self._cond:
+            self._flush_pending = False
+            # Copies: the supervisor thread keeps updating the live entries
+            rows = [replace(self._liveness[a]) for a in self._dirty if a in self._liveness]
+            self._dirty.clear()
+        if not rows:
+            return
+        try:
+            await self.registry.upsert_liveness(rows)
+        except Exception:
+            logger.warning("Failed to write agent liveness", exc_info=True)
+
+    def liveness(self) -> dict[str, Liveness]:
+        with self._cond:
+            return dict(self._liveness)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "tracked": len(self._liveness),
+                "watchdogs": len(self._watchdog_limits),
+                "no_activity": sorted(
+                    agent_id for agent_id, live in self._liveness.items() if live.no_activity_alert
+                ),
+                "watchdogs_fired": self._watchdogs_fired,
+            }
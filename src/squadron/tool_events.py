@@ -0,0 +1,244 @@
+"""Tool Event Recorder — takes activity logging off the tool-call critical path.
+
+Provides:
+- ToolEventRecorder: the SDK tool-use hooks enqueue a raw tuple here and
+  return immediately; a background task turns it into an ActivityEvent
+  (truncating large args/results), writes it to the ActivityLogger and
+  persists agent counters to the registry.
+
+Design Notes:
+- The hook captures the timestamp, so events keep the time the tool
+  actually ran no matter how far behind the writer is.  The activity
+  windows and queries order by timestamp, not insertion order.
+- Counter persistence is coalesced per agent: marking a record dirty ten
+  times before the writer catches up costs one ``update_agent``.
+- ``flush()`` waits until everything enqueued before the call is written.
+  AgentManager flushes at the end of every turn so the turn's tool events
+  and counters land before the post-turn lifecycle writes.
+- The queue is bounded; when full, activity events are dropped (and
+  counted) rather than blocking the model.  Counter persistence is never
+  dropped.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+from squadron.activity import ActivityEvent, ActivityEventType
+
+if TYPE_CHECKING:
+    from squadron.activity import ActivityLogger
+    from squadron.models import AgentRecord
+    from squadron.registry import AgentRegistry
+
+logger = logging.getLogger(__name__)
+
+MAX_ARG_CHARS = 500
+MAX_RESULT_CHARS = 1000
+
+_START = "start"
+_END = "end"
+_EVENT = "event"
+_PERSIST = "persist"
+_FLUSH = "flush"
+
+
+class ToolEventRecorder:
+    """Background writer for tool-call activity events and agent counters."""
+
+    def __init__(
+        self,
+        registry: AgentRegistry,
+        activity_logger: ActivityLogger | None = None,
+        maxsize: int = 10_000,
+    ) -> None:
+        self.registry = registry
+        self.activity_logger = activity_logger
+        self._queue: asyncio.Queue[tuple] = asyncio.Queue(maxsize=maxsize)
+        self._dirty: dict[str, AgentRecord] = {}
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self._stats = {"recorded": 0, "dropped": 0, "persisted": 0, "failed": 0}
+        self._max_lag = 0.0
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        self._running = True
+        self._task = asyncio.create_task(self._writer_loop(), name="tool-event-recorder")
+
+    async def stop(self) -> None:
+        """Write everything still queued, then stop the writer."""
+        if self._task is None:
+            return
+        await self.flush()
+        self._running = False
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    # ── Hook side (non-blocking) ─────────────────────────────────────────
+
+    def tool_started(self, record: AgentRecord, tool_name: str, tool_args: Any) -> None:
+        if self.activity_logger is not None:
+            self._put((_START, time.time(), record, tool_name, tool_args, record.tool_call_count))
+
+    def tool_finished(
+        self,
+        record: AgentRecord,
+        tool_name: str,
+        result: Any,
+        error: Any,
+        duration_ms: int | None,
+    ) -> None:
+        if self.activity_logger is not None:
+            self._put((_END, time.time(), record, tool_name, result, error, duration_ms))
+
+    def log(
+        self,
+        record: AgentRecord,
+        event_type: ActivityEventType,
+        content: str,
+        metadata: dict[str, Any],
+    ) -> None:
+        """Queue an arbitrary activity event for ``record``."""
+        if self.activity_logger is not None:
+            self._put((_EVENT, time.time(), record, event_type, content, metadata))
+
+    def persist(self, record: AgentRecord) -> None:
+        """Schedule ``update_agent(record)``; coalesced with pending writes."""
+        first = not self._dirty
+        self._dirty[record.agent_id] = record
+        if first:
+            # Wake the writer; never dropped — the dirty map holds the record
+            # even if this marker is, and the next item or flush persists it
+            self._put((_PERSIST,), count_drop=False)
+
+    def _put(self, item: tuple, count_drop: bool = True) -> None:
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            if count_drop:
+                self._stats["dropped"] += 1
+
+    async def flush(self) -> None:
+        """Wait until everything queued so far has been written."""
+        if not self._running:
+            return
+        done = asyncio.get_running_loop().create_future()
+        await self._queue.put((_FLUSH, done))
+        await done
+
+    # ── Writer ───────────────────────────────────────────────────────────
+
+    async def _writer_loop(self) -> None:
+        while self._running:
+            flushes: list[asyncio.Future] = []
+            try:
+                item = await self._queue.get()
+                while True:
+                    if item[0] == _FLUSH:
+                        flushes.append(item[1])
+                    elif item[0] != _PERSIST:
+                        await self._write_event(item)
+                    if self._queue.empty():
+                        break
+                    item = self._queue.get_nowait()
+                await self._persist_dirty()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Tool event recorder error")
+            finally:
+                # flush() waiters are released even when the batch failed
+                for done in flushes:
+                    if not done.done():
+                        done.set_result(None)
+
+    async def _write_event(self, item: tuple) -> None:
+        kind, ts, record = item[0], item[1], item[2]
+        try:
+            if kind == _START:
+                event = _start_event(record, *item[3:])
+            elif kind == _END:
+                event = _end_event(record, *item[3:])
+            else:
+                event_type, content, metadata = item[3:]
+                event = ActivityEvent(
+                    agent_id=record.agent_id,
+                    event_type=event_type,
+                    content=content,
+                    issue_number=record.issue_number,
+                    metadata=metadata,
+                )
+            event.timestamp = datetime.fromtimestamp(ts, timezone.utc)
+            await self.activity_logger.log(event)  # type: ignore[union-attr]
+            self._stats["recorded"] += 1
+            self._max_lag = max(self._max_lag, time.time() - ts)
+        except Exception:
+            self._stats["failed"] += 1
+            logger.debug("Failed to log %s tool activity", kind, exc_info=True)
+
+    async def _persist_dirty(self) -> None:
+        while self._dirty:
+            _, record = self._dirty.popitem()
+            try:
+                await self.registry.update_agent(record)
+                self._stats["persisted"] += 1
+            except Exception:
+                logger.warning("Failed to persist counters for %s", record.agent_id, exc_info=True)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "queued": self._queue.qsize(),
+            "pending_persist": len(self._dirty),
+            "max_lag_ms": round(self._max_lag * 1000, 1),
+            **self._stats,
+        }
+
+
+# ── Enrichment ───────────────────────────────────────────────────────────────
+
+
+def _start_event(
+    record: AgentRecord, tool_name: str, tool_args: Any, tool_call_count: int
+) -> ActivityEvent:
+    if isinstance(tool_args, dict):
+        tool_args = {
+            k: (v[:MAX_ARG_CHARS] + "..." if isinstance(v, str) and len(v) > MAX_ARG_CHARS else v)
+            for k, v in tool_args.items()
+        }
+    return ActivityEvent(
+        agent_id=record.agent_id,
+        event_type=ActivityEventType.TOOL_CALL_START,
+        tool_name=tool_name,
+        tool_args=tool_args,
+        issue_number=record.issue_number,
+        pr_number=record.pr_number,
+        metadata={"tool_call_count": tool_call_count},
+    )
+
+
+def _end_event(
+    record: AgentRecord, tool_name: str, result: Any, error: Any, duration_ms: int | None
+) -> ActivityEvent:
+    if isinstance(result, str) and len(result) > MAX_RESULT_CHARS:
+        result = result[:MAX_RESULT_CHARS] + "... (truncated)"
+    return ActivityEvent(
+        agent_id=record.agent_id,
+        event_type=ActivityEventType.TOOL_CALL_END,
+        tool_name=tool_name,
+        tool_result=result,
+        tool_success=error is None,
+        tool_duration_ms=duration_ms,
+        issue_number=record.issue_number,
+        pr_number=record.pr_number,
+        metadata={"error": str(error)} if error else {},
+    )
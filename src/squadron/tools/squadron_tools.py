@@ -29,9 +29,10 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
 
 from copilot import define_tool
+from copilot.types import Tool
 from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
@@ -96,6 +97,24 @@ ALL_TOOL_NAMES = [
 # O(1) lookup set for splitting .md tool lists into custom vs SDK built-in
 ALL_TOOL_NAMES_SET = frozenset(ALL_TOOL_NAMES)
 
+# Invocation key carrying the calling agent into a shared compiled tool
+_AGENT_ID_KEY = "squadron_agent_id"
+
+
+def _bind_tool(tool: Tool, agent_id: str) -> Tool:
+    """Bind a compiled tool to one agent, reusing its description and schema."""
+    handler = tool.handler
+
+    async def bound(invocation):
+        return await handler({**invocation, _AGENT_ID_KEY: agent_id})
+
+    return Tool(
+        name=tool.name,
+        description=tool.description,
+        handler=bound,
+        parameters=tool.parameters,
+    )
+
 
 # ── Tool Parameter Models ────────────────────────────────────────────────────
 
@@ -374,6 +393,7 @@ class SquadronTools:
         self._pre_sleep_hook = pre_sleep_hook
         self._git_push_callback = git_push_callback
         self.activity_logger = activity_logger
+        self._compiled: dict[str, Tool] | None = None
 
     def _agent_signature(self, role: str) -> str:
         """Build the agent signature prefix: emoji + display_name on its own line.
@@ -1554,6 +1574,10 @@ class SquadronTools:
     ) -> list:
         """Return SDK-compatible Tool objects for the specified tool names.
 
+        Tool definitions (including their pydantic JSON schemas) are compiled
+        once per SquadronTools instance; each call only binds the requested
+        tools to ``agent_id``.
+
         Args:
             agent_id: The agent these tools are bound to.
             names: Explicit list of tool names to include. If None or empty,
@@ -1563,7 +1587,7 @@ class SquadronTools:
             return []
 
         # Validate requested tool names
-        invalid = set(names) - set(ALL_TOOL_NAMES)
+        invalid = set(names) - ALL_TOOL_NAMES_SET
         if invalid:
             logger.warning(
                 "Unknown tool names requested for agent %s: %s (available: %s)",
@@ -1571,28 +1595,33 @@ class SquadronTools:
                 invalid,
                 ALL_TOOL_NAMES,
             )
-            names = [n for n in names if n in ALL_TOOL_NAMES]
+            names = [n for n in names if n in ALL_TOOL_NAMES_SET]
 
-        tools = self  # capture for closures
+        compiled = self._compiled_tools()
+        return [_bind_tool(compiled[name], agent_id) for name in names if name in compiled]
 
-        # Build the tool registry — each tool is created only if requested
-        tool_builders: dict[str, Any] = {}
+    def _compiled_tools(self) -> dict[str, Tool]:
+        """Agent-independent Tool definitions, built on first use."""
+        if self._compiled is None:
+            self._compiled = self._compile_tools()
+        return self._compiled
 
-        def _register(name: str, description: str, param_cls, impl):
-            """Register a tool builder. The tool is only created if its name is in `names`."""
+    def _compile_tools(self) -> dict[str, Tool]:
+        tools = self  # capture for closures
+        compiled: dict[str, Tool] = {}
 
-            def builder(pc=param_cls, desc=description, method=impl):
-                async def tool_fn(params) -> str:
-                    return await method(agent_id, params)
+        def _register(name: str, description: str, param_cls, impl):
+            """Compile a tool; the calling agent is injected into each invocation."""
 
-                # Set annotations with actual type objects to avoid
-                # __future__.annotations stringification issues
-                tool_fn.__annotations__ = {"params": pc, "return": str}
-                tool_fn.__name__ = name
-                tool_fn.__qualname__ = name
-                return define_tool(description=desc)(tool_fn)
+            async def tool_fn(params, invocation) -> str:
+                return await impl(invocation[_AGENT_ID_KEY], params)
 
-            tool_builders[name] = builder
+            # Set annotations with actual type objects to avoid
+            # __future__.annotations stringification issues
+            tool_fn.__annotations__ = {"params": param_cls, "invocation": dict, "return": str}
+            tool_fn.__name__ = name
+            tool_fn.__qualname__ = name
+            compiled[name] = define_tool(description=description)(tool_fn)
 
         _register(
             "check_for_events",
@@ -1809,11 +1838,4 @@ class SquadronTools:
             tools.reply_to_review_comment,
         )
 
-        # Build and return only the requested tools
-        result = []
-        for name in names:
-            builder = tool_builders.get(name)
-            if builder:
-                result.append(builder())
-
-        return result
+        return compiled
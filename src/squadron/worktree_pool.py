@@ -0,0 +1,287 @@
+"""Worktree pool — pre-materialized git worktrees recycled across agents.
+
+Provides:
+- WorktreePool: idle, detached worktrees kept next to the agent worktree
+  directory.  ``AgentManager._create_worktree`` checks one out onto the
+  agent's branch (``git checkout -B`` + ``git clean``) and moves it into
+  place instead of running ``git worktree add``; ``_cleanup_agent`` hands
+  the worktree back instead of running ``git worktree remove``.
+
+Design Notes:
+- Checkout only rewrites the files that differ between the pooled commit
+  and the target branch, and ignored build output is cleaned rather than
+  re-created from nothing, so on a large repo this replaces a full
+  materialization with an incremental update.
+- Idle worktrees are detached at ``origin/<default_branch>`` so they never
+  hold a branch another worktree needs.
+- The pool size follows demand: the target is the number of checkouts in
+  the last ``rate_window`` seconds, clamped to ``[min_size, max_size]``.
+  A background loop tops the pool up (one ``worktree add`` at a time) and
+  removes surplus worktrees when demand drops.
+- Idle worktrees survive a restart and are re-adopted on ``start()``.
+- Every failure path falls back to the caller's normal create/remove.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from squadron.config import WorktreePoolConfig
+
+logger = logging.getLogger(__name__)
+
+# (cwd, *git_args) → (returncode, stdout, stderr)
+GitRunner = Callable[..., Awaitable[tuple[int, str, str]]]
+
+
+class WorktreePool:
+    """Pre-materialized worktrees checked out and recycled by AgentManager."""
+
+    def __init__(
+        self,
+        config: WorktreePoolConfig,
+        repo_root: Path,
+        pool_dir: Path,
+        default_branch: str,
+        run_git: GitRunner,
+        sparse_checkout: bool = False,
+    ) -> None:
+        self.config = config
+        self.repo_root = repo_root
+        self.pool_dir = pool_dir
+        self.default_branch = default_branch
+        self.sparse_checkout = sparse_checkout
+        self._run_git = run_git
+        self._idle: deque[Path] = deque()
+        self._checkouts: deque[float] = deque()
+        self._fill_task: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+        self._running = False
+        self._stats = {"hits": 0, "misses": 0, "recycled": 0, "created": 0, "removed": 0}
+
+    @property
+    def target_size(self) -> int:
+        """Idle worktrees to keep, following the recent checkout rate."""
+        cutoff = time.monotonic() - self.config.rate_window
+        while self._checkouts and self._checkouts[0] < cutoff:
+            self._checkouts.popleft()
+        return max(self.config.min_size, min(self.config.max_size, len(self._checkouts)))
+
+    # ── Lifecycle ────────────────────────────────────────────────────────
+
+    async def start(self) -> None:
+        self._running = True
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        self._fill_task = asyncio.create_task(self._adopt_and_fill(), name="worktree-pool-fill")
+        self._task = asyncio.create_task(self._resize_loop(), name="worktree-pool")
+        logger.info(
+            "Worktree pool started (min=%d, max=%d, dir=%s)",
+            self.config.min_size,
+            self.config.max_size,
+            self.pool_dir,
+        )
+
+    async def stop(self) -> None:
+        """Stop background work; idle worktrees stay on disk for the next start."""
+        self._running = False
+        for task in (self._task, self._fill_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        logger.info("Worktree pool stopped (%d idle worktrees kept)", len(self._idle))
+
+    async def _resize_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.config.interval)
+                await self._trim()
+                self._schedule_fill()
+            except asyncio.CancelledError:
+                break
+            except Exception:
+                logger.exception("Worktree pool resize error")
+
+    # ── Checkout / recycle ───────────────────────────────────────────────
+
+    async def acquire(self, branch: str, target: Path, track_remote: bool = False) -> bool:
+        """Check out an idle worktree onto ``branch`` and move it to ``target``.
+
+        ``track_remote`` says ``origin/<branch>`` exists and should be
+        tracked.  Returns False on a pool miss or any git failure — the caller then
+        creates the worktree the normal way.
+        """
+        self._checkouts.append(time.monotonic())
+        if not self._idle:
+            self._stats["misses"] += 1
+            self._schedule_fill()
+            return False
+
+        path = self._idle.popleft()
+        self._schedule_fill()
+        try:
+            ok = await self._checkout_branch(path, branch, track_remote)
+            if ok:
+                rc, _, stderr = await self._run_git(
+                    self.repo_root, "worktree", "move", str(path), str(target)
+                )
+                ok = rc == 0
+                if not ok:
+                    logger.warning("Worktree pool move to %s failed: %s", target, stderr.strip())
+        except Exception:
+            logger.warning("Worktree pool checkout of %s failed", branch, exc_info=True)
+            ok = False
+
+        if not ok:
+            self._stats["misses"] += 1
+            await self._remove(path)
+            return False
+        self._stats["hits"] += 1
+        logger.info("Checked out pooled worktree for %s → %s", branch, target)
+        return True
+
+    async def _checkout_branch(self, path: Path, branch: str, track_remote: bool) -> bool:
+        # Same branch resolution as a fresh worktree: reuse a local branch,
+        # track an existing remote branch, else branch off the default.
+        local_rc, _, _ = await self._run_git(
+            self.repo_root, "rev-parse", "--verify", "--quiet", f"refs/heads/{branch}"
+        )
+        if local_rc == 0:
+            checkout = ("checkout", "--force", branch)
+        elif track_remote:
+            checkout = ("checkout", "--force", "-B", branch, "--track", f"origin/{branch}")
+        else:
+            checkout = ("checkout", "--force", "-B", branch, f"origin/{self.default_branch}")
+        rc, _, stderr = await self._run_git(path, *checkout)
+        if rc != 0:
+            # Checkout scans every worktree's metadata, which can be caught
+            # half-written by a concurrent ``worktree add`` (e.g. our own
+            # background fill) — one retry covers that window.
+            await asyncio.sleep(0.5)
+            rc, _, stderr = await self._run_git(path, *checkout)
+        if rc != 0:
+            logger.warning("Worktree pool checkout of %s failed: %s", branch, stderr.strip())
+            return False
+        rc, _, _ = await self._run_git(path, "clean", "-ffdx", "--quiet")
+        return rc == 0
+
+    async def release(self, path: Path) -> bool:
+        """Take back an agent's worktree for reuse.
+
+        Recycling is cheaper than creating, so worktrees are taken back up
+        to ``max_size``; the resize loop trims any surplus over the target.
+        Returns False when the pool is full or the worktree could not be
+        moved — the caller removes it as usual.
+        """
+        if not self._running or len(self._idle) >= self.config.max_size:
+            return False
+        pooled = self._new_path()
+        rc, _, stderr = await self._run_git(
+            self.repo_root, "worktree", "move", "--force", str(path), str(pooled)
+        )
+        if rc != 0:
+            logger.warning("Worktree pool could not reclaim %s: %s", path, stderr.strip())
+            return False
+        if await self._reset(pooled):
+            self._idle.append(pooled)
+            self._stats["recycled"] += 1
+            logger.info("Recycled worktree %s into pool", path)
+        else:
+            await self._remove(pooled)
+        return True
+
+    async def _reset(self, path: Path) -> bool:
+        """Discard all local state and detach at the default branch."""
+        steps: list[tuple[str, ...]] = [
+            ("reset", "--hard", "--quiet"),
+            ("clean", "-ffdx", "--quiet"),
+            ("checkout", "--force", "--detach", f"origin/{self.default_branch}"),
+        ]
+        if self.sparse_checkout:
+            steps.append(("sparse-checkout", "set", "/"))
+        for args in steps:
+            rc, _, stderr = await self._run_git(path, *args)
+            if rc != 0:
+                logger.warning("Worktree pool reset of %s failed: %s", path, stderr.strip())
+                return False
+        return True
+
+    # ── Background fill / trim ───────────────────────────────────────────
+
+    def _schedule_fill(self) -> None:
+        if self._running and (self._fill_task is None or self._fill_task.done()):
+            self._fill_task = asyncio.create_task(self._fill(), name="worktree-pool-fill")
+
+    async def _adopt_and_fill(self) -> None:
+        await self._run_git(self.repo_root, "worktree", "prune")
+        for entry in sorted(self.pool_dir.iterdir()):
+            if not (entry / ".git").exists():
+                continue
+            if len(self._idle) < self.config.max_size and await self._reset(entry):
+                self._idle.append(entry)
+            else:
+                await self._remove(entry)
+        if self._idle:
+            logger.info("Adopted %d pooled worktrees from a previous run", len(self._idle))
+        await self._fill()
+
+    async def _fill(self) -> None:
+        while self._running and len(self._idle) < self.target_size:
+            path = self._new_path()
+            if not await self._create(path):
+                return
+            self._idle.append(path)
+            self._stats["created"] += 1
+
+    async def _create(self, path: Path) -> bool:
+        start_point = f"origin/{self.default_branch}"
+        if self.sparse_checkout:
+            rc, _, stderr = await self._run_git(
+                self.repo_root,
+                "worktree",
+                "add",
+                "--no-checkout",
+                "--detach",
+                str(path),
+                start_point,
+            )
+            if rc == 0:
+                await self._run_git(path, "sparse-checkout", "init", "--cone")
+                await self._run_git(path, "sparse-checkout", "set", "/")
+                rc, _, stderr = await self._run_git(path, "checkout")
+        else:
+            rc, _, stderr = await self._run_git(
+                self.repo_root, "worktree", "add", "--detach", str(path), start_point
+            )
+        if rc != 0:
+            logger.warning("Worktree pool failed to pre-create %s: %s", path, stderr.strip())
+            await self._remove(path)
+            return False
+        return True
+
+    async def _trim(self) -> None:
+        while len(self._idle) > self.target_size:
+            await self._remove(self._idle.pop())
+
+    async def _remove(self, path: Path) -> None:
+        self._stats["removed"] += 1
+        try:
+            await self._run_git(self.repo_root, "worktree", "remove", "--force", str(path))
+        except Exception:
+            logger.warning("Failed to remove pooled worktree %s", path, exc_info=True)
+
+    def _new_path(self) -> Path:
+        return self.pool_dir / f"wt-{uuid.uuid4().hex[:8]}"
+
+    # ── Metrics ──────────────────────────────────────────────────────────
+
+    def stats(self) -> dict[str, Any]:
+        return {"idle": len(self._idle), "target": self.target_size, **self._stats}
@@ -0,0 +1,37 @@
+"""Shared test fixtures."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture
+def bench_history() -> Callable[..., None]:
+    """Record a benchmark result for tracking across commits.
+
+    ``bench_history("name", **fields)`` appends one JSON line (with
+    timestamp and Python version) to the file named by
+    ``SQUADRON_BENCH_HISTORY``; without that variable it does nothing.
+    """
+
+    def record(benchmark: str, **fields: Any) -> None:
+        path = os.environ.get("SQUADRON_BENCH_HISTORY")
+        if not path:
+            return
+        entry = {
+            "benchmark": benchmark,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            **fields,
+        }
+        with open(path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    return record
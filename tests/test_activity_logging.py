@@ -77,6 +77,18 @@ class TestActivityEvent:
         assert len(sse_data) < 5000
         assert "truncated" in sse_data
 
+    def test_to_sse_frame_is_encoded_once(self):
+        event = ActivityEvent(
+            id=7,
+            agent_id="test-agent",
+            event_type=ActivityEventType.AGENT_SPAWNED,
+        )
+        frame = event.to_sse_frame()
+        assert isinstance(frame, bytes)
+        assert frame.startswith(b"event: activity\nid: 7\ndata: ")
+        assert frame.endswith(b"\n\n")
+        assert event.to_sse_frame() is frame
+
 
 # ── ActivityLogger ───────────────────────────────────────────────────────────
 
@@ -202,6 +214,89 @@ class TestActivityLogger:
         assert pruned == 1
 
 
+# ── In-memory recent windows ─────────────────────────────────────────────────
+
+
+def _spawned(agent_id: str, **kwargs) -> ActivityEvent:
+    return ActivityEvent(agent_id=agent_id, event_type=ActivityEventType.AGENT_SPAWNED, **kwargs)
+
+
+class TestRecentWindow:
+    async def test_hydration_served_without_database(self, activity_logger):
+        for i in range(3):
+            await activity_logger.log(_spawned("agent-1", content=f"e{i}"))
+        # Prime the per-agent window, then take the database away
+        await activity_logger.get_agent_activity("agent-1", limit=10)
+        db, activity_logger._db = activity_logger._db, None
+        try:
+            recent = await activity_logger.get_recent_activity(limit=10)
+            agent = await activity_logger.get_agent_activity("agent-1", limit=2)
+        finally:
+            activity_logger._db = db
+
+        assert [e.content for e in recent] == ["e2", "e1", "e0"]
+        assert [e.content for e in agent] == ["e2", "e1"]
+
+    async def test_window_matches_database(self, activity_logger):
+        for i in range(6):
+            await activity_logger.log(_spawned(f"agent-{i % 2}", content=f"e{i}"))
+
+        cached = await activity_logger.get_agent_activity("agent-0", limit=10, offset=1)
+        from_db = await activity_logger._query_recent(limit=10, offset=1, agent_id="agent-0")
+        assert [e.id for e in cached] == [e.id for e in from_db]
+
+    async def test_global_window_warmed_on_initialize(self, tmp_path):
+        db_path = str(tmp_path / "warm.db")
+        first = ActivityLogger(db_path)
+        await first.initialize()
+        for i in range(5):
+            await first.log(_spawned("agent-1", content=f"e{i}"))
+        await first.close()
+
+        second = ActivityLogger(db_path, recent_window=3)
+        await second.initialize()
+        try:
+            assert [e.content for e in second._recent] == ["e2", "e3", "e4"]
+            # Past the window falls back to SQLite
+            events = await second.get_recent_activity(limit=5)
+            assert [e.content for e in events] == ["e4", "e3", "e2", "e1", "e0"]
+        finally:
+            await second.close()
+
+    async def test_window_is_bounded(self, tmp_path):
+        small = ActivityLogger(str(tmp_path / "small.db"), recent_window=2)
+        await small.initialize()
+        try:
+            await small.get_agent_activity("agent-1", limit=2)
+            for i in range(5):
+                await small.log(_spawned("agent-1", content=f"e{i}"))
+            assert len(small._recent) == 2
+            assert len(small._recent_by_agent["agent-1"]) == 2
+            events = await small.get_agent_activity("agent-1", limit=2)
+            assert [e.content for e in events] == ["e4", "e3"]
+        finally:
+            await small.close()
+
+    async def test_out_of_order_timestamp_is_placed_in_order(self, activity_logger):
+        from datetime import datetime, timedelta, timezone
+
+        now = datetime.now(timezone.utc)
+        await activity_logger.log(_spawned("agent-1", content="late", timestamp=now))
+        await activity_logger.log(
+            _spawned("agent-1", content="early", timestamp=now - timedelta(seconds=5))
+        )
+        events = await activity_logger.get_recent_activity(limit=10)
+        assert [e.content for e in events] == ["late", "early"]
+
+    async def test_prune_clears_window(self, activity_logger):
+        await activity_logger.log(_spawned("agent-1"))
+        await activity_logger.get_agent_activity("agent-1")
+        await activity_logger.prune_old_activity(hours=0)
+
+        assert await activity_logger.get_recent_activity() == []
+        assert await activity_logger.get_agent_activity("agent-1") == []
+
+
 # ── Subscription/Broadcast ───────────────────────────────────────────────────
 
 
@@ -267,6 +362,37 @@ class TestActivityBroadcast:
         # Queue should be empty (unsubscribed)
         assert queue.empty()
 
+    async def test_slow_subscriber_drops_oldest(self, activity_logger):
+        queues = [await activity_logger.subscribe(None), await activity_logger.subscribe("a")]
+        for i in range(queues[0].maxsize + 1):
+            await activity_logger.log(
+                ActivityEvent(
+                    agent_id="a", event_type=ActivityEventType.TOOL_CALL_START, content=f"{i}"
+                )
+            )
+        # Still subscribed; only the oldest event was discarded
+        assert activity_logger._global_subscribers == [queues[0]]
+        assert activity_logger._subscribers["a"] == [queues[1]]
+        assert [q.get_nowait().content for q in queues] == ["1", "1"]
+
+    async def test_subscribers_share_one_encoded_frame(self, activity_logger):
+        global_queue = await activity_logger.subscribe(None)
+        agent_queue = await activity_logger.subscribe("test-agent")
+
+        await activity_logger.log(
+            ActivityEvent(
+                agent_id="test-agent",
+                event_type=ActivityEventType.AGENT_SPAWNED,
+            )
+        )
+
+        a = await asyncio.wait_for(global_queue.get(), timeout=1.0)
+        b = await asyncio.wait_for(agent_queue.get(), timeout=1.0)
+        # Frame was built at publish time, with the DB id, and is shared
+        assert a._sse_frame is not None
+        assert f"id: {a.id}\n".encode() in a._sse_frame
+        assert a.to_sse_frame() is b.to_sse_frame()
+
 
 # ── Helper Functions ─────────────────────────────────────────────────────────
 
@@ -0,0 +1,142 @@
+"""Tests for resource-aware adaptive agent concurrency.
+
+Covers:
+- Classification of pressure samples with separate pressure / headroom watermarks
+- Multiplicative decrease under pressure, spaced by the cooldown
+- Additive increase only after sustained headroom with queued agents
+- Bounds, and deferral of new admissions when the limit drops
+- ResourceMonitor pressure sampling and the event-loop lag probe
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from squadron.adaptive_concurrency import HEADROOM, PRESSURE, STEADY, AdaptiveConcurrency
+from squadron.admission import AdmissionScheduler
+from squadron.config import AdaptiveConcurrencyConfig, AdmissionConfig
+from squadron.resource_monitor import PressureSample, ResourceMonitor
+
+CALM = PressureSample(memory_available_percent=60, process_percent=10, load_per_cpu=0.2)
+TIGHT = PressureSample(memory_available_percent=5, process_percent=10, load_per_cpu=0.2)
+# Between the watermarks: neither pressure nor headroom
+WARM = PressureSample(memory_available_percent=15, process_percent=10, load_per_cpu=0.2)
+
+
+def _controller(limit: int = 8, **kwargs) -> AdaptiveConcurrency:
+    config = AdaptiveConcurrencyConfig(
+        enabled=True, **{"min_agents": 2, "max_agents": 10, "raise_after": 2, **kwargs}
+    )
+    scheduler = AdmissionScheduler(limit, AdmissionConfig())
+    return AdaptiveConcurrency(config, scheduler, monitor=None, initial_limit=limit)
+
+
+async def _fill(scheduler: AdmissionScheduler, n: int, waiting: int = 0) -> list[asyncio.Task]:
+    for i in range(n):
+        await scheduler.acquire(f"held-{i}", "feat-dev")
+    tasks = [
+        asyncio.create_task(scheduler.acquire(f"queued-{i}", "feat-dev")) for i in range(waiting)
+    ]
+    await asyncio.sleep(0)
+    return tasks
+
+
+class TestClassify:
+    @pytest.mark.parametrize(
+        "sample, state",
+        [
+            (CALM, HEADROOM),
+            (TIGHT, PRESSURE),
+            (WARM, STEADY),
+            (PressureSample(process_percent=90), PRESSURE),
+            (PressureSample(load_per_cpu=2.0), PRESSURE),
+            (PressureSample(loop_lag=0.8), PRESSURE),
+            (PressureSample(loop_lag=0.3), STEADY),
+        ],
+    )
+    def test_states(self, sample, state):
+        assert _controller().classify(sample)[0] == state
+
+    def test_reasons_name_the_signal(self):
+        _, reasons = _controller().classify(PressureSample(memory_available_percent=3, loop_lag=1))
+        assert len(reasons) == 2
+        assert "memory" in reasons[0] and "lag" in reasons[1]
+
+
+class TestControl:
+    def test_pressure_cuts_limit_then_waits_for_cooldown(self):
+        c = _controller(limit=8, cooldown=30)
+        c.update(TIGHT)
+        assert c.scheduler.limit == 6
+        c.update(TIGHT)  # within cooldown
+        assert c.scheduler.limit == 6
+        c._last_decrease = time.monotonic() - 31
+        c.update(TIGHT)
+        assert c.scheduler.limit == 4
+        assert c.stats()["decreases"] == 2
+
+    def test_never_below_min(self):
+        c = _controller(limit=3, cooldown=0)
+        for _ in range(5):
+            c.update(TIGHT)
+        assert c.scheduler.limit == 2
+
+    async def test_headroom_raises_only_with_queued_agents(self):
+        c = _controller(limit=2)
+        for _ in range(5):
+            c.update(CALM)
+        assert c.scheduler.limit == 2  # no demand, no growth
+
+        queued = await _fill(c.scheduler, 2, waiting=1)
+        c.update(CALM)
+        assert c.scheduler.limit == 3
+        await queued[0]  # the raise admitted the waiter
+        assert c.stats()["raises"] == 1
+
+    async def test_steady_sample_resets_headroom_streak(self):
+        c = _controller(limit=2)
+        queued = await _fill(c.scheduler, 2, waiting=1)
+        c.update(CALM)
+        c.update(WARM)
+        c.update(CALM)
+        assert c.scheduler.limit == 2
+        c.update(CALM)
+        assert c.scheduler.limit == 3
+        await queued[0]
+
+    async def test_lower_limit_defers_new_admissions(self):
+        c = _controller(limit=4)
+        await _fill(c.scheduler, 4)
+        c.update(TIGHT)
+        assert c.scheduler.limit == 3
+        waiter = asyncio.create_task(c.scheduler.acquire("new", "feat-dev"))
+        await asyncio.sleep(0)
+        c.scheduler.release("held-0")
+        await asyncio.sleep(0)
+        assert not waiter.done()  # 3 still running at a limit of 3
+        c.scheduler.release("held-1")
+        await waiter
+
+    def test_max_bound(self):
+        c = _controller(limit=10)
+        assert c._clamp(25) == 10
+
+
+class TestResourceMonitorPressure:
+    async def test_pressure_sample_and_lag_probe(self, tmp_path):
+        monitor = ResourceMonitor(tmp_path)
+        await monitor.start()
+        try:
+            # Block the loop so the lag probe sees a late wake-up
+            await asyncio.sleep(0.05)
+            time.sleep(0.6)
+            await asyncio.sleep(0.05)
+            sample = await monitor.pressure()
+        finally:
+            await monitor.stop()
+        assert 0 <= sample.memory_available_percent <= 100
+        assert sample.load_per_cpu >= 0
+        assert sample.loop_lag > 0.05
@@ -0,0 +1,250 @@
+"""Tests for priority / fair-share agent admission.
+
+Covers:
+- Priority classes from roles and issue labels
+- Weighted fair share between roles within one priority
+- Cancelled waiters and idempotent release
+- Preemption of the lowest-priority holder and its re-queue priority
+- Wait-queue introspection and per-class wait metrics
+- AgentManager preemption: checkpoint, sleep and queued wake
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from squadron.admission import AdmissionScheduler
+from squadron.config import AdmissionConfig
+from squadron.models import AgentRecord, AgentStatus, SquadronEventType
+
+
+def _scheduler(limit: int = 1, preempt=None, **kwargs) -> AdmissionScheduler:
+    return AdmissionScheduler(limit, AdmissionConfig(**kwargs), preempt=preempt)
+
+
+async def _queue(scheduler: AdmissionScheduler, agent_id: str, role: str, labels=()):
+    task = asyncio.create_task(scheduler.acquire(agent_id, role, labels))
+    await asyncio.sleep(0)
+    return task
+
+
+class TestOrdering:
+    def test_priority_is_max_of_role_and_labels(self):
+        s = _scheduler(role_priorities={"pm": 5}, label_priorities={"critical": 20, "chore": -1})
+        assert s.priority_for("feat-dev") == 0
+        assert s.priority_for("pm", ["chore"]) == 5
+        assert s.priority_for("feat-dev", ["critical"]) == 20
+
+    async def test_higher_priority_waiter_admitted_first(self):
+        s = _scheduler(limit=1, role_priorities={"pr-review": 10})
+        await s.acquire("holder", "feat-dev")
+        low = await _queue(s, "feat-dev-2", "feat-dev")
+        high = await _queue(s, "review-1", "pr-review")
+
+        s.release("holder")
+        await asyncio.sleep(0)
+        assert high.done() and not low.done()
+        s.release("review-1")
+        await low
+
+    async def test_label_priority_applies(self):
+        s = _scheduler(limit=1, label_priorities={"critical": 50})
+        await s.acquire("holder", "feat-dev")
+        normal = await _queue(s, "a", "feat-dev")
+        urgent = await _queue(s, "b", "feat-dev", ["critical"])
+        s.release("holder")
+        await urgent
+        assert not normal.done()
+        normal.cancel()
+
+    async def test_fair_share_between_roles(self):
+        s = _scheduler(limit=3, role_weights={"feat-dev": 2})
+        # feat-dev holds two slots (its share at weight 2), bug-fix one
+        for agent_id, role in (("f1", "feat-dev"), ("f2", "feat-dev"), ("b1", "bug-fix")):
+            await s.acquire(agent_id, role)
+        more_dev = await _queue(s, "f3", "feat-dev")
+        more_fix = await _queue(s, "b2", "bug-fix")
+
+        # A bug-fix slot frees: bug-fix (0/1) is further below its share than feat-dev (2/2)
+        s.release("b1")
+        await more_fix
+        assert not more_dev.done()
+        more_dev.cancel()
+
+    async def test_fifo_within_same_class(self):
+        s = _scheduler(limit=1)
+        await s.acquire("holder", "feat-dev")
+        first = await _queue(s, "a", "feat-dev")
+        second = await _queue(s, "b", "feat-dev")
+        s.release("holder")
+        await first
+        assert not second.done()
+        second.cancel()
+
+
+class TestRelease:
+    async def test_release_is_per_agent_and_idempotent(self):
+        s = _scheduler(limit=2)
+        await s.acquire("a", "feat-dev")
+        await s.acquire("a", "feat-dev")  # already holding — no second slot
+        assert s.occupancy()["in_use"] == 1
+        assert s.release("a") is True
+        assert s.release("a") is False
+        assert s.release("never-held") is False
+        assert s.occupancy()["in_use"] == 0
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        s = _scheduler(limit=1)
+        await s.acquire("holder", "feat-dev")
+        waiter = await _queue(s, "a", "feat-dev")
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert s.occupancy() == {"limit": 1, "in_use": 1, "waiting": 0}
+        s.release("holder")
+        assert s.occupancy()["in_use"] == 0
+
+    async def test_unlimited_never_waits(self):
+        s = _scheduler(limit=0)
+        for i in range(20):
+            await s.acquire(f"a{i}", "feat-dev")
+        assert s.occupancy() == {"limit": 0, "in_use": 20, "waiting": 0}
+
+
+class TestPreemption:
+    async def test_lowest_priority_holder_is_preempted(self):
+        preempted: list[str] = []
+        s = _scheduler(
+            limit=2,
+            preempt=lambda agent_id: preempted.append(agent_id) or True,
+            role_priorities={"pm": 1, "security-review": 10},
+            preemption=True,
+        )
+        await s.acquire("docs-1", "docs")
+        await s.acquire("pm-1", "pm")
+        urgent = await _queue(s, "sec-1", "security-review")
+        assert preempted == ["docs-1"]
+        assert s.stats()["preempting"] == ["docs-1"]
+
+        # The preempted agent checkpoints and releases; its slot goes to the waiter
+        s.release("docs-1")
+        await urgent
+        assert s.stats()["preemptions"] == 1
+
+    async def test_no_preemption_for_equal_priority(self):
+        preempt = MagicMock(return_value=True)
+        s = _scheduler(limit=1, preempt=preempt, preemption=True)
+        await s.acquire("a", "feat-dev")
+        waiter = await _queue(s, "b", "feat-dev")
+        preempt.assert_not_called()
+        waiter.cancel()
+
+    async def test_disabled_by_default(self):
+        preempt = MagicMock(return_value=True)
+        s = _scheduler(limit=1, preempt=preempt, role_priorities={"pm": 10})
+        await s.acquire("a", "feat-dev")
+        waiter = await _queue(s, "pm-1", "pm")
+        preempt.assert_not_called()
+        waiter.cancel()
+
+    async def test_preempted_agent_requeues_at_original_priority(self):
+        s = _scheduler(
+            limit=1,
+            preempt=lambda agent_id: True,
+            label_priorities={"critical": 10, "p1": 20},
+            preemption=True,
+        )
+        await s.acquire("a", "feat-dev", ["critical"])
+        urgent = await _queue(s, "b", "feat-dev", ["p1"])
+        s.release("a")
+        await urgent
+
+        # The wake carries no labels, but the agent keeps its priority class
+        requeued = await _queue(s, "a", "feat-dev")
+        assert s.stats()["queue"][0]["priority"] == 10
+        requeued.cancel()
+
+
+class TestIntrospection:
+    async def test_queue_and_wait_metrics(self):
+        s = _scheduler(limit=1, role_priorities={"pm": 5})
+        await s.acquire("holder", "feat-dev")
+        waiter = await _queue(s, "pm-1", "pm")
+        stats = s.stats()
+        assert stats["holders_by_role"] == {"feat-dev": 1}
+        assert [q["agent_id"] for q in stats["queue"]] == ["pm-1"]
+        assert stats["queue"][0]["priority"] == 5
+
+        s.release("holder")
+        await waiter
+        classes = s.stats()["wait_by_priority"]
+        assert classes["0"]["admitted"] == 1
+        assert classes["5"]["admitted"] == 1
+        assert classes["5"]["max_wait_seconds"] >= 0
+
+
+class TestAgentManagerPreemption:
+    def _manager(self, scheduler):
+        from squadron.agent_manager import AgentManager
+
+        manager = AgentManager.__new__(AgentManager)
+        manager._admission = scheduler
+        manager._preempted = set()
+        manager._agent_tasks = {}
+        manager._copilot_agents = {}
+        manager._keepalive = MagicMock()
+        manager._keepalive.park.return_value = False
+        manager._supervisor = MagicMock()
+        manager._running = True
+        manager.registry = AsyncMock()
+        manager.activity_logger = None
+        manager._wip_commit_and_push = AsyncMock()
+        manager.wake_agent = AsyncMock()
+        return manager
+
+    async def test_preempt_without_task_is_declined(self):
+        manager = self._manager(_scheduler())
+        assert manager._preempt_agent("missing") is False
+
+    async def test_checkpoint_and_sleep(self):
+        scheduler = _scheduler(limit=1)
+        manager = self._manager(scheduler)
+        await scheduler.acquire("feat-dev-issue-1", "feat-dev")
+        copilot = AsyncMock()
+        manager._copilot_agents["feat-dev-issue-1"] = copilot
+        record = AgentRecord(
+            agent_id="feat-dev-issue-1",
+            role="feat-dev",
+            issue_number=1,
+            status=AgentStatus.ACTIVE,
+            branch="feat/issue-1",
+        )
+
+        async def run():
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                await manager._checkpoint_and_sleep(record)
+                raise
+
+        manager._agent_tasks[record.agent_id] = asyncio.create_task(run())
+        await asyncio.sleep(0)
+        assert manager._preempt_agent(record.agent_id)
+        with pytest.raises(asyncio.CancelledError):
+            await manager._agent_tasks[record.agent_id]
+        await asyncio.sleep(0)
+
+        manager._wip_commit_and_push.assert_awaited_once_with(record)
+        assert record.status == AgentStatus.SLEEPING
+        manager.registry.update_agent.assert_awaited_with(record)
+        copilot.stop.assert_awaited_once()
+        assert scheduler.occupancy()["in_use"] == 0
+        assert record.agent_id not in manager._agent_tasks
+
+        agent_id, wake_event = manager.wake_agent.call_args.args
+        assert agent_id == record.agent_id
+        assert wake_event.event_type == SquadronEventType.WAKE_AGENT
+        assert wake_event.data == {"reason": "preempted"}
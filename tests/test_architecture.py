@@ -92,28 +92,30 @@ class TestAgentConcurrencySemaphore:
         yield reg
         await reg.close()
 
-    async def test_semaphore_created_with_limit(self, registry):
+    async def test_admission_created_with_limit(self, registry):
         manager = self._make_manager(registry, max_concurrent=5)
-        assert manager._agent_semaphore is not None
-        assert manager._agent_semaphore._value == 5
+        assert manager._admission.limit == 5
+        assert manager.concurrency_stats() == {"limit": 5, "in_use": 0, "waiting": 0}
 
-    async def test_semaphore_none_when_unlimited(self, registry):
+    async def test_concurrency_stats_none_when_unlimited(self, registry):
         manager = self._make_manager(registry, max_concurrent=0)
-        assert manager._agent_semaphore is None
+        assert manager.concurrency_stats() is None
 
-    async def test_release_semaphore_decrements(self, registry):
+    async def test_release_frees_slot(self, registry):
         manager = self._make_manager(registry, max_concurrent=3)
-        # Acquire one slot
-        await manager._agent_semaphore.acquire()
-        assert manager._agent_semaphore._value == 2
-        # Release via helper
-        manager._release_semaphore()
-        assert manager._agent_semaphore._value == 3
-
-    async def test_release_semaphore_noop_when_unlimited(self, registry):
-        manager = self._make_manager(registry, max_concurrent=0)
-        # Should not raise
-        manager._release_semaphore()
+        await manager._admission.acquire("a-1", "feat-dev")
+        assert manager.concurrency_stats()["in_use"] == 1
+        manager._admission.release("a-1")
+        assert manager.concurrency_stats()["in_use"] == 0
+
+    async def test_release_is_idempotent(self, registry):
+        manager = self._make_manager(registry, max_concurrent=3)
+        await manager._admission.acquire("a-1", "feat-dev")
+        manager._admission.release("a-1")
+        # A second release (e.g. cleanup of an agent that already slept) must not
+        # hand out an extra slot
+        assert manager._admission.release("a-1") is False
+        assert manager.concurrency_stats()["in_use"] == 0
 
 
 # ── Async Git Operations ────────────────────────────────────────────────────
@@ -0,0 +1,226 @@
+"""Tests for the warm pool of pre-started Copilot CLI clients.
+
+Covers:
+- Background warm-up of the default profile on start
+- Checkout hits, misses and per-profile keys
+- Disconnected / failed-ping clients are evicted
+- Max-idle recycling and dropping profiles without demand
+- AgentManager spawn path using the pool with a fresh-start fallback
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from squadron.config import CopilotPoolConfig, ModelOverride, RuntimeConfig
+from squadron.copilot_pool import CopilotPool
+
+
+class FakeCopilotAgent:
+    """Stand-in for CopilotAgent that 'starts' instantly."""
+
+    instances: list["FakeCopilotAgent"] = []
+    fail_start = False
+
+    def __init__(self, runtime_config, working_directory, env=None):
+        self.working_directory = working_directory
+        self.env = env
+        self.client = MagicMock()
+        self.client.get_state.return_value = "connected"
+        self.client.ping = AsyncMock()
+        self.stopped = False
+        FakeCopilotAgent.instances.append(self)
+
+    async def start(self):
+        if FakeCopilotAgent.fail_start:
+            raise RuntimeError("spawn failed")
+
+    async def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture(autouse=True)
+def fake_agent():
+    FakeCopilotAgent.instances = []
+    FakeCopilotAgent.fail_start = False
+    with patch("squadron.copilot_pool.CopilotAgent", FakeCopilotAgent):
+        yield
+
+
+def _pool(size: int = 2, **kwargs) -> CopilotPool:
+    runtime = RuntimeConfig(
+        default_model="model-a", models={"review": ModelOverride(model="model-b")}
+    )
+    return CopilotPool(
+        config=CopilotPoolConfig(enabled=True, size=size, **kwargs),
+        runtime_config=runtime,
+        working_directory="/repo",
+        env_factory=lambda: {"PATH": "/bin"},
+    )
+
+
+async def _settle(pool: CopilotPool) -> None:
+    await asyncio.gather(*pool._refill_tasks.values())
+
+
+class TestCheckout:
+    async def test_start_warms_default_profile(self):
+        pool = _pool(size=2)
+        await pool.start()
+        try:
+            await _settle(pool)
+            assert pool.stats()["idle"] == {"copilot/model-a": 2}
+            assert all(a.working_directory == "/repo" for a in FakeCopilotAgent.instances)
+            assert FakeCopilotAgent.instances[0].env == {"PATH": "/bin"}
+        finally:
+            await pool.stop()
+        assert all(a.stopped for a in FakeCopilotAgent.instances)
+
+    async def test_hit_then_refill(self):
+        pool = _pool(size=1)
+        await pool.start()
+        try:
+            await _settle(pool)
+            first = FakeCopilotAgent.instances[0]
+            assert pool.checkout("feat-dev") is first
+            await _settle(pool)
+            stats = pool.stats()
+            assert stats["hits"] == 1
+            assert stats["idle"] == {"copilot/model-a": 1}
+            assert stats["started"] == 2
+        finally:
+            await pool.stop()
+        # Checked-out clients belong to the agent, not the pool
+        assert not first.stopped
+
+    async def test_miss_for_cold_profile_schedules_warmup(self):
+        pool = _pool(size=1)
+        await pool.start()
+        try:
+            await _settle(pool)
+            assert pool.checkout("review") is None
+            await _settle(pool)
+            stats = pool.stats()
+            assert stats["misses"] == 1
+            assert stats["hit_rate"] == 0.0
+            assert stats["idle"]["copilot/model-b"] == 1
+            assert pool.checkout("review") is not None
+            assert pool.stats()["hit_rate"] == 0.5
+        finally:
+            await pool.stop()
+
+    async def test_disconnected_client_is_evicted_on_checkout(self):
+        pool = _pool(size=2)
+        await pool.start()
+        try:
+            await _settle(pool)
+            dead, alive = FakeCopilotAgent.instances
+            dead.client.get_state.return_value = "error"
+            assert pool.checkout("feat-dev") is alive
+            await asyncio.sleep(0)
+            assert dead.stopped
+            assert pool.stats()["evicted"] == 1
+        finally:
+            await pool.stop()
+
+    async def test_failed_start_is_counted(self):
+        FakeCopilotAgent.fail_start = True
+        pool = _pool(size=1)
+        await pool.start()
+        try:
+            await _settle(pool)
+            assert pool.checkout("feat-dev") is None
+            assert pool.stats()["failed"] >= 1
+            assert FakeCopilotAgent.instances[0].stopped
+        finally:
+            await pool.stop()
+
+
+class TestHealthChecks:
+    async def test_failed_ping_evicts_and_refills(self):
+        pool = _pool(size=1)
+        await pool.start()
+        try:
+            await _settle(pool)
+            sick = FakeCopilotAgent.instances[0]
+            sick.client.ping.side_effect = ConnectionError("gone")
+            await pool._check_idle()
+            await _settle(pool)
+            assert sick.stopped
+            assert pool.stats()["idle"] == {"copilot/model-a": 1}
+            assert pool.checkout("feat-dev") is not sick
+        finally:
+            await pool.stop()
+
+    async def test_max_idle_recycles_default_and_drops_unused_profiles(self):
+        pool = _pool(size=1, max_idle_seconds=60)
+        await pool.start()
+        try:
+            pool.checkout("review")
+            await _settle(pool)
+            # Age every idle client and all demand past max_idle
+            for entries in pool._idle.values():
+                for entry in entries:
+                    entry.idle_since -= 120
+            pool._demand["copilot/model-b"] = time.monotonic() - 120
+
+            await pool._check_idle()
+            await _settle(pool)
+            stats = pool.stats()
+            assert stats["evicted"] == 2
+            # The default profile is kept warm with a fresh client
+            assert stats["idle"] == {"copilot/model-a": 1}
+        finally:
+            await pool.stop()
+
+
+class TestAgentManagerIntegration:
+    def _manager(self, pool):
+        from squadron.agent_manager import AgentManager
+
+        manager = AgentManager.__new__(AgentManager)
+        manager.config = MagicMock()
+        manager._copilot_pool = pool
+        manager._keepalive = MagicMock()
+        manager._admission = MagicMock()
+        manager._build_agent_env = lambda: {}
+        return manager
+
+    async def test_start_copilot_uses_pool_hit(self, tmp_path):
+        pooled = FakeCopilotAgent(None, "/repo")
+        pool = MagicMock()
+        pool.checkout.return_value = pooled
+        manager = self._manager(pool)
+
+        with patch("squadron.agent_manager.CopilotAgent") as fresh:
+            copilot = await manager._start_copilot("feat-dev", tmp_path)
+        assert copilot is pooled
+        assert copilot.working_directory == str(tmp_path)
+        fresh.assert_not_called()
+
+    async def test_start_copilot_falls_back_on_miss(self, tmp_path):
+        pool = MagicMock()
+        pool.checkout.return_value = None
+        manager = self._manager(pool)
+
+        with patch("squadron.agent_manager.CopilotAgent") as fresh:
+            fresh.return_value.start = AsyncMock()
+            copilot = await manager._start_copilot("feat-dev", tmp_path)
+        assert copilot is fresh.return_value
+        copilot.start.assert_awaited_once()
+        assert fresh.call_args.kwargs["working_directory"] == str(tmp_path)
+
+    async def test_sandboxed_agent_bypasses_pool(self, tmp_path):
+        pool = MagicMock()
+        manager = self._manager(pool)
+
+        with patch("squadron.agent_manager.CopilotAgent") as fresh:
+            fresh.return_value.start = AsyncMock()
+            copilot = await manager._start_copilot("feat-dev", tmp_path, sandboxed=True)
+        pool.checkout.assert_not_called()
+        assert copilot is fresh.return_value
+        assert fresh.call_args.kwargs["working_directory"] == str(tmp_path)
@@ -34,6 +34,12 @@ def make_event(
     )
 
 
+async def _decoded(gen):
+    """Decode the generator's pre-encoded SSE byte frames for string assertions."""
+    async for chunk in gen:
+        yield chunk.decode()
+
+
 async def collect_sse_output(gen, max_items: int = 50) -> list[str]:
     """Collect SSE output lines from an async generator, stopping after max_items."""
     results = []
@@ -78,7 +84,7 @@ class TestSseGeneratorHydration:
         mock_logger.get_recent_activity = AsyncMock(return_value=history_events)
         dashboard_mod._activity_logger = mock_logger
 
-        gen = dashboard_mod._sse_generator(agent_id=None)
+        gen = _decoded(dashboard_mod._sse_generator(agent_id=None))
         # First item must be the 'connected' event
         first = await gen.__anext__()
         assert "event: connected" in first
@@ -95,7 +101,7 @@ class TestSseGeneratorHydration:
         mock_logger.get_recent_activity = AsyncMock(return_value=history_events)
         dashboard_mod._activity_logger = mock_logger
 
-        gen = dashboard_mod._sse_generator(agent_id=None)
+        gen = _decoded(dashboard_mod._sse_generator(agent_id=None))
         collected = []
         # Collect connected + 2 history + hydrated (4 items)
         for _ in range(4):
@@ -123,7 +129,7 @@ class TestSseGeneratorHydration:
         mock_logger.get_recent_activity = AsyncMock(return_value=[])
         dashboard_mod._activity_logger = mock_logger
 
-        gen = dashboard_mod._sse_generator(agent_id=None)
+        gen = _decoded(dashboard_mod._sse_generator(agent_id=None))
         # Skip 'connected'
         await gen.__anext__()
         # Next should be 'hydrated' (no history events)
@@ -151,7 +157,7 @@ class TestSseGeneratorHydration:
         mock_logger.get_recent_activity = AsyncMock(return_value=history_events)
         dashboard_mod._activity_logger = mock_logger
 
-        gen = dashboard_mod._sse_generator(agent_id=None)
+        gen = _decoded(dashboard_mod._sse_generator(agent_id=None))
         # Skip 'connected'
         await gen.__anext__()
         # Collect 2 history events
@@ -176,7 +182,7 @@ class TestSseGeneratorHydration:
         mock_logger.get_recent_activity = AsyncMock(return_value=[])
         dashboard_mod._activity_logger = mock_logger
 
-        gen = dashboard_mod._sse_generator(agent_id="agent-123")
+        gen = _decoded(dashboard_mod._sse_generator(agent_id="agent-123"))
         await gen.__anext__()  # connected
         await gen.__anext__()  # hydrated
 
@@ -195,7 +201,7 @@ class TestSseGeneratorHydration:
         mock_logger.get_agent_activity = AsyncMock(return_value=[])
         dashboard_mod._activity_logger = mock_logger
 
-        gen = dashboard_mod._sse_generator(agent_id=None)
+        gen = _decoded(dashboard_mod._sse_generator(agent_id=None))
         await gen.__anext__()  # connected
         await gen.__anext__()  # hydrated
 
@@ -223,7 +229,7 @@ class TestSseGeneratorHydration:
         mock_logger.get_recent_activity = track_get_recent_activity
         dashboard_mod._activity_logger = mock_logger
 
-        gen = dashboard_mod._sse_generator(agent_id=None)
+        gen = _decoded(dashboard_mod._sse_generator(agent_id=None))
         await gen.__anext__()  # connected (triggers subscribe + history fetch)
         await gen.__anext__()  # hydrated
 
@@ -237,7 +243,7 @@ class TestSseGeneratorHydration:
         import squadron.dashboard as dashboard_mod
 
         dashboard_mod._activity_logger = None
-        gen = dashboard_mod._sse_generator(agent_id=None)
+        gen = _decoded(dashboard_mod._sse_generator(agent_id=None))
         first = await gen.__anext__()
         assert "event: error" in first
         assert '"error"' in first
@@ -256,7 +262,7 @@ class TestSseGeneratorHydration:
         mock_logger.get_recent_activity = AsyncMock(return_value=[])
         dashboard_mod._activity_logger = mock_logger
 
-        gen = dashboard_mod._sse_generator(agent_id=None)
+        gen = _decoded(dashboard_mod._sse_generator(agent_id=None))
         await gen.__anext__()  # connected
         await gen.__anext__()  # hydrated (no history)
 
@@ -0,0 +1,291 @@
+"""Tests for the multiplexed dashboard WebSocket stream.
+
+Covers:
+- subscribe / unsubscribe protocol and error replies
+- Server-side filtering (agent, event type, role, log level, pipeline run)
+- Batching of events into one frame per tick
+- Bandwidth scaling with what each client watches
+- Endpoint authentication
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, WebSocketDisconnect
+from fastapi.testclient import TestClient
+
+import squadron.dashboard as dashboard_mod
+from squadron.activity import ActivityEvent, ActivityEventType, ActivityLogger
+from squadron.log_buffer import LogBuffer, LogRecord
+
+
+class FakeWebSocket:
+    """Minimal stand-in for starlette's WebSocket used by _WsClient."""
+
+    def __init__(self) -> None:
+        self.incoming: asyncio.Queue[str | None] = asyncio.Queue()
+        self.sent: list[dict] = []
+        self.bytes_sent = 0
+
+    async def receive_text(self) -> str:
+        msg = await self.incoming.get()
+        if msg is None:
+            raise WebSocketDisconnect()
+        return msg
+
+    async def send_text(self, text: str) -> None:
+        self.bytes_sent += len(text)
+        self.sent.append(json.loads(text))
+
+    def send(self, **message) -> None:
+        self.incoming.put_nowait(json.dumps(message))
+
+    def batches(self) -> list[dict]:
+        return [m for m in self.sent if m.get("type") == "batch"]
+
+    def entries(self) -> list[dict]:
+        return [e for b in self.batches() for e in b["events"]]
+
+    def events(self) -> list[dict]:
+        return [e for e in self.entries() if "data" in e]
+
+
+async def wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+@pytest_asyncio.fixture
+async def activity_logger(tmp_path):
+    logger = ActivityLogger(str(tmp_path / "activity.db"))
+    await logger.initialize()
+    yield logger
+    await logger.close()
+
+
+@pytest_asyncio.fixture
+async def ws_env(activity_logger, monkeypatch):
+    """Configure the dashboard module and yield a client factory."""
+    monkeypatch.setattr(dashboard_mod, "_WS_TICK", 0.01)
+    for key in dashboard_mod._ws_stats:
+        monkeypatch.setitem(dashboard_mod._ws_stats, key, 0)
+
+    registry = MagicMock()
+    registry.get_agent = AsyncMock(
+        side_effect=lambda agent_id: MagicMock(role=agent_id.split("-")[0])
+    )
+    log_buffer = LogBuffer(maxlen=100)
+    log_buffer.attach_loop(asyncio.get_running_loop())
+    pipeline_registry = MagicMock()
+    pipeline_registry.get_active_pipeline_runs = AsyncMock(return_value=[])
+    dashboard_mod.configure(
+        activity_logger, registry, log_buffer, pipeline_registry=pipeline_registry
+    )
+
+    tasks: list[asyncio.Task] = []
+
+    def connect() -> FakeWebSocket:
+        ws = FakeWebSocket()
+        tasks.append(asyncio.create_task(dashboard_mod._WsClient(ws).run()))
+        return ws
+
+    yield connect, log_buffer
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    dashboard_mod._pipeline_subscribers.clear()
+
+
+def _event(agent_id: str, event_type=ActivityEventType.AGENT_SPAWNED) -> ActivityEvent:
+    return ActivityEvent(agent_id=agent_id, event_type=event_type)
+
+
+async def _subscribe(ws: FakeWebSocket, **message) -> None:
+    ws.send(op="subscribe", **message)
+    await wait_for(lambda: any(m.get("type") in ("subscribed", "error") for m in ws.sent))
+
+
+class TestWebSocketProtocol:
+    async def test_subscribe_ack_and_unsubscribe(self, ws_env):
+        connect, _ = ws_env
+        ws = connect()
+        await _subscribe(ws, id="a", stream="activity")
+        assert ws.sent[0] == {"type": "subscribed", "id": "a", "stream": "activity"}
+        assert dashboard_mod._ws_stats["subscriptions"] == 1
+
+        ws.send(op="unsubscribe", id="a")
+        await wait_for(lambda: any(m.get("type") == "unsubscribed" for m in ws.sent))
+        assert dashboard_mod._ws_stats["subscriptions"] == 0
+
+    async def test_unknown_stream_is_an_error(self, ws_env):
+        connect, _ = ws_env
+        ws = connect()
+        await _subscribe(ws, id="x", stream="nope")
+        assert ws.sent[0]["type"] == "error"
+        assert "unknown stream" in ws.sent[0]["error"]
+
+    async def test_invalid_json_is_an_error(self, ws_env):
+        connect, _ = ws_env
+        ws = connect()
+        ws.incoming.put_nowait("not json")
+        await wait_for(lambda: ws.sent)
+        assert ws.sent[0]["type"] == "error"
+
+    async def test_disconnect_releases_subscriptions(self, ws_env, activity_logger):
+        connect, _ = ws_env
+        ws = connect()
+        await _subscribe(ws, id="a", stream="activity")
+        assert len(activity_logger._global_subscribers) == 1
+
+        ws.incoming.put_nowait(None)
+        await wait_for(lambda: dashboard_mod._ws_stats["clients"] == 0)
+        assert activity_logger._global_subscribers == []
+
+
+class TestWebSocketFiltering:
+    async def test_agent_filter_uses_per_agent_queue(self, ws_env, activity_logger):
+        connect, _ = ws_env
+        ws = connect()
+        await _subscribe(ws, id="a", stream="activity", filter={"agent_id": "dev-1"})
+
+        await activity_logger.log(_event("dev-2"))
+        await activity_logger.log(_event("dev-1"))
+        await wait_for(lambda: ws.events())
+
+        events = ws.events()
+        assert [e["data"]["agent_id"] for e in events] == ["dev-1"]
+        assert events[0]["sub"] == "a"
+        assert events[0]["stream"] == "activity"
+        # The other agent's event never reached this client at all
+        assert dashboard_mod._ws_stats["events_filtered"] == 0
+
+    async def test_event_type_and_role_filters(self, ws_env, activity_logger):
+        connect, _ = ws_env
+        ws = connect()
+        await _subscribe(
+            ws,
+            id="a",
+            stream="activity",
+            filter={"event_types": ["error"], "roles": ["review"]},
+        )
+
+        await activity_logger.log(_event("dev-1", ActivityEventType.ERROR))
+        await activity_logger.log(_event("review-1", ActivityEventType.AGENT_SPAWNED))
+        await activity_logger.log(_event("review-1", ActivityEventType.ERROR))
+        await wait_for(lambda: ws.events())
+
+        assert [(e["data"]["agent_id"], e["data"]["event_type"]) for e in ws.events()] == [
+            ("review-1", "error")
+        ]
+        assert dashboard_mod._ws_stats["events_filtered"] == 2
+
+    async def test_log_level_filter(self, ws_env):
+        connect, log_buffer = ws_env
+        ws = connect()
+        await _subscribe(ws, id="l", stream="logs", filter={"level": "WARNING"})
+
+        for level in ("DEBUG", "INFO", "ERROR"):
+            log_buffer.push(LogRecord(timestamp="t", level=level, name="squadron", message=level))
+        await wait_for(lambda: ws.events())
+
+        assert [e["data"]["message"] for e in ws.events()] == ["ERROR"]
+
+    async def test_pipeline_run_filter(self, ws_env):
+        connect, _ = ws_env
+        ws = connect()
+        await _subscribe(ws, id="p", stream="pipelines", filter={"run_id": "r2"})
+
+        dashboard_mod._publish_pipeline_event("pipeline_cancelled", {"run_id": "r1"})
+        dashboard_mod._publish_pipeline_event("pipeline_cancelled", {"run_id": "r2"})
+        await wait_for(lambda: ws.events())
+
+        events = ws.events()
+        assert len(events) == 1
+        assert events[0]["data"] == {"event_type": "pipeline_cancelled", "run_id": "r2"}
+
+    async def test_hydration(self, ws_env, activity_logger):
+        connect, _ = ws_env
+        await activity_logger.log(_event("dev-1"))
+        await activity_logger.log(_event("dev-2"))
+
+        ws = connect()
+        await _subscribe(ws, id="a", stream="activity", filter={"agent_id": "dev-2"}, hydrate=True)
+        await wait_for(lambda: ws.events())
+        assert [e["data"]["agent_id"] for e in ws.events()] == ["dev-2"]
+
+        # History ends with a marker, ahead of live events
+        await activity_logger.log(_event("dev-2"))
+        await wait_for(lambda: len(ws.events()) == 2)
+        assert [e.get("hydrated", False) for e in ws.entries()] == [False, True, False]
+
+
+class TestWebSocketBatching:
+    async def test_events_in_one_tick_share_a_frame(self, ws_env, activity_logger, monkeypatch):
+        monkeypatch.setattr(dashboard_mod, "_WS_TICK", 0.2)
+        connect, _ = ws_env
+        ws = connect()
+        await _subscribe(ws, id="a", stream="activity")
+
+        for i in range(5):
+            await activity_logger.log(_event(f"dev-{i}"))
+        await wait_for(lambda: ws.batches())
+
+        assert len(ws.batches()) == 1
+        assert len(ws.events()) == 5
+        assert dashboard_mod._ws_stats["frames_sent"] == 1
+        assert dashboard_mod._ws_stats["events_sent"] == 5
+
+    async def test_bandwidth_scales_with_subscription(self, ws_env, activity_logger):
+        connect, _ = ws_env
+        narrow = connect()
+        wide = connect()
+        await _subscribe(narrow, id="n", stream="activity", filter={"agent_id": "dev-0"})
+        await _subscribe(wide, id="w", stream="activity")
+
+        for i in range(20):
+            await activity_logger.log(_event(f"dev-{i % 10}"))
+        await wait_for(lambda: len(wide.events()) == 20 and len(narrow.events()) == 2)
+
+        assert narrow.bytes_sent * 5 < wide.bytes_sent
+
+
+class TestWebSocketEndpoint:
+    @pytest.fixture
+    def app(self):
+        registry = MagicMock()
+        activity = MagicMock()
+        activity.subscribe = AsyncMock(return_value=asyncio.Queue())
+        activity.unsubscribe = AsyncMock()
+        activity.get_recent_activity = AsyncMock(return_value=[_event("dev-1")])
+        dashboard_mod.configure(activity, registry)
+        app = FastAPI()
+        app.include_router(dashboard_mod.router)
+        return app
+
+    def test_rejects_bad_token(self, app, monkeypatch):
+        monkeypatch.setenv("SQUADRON_DASHBOARD_API_KEY", "secret")
+        client = TestClient(app)
+        with pytest.raises(WebSocketDisconnect) as exc:
+            with client.websocket_connect("/dashboard/ws?token=wrong") as ws:
+                ws.receive_text()
+        assert exc.value.code == 1008
+
+    def test_subscribe_and_hydrate(self, app, monkeypatch):
+        monkeypatch.delenv("SQUADRON_DASHBOARD_API_KEY", raising=False)
+        monkeypatch.setattr(dashboard_mod, "_WS_TICK", 0.01)
+        client = TestClient(app)
+        with client.websocket_connect("/dashboard/ws") as ws:
+            ws.send_json({"op": "subscribe", "id": "a", "stream": "activity", "hydrate": True})
+            assert ws.receive_json() == {"type": "subscribed", "id": "a", "stream": "activity"}
+            batch = ws.receive_json()
+        assert batch["type"] == "batch"
+        assert batch["events"][0]["data"]["agent_id"] == "dev-1"
@@ -47,6 +47,10 @@ class TestEventMapping:
             "pull_request_review.submitted",
             "pull_request_review_comment.created",
             "push",
+            "create",
+            "check_run.completed",
+            "check_suite.completed",
+            "status",
         }
         assert set(EVENT_MAP.keys()) == expected
 
@@ -215,6 +219,20 @@ class TestEventConversion:
         assert squadron_event.event_type == SquadronEventType.PR_OPENED
         assert squadron_event.pr_number == 7
 
+    async def test_check_run_event_conversion(self, router):
+        r, _ = router
+        event = GitHubEvent(
+            delivery_id="c3",
+            event_type="check_run",
+            action="completed",
+            payload={
+                "sender": {"login": "github-actions[bot]"},
+                "check_run": {"head_sha": "abc", "pull_requests": [{"number": 9}]},
+            },
+        )
+        squadron_event = r._to_squadron_event(event, SquadronEventType.CHECK_RUN_COMPLETED)
+        assert squadron_event.pr_number == 9
+
 
 class TestDispatch:
     async def test_handler_called(self, router, registry):
@@ -15,7 +15,9 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 import pytest_asyncio
 
+from squadron.admission import AdmissionScheduler
 from squadron.agent_manager import AgentManager
+from squadron.config import AdmissionConfig
 from squadron.models import AgentRecord, AgentStatus, SquadronEvent, SquadronEventType
 from squadron.registry import AgentRegistry
 
@@ -58,8 +60,8 @@ class TestFeatDevCleanupWorkflow:
         mgr.github = github
         mgr._copilot_agents = {}
         mgr._agent_tasks = {}
-        mgr._watchdog_tasks = {}
-        mgr._agent_semaphore = None
+        mgr._supervisor = MagicMock()
+        mgr._admission = AdmissionScheduler(0, AdmissionConfig())
 
         # Create a sleeping feat-dev agent that opened a PR
         agent_id = "feat-dev-issue-42"
@@ -0,0 +1,243 @@
+"""Tests for the background, coalescing git fetcher.
+
+Covers:
+- Concurrent fetch requests coalescing into one follow-up fetch
+- Failure accounting and the periodic fallback
+- push / create webhooks routed to the fetcher
+- Local-first remote-branch checks, with one fetch for expected branches
+  and a targeted fetch for other misses
+- _create_worktree deciding branch tracking without ``git ls-remote``
+"""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from squadron.event_router import EVENT_MAP
+from squadron.git_fetcher import GitFetcher
+from squadron.models import SquadronEventType
+
+
+class FakeGit:
+    """Records git invocations; ``fetch`` blocks until released."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, ...]] = []
+        self.release = asyncio.Event()
+        self.fetch_rc = 0
+        self.known_refs: set[str] = set()
+        self.remote_branches: set[str] = set()
+
+    async def __call__(self, cwd, *args, timeout=60, auth=False):
+        self.calls.append(args)
+        if args[0] == "fetch":
+            assert auth, "fetch must authenticate"
+            if args[-1].startswith("+refs/heads/"):
+                branch = args[-1].removeprefix("+refs/heads/").split(":")[0]
+                if branch not in self.remote_branches:
+                    return 128, "", "fatal: couldn't find remote ref " + branch
+                self.known_refs.add(f"refs/remotes/origin/{branch}")
+                return 0, "", ""
+            await self.release.wait()
+            return self.fetch_rc, "", "" if self.fetch_rc == 0 else "boom"
+        if args[0] == "rev-parse":
+            ref = args[-1].removesuffix("^{commit}")
+            return (0, "abc123\n", "") if ref in self.known_refs else (1, "", "")
+        raise AssertionError(f"unexpected git call {args}")
+
+    @property
+    def fetches(self) -> int:
+        return sum(1 for c in self.calls if c[0] == "fetch" and "--prune" in c)
+
+    @property
+    def branch_fetches(self) -> int:
+        return sum(1 for c in self.calls if c[0] == "fetch" and "--prune" not in c)
+
+
+@pytest.fixture
+async def fetcher():
+    git = FakeGit()
+    f = GitFetcher(Path("/repo"), git, interval=3600)
+    await f.start()
+    yield f, git
+    git.release.set()
+    await f.stop()
+
+
+class TestCoalescing:
+    async def test_burst_of_requests_costs_two_fetches(self, fetcher):
+        f, git = fetcher
+        first = f.request()
+        await asyncio.sleep(0)
+        # Arrive while the first fetch is running — all share the next one
+        followers = [f.request() for _ in range(10)]
+        assert len({id(x) for x in followers}) == 1
+
+        git.release.set()
+        assert await first is True
+        assert all([await x for x in followers])
+        assert git.fetches == 2
+        assert f.stats()["requests"] == 11
+        assert f.last_fetch_time is not None
+
+    async def test_failed_fetch_is_reported(self, fetcher):
+        f, git = fetcher
+        git.fetch_rc = 1
+        git.release.set()
+        assert await f.fetch() is False
+        assert f.stats()["failures"] == 1
+        assert f.last_fetch_time is None
+
+    async def test_periodic_fallback(self):
+        git = FakeGit()
+        git.release.set()
+        f = GitFetcher(Path("/repo"), git, interval=0.01)
+        await f.start()
+        try:
+            await asyncio.sleep(0.05)
+            assert git.fetches >= 1
+        finally:
+            await f.stop()
+
+    async def test_stop_resolves_waiters(self, fetcher):
+        f, _ = fetcher
+        pending = f.request()
+        await asyncio.sleep(0)
+        await f.stop()
+        assert await pending is False
+
+    async def test_webhook_triggers_fetch(self, fetcher):
+        f, git = fetcher
+        git.release.set()
+        await f.handle_event(MagicMock())
+        await f._fetch_task
+        assert git.fetches == 1
+
+    def test_create_webhook_is_mapped(self):
+        assert EVENT_MAP["create"] == SquadronEventType.BRANCH_CREATED
+
+
+class TestRemoteBranchLookup:
+    async def test_known_branch_is_local_only(self, fetcher):
+        f, git = fetcher
+        git.known_refs.add("refs/remotes/origin/feat/x")
+        assert await f.has_remote_branch("feat/x", expected=True)
+        assert git.fetches == 0
+
+    async def test_unknown_branch_costs_one_targeted_fetch(self, fetcher):
+        f, git = fetcher
+        assert not await f.has_remote_branch("feat/new")
+        assert git.fetches == 0
+        assert git.branch_fetches == 1
+
+    async def test_branch_pushed_since_last_fetch_is_found(self, fetcher):
+        f, git = fetcher
+        git.remote_branches.add("feat/squadron-7")
+        assert await f.has_remote_branch("feat/squadron-7")
+        assert "refs/remotes/origin/feat/squadron-7" in git.known_refs
+        assert git.fetches == 0
+        assert f.stats()["branch_fetches"] == 1
+
+    async def test_expected_branch_waits_for_one_fetch(self, fetcher):
+        f, git = fetcher
+
+        async def land_ref():
+            await asyncio.sleep(0.01)
+            git.known_refs.add("refs/remotes/origin/pr-head")
+            git.release.set()
+
+        asyncio.create_task(land_ref())
+        assert await f.has_remote_branch("pr-head", expected=True)
+        assert git.fetches == 1
+        assert git.branch_fetches == 0
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+class TestCreateWorktreeUsesLocalRefs:
+    async def test_tracks_fetched_remote_branch_without_ls_remote(self, tmp_path):
+        from squadron.agent_manager import AgentManager
+        from squadron.config import RuntimeConfig
+        from squadron.models import AgentRecord
+
+        origin = tmp_path / "origin.git"
+        seed = tmp_path / "seed"
+        _git(tmp_path, "init", "--bare", "-b", "main", str(origin))
+        _git(tmp_path, "init", "-b", "main", str(seed))
+        _git(seed, "-c", "user.email=t@e", "-c", "user.name=t", "commit", "--allow-empty", "-mi")
+        _git(seed, "push", str(origin), "main", "main:pr-head")
+        repo = tmp_path / "repo"
+        _git(tmp_path, "clone", str(origin), str(repo))
+
+        manager = AgentManager.__new__(AgentManager)
+        manager.config = MagicMock()
+        manager.config.runtime = RuntimeConfig(worktree_dir=str(tmp_path / "worktrees"))
+        manager.config.project.default_branch = "main"
+        manager.repo_root = repo
+        manager._worktree_pool = None
+
+        calls: list[tuple[str, ...]] = []
+        original_run_git = AgentManager._run_git
+
+        async def recording_run_git(*args, timeout=60):
+            calls.append(args)
+            return await original_run_git(manager, *args, timeout=timeout)
+
+        manager._run_git = recording_run_git
+        manager._git_fetcher = GitFetcher(repo, manager._run_git_in)
+
+        record = AgentRecord(
+            agent_id="pr-review-issue-7",
+            role="pr-review",
+            issue_number=7,
+            branch="pr-head",
+            pr_number=7,
+        )
+        path = await manager._create_worktree(record)
+        assert path == tmp_path / "worktrees" / "issue-7"
+        assert _git(path, "rev-parse", "--abbrev-ref", "@{upstream}") == "origin/pr-head"
+        assert not any("ls-remote" in c for c in calls)
+
+    async def test_own_branch_pushed_after_last_fetch_is_tracked(self, tmp_path):
+        from squadron.agent_manager import AgentManager
+        from squadron.config import RuntimeConfig
+        from squadron.models import AgentRecord
+
+        origin = tmp_path / "origin.git"
+        seed = tmp_path / "seed"
+        _git(tmp_path, "init", "--bare", "-b", "main", str(origin))
+        _git(tmp_path, "init", "-b", "main", str(seed))
+        _git(seed, "-c", "user.email=t@e", "-c", "user.name=t", "commit", "--allow-empty", "-mi")
+        _git(seed, "push", str(origin), "main")
+        repo = tmp_path / "repo"
+        _git(tmp_path, "clone", str(origin), str(repo))
+        # Pushed by an earlier run of this agent; the clone's refs predate it
+        _git(seed, "-c", "user.email=t@e", "-c", "user.name=t", "commit", "--allow-empty", "-mw")
+        _git(seed, "push", str(origin), "main:feat/issue-7")
+        pushed = _git(seed, "rev-parse", "HEAD")
+
+        manager = AgentManager.__new__(AgentManager)
+        manager.config = MagicMock()
+        manager.config.runtime = RuntimeConfig(worktree_dir=str(tmp_path / "worktrees"))
+        manager.config.project.default_branch = "main"
+        manager.repo_root = repo
+        manager._worktree_pool = None
+        manager._branch_name = lambda role, issue_number: f"feat/issue-{issue_number}"
+        manager._git_auth_env = AsyncMock(return_value=None)
+        manager._git_fetcher = GitFetcher(repo, manager._run_git_in)
+
+        record = AgentRecord(
+            agent_id="feat-dev-issue-7", role="feat-dev", issue_number=7, branch="feat/issue-7"
+        )
+        path = await manager._create_worktree(record)
+        assert _git(path, "rev-parse", "HEAD") == pushed
+        assert _git(path, "rev-parse", "--abbrev-ref", "@{upstream}") == "origin/feat/issue-7"
@@ -745,7 +745,15 @@ class TestWipCommitAndPush:
 
     def _make_manager(self, tmp_path):
         """Create an AgentManager with mocks sufficient for WIP commit tests."""
-        from squadron.config import SquadronConfig, ProjectConfig, RuntimeConfig
+        from squadron.config import (
+            AdmissionConfig,
+            CopilotPoolConfig,
+            ProjectConfig,
+            RuntimeConfig,
+            SessionKeepAliveConfig,
+            SquadronConfig,
+            WorktreePoolConfig,
+        )
 
         from squadron.config import SkillsConfig as _SkillsConfig
 
@@ -757,6 +765,11 @@ class TestWipCommitAndPush:
         config.runtime = MagicMock(spec=RuntimeConfig)
         config.runtime.max_concurrent_agents = 5
         config.runtime.worktree_dir = None
+        config.runtime.ref_fetch_interval = 600
+        config.runtime.copilot_pool = CopilotPoolConfig()
+        config.runtime.worktree_pool = WorktreePoolConfig()
+        config.runtime.session_keepalive = SessionKeepAliveConfig()
+        config.runtime.admission = AdmissionConfig()
         config.skills = _SkillsConfig()
 
         registry_mock = AsyncMock(spec=AgentRegistry)
@@ -0,0 +1,269 @@
+"""Tests for the on-disk log archive behind the ring buffer.
+
+Covers:
+- LogArchive flush/query round trip and filters
+- Segment rotation and size-bounded retention
+- Sparse time index seeks (since/until)
+- Reloading the index after a restart
+- LogBuffer.search spanning ring buffer + archive without duplicates
+- Dashboard /logs since/until parameters
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from squadron.log_archive import LogArchive
+from squadron.log_buffer import LogBuffer, LogRecord
+
+
+def _ts(i: int) -> str:
+    return f"2025-01-01T00:{i // 60:02d}:{i % 60:02d}+00:00"
+
+
+def _record(i: int, level: str = "INFO", name: str = "squadron.test") -> LogRecord:
+    return LogRecord(timestamp=_ts(i), level=level, name=name, message=f"msg{i}")
+
+
+class TestLogArchive:
+    def test_flush_and_query_round_trip(self, tmp_path):
+        archive = LogArchive(tmp_path)
+        for i in range(10):
+            archive.append(_record(i))
+
+        assert archive.flush() == 10
+        assert archive.flush() == 0
+
+        results = archive.query()
+        assert [r["message"] for r in results] == [f"msg{i}" for i in range(9, -1, -1)]
+        assert archive.stats()["entries"] == 10
+        assert archive.stats()["pending"] == 0
+
+    def test_query_filters_and_limit(self, tmp_path):
+        archive = LogArchive(tmp_path)
+        archive.append(_record(0, level="DEBUG"))
+        archive.append(_record(1, level="WARNING", name="squadron.agent_manager"))
+        archive.append(_record(2, level="ERROR", name="squadron.server"))
+        archive.flush()
+
+        assert [r["message"] for r in archive.query(level="WARNING")] == ["msg2", "msg1"]
+        assert [r["message"] for r in archive.query(name="squadron.agent")] == ["msg1"]
+        assert len(archive.query(limit=1)) == 1
+
+    def test_segments_rotate(self, tmp_path):
+        archive = LogArchive(tmp_path, segment_max_bytes=1, block_max_entries=5)
+        for i in range(20):
+            archive.append(_record(i))
+        archive.flush()
+
+        # Every block fills a segment, so each block starts a new one
+        assert archive.stats()["segments"] == 4
+        assert len(list(tmp_path.glob("segment-*.log.gz"))) == 4
+        assert len(archive.query(limit=100)) == 20
+
+    def test_retention_bounds_disk_usage(self, tmp_path):
+        archive = LogArchive(tmp_path, segment_max_bytes=1, block_max_entries=5, max_total_bytes=1)
+        for i in range(20):
+            archive.append(_record(i))
+        archive.flush()
+
+        # Only the segment being written survives
+        stats = archive.stats()
+        assert stats["segments"] == 1
+        assert len(list(tmp_path.glob("segment-*"))) == 2  # data + index
+        assert [r["message"] for r in archive.query()][0] == "msg19"
+        assert stats["oldest_timestamp"] == _ts(15)
+
+    def test_since_until_range(self, tmp_path):
+        archive = LogArchive(tmp_path, block_max_entries=10)
+        for i in range(100):
+            archive.append(_record(i))
+        archive.flush()
+
+        results = archive.query(since=_ts(42), until=_ts(47), limit=100)
+        assert [r["message"] for r in results] == ["msg46", "msg45", "msg44", "msg43", "msg42"]
+
+    def test_since_until_skips_unrelated_blocks(self, tmp_path, monkeypatch):
+        archive = LogArchive(tmp_path, block_max_entries=10)
+        for i in range(100):
+            archive.append(_record(i))
+        archive.flush()
+
+        reads = []
+        original = LogArchive._read_block
+
+        def counting_read(path, block):
+            reads.append(block.first_ts)
+            return original(path, block)
+
+        monkeypatch.setattr(LogArchive, "_read_block", staticmethod(counting_read))
+        archive.query(since=_ts(42), until=_ts(47))
+        assert reads == [_ts(40)]
+
+    def test_reload_after_restart(self, tmp_path):
+        first = LogArchive(tmp_path)
+        for i in range(5):
+            first.append(_record(i))
+        first.flush()
+
+        second = LogArchive(tmp_path)
+        second.load()
+        assert [r["message"] for r in second.query()][0] == "msg4"
+
+        # A restart opens a fresh segment rather than appending to the old one
+        second.append(_record(5))
+        second.flush()
+        assert second.stats()["segments"] == 2
+        assert len(second.query()) == 6
+
+    def test_load_drops_index_past_end_of_segment(self, tmp_path):
+        archive = LogArchive(tmp_path)
+        archive.append(_record(0))
+        archive.flush()
+        archive.append(_record(1))
+        archive.flush()
+
+        # Simulate a torn write: truncate the data file mid-way through block 2
+        seg = next(tmp_path.glob("segment-*.log.gz"))
+        data = seg.read_bytes()
+        seg.write_bytes(data[: len(data) - 5])
+
+        reloaded = LogArchive(tmp_path)
+        reloaded.load()
+        assert [r["message"] for r in reloaded.query()] == ["msg0"]
+
+    async def test_start_stop_flushes_pending(self, tmp_path):
+        archive = LogArchive(tmp_path, flush_interval=3600)
+        await archive.start()
+        archive.append(_record(0))
+        await archive.stop()
+
+        reloaded = LogArchive(tmp_path)
+        reloaded.load()
+        assert [r["message"] for r in reloaded.query()] == ["msg0"]
+
+
+class TestLogBufferSearch:
+    async def test_search_spans_ring_and_archive_without_duplicates(self, tmp_path):
+        archive = LogArchive(tmp_path)
+        buf = LogBuffer(maxlen=5)
+        buf.attach_archive(archive)
+        for i in range(20):
+            buf.push(_record(i))
+        archive.flush()
+
+        results = await buf.search(limit=100)
+        assert [r["message"] for r in results] == [f"msg{i}" for i in range(19, -1, -1)]
+
+    async def test_search_keeps_evicted_entries_at_the_ring_boundary(self, tmp_path):
+        archive = LogArchive(tmp_path)
+        buf = LogBuffer(maxlen=3)
+        buf.attach_archive(archive)
+        for message in ("a", "b", "c", "d"):
+            buf.push(LogRecord(timestamp=_ts(5), level="INFO", name="n", message=message))
+        buf.push(_record(6))
+        archive.flush()
+
+        # "a" and "b" were evicted but share the oldest ring timestamp
+        results = await buf.search(limit=100)
+        assert [r["message"] for r in results] == ["msg6", "d", "c", "b", "a"]
+
+    async def test_search_served_from_ring_when_enough(self, tmp_path):
+        archive = LogArchive(tmp_path)
+        buf = LogBuffer(maxlen=5)
+        buf.attach_archive(archive)
+        for i in range(20):
+            buf.push(_record(i))
+        archive.flush()
+
+        results = await buf.search(limit=3)
+        assert [r["message"] for r in results] == ["msg19", "msg18", "msg17"]
+
+    async def test_search_time_range_reaches_archive(self, tmp_path):
+        archive = LogArchive(tmp_path)
+        buf = LogBuffer(maxlen=5)
+        buf.attach_archive(archive)
+        for i in range(20):
+            buf.push(_record(i))
+        archive.flush()
+
+        results = await buf.search(since=_ts(2), until=_ts(4))
+        assert [r["message"] for r in results] == ["msg3", "msg2"]
+
+    async def test_search_normalizes_time_bounds(self):
+        buf = LogBuffer(maxlen=50)
+        for i in range(20):
+            buf.push(_record(i))
+        # "Z" suffix, naive (UTC) and other-offset bounds match the same range
+        expected = ["msg3", "msg2"]
+        for since, until in (
+            ("2025-01-01T00:00:02Z", "2025-01-01T00:00:04Z"),
+            ("2025-01-01T00:00:02", "2025-01-01T00:00:04"),
+            ("2025-01-01T01:00:02+01:00", "2025-01-01T01:00:04+01:00"),
+        ):
+            results = await buf.search(since=since, until=until)
+            assert [r["message"] for r in results] == expected
+        with pytest.raises(ValueError):
+            await buf.search(since="yesterday")
+
+    async def test_search_without_archive(self):
+        buf = LogBuffer(maxlen=5)
+        for i in range(10):
+            buf.push(_record(i))
+        results = await buf.search(limit=100)
+        assert len(results) == 5
+
+
+# ── Dashboard /logs with archive ─────────────────────────────────────────────
+
+
+@pytest.fixture
+def archive_client(tmp_path, monkeypatch):
+    import squadron.dashboard as dashboard_mod
+
+    monkeypatch.delenv("SQUADRON_DASHBOARD_API_KEY", raising=False)
+
+    archive = LogArchive(tmp_path)
+    buf = LogBuffer(maxlen=5)
+    buf.attach_archive(archive)
+    for i in range(20):
+        buf.push(_record(i))
+    archive.flush()
+
+    mock_registry = MagicMock()
+    mock_registry.get_all_active_agents = AsyncMock(return_value=[])
+    mock_activity = MagicMock()
+    dashboard_mod.configure(mock_activity, mock_registry, buf)
+
+    app = FastAPI()
+    app.include_router(dashboard_mod.router)
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestLogsEndpointArchive:
+    def test_logs_reads_through_to_archive(self, archive_client):
+        resp = archive_client.get("/dashboard/logs?limit=100")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["count"] == 20
+        assert data["buffer_size"] == 5
+        assert data["archive"]["entries"] == 20
+
+    def test_logs_since_until(self, archive_client):
+        resp = archive_client.get(
+            "/dashboard/logs",
+            params={"since": _ts(2), "until": _ts(5)},
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert [e["message"] for e in data["entries"]] == ["msg4", "msg3", "msg2"]
+        assert data["filters"]["since"] == _ts(2)
+        assert data["filters"]["until"] == _ts(5)
+
+    def test_logs_rejects_bad_time_range(self, archive_client):
+        resp = archive_client.get("/dashboard/logs", params={"since": "not-a-time"})
+        assert resp.status_code == 400
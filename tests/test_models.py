@@ -149,6 +149,10 @@ class TestSquadronEvent:
             SquadronEventType.PR_REVIEW_COMMENT,
             SquadronEventType.PR_SYNCHRONIZED,
             SquadronEventType.PUSH,
+            SquadronEventType.BRANCH_CREATED,
+            SquadronEventType.CHECK_RUN_COMPLETED,
+            SquadronEventType.CHECK_SUITE_COMPLETED,
+            SquadronEventType.COMMIT_STATUS,
         }
         internal_types = {
             SquadronEventType.AGENT_BLOCKED,
@@ -0,0 +1,213 @@
+"""Tests for the incrementally maintained dashboard overview.
+
+Covers:
+- Agent counts by status / role moving on registry writes
+- Active pipeline tracking from pipeline registry writes
+- Gauge sampling and version bumps only on change
+- Snapshot caching per version and long-poll wake-ups
+- GET /dashboard/overview
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from squadron.models import AgentRecord, AgentStatus
+from squadron.overview import DashboardOverview
+from squadron.pipeline.models import PipelineRun, PipelineRunStatus
+from squadron.pipeline.registry import PipelineRegistry
+from squadron.registry import AgentRegistry
+
+
+@pytest_asyncio.fixture
+async def registry(tmp_path):
+    reg = AgentRegistry(str(tmp_path / "registry.db"))
+    await reg.initialize()
+    yield reg
+    await reg.close()
+
+
+@pytest_asyncio.fixture
+async def pipeline_registry(tmp_path):
+    async with aiosqlite.connect(str(tmp_path / "pipeline.db")) as conn:
+        conn.row_factory = aiosqlite.Row
+        reg = PipelineRegistry(conn)
+        await reg.initialize()
+        yield reg
+
+
+class TestAgentCounts:
+    async def test_counts_follow_registry_transitions(self, registry):
+        overview = DashboardOverview()
+        registry.add_listener(overview.agent_changed)
+
+        agent = AgentRecord(agent_id="feat-dev-issue-1", role="feat-dev", status=AgentStatus.ACTIVE)
+        await registry.create_agent(agent)
+        await registry.create_agent(
+            AgentRecord(agent_id="pm-issue-2", role="pm", status=AgentStatus.SLEEPING)
+        )
+        agents = overview.snapshot()["agents"]
+        assert agents["total"] == 2
+        assert agents["by_status"] == {"active": 1, "sleeping": 1}
+        assert agents["by_role"] == {"feat-dev": 1, "pm": 1}
+
+        agent.status = AgentStatus.COMPLETED
+        await registry.update_agent(agent)
+        agents = overview.snapshot()["agents"]
+        assert agents["by_status"] == {"completed": 1, "sleeping": 1}
+        # Terminal agents drop out of the live per-role breakdown
+        assert agents["by_role"] == {"pm": 1}
+
+        await registry.delete_agent("pm-issue-2")
+        agents = overview.snapshot()["agents"]
+        assert agents["total"] == 1
+        assert agents["by_status"] == {"completed": 1}
+
+    async def test_load_seeds_from_registry(self, registry):
+        await registry.create_agent(
+            AgentRecord(agent_id="a", role="feat-dev", status=AgentStatus.ACTIVE)
+        )
+        overview = DashboardOverview()
+        await overview.load(registry)
+        assert overview.snapshot()["agents"]["by_status"] == {"active": 1}
+
+    def test_unchanged_update_does_not_bump_version(self):
+        overview = DashboardOverview()
+        record = AgentRecord(agent_id="a", role="pm", status=AgentStatus.ACTIVE)
+        overview.agent_changed("a", record)
+        version = overview.version
+        # e.g. a tool_call_count update — same role and status
+        overview.agent_changed("a", record)
+        assert overview.version == version
+
+
+class TestPipelines:
+    async def test_active_pipelines_follow_registry(self, pipeline_registry):
+        overview = DashboardOverview()
+        pipeline_registry.add_listener(overview.pipeline_changed)
+
+        run = PipelineRun(run_id="r1", pipeline_name="review", pr_number=5)
+        await pipeline_registry.create_pipeline_run(run)
+        assert overview.snapshot()["pipelines"]["active_count"] == 1
+
+        run.status = PipelineRunStatus.RUNNING
+        run.current_stage_id = "lint"
+        await pipeline_registry.update_pipeline_run(run)
+        active = overview.snapshot()["pipelines"]["active"]
+        assert active[0]["status"] == "running"
+        assert active[0]["current_stage_id"] == "lint"
+
+        run.status = PipelineRunStatus.COMPLETED
+        await pipeline_registry.update_pipeline_run(run)
+        assert overview.snapshot()["pipelines"] == {"active_count": 0, "active": []}
+
+
+class TestGaugesAndVersions:
+    def test_snapshot_cached_per_version(self):
+        overview = DashboardOverview()
+        first = overview.snapshot()
+        assert overview.snapshot() is first
+        overview.agent_changed("a", AgentRecord(agent_id="a", role="pm"))
+        second = overview.snapshot()
+        assert second is not first
+        assert second["version"] == first["version"] + 1
+
+    def test_gauges_only_bump_on_change(self):
+        overview = DashboardOverview()
+        depth = {"value": 0}
+        overview.add_gauge("event_queue", lambda: {"depth": depth["value"]})
+        version = overview.version
+
+        assert overview._sample_gauges() is False
+        depth["value"] = 3
+        assert overview._sample_gauges() is True
+        overview._bump()
+        assert overview.version == version + 1
+        assert overview.snapshot()["event_queue"] == {"depth": 3}
+
+    def test_agents_version_ignores_gauge_changes(self):
+        overview = DashboardOverview()
+        overview.agent_changed("a", AgentRecord(agent_id="a", role="pm"))
+        agents_version = overview.snapshot()["agents"]["version"]
+        assert agents_version == overview.version
+
+        overview.add_gauge("event_queue", lambda: {"depth": 1})
+        assert overview.snapshot()["agents"]["version"] == agents_version
+        overview.agent_changed("a", None)
+        assert overview.snapshot()["agents"]["version"] == overview.version
+
+    def test_failing_gauge_reports_none(self):
+        overview = DashboardOverview()
+        overview.add_gauge("api_budget", lambda: 1 / 0)
+        assert overview.snapshot()["api_budget"] is None
+
+    async def test_long_poll_wakes_on_change(self):
+        overview = DashboardOverview()
+        version = overview.version
+        waiter = asyncio.create_task(overview.wait_for_change(version, timeout=5))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        overview.agent_changed("a", AgentRecord(agent_id="a", role="pm"))
+        snapshot = await asyncio.wait_for(waiter, timeout=1)
+        assert snapshot["version"] == version + 1
+
+    async def test_long_poll_times_out_with_current_snapshot(self):
+        overview = DashboardOverview()
+        snapshot = await overview.wait_for_change(overview.version, timeout=0.05)
+        assert snapshot["version"] == overview.version
+
+    async def test_sample_loop_runs(self):
+        overview = DashboardOverview(interval=0.01)
+        depth = {"value": 0}
+        overview.add_gauge("event_queue", lambda: depth["value"])
+        await overview.start()
+        try:
+            version = overview.version
+            depth["value"] = 1
+            await asyncio.sleep(0.05)
+            assert overview.version > version
+        finally:
+            await overview.stop()
+
+
+class TestOverviewEndpoint:
+    @pytest.fixture
+    def client(self, monkeypatch):
+        import squadron.dashboard as dashboard_mod
+
+        monkeypatch.delenv("SQUADRON_DASHBOARD_API_KEY", raising=False)
+        overview = DashboardOverview()
+        overview.agent_changed("a", AgentRecord(agent_id="a", role="pm"))
+        dashboard_mod.configure(MagicMock(), MagicMock(), overview=overview)
+        app = FastAPI()
+        app.include_router(dashboard_mod.router)
+        return TestClient(app), overview
+
+    def test_returns_snapshot(self, client):
+        test_client, overview = client
+        resp = test_client.get("/dashboard/overview")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["version"] == overview.version
+        assert data["agents"]["by_role"] == {"pm": 1}
+
+    def test_long_poll_returns_after_timeout(self, client):
+        test_client, overview = client
+        resp = test_client.get(
+            "/dashboard/overview", params={"since_version": overview.version, "timeout": 0.05}
+        )
+        assert resp.status_code == 200
+        assert resp.json()["version"] == overview.version
+
+    def test_stale_version_returns_immediately(self, client):
+        test_client, overview = client
+        resp = test_client.get("/dashboard/overview", params={"since_version": 0, "timeout": 30})
+        assert resp.json()["version"] == overview.version
@@ -0,0 +1,184 @@
+"""Tests for the in-memory index of active pipeline runs (ActiveRunIndex)."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from squadron.pipeline.active_index import ActiveRunIndex
+from squadron.pipeline.compiled import DefinitionCache
+from squadron.pipeline.engine import PipelineEngine
+from squadron.pipeline.gates import GateCheck, GateCheckRegistry, GateCheckResult
+from squadron.pipeline.models import (
+    GateConditionConfig,
+    HumanStageConfig,
+    HumanWaitType,
+    PipelineDefinition,
+    PipelineRun,
+    PipelineRunStatus,
+    StageDefinition,
+    TriggerDefinition,
+)
+from squadron.pipeline.registry import PipelineRegistry
+
+CI_EVENT = "check_run.completed"
+REVIEW_EVENT = "pull_request_review.submitted"
+
+
+class WaitingCheck(GateCheck):
+    reactive_events = {CI_EVENT}
+
+    async def evaluate(self, config, context):
+        return GateCheckResult(passed=False, message="waiting")
+
+
+def make_definition() -> PipelineDefinition:
+    return PipelineDefinition(
+        trigger=TriggerDefinition(event="pull_request.opened"),
+        stages=[
+            StageDefinition(id="ci", type="gate", conditions=[GateConditionConfig(check="ci")]),
+            StageDefinition(
+                id="signoff",
+                type="human",
+                human=HumanStageConfig(wait_for=HumanWaitType.APPROVAL),
+            ),
+        ],
+    )
+
+
+def make_gates() -> GateCheckRegistry:
+    gates = GateCheckRegistry()
+    gates.register("ci", WaitingCheck())
+    return gates
+
+
+def make_run(run_id: str = "run-1", **overrides) -> PipelineRun:
+    fields = dict(
+        run_id=run_id,
+        pipeline_name="review",
+        definition_snapshot=make_definition().model_dump_json(),
+        status=PipelineRunStatus.RUNNING,
+        current_stage_id="ci",
+        pr_number=7,
+    )
+    fields.update(overrides)
+    return PipelineRun(**fields)
+
+
+class TestActiveRunIndex:
+    def _index(self) -> ActiveRunIndex:
+        return ActiveRunIndex(DefinitionCache(make_gates()))
+
+    def test_lookup_by_pr_and_current_stage_events(self):
+        index = self._index()
+        index.run_changed("run-1", make_run())
+        assert index.lookup(CI_EVENT, pr_number=7) == ["run-1"]
+        assert index.lookup(CI_EVENT, pr_number=8) == []
+        assert index.lookup(REVIEW_EVENT, pr_number=7) == []
+
+        # Stage transition moves the run to the human stage's event
+        index.run_changed("run-1", make_run(current_stage_id="signoff"))
+        assert index.lookup(CI_EVENT, pr_number=7) == []
+        assert index.lookup(REVIEW_EVENT, pr_number=7) == ["run-1"]
+        assert index.stats()["skipped"] == 3
+
+    def test_inactive_and_deleted_runs_are_dropped(self):
+        index = self._index()
+        index.run_changed("run-1", make_run())
+        index.run_changed("run-2", make_run("run-2"))
+        index.run_changed("run-1", make_run(status=PipelineRunStatus.COMPLETED))
+        index.run_changed("run-2", None)
+        assert index.lookup(CI_EVENT, pr_number=7) == []
+        assert index.stats()["active_runs"] == 0
+        assert index.pipeline_names_for_pr(7) == set()
+
+    def test_issue_lookups_only_match_running_runs(self):
+        index = self._index()
+        pending = make_run("pending", pr_number=None, issue_number=3)
+        pending.status = PipelineRunStatus.PENDING
+        index.run_changed("pending", pending)
+        index.run_changed("running", make_run("running", pr_number=None, issue_number=3))
+        assert index.lookup(CI_EVENT, issue_number=3) == ["running"]
+
+    def test_pr_associations(self):
+        index = self._index()
+        index.run_changed("run-1", make_run())
+        index.pr_associated("run-1", 11)
+        index.pr_associated("unknown", 11)
+        assert index.lookup(CI_EVENT, pr_number=11) == ["run-1"]
+        # Associations survive stage transitions and go away with the run
+        index.run_changed("run-1", make_run())
+        assert index.pipeline_names_for_pr(11) == {"review"}
+        index.run_changed("run-1", make_run(status=PipelineRunStatus.FAILED))
+        assert index.lookup(CI_EVENT, pr_number=11) == []
+
+    def test_writes_during_load_win_over_seeded_rows(self):
+        index = self._index()
+        index.begin_load()
+        index.run_changed("run-1", make_run(status=PipelineRunStatus.COMPLETED))
+        index.load([make_run(), make_run("run-2")], [("run-2", 12)])
+        assert index.loaded
+        assert index.lookup(CI_EVENT, pr_number=7) == ["run-2"]
+        assert index.lookup(CI_EVENT, pr_number=12) == ["run-2"]
+
+
+# ── Engine integration ───────────────────────────────────────────────────────
+
+
+@pytest_asyncio.fixture
+async def db(tmp_path):
+    async with aiosqlite.connect(str(tmp_path / "active.db")) as conn:
+        conn.row_factory = aiosqlite.Row
+        yield conn
+
+
+@pytest_asyncio.fixture
+async def registry(db):
+    reg = PipelineRegistry(db)
+    await reg.initialize()
+    return reg
+
+
+@pytest.fixture
+def engine(registry):
+    eng = PipelineEngine(registry, make_gates())
+    eng.add_pipeline("review", make_definition())
+    return eng
+
+
+class TestEngineRouting:
+    async def test_irrelevant_event_costs_no_queries(self, engine, db):
+        payload = {"pull_request": {"number": 7}}
+        run = await engine.evaluate_event("pull_request.opened", payload)
+        assert run is not None
+
+        with patch.object(db, "execute", wraps=db.execute) as execute:
+            await engine.evaluate_event("issue_comment.created", payload)
+            await engine.evaluate_event(REVIEW_EVENT, payload)  # gate is not waiting on it
+            await engine.evaluate_event(CI_EVENT, {"pull_request": {"number": 8}})
+        execute.assert_not_called()
+        assert engine.active_run_stats()["active_runs"] == 1
+
+    async def test_relevant_event_reevaluates_waiting_gate(self, engine, registry):
+        payload = {"pull_request": {"number": 7}}
+        run = await engine.evaluate_event("pull_request.opened", payload)
+        latest = registry.get_latest_stage_run
+        with patch.object(registry, "get_latest_stage_run", wraps=latest) as get:
+            await engine.evaluate_event(CI_EVENT, payload)
+        get.assert_called_with(run.run_id, "ci")
+
+    async def test_index_seeded_from_existing_runs(self, registry):
+        await registry.create_pipeline_run(make_run())
+        await registry.add_pr_association("run-1", 15, "o/r")
+        engine = PipelineEngine(registry, make_gates())
+        assert await engine.recover_active_pipelines() == 1
+        assert engine._active_runs.lookup(CI_EVENT, pr_number=15) == ["run-1"]
+
+    async def test_duplicate_trigger_skipped(self, engine, registry):
+        payload = {"pull_request": {"number": 7}}
+        await engine.evaluate_event("pull_request.opened", payload)
+        assert await engine.evaluate_event("pull_request.opened", payload) is None
+        assert len(await registry.get_running_pipelines_for_pr(7)) == 1
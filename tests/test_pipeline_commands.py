@@ -0,0 +1,257 @@
+"""Tests for the pooled executor behind ``command`` gate checks."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from squadron.agent_manager import AgentManager
+from squadron.config import RuntimeConfig
+from squadron.git_fetcher import GitFetcher
+from squadron.models import SquadronEvent, SquadronEventType
+from squadron.pipeline.commands import CommandExecutor
+from squadron.pipeline.gates import CommandCheck, GateFetchContext, PipelineContext
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A clean git checkout with one commit."""
+    env = {**os.environ, "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@example.com"}
+    env.update(GIT_COMMITTER_NAME="t", GIT_COMMITTER_EMAIL="t@example.com")
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True, env=env)
+    (tmp_path / "a.txt").write_text("one\n")
+    subprocess.run(["git", "add", "a.txt"], cwd=tmp_path, check=True, env=env)
+    subprocess.run(["git", "commit", "-qm", "init"], cwd=tmp_path, check=True, env=env)
+    return tmp_path
+
+
+class TestCommandExecutor:
+    async def test_runs_and_captures_output(self, tmp_path):
+        executor = CommandExecutor(cwd=str(tmp_path))
+        code, stdout, stderr = await executor("echo out; echo err >&2; exit 3")
+        assert (code, stdout, stderr) == (3, "out\n", "err\n")
+        stats = executor.stats()
+        assert stats["runs"] == 1
+        assert stats["run_time"]["count"] == stats["queue_wait"]["count"] == 1
+
+    async def test_concurrency_limit(self, tmp_path):
+        executor = CommandExecutor(max_concurrent=2, cwd=str(tmp_path))
+        started = time.monotonic()
+        calls = [asyncio.create_task(executor(f"sleep 0.2; echo {i}")) for i in range(4)]
+        await asyncio.sleep(0.1)
+        assert executor.stats()["running"] == 2
+        assert executor.stats()["queued"] == 2
+        await asyncio.gather(*calls)
+        assert time.monotonic() - started >= 0.4
+        assert executor.stats()["queue_wait"]["max_s"] >= 0.15
+
+    async def test_cached_by_checkout_tree_hash(self, repo):
+        executor = CommandExecutor()
+        first = await executor("cat a.txt; date +%s%N", cwd=str(repo))
+        assert await executor("cat a.txt; date +%s%N", cwd=str(repo)) == first
+        assert executor.stats()["cache_hits"] == 1
+
+        # Uncommitted changes: not cacheable
+        (repo / "a.txt").write_text("two\n")
+        dirty = await executor("cat a.txt; date +%s%N", cwd=str(repo))
+        assert dirty[1].startswith("two")
+        assert await executor("cat a.txt; date +%s%N", cwd=str(repo)) != dirty
+        assert executor.stats()["runs"] == 3
+
+    async def test_duplicate_commands_queue_and_share_the_result(self, repo):
+        executor = CommandExecutor(max_concurrent=4)
+        results = await asyncio.gather(
+            *(executor("sleep 0.1; date +%s%N", cwd=str(repo)) for _ in range(3))
+        )
+        assert len(set(results)) == 1
+        assert executor.stats()["runs"] == 1
+        assert executor.stats()["cache_hits"] == 2
+
+    async def test_default_directory_is_never_shared(self, repo):
+        # The default directory is not a PR checkout: no dedup, no cache
+        executor = CommandExecutor(max_concurrent=4, cwd=str(repo))
+        results = await asyncio.gather(*(executor("sleep 0.1; date +%s%N") for _ in range(3)))
+        assert len(set(results)) == 3
+        await executor("true")
+        await executor("true")
+        assert executor.stats()["runs"] == 5
+        assert executor.stats()["cache_entries"] == executor.stats()["cache_hits"] == 0
+
+    async def test_output_streams_in_batches(self, tmp_path):
+        chunks: list[tuple[str, str]] = []
+
+        async def on_output(command, stream, text):
+            chunks.append((stream, text))
+
+        executor = CommandExecutor(cwd=str(tmp_path), on_output=on_output)
+        _, stdout, _ = await executor("for i in 1 2 3; do seq 1 60; sleep 0.1; done")
+        stdout_chunks = [text for stream, text in chunks if stream == "stdout"]
+        assert len(stdout_chunks) >= 2
+        assert "".join(stdout_chunks) == stdout
+
+    async def test_timeout_kills_the_command(self, tmp_path):
+        executor = CommandExecutor(cwd=str(tmp_path))
+        with pytest.raises(TimeoutError):
+            await executor("sleep 30", timeout=1)
+        assert executor.stats()["timeouts"] == 1
+        assert executor.stats()["running"] == 0
+
+    async def test_environment_is_the_one_given(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SQUADRON_TEST_SECRET", "hunter2")
+        executor = CommandExecutor(cwd=str(tmp_path), env={"PATH": os.environ["PATH"]})
+        _, stdout, _ = await executor('echo "[$SQUADRON_TEST_SECRET]"')
+        assert stdout == "[]\n"
+
+    async def test_command_check_reports_timeout_as_error(self, tmp_path):
+        executor = CommandExecutor(cwd=str(tmp_path))
+
+        async def quick_timeout(command, *, cwd=None, timeout=300):
+            return await executor(command, cwd=cwd, timeout=1)
+
+        check = CommandCheck(command_runner=quick_timeout)
+        result = await check.evaluate({"run": "sleep 30"}, PipelineContext())
+        assert not result.passed
+        assert "timed out" in result.data["error"]
+
+    async def test_command_check_runs_in_the_pr_checkout(self, repo, tmp_path):
+        executor = CommandExecutor(cwd=str(tmp_path))
+        resolved: list[int | None] = []
+
+        async def checkout(context):
+            resolved.append(context.pr_number)
+            return str(repo)
+
+        check = CommandCheck(command_runner=executor)
+        context = PipelineContext(pr_number=5, checkout_resolver=checkout)
+        result = await check.evaluate({"run": "cat a.txt"}, context)
+        assert result.passed
+        assert result.data["stdout"] == "one\n"
+        assert resolved == [5]
+
+    async def test_command_check_fails_without_a_checkout(self, tmp_path):
+        executor = CommandExecutor(cwd=str(tmp_path))
+
+        async def checkout(context):
+            raise RuntimeError("no such commit")
+
+        check = CommandCheck(command_runner=executor)
+        context = PipelineContext(pr_number=5, checkout_resolver=checkout)
+        result = await check.evaluate({"run": "true"}, context)
+        assert not result.passed
+        assert result.data["error"] == "no such commit"
+        assert executor.stats()["runs"] == 0
+
+
+def _git(cwd, *args: str) -> str:
+    return subprocess.run(
+        ["git", "-c", "user.email=t@e", "-c", "user.name=t", *args],
+        cwd=cwd,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+class TestPrCheckout:
+    """AgentManager.pipeline_checkout_callback — one detached worktree per PR head."""
+
+    @pytest.fixture
+    def origin(self, tmp_path):
+        origin = tmp_path / "origin.git"
+        _git(tmp_path, "init", "--bare", "-b", "main", str(origin))
+        fork = tmp_path / "fork"
+        _git(tmp_path, "clone", "-q", str(origin), str(fork))
+        _git(fork, "commit", "--allow-empty", "-m", "base")
+        _git(fork, "push", "-q", "origin", "main")
+        return origin
+
+    @pytest.fixture
+    def manager(self, tmp_path, origin):
+        repo = tmp_path / "repo"
+        _git(tmp_path, "clone", "-q", str(origin), str(repo))
+        manager = AgentManager.__new__(AgentManager)
+        manager.config = MagicMock()
+        manager.config.runtime = RuntimeConfig(worktree_dir=str(tmp_path / "worktrees"))
+        manager.repo_root = repo
+        manager._git_fetcher = GitFetcher(repo, manager._run_git_in)
+        manager._gate_checkouts = {}
+        manager._gate_checkout_locks = {}
+        manager._git_auth_env = _no_auth
+        return manager
+
+    def push_pr_head(self, fork, pr_number: int, content: str) -> str:
+        """Push a commit only reachable from ``refs/pull/<n>/head`` (like a fork PR)."""
+        _git(fork, "checkout", "-q", "--detach", "main")
+        (fork / "a.txt").write_text(content)
+        _git(fork, "add", "a.txt")
+        _git(fork, "commit", "-qm", content)
+        _git(fork, "push", "-q", "-f", "origin", f"HEAD:refs/pull/{pr_number}/head")
+        return _git(fork, "rev-parse", "HEAD")
+
+    async def checkout(self, manager, pr_number: int, sha: str, head_repo="o/r") -> str:
+        client = MagicMock()
+
+        async def get_pull_request(owner, repo, number):
+            return {
+                "head": {"sha": sha, "repo": {"full_name": head_repo} if head_repo else None},
+                "base": {"repo": {"full_name": "o/r"}},
+            }
+
+        client.get_pull_request = get_pull_request
+        context = PipelineContext(
+            pr_number=pr_number, github_client=client, fetch=GateFetchContext()
+        )
+        return await manager.pipeline_checkout_callback(context)
+
+    async def test_each_pr_head_gets_its_own_checkout(self, tmp_path, manager):
+        fork = tmp_path / "fork"
+        first_sha = self.push_pr_head(fork, 5, "pr5-v0\n")
+        other_sha = self.push_pr_head(fork, 6, "pr6\n")
+
+        first = await self.checkout(manager, 5, first_sha)
+        assert await self.checkout(manager, 5, first_sha) == first
+        assert (tmp_path / first / "a.txt").read_text() == "pr5-v0\n"
+        other = await self.checkout(manager, 6, other_sha)
+        assert (tmp_path / other / "a.txt").read_text() == "pr6\n"
+
+        # The previous head's checkout survives one push; older ones are removed
+        second_sha = self.push_pr_head(fork, 5, "pr5-v1\n")
+        second = await self.checkout(manager, 5, second_sha)
+        await self.checkout(manager, 5, self.push_pr_head(fork, 5, "pr5-v2\n"))
+        assert not os.path.exists(first)
+        assert _git(second, "rev-parse", "HEAD") == second_sha
+
+    @pytest.mark.parametrize("head_repo", ["someone/r", None])
+    async def test_fork_heads_are_refused(self, tmp_path, manager, head_repo):
+        sha = self.push_pr_head(tmp_path / "fork", 5, "untrusted\n")
+        with pytest.raises(RuntimeError, match="fork"):
+            await self.checkout(manager, 5, sha, head_repo=head_repo)
+        assert not (tmp_path / "gate-checkouts").exists()
+
+    async def test_closing_the_pr_removes_its_checkouts(self, tmp_path, manager):
+        fork = tmp_path / "fork"
+        first = await self.checkout(manager, 5, self.push_pr_head(fork, 5, "v0\n"))
+        second = await self.checkout(manager, 5, self.push_pr_head(fork, 5, "v1\n"))
+        other = await self.checkout(manager, 6, self.push_pr_head(fork, 6, "pr6\n"))
+
+        closed = SquadronEvent(event_type=SquadronEventType.PR_CLOSED, pr_number=5)
+        await manager._handle_pr_closed_gate_checkouts(closed)
+        assert not os.path.exists(first) and not os.path.exists(second)
+        assert os.path.exists(other)
+        assert 5 not in manager._gate_checkouts
+        assert str(first) not in _git(manager.repo_root, "worktree", "list")
+
+    async def test_startup_sweeps_leftover_checkouts(self, tmp_path, manager):
+        leftover = await self.checkout(manager, 5, self.push_pr_head(tmp_path / "fork", 5, "v\n"))
+        await manager._sweep_gate_checkouts()
+        assert not (tmp_path / "gate-checkouts").exists()
+        assert leftover not in _git(manager.repo_root, "worktree", "list")
+
+
+async def _no_auth():
+    return None
@@ -0,0 +1,184 @@
+"""Tests for compiled pipeline definitions and the snapshot-hash cache."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from squadron.pipeline.compiled import DefinitionCache, compile_definition, snapshot_hash
+from squadron.pipeline.engine import PipelineEngine
+from squadron.pipeline.gates import GateCheck, GateCheckRegistry, GateCheckResult
+from squadron.pipeline.models import (
+    GateConditionConfig,
+    HumanStageConfig,
+    HumanWaitType,
+    PipelineDefinition,
+    ReactiveAction,
+    ReactiveEventConfig,
+    StageDefinition,
+    TriggerDefinition,
+)
+from squadron.pipeline.registry import PipelineRegistry
+
+
+def make_definition() -> PipelineDefinition:
+    return PipelineDefinition(
+        trigger=TriggerDefinition(event="pull_request.opened"),
+        on_events={"push": ReactiveEventConfig(action=ReactiveAction.NOTIFY)},
+        stages=[
+            StageDefinition(id="review", type="agent", agent="reviewer"),
+            StageDefinition(
+                id="ci",
+                type="gate",
+                conditions=[GateConditionConfig(check="ci_status")],
+            ),
+            StageDefinition(
+                id="signoff",
+                type="human",
+                human=HumanStageConfig(wait_for=HumanWaitType.APPROVAL),
+            ),
+        ],
+    )
+
+
+class NeverPassCheck(GateCheck):
+    reactive_events = {"check_run.completed"}
+
+    async def evaluate(self, config, context):
+        return GateCheckResult(passed=False, message="waiting")
+
+
+class TestCompiledPipeline:
+    def test_lookup_tables(self):
+        compiled = compile_definition(make_definition(), GateCheckRegistry())
+        assert compiled.stage_index == {"review": 0, "ci": 1, "signoff": 2}
+        assert compiled.stage("ci").type == "gate"
+        assert compiled.stage("missing") is None
+        assert compiled.next_stage("review").id == "ci"
+        assert compiled.next_stage("signoff") is None
+
+    def test_reactive_events_per_stage(self):
+        compiled = compile_definition(make_definition(), GateCheckRegistry())
+        assert "check_run.completed" in compiled.reactive_events["ci"]
+        assert compiled.reactive_events["signoff"] == {"pull_request_review.submitted"}
+        assert compiled.reactive_events["review"] == frozenset()
+
+        assert compiled.reacts_to("ci", "check_run.completed")
+        assert compiled.reacts_to("review", "push")  # on_events applies to every stage
+        assert not compiled.reacts_to("review", "check_run.completed")
+        assert not compiled.reacts_to(None, "issue_comment.created")
+
+
+class TestDefinitionCache:
+    def test_parses_each_snapshot_once(self):
+        cache = DefinitionCache(GateCheckRegistry())
+        snapshot = make_definition().model_dump_json()
+        with patch.object(
+            PipelineDefinition,
+            "model_validate_json",
+            wraps=PipelineDefinition.model_validate_json,
+        ) as parse:
+            first = cache.get(snapshot)
+            assert cache.get(snapshot) is first
+        assert parse.call_count == 1
+        assert first.definition_hash == snapshot_hash(snapshot)
+        assert cache.stats()["hits"] == cache.stats()["misses"] == 1
+
+    def test_stored_hash_is_used_as_key(self):
+        cache = DefinitionCache(GateCheckRegistry())
+        snapshot = make_definition().model_dump_json()
+        with patch("squadron.pipeline.compiled.snapshot_hash") as rehash:
+            compiled = cache.get(snapshot, "stored-hash")
+            assert cache.get(snapshot, "stored-hash") is compiled
+        rehash.assert_not_called()
+        assert compiled.definition_hash == "stored-hash"
+
+    def test_lru_bound(self):
+        cache = DefinitionCache(GateCheckRegistry(), max_entries=2)
+        snapshots = []
+        for i in range(3):
+            defn = make_definition()
+            defn.description = f"v{i}"
+            snapshots.append(defn.model_dump_json())
+        for snapshot in snapshots:
+            cache.get(snapshot)
+        cache.get(snapshots[0])
+        assert cache.stats()["evicted"] == 2
+        assert cache.stats()["entries"] == 2
+
+    def test_invalid_snapshot_raises_and_is_not_cached(self):
+        cache = DefinitionCache(GateCheckRegistry())
+        with pytest.raises(Exception):
+            cache.get("{}")
+        assert cache.stats()["entries"] == 0
+
+    def test_gate_registration_invalidates(self):
+        gates = GateCheckRegistry()
+        cache = DefinitionCache(gates)
+        defn = PipelineDefinition(
+            stages=[
+                StageDefinition(
+                    id="gate", type="gate", conditions=[GateConditionConfig(check="never")]
+                )
+            ]
+        )
+        snapshot = defn.model_dump_json()
+        assert cache.get(snapshot).reactive_events["gate"] == frozenset()
+        gates.register("never", NeverPassCheck())
+        assert cache.get(snapshot).reactive_events["gate"] == {"check_run.completed"}
+
+
+# ── Engine integration ───────────────────────────────────────────────────────
+
+
+@pytest_asyncio.fixture
+async def registry(tmp_path):
+    async with aiosqlite.connect(str(tmp_path / "compiled.db")) as conn:
+        conn.row_factory = aiosqlite.Row
+        reg = PipelineRegistry(conn)
+        await reg.initialize()
+        yield reg
+
+
+@pytest.fixture
+def engine(registry):
+    gates = GateCheckRegistry()
+    gates.register("never", NeverPassCheck())
+    eng = PipelineEngine(registry, gates)
+    eng.add_pipeline(
+        "gated",
+        PipelineDefinition(
+            trigger=TriggerDefinition(event="pull_request.opened"),
+            stages=[
+                StageDefinition(
+                    id="gate", type="gate", conditions=[GateConditionConfig(check="never")]
+                ),
+                StageDefinition(id="merge", type="action", action="merge_pr"),
+            ],
+        ),
+    )
+    return eng
+
+
+class TestEngineRouting:
+    async def test_routing_reuses_compiled_definition(self, engine):
+        payload = {"pull_request": {"number": 7}}
+        await engine.evaluate_event("pull_request.opened", payload)
+        for _ in range(5):
+            await engine.evaluate_event("check_run.completed", payload)
+        stats = engine.definition_cache_stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] >= 5
+
+    async def test_irrelevant_event_skips_stage_lookups(self, engine, registry):
+        payload = {"pull_request": {"number": 7}}
+        await engine.evaluate_event("pull_request.opened", payload)
+        latest = registry.get_latest_stage_run
+        with patch.object(registry, "get_latest_stage_run", wraps=latest) as get:
+            await engine.evaluate_event("issue_comment.created", payload)
+            get.assert_not_called()
+            await engine.evaluate_event("check_run.completed", payload)
+            get.assert_called()
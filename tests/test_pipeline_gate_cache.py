@@ -0,0 +1,298 @@
+"""Tests for input-keyed memoization of gate check results (GateResultCache)."""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any
+
+import aiosqlite
+import pytest_asyncio
+
+from squadron.pipeline.engine import PipelineEngine
+from squadron.pipeline.gate_cache import GateResultCache
+from squadron.pipeline.gates import (
+    CiStatusCheck,
+    GateCheck,
+    GateCheckRegistry,
+    GateCheckResult,
+    GateFetchContext,
+    LabelPresentCheck,
+    PipelineContext,
+)
+from squadron.pipeline.models import (
+    GateConditionConfig,
+    PipelineDefinition,
+    StageDefinition,
+    StageRunStatus,
+    TriggerDefinition,
+)
+from squadron.pipeline.registry import PipelineRegistry
+
+
+class FakeGitHubClient:
+    def __init__(self) -> None:
+        self.head_sha = "sha-1"
+        self.labels = ["ready"]
+        self.reviews: list[dict[str, Any]] = []
+        self.check_runs = [{"name": "test", "status": "completed", "conclusion": "failure"}]
+        self.commit_prs = [{"number": 7, "state": "open", "head": {"sha": "sha-1"}}]
+        self.calls: Counter[str] = Counter()
+
+    async def get_pull_request(self, owner: str, repo: str, pr_number: int) -> dict:
+        self.calls["pr"] += 1
+        return {"head": {"sha": self.head_sha}, "labels": [{"name": n} for n in self.labels]}
+
+    async def get_pr_reviews(self, owner: str, repo: str, pr_number: int) -> list[dict]:
+        self.calls["reviews"] += 1
+        return self.reviews
+
+    async def list_pull_requests_for_commit(self, owner: str, repo: str, sha: str) -> list[dict]:
+        self.calls["commit_prs"] += 1
+        return self.commit_prs
+
+    async def list_check_runs(self, owner: str, repo: str, ref: str) -> list[dict]:
+        self.calls["check_runs"] += 1
+        if isinstance(self.check_runs, Exception):
+            raise self.check_runs
+        return self.check_runs
+
+
+def make_context(client, pr_number: int = 7) -> PipelineContext:
+    return PipelineContext(
+        pr_number=pr_number, owner="o", repo="r", github_client=client, fetch=GateFetchContext()
+    )
+
+
+async def cached_evaluate(cache, name, check, config, context) -> GateCheckResult:
+    key = await cache.key(name, check, config, context)
+    if key is not None and (hit := cache.get(key)) is not None:
+        return hit
+    result = await check.evaluate(config, context)
+    if key is not None:
+        cache.put(key, check, result)
+    return result
+
+
+class TestGateResultCache:
+    async def test_reused_until_reactive_event(self):
+        cache, client, check = GateResultCache(), FakeGitHubClient(), CiStatusCheck()
+        first = await cached_evaluate(cache, "ci_status", check, {}, make_context(client))
+        again = await cached_evaluate(cache, "ci_status", check, {}, make_context(client))
+        assert again is first
+        assert client.calls["check_runs"] == 1
+
+        # Events the check does not react to leave the entry alone
+        assert cache.invalidate("pull_request.labeled", "o", "r", 7) == 0
+        assert cache.invalidate("check_run.completed", "o", "r", 8) == 0
+        assert cache.invalidate("check_run.completed", "o", "r", 7) == 1
+        await cached_evaluate(cache, "ci_status", check, {}, make_context(client))
+        assert client.calls["check_runs"] == 2
+
+        stats = cache.stats()["checks"]["ci_status"]
+        assert stats == {"hits": 1, "misses": 2, "hit_rate": 0.333}
+
+    async def test_event_without_pr_invalidates_every_pr(self):
+        cache, client, check = GateResultCache(), FakeGitHubClient(), CiStatusCheck()
+        await cached_evaluate(cache, "ci_status", check, {}, make_context(client, 7))
+        await cached_evaluate(cache, "ci_status", check, {}, make_context(client, 8))
+        assert cache.invalidate("status", "o", "r", None) == 2
+        assert cache.stats()["entries"] == 0
+
+    async def test_input_change_is_a_miss(self):
+        cache, client = GateResultCache(), FakeGitHubClient()
+        check = LabelPresentCheck()
+        config = {"label": "ready"}
+        assert (await cached_evaluate(cache, "label", check, config, make_context(client))).passed
+        client.labels = []
+        assert not (
+            await cached_evaluate(cache, "label", check, config, make_context(client))
+        ).passed
+
+        client.head_sha = "sha-2"
+        ci = CiStatusCheck()
+        await cached_evaluate(cache, "ci_status", ci, {}, make_context(client))
+        client.head_sha = "sha-3"
+        await cached_evaluate(cache, "ci_status", ci, {}, make_context(client))
+        assert client.calls["check_runs"] == 2
+
+    async def test_errors_and_undeclared_inputs_are_not_cached(self):
+        cache, client = GateResultCache(), FakeGitHubClient()
+        client.check_runs = RuntimeError("api down")
+        check = CiStatusCheck()
+        result = await cached_evaluate(cache, "ci_status", check, {}, make_context(client))
+        assert result.data["error"] == "api down"
+        assert cache.stats()["entries"] == 0
+
+        class Uncached(GateCheck):
+            async def evaluate(self, config, context):
+                return GateCheckResult(passed=True, message="ok")
+
+        assert await cache.key("plain", Uncached(), {}, make_context(client)) is None
+        assert await cache.key("ci_status", check, {}, PipelineContext(pr_number=7)) is None
+
+    async def test_pending_ci_is_not_cached(self):
+        cache, client, check = GateResultCache(), FakeGitHubClient(), CiStatusCheck()
+        client.check_runs = [{"name": "test", "status": "in_progress", "conclusion": None}]
+        result = await cached_evaluate(cache, "ci_status", check, {}, make_context(client))
+        assert result.data["pending"] == ["test"]
+        required = {"workflows": ["test", "lint"]}
+        await cached_evaluate(cache, "ci_status", check, required, make_context(client))
+        assert cache.stats()["entries"] == 0
+
+        # Once every run has concluded the result is reused
+        client.check_runs = [{"name": "test", "status": "completed", "conclusion": "success"}]
+        await cached_evaluate(cache, "ci_status", check, {}, make_context(client))
+        await cached_evaluate(cache, "ci_status", check, {}, make_context(client))
+        assert client.calls["check_runs"] == 3
+
+    async def test_lru_bound(self):
+        cache, client, check = GateResultCache(max_entries=2), FakeGitHubClient(), CiStatusCheck()
+        for pr_number in (1, 2, 3):
+            await cached_evaluate(cache, "ci_status", check, {}, make_context(client, pr_number))
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["evicted"] == 1
+
+
+# ── Engine integration ───────────────────────────────────────────────────────
+
+
+@pytest_asyncio.fixture
+async def registry(tmp_path):
+    async with aiosqlite.connect(str(tmp_path / "gate_cache.db")) as conn:
+        conn.row_factory = aiosqlite.Row
+        reg = PipelineRegistry(conn)
+        await reg.initialize()
+        yield reg
+
+
+async def test_review_event_reuses_ci_result(registry):
+    client = FakeGitHubClient()
+    engine = PipelineEngine(
+        registry, GateCheckRegistry(), github_client=client, owner="o", repo="r"
+    )
+    engine.add_pipeline(
+        "merge-gate",
+        PipelineDefinition(
+            trigger=TriggerDefinition(event="pull_request.opened"),
+            stages=[
+                StageDefinition(
+                    id="gate",
+                    type="gate",
+                    conditions=[
+                        GateConditionConfig(check="ci_status"),
+                        GateConditionConfig(check="human_approved"),
+                    ],
+                ),
+            ],
+        ),
+    )
+    # CI events reach the engine (and invalidate) only if handlers are registered
+    assert {"check_run.completed", "status"} <= engine.reactive_event_types("merge-gate")
+
+    payload = {"pull_request": {"number": 7}}
+    run = await engine.evaluate_event("pull_request.opened", payload)
+    assert client.calls["check_runs"] == 1
+
+    # A review only invalidates the review-based check; CI is reused
+    client.reviews = [{"id": 1, "user": {"login": "alice"}, "state": "APPROVED"}]
+    review = {**payload, "review": {"state": "approved", "user": {"login": "alice"}}}
+    await engine.evaluate_event("pull_request_review.submitted", review)
+    assert client.calls["check_runs"] == 1
+    assert engine.gate_cache_stats()["checks"]["ci_status"]["hits"] == 1
+
+    # A re-run finishing invalidates the CI result and the gate passes
+    client.check_runs = [{"name": "test", "status": "completed", "conclusion": "success"}]
+    await engine.evaluate_event("check_run.completed", payload)
+    assert client.calls["check_runs"] == 2
+    stage_run = await registry.get_latest_stage_run(run.run_id, "gate")
+    assert stage_run.status == StageRunStatus.COMPLETED
+
+
+async def test_review_event_refetches_pending_ci(registry):
+    client = FakeGitHubClient()
+    client.check_runs = [{"name": "test", "status": "in_progress", "conclusion": None}]
+    engine = PipelineEngine(
+        registry, GateCheckRegistry(), github_client=client, owner="o", repo="r"
+    )
+    engine.add_pipeline(
+        "merge-gate",
+        PipelineDefinition(
+            trigger=TriggerDefinition(event="pull_request.opened"),
+            stages=[
+                StageDefinition(
+                    id="gate",
+                    type="gate",
+                    conditions=[
+                        GateConditionConfig(check="ci_status"),
+                        GateConditionConfig(check="human_approved"),
+                    ],
+                ),
+            ],
+        ),
+    )
+    payload = {"pull_request": {"number": 7}}
+    run = await engine.evaluate_event("pull_request.opened", payload)
+
+    # CI finished but its webhook was never delivered: the next review still
+    # sees the settled CI state instead of the cached in-progress result
+    client.check_runs = [{"name": "test", "status": "completed", "conclusion": "success"}]
+    client.reviews = [{"id": 1, "user": {"login": "alice"}, "state": "APPROVED"}]
+    review = {**payload, "review": {"state": "approved", "user": {"login": "alice"}}}
+    await engine.evaluate_event("pull_request_review.submitted", review)
+    assert client.calls["check_runs"] == 2
+    stage_run = await registry.get_latest_stage_run(run.run_id, "gate")
+    assert stage_run.status == StageRunStatus.COMPLETED
+
+
+def _ci_gate_pipeline() -> PipelineDefinition:
+    return PipelineDefinition(
+        trigger=TriggerDefinition(event="pull_request.opened"),
+        stages=[
+            StageDefinition(
+                id="gate", type="gate", conditions=[GateConditionConfig(check="ci_status")]
+            ),
+        ],
+    )
+
+
+async def test_check_run_payload_reevaluates_its_prs_gate(registry):
+    client = FakeGitHubClient()
+    engine = PipelineEngine(
+        registry, GateCheckRegistry(), github_client=client, owner="o", repo="r"
+    )
+    engine.add_pipeline("ci-gate", _ci_gate_pipeline())
+    run = await engine.evaluate_event("pull_request.opened", {"pull_request": {"number": 7}})
+
+    # Real check_run payloads name the PR only inside check_run.pull_requests
+    client.check_runs = [{"name": "test", "status": "completed", "conclusion": "success"}]
+    payload = {"check_run": {"head_sha": "sha-1", "pull_requests": [{"number": 7}]}}
+    await engine.evaluate_event("check_run.completed", payload)
+    stage_run = await registry.get_latest_stage_run(run.run_id, "gate")
+    assert stage_run.status == StageRunStatus.COMPLETED
+    assert client.calls["commit_prs"] == 0
+
+
+async def test_status_payload_resolves_pr_from_head_sha(registry):
+    client = FakeGitHubClient()
+    client.commit_prs.append({"number": 8, "state": "closed", "head": {"sha": "sha-1"}})
+    engine = PipelineEngine(
+        registry, GateCheckRegistry(), github_client=client, owner="o", repo="r"
+    )
+    engine.add_pipeline("ci-gate", _ci_gate_pipeline())
+    run = await engine.evaluate_event("pull_request.opened", {"pull_request": {"number": 7}})
+
+    client.check_runs = [{"name": "test", "status": "completed", "conclusion": "success"}]
+    await engine.evaluate_event("status", {"sha": "sha-1", "state": "success"})
+    assert client.calls["commit_prs"] == 1
+    stage_run = await registry.get_latest_stage_run(run.run_id, "gate")
+    assert stage_run.status == StageRunStatus.COMPLETED
+
+
+async def test_ci_payload_without_listeners_skips_pr_lookup(registry):
+    client = FakeGitHubClient()
+    engine = PipelineEngine(
+        registry, GateCheckRegistry(), github_client=client, owner="o", repo="r"
+    )
+    engine.add_pipeline("ci-gate", _ci_gate_pipeline())
+    await engine.evaluate_event("status", {"sha": "sha-1", "state": "success"})
+    assert client.calls["commit_prs"] == 0
@@ -0,0 +1,239 @@
+"""Tests for concurrent gate condition evaluation and the shared fetch context."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from typing import Any
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from squadron.pipeline.engine import PipelineEngine
+from squadron.pipeline.gates import (
+    GateCheck,
+    GateCheckRegistry,
+    GateCheckResult,
+    GateFetchContext,
+    PipelineContext,
+)
+from squadron.pipeline.models import (
+    GateConditionConfig,
+    PipelineDefinition,
+    PipelineRun,
+    PipelineRunStatus,
+    StageDefinition,
+    StageRunStatus,
+    TriggerDefinition,
+)
+from squadron.pipeline.registry import PipelineRegistry
+
+CONDITIONS = [
+    GateConditionConfig(check="ci_status"),
+    GateConditionConfig(check="pr_approvals_met", count=1),
+    GateConditionConfig(check="no_changes_requested"),
+    GateConditionConfig(check="label_present", label="ready"),
+]
+
+
+class SlowGitHubClient:
+    """Fake GitHub client with per-call latency that counts requests."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        self.latency = latency
+        self.calls: Counter[str] = Counter()
+
+    async def _respond(self, name: str, value: Any) -> Any:
+        self.calls[name] += 1
+        await asyncio.sleep(self.latency)
+        return value
+
+    async def get_pull_request(self, owner: str, repo: str, pr_number: int) -> dict:
+        pr = {"head": {"sha": "abc123"}, "labels": [{"name": "ready"}]}
+        return await self._respond("pr", pr)
+
+    async def get_pr_reviews(self, owner: str, repo: str, pr_number: int) -> list[dict]:
+        reviews = [{"user": {"login": "alice"}, "state": "APPROVED"}]
+        return await self._respond("reviews", reviews)
+
+    async def list_check_runs(self, owner: str, repo: str, ref: str) -> list[dict]:
+        runs = [{"name": "test", "status": "completed", "conclusion": "success"}]
+        return await self._respond("check_runs", runs)
+
+
+class PassCheck(GateCheck):
+    async def evaluate(self, config, context):
+        return GateCheckResult(passed=True, message="ok")
+
+
+class HangingCheck(GateCheck):
+    def __init__(self) -> None:
+        self.cancelled = False
+
+    async def evaluate(self, config, context):
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return GateCheckResult(passed=False, message="unreachable")
+
+
+class BrokenCheck(GateCheck):
+    async def evaluate(self, config, context):
+        raise RuntimeError("broken check")
+
+
+class TestGateFetchContext:
+    async def test_concurrent_reads_share_one_request(self):
+        client = SlowGitHubClient(latency=0.01)
+        fetch = GateFetchContext()
+        ctx = PipelineContext(pr_number=1, owner="o", repo="r", github_client=client, fetch=fetch)
+        other_pr = PipelineContext(
+            pr_number=2, owner="o", repo="r", github_client=client, fetch=fetch
+        )
+        await asyncio.gather(ctx.get_pull_request(), ctx.get_pull_request(), ctx.get_pr_reviews())
+        await other_pr.get_pull_request()
+        assert client.calls == {"pr": 2, "reviews": 1}
+        assert (fetch.fetches, fetch.hits) == (3, 1)
+
+    async def test_cancelled_reader_does_not_cancel_shared_request(self):
+        client = SlowGitHubClient(latency=0.02)
+        ctx = PipelineContext(pr_number=1, github_client=client, fetch=GateFetchContext())
+        first = asyncio.create_task(ctx.get_pull_request())
+        await asyncio.sleep(0)
+        second = asyncio.create_task(ctx.get_pull_request())
+        await asyncio.sleep(0.005)
+        first.cancel()
+        assert (await second)["head"]["sha"] == "abc123"
+        assert client.calls["pr"] == 1
+
+    async def test_without_fetch_context_reads_go_to_the_client(self):
+        client = SlowGitHubClient()
+        ctx = PipelineContext(pr_number=1, github_client=client)
+        await ctx.get_pull_request()
+        await ctx.get_pull_request()
+        assert client.calls["pr"] == 2
+
+
+# ── Engine integration ───────────────────────────────────────────────────────
+
+
+@pytest_asyncio.fixture
+async def registry(tmp_path):
+    async with aiosqlite.connect(str(tmp_path / "gates.db")) as conn:
+        conn.row_factory = aiosqlite.Row
+        reg = PipelineRegistry(conn)
+        await reg.initialize()
+        yield reg
+
+
+def make_engine(registry, client=None, **checks: GateCheck) -> PipelineEngine:
+    gates = GateCheckRegistry()
+    for name, check in checks.items():
+        gates.register(name, check)
+    return PipelineEngine(registry, gates, github_client=client, owner="o", repo="r")
+
+
+def gate_pipeline(*, conditions=(), any_of=None) -> PipelineDefinition:
+    return PipelineDefinition(
+        trigger=TriggerDefinition(event="pull_request.opened"),
+        stages=[
+            StageDefinition(id="gate", type="gate", conditions=list(conditions), any_of=any_of),
+        ],
+    )
+
+
+async def run_gate(engine, registry, defn) -> tuple[PipelineRun, list]:
+    engine.add_pipeline("gated", defn)
+    run = await engine.evaluate_event("pull_request.opened", {"pull_request": {"number": 7}})
+    stage_run = await registry.get_latest_stage_run(run.run_id, "gate")
+    return run, await registry.get_gate_checks_for_stage(stage_run.id)
+
+
+class TestEngineGateEvaluation:
+    async def test_conditions_share_github_reads(self, registry):
+        client = SlowGitHubClient(latency=0.005)
+        engine = make_engine(registry, client)
+        run, checks = await run_gate(engine, registry, gate_pipeline(conditions=CONDITIONS))
+
+        assert client.calls == {"pr": 1, "reviews": 1, "check_runs": 1}
+        assert [c.check_type for c in checks] == [c.check for c in CONDITIONS]
+        assert all(c.passed for c in checks)
+        stored = await registry.get_pipeline_run(run.run_id)
+        assert stored.status == PipelineRunStatus.COMPLETED
+
+    async def test_any_of_cancels_remaining_checks(self, registry):
+        hanging = HangingCheck()
+        engine = make_engine(registry, hanging=hanging, quick=PassCheck())
+        defn = gate_pipeline(
+            any_of=[GateConditionConfig(check="hanging"), GateConditionConfig(check="quick")]
+        )
+        run, checks = await asyncio.wait_for(run_gate(engine, registry, defn), 5)
+
+        assert hanging.cancelled
+        assert [c.check_type for c in checks] == ["quick"]
+        stage_run = await registry.get_latest_stage_run(run.run_id, "gate")
+        assert stage_run.status == StageRunStatus.COMPLETED
+
+    async def test_failing_check_cancels_the_others(self, registry):
+        hanging = HangingCheck()
+        engine = make_engine(registry, hanging=hanging, broken=BrokenCheck())
+        ctx = PipelineContext()
+        conditions = [GateConditionConfig(check="hanging"), GateConditionConfig(check="broken")]
+        run = PipelineRun(run_id="r", pipeline_name="p", definition_snapshot="{}")
+        with pytest.raises(RuntimeError, match="broken check"):
+            await asyncio.wait_for(engine._evaluate_conditions(run, ctx, conditions), 5)
+        assert hanging.cancelled
+
+
+# ── Benchmark ────────────────────────────────────────────────────────────────
+
+BENCH_LATENCY = 0.01  # seconds per simulated GitHub API call
+BENCH_ROUNDS = 10
+
+
+@pytest.mark.benchmark
+async def test_gate_evaluation_latency(registry, bench_history):
+    """Sequential per-check fetches vs. concurrent evaluation with a shared context.
+
+    Set ``SQUADRON_BENCH_HISTORY=path.jsonl`` to append the result.
+    """
+    client = SlowGitHubClient(latency=BENCH_LATENCY)
+    engine = make_engine(registry, client)
+    gates = GateCheckRegistry()
+    run = PipelineRun(run_id="r", pipeline_name="p", definition_snapshot="{}", pr_number=7)
+
+    async def sequential() -> list[GateCheckResult]:
+        ctx = PipelineContext(pr_number=7, owner="o", repo="r", github_client=client)
+        return [await gates.get(cond.check).evaluate(cond.get_config(), ctx) for cond in CONDITIONS]
+
+    async def concurrent() -> list[GateCheckResult]:
+        engine._gate_results.clear()  # measure evaluation, not result reuse
+        ctx = PipelineContext(
+            pr_number=7, owner="o", repo="r", github_client=client, fetch=GateFetchContext()
+        )
+        return [result for _, result in await engine._evaluate_conditions(run, ctx, CONDITIONS)]
+
+    timings: dict[str, float] = {}
+    calls: dict[str, int] = {}
+    for mode, evaluate in (("sequential", sequential), ("concurrent", concurrent)):
+        client.calls.clear()
+        started = time.perf_counter()
+        for _ in range(BENCH_ROUNDS):
+            results = await evaluate()
+            assert all(r.passed for r in results)
+        timings[mode] = (time.perf_counter() - started) / BENCH_ROUNDS * 1000
+        calls[mode] = sum(client.calls.values()) // BENCH_ROUNDS
+
+    bench_history(
+        "gate_evaluation",
+        conditions=len(CONDITIONS),
+        latency_ms=BENCH_LATENCY * 1000,
+        **{f"{mode}_ms": round(ms, 2) for mode, ms in timings.items()},
+        **{f"{mode}_api_calls": n for mode, n in calls.items()},
+    )
+    assert calls == {"sequential": 5, "concurrent": 3}
+    assert timings["concurrent"] < timings["sequential"]
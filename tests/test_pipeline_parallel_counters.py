@@ -0,0 +1,153 @@
+"""Tests for counter-based parallel stage completion tracking."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiosqlite
+import pytest_asyncio
+
+from squadron.pipeline.engine import PipelineEngine
+from squadron.pipeline.gates import GateCheckRegistry
+from squadron.pipeline.models import (
+    JoinStrategy,
+    ParallelBranch,
+    PipelineDefinition,
+    PipelineRun,
+    StageDefinition,
+    StageRun,
+    StageRunStatus,
+    TriggerDefinition,
+)
+from squadron.pipeline.registry import PipelineRegistry
+
+
+@pytest_asyncio.fixture
+async def registry(tmp_path):
+    async with aiosqlite.connect(str(tmp_path / "counters.db")) as conn:
+        conn.row_factory = aiosqlite.Row
+        reg = PipelineRegistry(conn)
+        await reg.initialize()
+        yield reg
+
+
+async def parallel_stage(registry, *statuses: StageRunStatus) -> tuple[StageRun, list[StageRun]]:
+    await registry.create_pipeline_run(
+        PipelineRun(run_id="r", pipeline_name="p", definition_snapshot="{}")
+    )
+    parent = StageRun(run_id="r", stage_id="fan", status=StageRunStatus.WAITING)
+    parent.id = await registry.create_stage_run(parent)
+    branches = [
+        StageRun(
+            run_id="r", stage_id=f"fan/b{i}", status=s, branch_id=f"b{i}", parent_stage_id="fan"
+        )
+        for i, s in enumerate(statuses)
+    ]
+    for branch, sr_id in zip(branches, await registry.create_parallel_branches(parent, branches)):
+        branch.id = sr_id
+    return parent, branches
+
+
+def tallies(counters) -> tuple[int, int, int, int]:
+    return counters.pending, counters.succeeded, counters.failed, counters.skipped
+
+
+class TestRegistryCounters:
+    async def test_counters_follow_branch_status(self, registry):
+        running, skipped = StageRunStatus.RUNNING, StageRunStatus.SKIPPED
+        parent, branches = await parallel_stage(registry, running, running, running, skipped)
+        counters = await registry.get_parallel_counters("r", "fan")
+        assert counters.stage_run_id == parent.id
+        assert tallies(counters) == (3, 0, 0, 1)
+
+        branches[0].status = StageRunStatus.WAITING
+        await registry.update_stage_run(branches[0])
+        branches[1].status = StageRunStatus.COMPLETED
+        await registry.update_stage_run(branches[1])
+        await registry.update_stage_run(branches[1])  # same status again: no change
+        branches[2].status = StageRunStatus.FAILED
+        await registry.update_stage_run(branches[2])
+        assert tallies(await registry.get_parallel_counters("r", "fan")) == (1, 1, 1, 1)
+
+    async def test_rerun_resets_counters(self, registry):
+        parent, _ = await parallel_stage(registry, StageRunStatus.COMPLETED)
+        retry = StageRun(run_id="r", stage_id="fan/b0", branch_id="b0", parent_stage_id="fan")
+        await registry.create_parallel_branches(parent, [retry])
+        assert tallies(await registry.get_parallel_counters("r", "fan")) == (1, 0, 0, 0)
+
+    async def test_resolve_only_from_waiting(self, registry):
+        parent, _ = await parallel_stage(registry, StageRunStatus.COMPLETED)
+        assert await registry.resolve_stage_run(parent.id, StageRunStatus.COMPLETED)
+        assert not await registry.resolve_stage_run(parent.id, StageRunStatus.FAILED, "late")
+        assert (await registry.get_stage_run(parent.id)).status == StageRunStatus.COMPLETED
+
+    async def test_backfill_for_stages_started_without_counters(self, registry):
+        await parallel_stage(registry, StageRunStatus.COMPLETED, StageRunStatus.WAITING)
+        await registry._db.execute("DELETE FROM pipeline_parallel_counters")
+        assert tallies(await registry.get_parallel_counters("r", "fan")) == (1, 1, 0, 0)
+        assert await registry.get_parallel_counters("r", "other") is None
+
+
+# ── Engine integration ───────────────────────────────────────────────────────
+
+
+def fan_out(join: JoinStrategy, count: int = 3) -> PipelineDefinition:
+    branches = [ParallelBranch(id=f"b{i}", agent=f"agent-{i}") for i in range(count)]
+    return PipelineDefinition(
+        trigger=TriggerDefinition(event="pull_request.opened"),
+        stages=[
+            StageDefinition(id="fan", type="parallel", join=join, branches=branches),
+            StageDefinition(id="after", type="action", action="record"),
+        ],
+    )
+
+
+async def start(registry, defn) -> tuple[PipelineEngine, str, list[str]]:
+    actions: list[str] = []
+
+    async def spawn(role, issue_number, **kwargs):
+        return f"{role}-id"
+
+    async def action(name, config, context):
+        await asyncio.sleep(0)
+        actions.append(name)
+        return {"success": True}
+
+    engine = PipelineEngine(registry, GateCheckRegistry())
+    engine.set_spawn_callback(spawn)
+    engine.set_action_callback(action)
+    engine.add_pipeline("fan", defn)
+    run = await engine.start_pipeline("fan", pr_number=1)
+    return engine, run.run_id, actions
+
+
+class TestEngineCompletion:
+    async def test_concurrent_completions_advance_once(self, registry):
+        engine, run_id, actions = await start(registry, fan_out(JoinStrategy.ALL))
+        await asyncio.gather(*(engine.on_agent_complete(f"agent-{i}-id") for i in range(3)))
+        assert actions == ["record"]
+        parent = await registry.get_latest_stage_run(run_id, "fan")
+        assert parent.status == StageRunStatus.COMPLETED
+
+    async def test_join_any_first_success_wins(self, registry):
+        engine, run_id, actions = await start(registry, fan_out(JoinStrategy.ANY))
+        await engine.on_agent_error("agent-0-id", "boom")
+        assert actions == []
+        await asyncio.gather(
+            engine.on_agent_complete("agent-1-id"), engine.on_agent_complete("agent-2-id")
+        )
+        assert actions == ["record"]
+
+    async def test_completion_does_not_reload_stage_runs(self, registry):
+        engine, run_id, actions = await start(registry, fan_out(JoinStrategy.ALL, count=2))
+
+        async def forbidden(run_id):
+            raise AssertionError("completion check scanned all stage runs")
+
+        registry.get_stage_runs_for_pipeline = forbidden
+        await engine.on_agent_complete("agent-0-id")
+        await engine.on_agent_error("agent-1-id", "boom")
+        parent = await registry.get_latest_stage_run(run_id, "fan")
+        assert parent.status == StageRunStatus.FAILED
+        assert parent.error_message == "One or more parallel branches failed"
+        assert actions == ["record"]
@@ -0,0 +1,150 @@
+"""Tests for concurrent launch of parallel stage branches."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiosqlite
+import pytest_asyncio
+
+from squadron.pipeline.engine import DEFAULT_PARALLEL_FAN_OUT, PipelineEngine
+from squadron.pipeline.gates import GateCheckRegistry
+from squadron.pipeline.models import (
+    ParallelBranch,
+    PipelineDefinition,
+    PipelineRun,
+    StageDefinition,
+    StageRun,
+    StageRunStatus,
+    TriggerDefinition,
+)
+from squadron.pipeline.registry import PipelineRegistry
+
+
+@pytest_asyncio.fixture
+async def registry(tmp_path):
+    async with aiosqlite.connect(str(tmp_path / "parallel.db")) as conn:
+        conn.row_factory = aiosqlite.Row
+        reg = PipelineRegistry(conn)
+        await reg.initialize()
+        yield reg
+
+
+class SlowSpawner:
+    """Spawn callback that takes a while and records peak concurrency."""
+
+    def __init__(self, delay: float = 0.05, fail: set[str] | None = None) -> None:
+        self.delay = delay
+        self.fail = fail or set()
+        self.active = 0
+        self.peak = 0
+        self.spawned: list[str] = []
+
+    async def __call__(self, role, issue_number, *, stage_id=None, **kwargs):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+            if role in self.fail:
+                raise RuntimeError(f"cannot spawn {role}")
+            self.spawned.append(role)
+            return f"{role}-agent"
+        finally:
+            self.active -= 1
+
+
+def review_fan_out(count: int, **stage_kwargs) -> PipelineDefinition:
+    branches = [ParallelBranch(id=f"review-{i}", agent=f"reviewer-{i}") for i in range(count)]
+    return PipelineDefinition(
+        trigger=TriggerDefinition(event="pull_request.opened"),
+        stages=[
+            StageDefinition(id="reviews", type="parallel", branches=branches, **stage_kwargs),
+            StageDefinition(id="done", type="action", action="noop"),
+        ],
+    )
+
+
+async def branch_runs(registry, run_id) -> dict[str, StageRun]:
+    return {
+        s.branch_id: s
+        for s in await registry.get_stage_runs_for_pipeline(run_id)
+        if s.parent_stage_id == "reviews"
+    }
+
+
+async def start(registry, defn, spawner) -> tuple[PipelineEngine, str]:
+    engine = PipelineEngine(registry, GateCheckRegistry())
+    engine.set_spawn_callback(spawner)
+    engine.add_pipeline("fan-out", defn)
+    run = await engine.start_pipeline("fan-out", pr_number=3)
+    return engine, run.run_id
+
+
+class TestParallelLaunch:
+    async def test_branches_launch_concurrently_up_to_the_limit(self, registry):
+        spawner = SlowSpawner(delay=0.05)
+        _, run_id = await start(registry, review_fan_out(5, max_parallel=2), spawner)
+        assert spawner.peak == 2
+        assert len(spawner.spawned) == 5
+        branches = await branch_runs(registry, run_id)
+        assert {b.status for b in branches.values()} == {StageRunStatus.WAITING}
+
+    async def test_default_fan_out(self, registry):
+        spawner = SlowSpawner(delay=0.02)
+        await start(registry, review_fan_out(DEFAULT_PARALLEL_FAN_OUT + 2), spawner)
+        assert spawner.peak == DEFAULT_PARALLEL_FAN_OUT
+
+    async def test_failed_launch_is_isolated(self, registry):
+        spawner = SlowSpawner(delay=0.01, fail={"reviewer-1"})
+        engine, run_id = await start(registry, review_fan_out(3), spawner)
+        assert sorted(spawner.spawned) == ["reviewer-0", "reviewer-2"]
+
+        branches = await branch_runs(registry, run_id)
+        assert branches["review-1"].status == StageRunStatus.FAILED
+        assert branches["review-1"].error_message == "cannot spawn reviewer-1"
+        assert branches["review-0"].status == branches["review-2"].status == StageRunStatus.WAITING
+
+        # The stage still resolves once the launched branches finish
+        await engine.on_agent_complete("reviewer-0-agent")
+        await engine.on_agent_complete("reviewer-2-agent")
+        parent = await registry.get_latest_stage_run(run_id, "reviews")
+        assert parent.status == StageRunStatus.FAILED
+        assert parent.error_message == "One or more parallel branches failed"
+
+    async def test_skipped_branches_created_in_one_batch(self, registry):
+        defn = review_fan_out(1)
+        defn.stages[0].branches += [
+            ParallelBranch(id=f"skip-{i}", agent="x", condition={"labels_include": "never"})
+            for i in range(3)
+        ]
+        inserts: list[int] = []
+        create_parallel_branches = registry.create_parallel_branches
+
+        async def counting(parent, stage_runs):
+            inserts.append(len(stage_runs))
+            return await create_parallel_branches(parent, stage_runs)
+
+        registry.create_parallel_branches = counting
+        _, run_id = await start(registry, defn, SlowSpawner(delay=0))
+
+        assert inserts == [4]
+        branches = await branch_runs(registry, run_id)
+        assert [branches[f"skip-{i}"].status for i in range(3)] == [StageRunStatus.SKIPPED] * 3
+        assert len({b.id for b in branches.values()}) == 4
+
+
+async def test_branch_runs_get_ids_in_order(registry):
+    await registry.create_pipeline_run(
+        PipelineRun(run_id="r", pipeline_name="p", definition_snapshot="{}")
+    )
+    parent = StageRun(run_id="r", stage_id="fan", status=StageRunStatus.WAITING)
+    parent.id = await registry.create_stage_run(parent)
+    ids = await registry.create_parallel_branches(
+        parent, [StageRun(run_id="r", stage_id=f"fan/b{i}", branch_id=f"b{i}") for i in range(3)]
+    )
+    assert [(await registry.get_stage_run(i)).stage_id for i in ids] == [
+        "fan/b0",
+        "fan/b1",
+        "fan/b2",
+    ]
+    assert await registry.create_parallel_branches(parent, []) == []
@@ -744,3 +744,88 @@ class TestCleanup:
         reqs_43 = await registry.get_pr_requirements(43)
         assert len(reqs_43) == 1
         assert reqs_43[0]["role"] == "security"
+
+
+# ── Content-Addressed Definition Snapshots ───────────────────────────────────
+
+
+_LEGACY_PIPELINE_RUNS_SQL = """
+CREATE TABLE pipeline_runs (
+    run_id TEXT PRIMARY KEY,
+    pipeline_name TEXT NOT NULL,
+    definition_snapshot TEXT NOT NULL DEFAULT '{}',
+    trigger_event TEXT,
+    trigger_delivery_id TEXT UNIQUE,
+    issue_number INTEGER,
+    pr_number INTEGER,
+    scope TEXT DEFAULT 'single-pr',
+    parent_run_id TEXT REFERENCES pipeline_runs(run_id),
+    parent_stage_id TEXT,
+    nesting_depth INTEGER DEFAULT 0,
+    status TEXT DEFAULT 'pending',
+    current_stage_id TEXT,
+    context TEXT DEFAULT '{}',
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    started_at TEXT,
+    completed_at TEXT,
+    error_message TEXT,
+    error_stage_id TEXT
+);
+"""
+
+
+async def _columns(db: aiosqlite.Connection, table: str) -> set[str]:
+    cursor = await db.execute(f"PRAGMA table_info({table})")
+    return {row[1] for row in await cursor.fetchall()}
+
+
+class TestDefinitionSnapshots:
+    @pytest.mark.asyncio
+    async def test_runs_share_one_definition_row(self, registry: PipelineRegistry, db):
+        snapshot = '{"stages": [{"id": "a"}]}'
+        for run_id in ("run-a", "run-b"):
+            await registry.create_pipeline_run(
+                make_pipeline_run(run_id, definition_snapshot=snapshot)
+            )
+
+        cursor = await db.execute("SELECT COUNT(*) FROM pipeline_definitions")
+        assert (await cursor.fetchone())[0] == 1
+        assert "definition_snapshot" not in await _columns(db, "pipeline_runs")
+
+        # A fresh registry (cold in-memory cache) resolves the hash from the table
+        fresh = PipelineRegistry(db)
+        fetched = await fresh.get_pipeline_run("run-b")
+        assert fetched is not None
+        assert fetched.definition_snapshot == snapshot
+        assert fetched.definition_hash == await fresh.store_definition(snapshot)
+
+    @pytest.mark.asyncio
+    async def test_migrates_inline_snapshots(self, db):
+        await db.executescript(_LEGACY_PIPELINE_RUNS_SQL)
+        await db.executemany(
+            "INSERT INTO pipeline_runs (run_id, pipeline_name, definition_snapshot, status) "
+            "VALUES (?, 'p', ?, 'running')",
+            [("run-1", '{"v": 1}'), ("run-2", '{"v": 1}'), ("run-3", '{"v": 2}')],
+        )
+        await db.commit()
+
+        registry = PipelineRegistry(db)
+        await registry.initialize()
+
+        columns = await _columns(db, "pipeline_runs")
+        assert "definition_hash" in columns
+        assert "definition_snapshot" not in columns
+        cursor = await db.execute("SELECT COUNT(*) FROM pipeline_definitions")
+        assert (await cursor.fetchone())[0] == 2
+
+        active = await PipelineRegistry(db).get_active_pipeline_runs()
+        assert {r.run_id: r.definition_snapshot for r in active} == {
+            "run-1": '{"v": 1}',
+            "run-2": '{"v": 1}',
+            "run-3": '{"v": 2}',
+        }
+
+        # Running the migration again is a no-op
+        await registry.initialize()
+        await registry.create_pipeline_run(make_pipeline_run("run-4"))
+        assert len(await registry.get_active_pipeline_runs()) == 4
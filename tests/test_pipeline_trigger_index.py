@@ -0,0 +1,155 @@
+"""Tests for the event-type trigger index used by PipelineEngine.evaluate_event."""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from squadron.pipeline.engine import PipelineEngine
+from squadron.pipeline.gates import GateCheckRegistry
+from squadron.pipeline.models import PipelineDefinition, StageDefinition, TriggerDefinition
+from squadron.pipeline.trigger_index import TriggerIndex
+
+
+def make_pipeline(event: str | None, **conditions: Any) -> PipelineDefinition:
+    return PipelineDefinition(
+        trigger=TriggerDefinition(event=event, conditions=conditions) if event else None,
+        stages=[StageDefinition(id="review", type="agent", agent="reviewer")],
+    )
+
+
+def labeled(label: str) -> dict[str, Any]:
+    return {"label": {"name": label}, "pull_request": {"number": 1}}
+
+
+class TestTriggerIndex:
+    def test_only_pipelines_for_the_event_type(self):
+        index = TriggerIndex(
+            {
+                "opened": make_pipeline("pull_request.opened"),
+                "closed": make_pipeline("pull_request.closed"),
+                "sub": make_pipeline(None),
+            }
+        )
+        assert len(index) == 2
+        assert [n for n, _ in index.candidates("pull_request.opened", {})] == ["opened"]
+        assert index.candidates("push", {}) == []
+
+    def test_label_prefilter(self):
+        index = TriggerIndex(
+            {
+                "security": make_pipeline("pull_request.labeled", label="security"),
+                "any": make_pipeline("pull_request.labeled"),
+                "docs": make_pipeline("pull_request.labeled", label="docs"),
+            }
+        )
+        names = [n for n, _ in index.candidates("pull_request.labeled", labeled("docs"))]
+        assert names == ["any", "docs"]  # registration order
+
+    def test_base_branch_prefilter(self):
+        index = TriggerIndex(
+            {
+                "main": make_pipeline("pull_request.opened", base_branch="main"),
+                "release": make_pipeline("pull_request.opened", base_branch="release"),
+            }
+        )
+        payload = {"pull_request": {"number": 1, "base": {"ref": "release"}}}
+        assert [n for n, _ in index.candidates("pull_request.opened", payload)] == ["release"]
+
+    def test_matching_applies_remaining_conditions(self):
+        index = TriggerIndex(
+            {
+                "draft": make_pipeline("pull_request.opened", draft=True),
+                "all": make_pipeline("pull_request.opened"),
+            }
+        )
+        assert [n for n, _ in index.matching("pull_request.opened", {"draft": False})] == ["all"]
+        assert len(index.candidates("pull_request.opened", {"draft": False})) == 2
+
+
+class TestEngineTriggerIndex:
+    def _engine(self) -> PipelineEngine:
+        registry = MagicMock()
+        registry.get_running_pipelines_for_pr = AsyncMock(return_value=[])
+        return PipelineEngine(registry, GateCheckRegistry())
+
+    def test_rebuilt_when_definitions_change(self):
+        engine = self._engine()
+        engine.add_pipeline("a", make_pipeline("pull_request.opened"))
+        assert engine._triggers().event_types == {"pull_request.opened"}
+
+        engine.add_pipeline("b", make_pipeline("issues.labeled", label="bug"))
+        assert engine._triggers().event_types == {"pull_request.opened", "issues.labeled"}
+
+        engine.clear_pipelines()
+        assert len(engine._triggers()) == 0
+        assert engine.list_pipelines() == []
+
+    async def test_unrelated_event_does_not_match_triggers(self):
+        engine = self._engine()
+        engine.add_pipeline("a", make_pipeline("pull_request.opened"))
+        engine._route_reactive_event = AsyncMock()
+
+        with patch.object(TriggerDefinition, "matches", return_value=False) as matches:
+            assert await engine.evaluate_event("push", {"ref": "refs/heads/main"}) is None
+        matches.assert_not_called()
+
+
+# ── Benchmark ────────────────────────────────────────────────────────────────
+
+BENCH_PIPELINES = 500
+BENCH_EVENTS = 2000
+
+
+def _bench_pipelines() -> dict[str, PipelineDefinition]:
+    events = ["pull_request.opened", "pull_request.labeled", "issues.labeled", "push"]
+    pipelines: dict[str, PipelineDefinition] = {}
+    for i in range(BENCH_PIPELINES):
+        event = events[i % len(events)]
+        conditions = {"label": f"label-{i}"} if event.endswith(".labeled") else {}
+        pipelines[f"pipeline-{i}"] = make_pipeline(event, **conditions)
+    return pipelines
+
+
+@pytest.mark.benchmark
+def test_trigger_matching_with_many_pipelines(bench_history):
+    """Indexed vs. linear trigger matching over hundreds of pipeline definitions.
+
+    Set ``SQUADRON_BENCH_HISTORY=path.jsonl`` to append the result.
+    """
+    pipelines = _bench_pipelines()
+    index = TriggerIndex(pipelines)
+    events = [
+        ("pull_request.labeled", labeled("label-1")),
+        ("issue_comment.created", {"issue": {"number": 1}}),
+        ("check_run.completed", {}),
+        ("issues.labeled", labeled("unknown")),
+    ]
+
+    def linear(event_type, payload):
+        return [
+            (name, d)
+            for name, d in pipelines.items()
+            if d.trigger and d.trigger.matches(event_type, payload)
+        ]
+
+    timings: dict[str, float] = {}
+    for mode, match in (("linear", linear), ("indexed", index.matching)):
+        started = time.perf_counter()
+        for i in range(BENCH_EVENTS):
+            event_type, payload = events[i % len(events)]
+            match(event_type, payload)
+        timings[mode] = (time.perf_counter() - started) / BENCH_EVENTS * 1e6
+
+    for event_type, payload in events:
+        assert index.matching(event_type, payload) == linear(event_type, payload)
+
+    bench_history(
+        "trigger_matching",
+        pipelines=BENCH_PIPELINES,
+        **{f"{mode}_us_per_event": round(us, 2) for mode, us in timings.items()},
+    )
+    assert timings["indexed"] < timings["linear"]
@@ -0,0 +1,189 @@
+"""Tests for the stage worker pool and engine stage submission."""
+
+from __future__ import annotations
+
+import asyncio
+
+import aiosqlite
+import pytest
+import pytest_asyncio
+
+from squadron.pipeline.engine import PipelineEngine
+from squadron.pipeline.gates import GateCheck, GateCheckRegistry, GateCheckResult
+from squadron.pipeline.models import (
+    GateConditionConfig,
+    PipelineDefinition,
+    PipelineRunStatus,
+    StageDefinition,
+    StageRunStatus,
+    TriggerDefinition,
+)
+from squadron.pipeline.registry import PipelineRegistry
+from squadron.pipeline.workers import StageWorkerPool
+
+
+@pytest_asyncio.fixture
+async def pool():
+    p = StageWorkerPool(workers=2)
+    await p.start()
+    yield p
+    await p.stop()
+
+
+class TestStageWorkerPool:
+    async def test_jobs_for_one_run_are_serialized(self, pool):
+        order: list[str] = []
+        running = 0
+        overlap = False
+
+        def job(name: str):
+            async def run() -> None:
+                nonlocal running, overlap
+                running += 1
+                overlap = overlap or running > 1
+                await asyncio.sleep(0.01)
+                order.append(name)
+                running -= 1
+
+            return run
+
+        for name in ("a", "b", "c"):
+            pool.submit("run-1", job(name))
+        await asyncio.wait_for(pool.drain(), 5)
+        assert order == ["a", "b", "c"]
+        assert not overlap
+
+    async def test_runs_execute_concurrently_up_to_worker_count(self, pool):
+        running = 0
+        peak = 0
+
+        async def job() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        for i in range(5):
+            pool.submit(f"run-{i}", job)
+        await asyncio.sleep(0.005)
+        stats = pool.stats()
+        assert stats["busy"] == 2
+        assert stats["saturation"] == 1.0
+        assert stats["queued"] == 3
+
+        await asyncio.wait_for(pool.drain(), 5)
+        assert peak == 2
+        stats = pool.stats()
+        assert stats["completed"] == stats["submitted"] == 5
+        assert stats["queue_wait_ms"]["count"] == 5
+        assert stats["queue_wait_ms"]["max"] >= stats["queue_wait_ms"]["p50"] > 0
+
+    async def test_failed_job_does_not_block_the_run(self, pool):
+        done: list[str] = []
+
+        async def boom() -> None:
+            raise RuntimeError("boom")
+
+        async def ok() -> None:
+            done.append("ok")
+
+        pool.submit("run-1", boom, "boom")
+        pool.submit("run-1", ok)
+        await asyncio.wait_for(pool.drain(), 5)
+        assert done == ["ok"]
+        assert pool.stats()["failed"] == 1
+
+    async def test_jobs_may_submit_more_work(self, pool):
+        done: list[str] = []
+
+        async def child() -> None:
+            done.append("child")
+
+        async def parent() -> None:
+            pool.submit("run-2", child)
+            pool.submit("run-1", child)
+            done.append("parent")
+
+        pool.submit("run-1", parent)
+        await asyncio.wait_for(pool.drain(), 5)
+        assert done == ["parent", "child", "child"]
+
+
+# ── Engine integration ───────────────────────────────────────────────────────
+
+
+class SlowCheck(GateCheck):
+    """Blocks until released, like a long-running CommandCheck."""
+
+    reactive_events = {"check_run.completed"}
+
+    def __init__(self) -> None:
+        self.release = asyncio.Event()
+
+    async def evaluate(self, config, context):
+        await self.release.wait()
+        return GateCheckResult(passed=True, message="done")
+
+
+@pytest_asyncio.fixture
+async def registry(tmp_path):
+    async with aiosqlite.connect(str(tmp_path / "workers.db")) as conn:
+        conn.row_factory = aiosqlite.Row
+        reg = PipelineRegistry(conn)
+        await reg.initialize()
+        yield reg
+
+
+@pytest.fixture
+def slow_check():
+    return SlowCheck()
+
+
+@pytest.fixture
+def engine(registry, slow_check):
+    gates = GateCheckRegistry()
+    gates.register("slow", slow_check)
+    eng = PipelineEngine(registry, gates)
+    eng.add_pipeline(
+        "gated",
+        PipelineDefinition(
+            trigger=TriggerDefinition(event="pull_request.opened"),
+            stages=[
+                StageDefinition(
+                    id="gate", type="gate", conditions=[GateConditionConfig(check="slow")]
+                ),
+            ],
+        ),
+    )
+    return eng
+
+
+class TestEngineSubmission:
+    async def test_slow_gate_does_not_block_routing(self, engine, registry, pool, slow_check):
+        engine.set_worker_pool(pool)
+
+        first = await asyncio.wait_for(
+            engine.evaluate_event("pull_request.opened", {"pull_request": {"number": 1}}), 1
+        )
+        second = await asyncio.wait_for(
+            engine.evaluate_event("pull_request.opened", {"pull_request": {"number": 2}}), 1
+        )
+        await asyncio.sleep(0.01)
+        assert pool.stats()["busy"] == 2
+
+        slow_check.release.set()
+        await asyncio.wait_for(pool.drain(), 5)
+        for run in (first, second):
+            stored = await registry.get_pipeline_run(run.run_id)
+            assert stored.status == PipelineRunStatus.COMPLETED
+        assert engine.worker_stats()["completed"] == 2
+
+    async def test_inline_without_pool(self, engine, registry, slow_check):
+        slow_check.release.set()
+        run = await engine.evaluate_event("pull_request.opened", {"pull_request": {"number": 1}})
+        stored = await registry.get_pipeline_run(run.run_id)
+        assert stored.status == PipelineRunStatus.COMPLETED
+        stage = await registry.get_latest_stage_run(run.run_id, "gate")
+        assert stage.status == StageRunStatus.COMPLETED
+        assert engine.worker_stats() is None
@@ -10,8 +10,9 @@ Covers:
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import FastAPI
@@ -213,6 +214,58 @@ class TestNewEventTypes:
         assert event.metadata["session_id"] == "sess-123"
 
 
+class TestSseFrames:
+    """SSE frames are encoded once and shared across subscribers."""
+
+    def test_log_record_frame_cached(self):
+        from squadron.log_buffer import LogRecord
+
+        entry = LogRecord(timestamp="t1", level="INFO", name="test", message="hello")
+        frame = entry.to_sse_frame()
+        assert frame.startswith(b"event: log\ndata: {")
+        assert b'"message": "hello"' in frame
+        assert entry.to_sse_frame() is frame
+
+    async def test_pipeline_event_frame_shared(self):
+        import squadron.dashboard as dashboard_mod
+
+        queues = [asyncio.Queue(), asyncio.Queue()]
+        dashboard_mod._pipeline_subscribers[:] = queues
+        try:
+            dashboard_mod._publish_pipeline_event("pipeline_cancelled", {"run_id": "r1"})
+            a, b = queues[0].get_nowait(), queues[1].get_nowait()
+        finally:
+            dashboard_mod._pipeline_subscribers.clear()
+
+        assert a is b
+        assert a.frame.startswith(b"event: pipeline_cancelled\ndata: ")
+        assert b'"run_id": "r1"' in a.frame
+
+    async def test_pipeline_slow_subscriber_drops_oldest(self):
+        import squadron.dashboard as dashboard_mod
+
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        dashboard_mod._pipeline_subscribers[:] = [queue]
+        try:
+            for run_id in ("r1", "r2", "r3"):
+                dashboard_mod._publish_pipeline_event("pipeline_cancelled", {"run_id": run_id})
+            assert dashboard_mod._pipeline_subscribers == [queue]
+        finally:
+            dashboard_mod._pipeline_subscribers.clear()
+
+        assert [queue.get_nowait().data["run_id"] for _ in range(2)] == ["r2", "r3"]
+
+    async def test_log_slow_subscriber_drops_oldest(self):
+        from squadron.log_buffer import LogBuffer, LogRecord
+
+        buf = LogBuffer()
+        queue = await buf.subscribe()
+        for i in range(queue.maxsize + 1):
+            buf._sync_broadcast(LogRecord(timestamp="t", level="INFO", name="n", message=f"m{i}"))
+        assert buf._subscribers == [queue]
+        assert queue.get_nowait()["message"] == "m1"
+
+
 # ── Dashboard /logs endpoint tests ───────────────────────────────────────────
 
 
@@ -366,103 +419,49 @@ class TestLogStreamEndpoint:
 # ── Heartbeat bugfix tests ───────────────────────────────────────────────────
 
 
-class TestHeartbeatUsesThread:
-    """Bug #1: Heartbeat must run on a dedicated thread, not an asyncio task."""
-
-    @pytest.mark.asyncio
-    async def test_start_heartbeat_creates_stop_event(self):
-        """_start_heartbeat should populate _heartbeat_stops with a threading.Event."""
-        import threading
-        from unittest.mock import MagicMock
+class TestHeartbeatUsesSupervisor:
+    """Bug #1: Heartbeats must not run on the event loop (now: the shared supervisor thread)."""
 
+    def test_start_heartbeat_tracks_record(self):
+        """_start_heartbeat should register the live record with the supervisor."""
         from squadron.agent_manager import AgentManager
 
         mgr = MagicMock(spec=AgentManager)
-        mgr._heartbeat_stops = {}
-        mgr.registry = MagicMock()
+        mgr._supervisor = MagicMock()
 
         record = MagicMock()
         record.agent_id = "test-agent-hb"
-        record.issue_number = 1
-        record.pr_number = None
 
-        # Call the real method — must be within an async context so
-        # asyncio.get_running_loop() succeeds inside _start_heartbeat
         AgentManager._start_heartbeat(mgr, record)
 
-        assert "test-agent-hb" in mgr._heartbeat_stops
-        assert isinstance(mgr._heartbeat_stops["test-agent-hb"], threading.Event)
-
-        # Cleanup: signal the thread to stop
-        mgr._heartbeat_stops["test-agent-hb"].set()
-
-    def test_stop_heartbeat_signals_event(self):
-        """_stop_heartbeat should set the threading.Event and remove from dict."""
-        import threading
-        from unittest.mock import MagicMock
+        mgr._supervisor.track.assert_called_once_with(record)
 
+    def test_stop_heartbeat_untracks(self):
+        """_stop_heartbeat should drop the agent from the supervisor."""
         from squadron.agent_manager import AgentManager
+        from squadron.supervisor import AgentSupervisor
 
         mgr = MagicMock(spec=AgentManager)
-        stop_event = threading.Event()
-        mgr._heartbeat_stops = {"agent-1": stop_event}
+        mgr._supervisor = AgentSupervisor(MagicMock(), on_watchdog=lambda *a: None)
+        record = MagicMock()
+        record.agent_id = "agent-1"
+        mgr._supervisor.track(record)
 
         AgentManager._stop_heartbeat(mgr, "agent-1")
 
-        assert stop_event.is_set()
-        assert "agent-1" not in mgr._heartbeat_stops
+        assert "agent-1" not in mgr._supervisor.liveness()
 
     def test_stop_heartbeat_noop_for_unknown_agent(self):
         """_stop_heartbeat should be safe to call for non-existent agents."""
-        from unittest.mock import MagicMock
-
         from squadron.agent_manager import AgentManager
+        from squadron.supervisor import AgentSupervisor
 
         mgr = MagicMock(spec=AgentManager)
-        mgr._heartbeat_stops = {}
+        mgr._supervisor = AgentSupervisor(MagicMock(), on_watchdog=lambda *a: None)
 
         # Should not raise
         AgentManager._stop_heartbeat(mgr, "no-such-agent")
 
-    def test_heartbeat_thread_fires_within_interval(self):
-        """The heartbeat thread should emit an event after the interval elapses."""
-        import asyncio
-        import threading
-        import time
-
-        from squadron.agent_manager import AgentManager
-
-        mgr = MagicMock(spec=AgentManager)
-        mgr.registry = MagicMock()
-        mgr._log_activity = AsyncMock()
-
-        loop = asyncio.new_event_loop()
-        stop_event = threading.Event()
-
-        # Patch the heartbeat to use a very short interval for testing.
-        # We can't easily change the 60s constant, so instead we test the
-        # thread mechanics by directly calling _heartbeat_thread with a
-        # pre-signaled stop event (fires immediately after first wait).
-        def signal_after_short_delay():
-            time.sleep(0.1)
-            stop_event.set()
-
-        timer = threading.Thread(target=signal_after_short_delay, daemon=True)
-        timer.start()
-
-        # Run in a thread (simulates the real call)
-        t = threading.Thread(
-            target=AgentManager._heartbeat_thread,
-            args=(mgr, "test-agent", 1, None, stop_event, loop),
-            daemon=True,
-        )
-        t.start()
-        t.join(timeout=2)
-
-        # Thread should have exited (stop_event was set before the 60s sleep completed)
-        assert not t.is_alive()
-        loop.close()
-
 
 class TestLogActivityErrorVisibility:
     """Bug #2: _log_activity failures must be logged at WARNING, not DEBUG."""
@@ -545,14 +544,13 @@ class TestLogBufferAttachLoop:
 
 
 class TestCleanupAgentStopsHeartbeat:
-    """Bug #6: _cleanup_agent must stop heartbeat to prevent orphaned threads."""
+    """Bug #6: _cleanup_agent must stop heartbeat so the agent is no longer supervised."""
 
     @pytest.mark.asyncio
     async def test_cleanup_stops_heartbeat(self):
         """_cleanup_agent should call _stop_heartbeat for the agent."""
-        import threading
-
         from squadron.agent_manager import AgentManager
+        from squadron.supervisor import AgentSupervisor
 
         mgr = MagicMock(spec=AgentManager)
         mgr._copilot_agents = {}
@@ -560,13 +558,18 @@ class TestCleanupAgentStopsHeartbeat:
         mgr._watchdog_enforced = set()
         mgr.agent_mail_queues = {}
         mgr.agent_inboxes = {}
+        mgr._admission = MagicMock()
+        mgr._keepalive = MagicMock()
+        mgr._wake_started = {}
 
-        stop_event = threading.Event()
-        mgr._heartbeat_stops = {"agent-cleanup": stop_event}
+        mgr._supervisor = AgentSupervisor(MagicMock(), on_watchdog=lambda *a: None)
+        record = MagicMock()
+        record.agent_id = "agent-cleanup"
+        mgr._supervisor.track(record)
 
         # Make all the methods that _cleanup_agent calls behave:
         # - _cancel_watchdog: already a MagicMock from spec
-        # - _stop_heartbeat: use real impl so we can verify stop_event is set
+        # - _stop_heartbeat: use real impl so we can verify the agent is untracked
         mgr._stop_heartbeat = lambda aid: AgentManager._stop_heartbeat(mgr, aid)
         # - _sandbox.teardown_session: async mock
         mgr._sandbox = MagicMock()
@@ -579,142 +582,49 @@ class TestCleanupAgentStopsHeartbeat:
 
         await AgentManager._cleanup_agent(mgr, "agent-cleanup")
 
-        # Heartbeat stop event should have been signaled
-        assert stop_event.is_set()
-        assert "agent-cleanup" not in mgr._heartbeat_stops
+        assert "agent-cleanup" not in mgr._supervisor.liveness()
 
 
 class TestNoActivityAlert:
     """Phase 3: Heartbeat emits a NO-ACTIVITY ALERT after 120s with 0 tool calls."""
 
+    def _beat_after(self, record, elapsed):
+        from squadron.supervisor import AgentSupervisor
+
+        supervisor = AgentSupervisor(MagicMock(), on_watchdog=lambda *a: None)
+        supervisor.track(record)
+        supervisor._liveness[record.agent_id].started -= elapsed
+        with supervisor._cond:  # beats run on the supervisor thread with the lock held
+            supervisor._beat(record.agent_id)
+        return supervisor
+
     def test_no_activity_warning_logged(self, caplog):
         """If 120s pass with 0 tool calls and 0 turns, a WARNING is logged."""
-        import asyncio
-        import logging
-        import threading
-        import time
-
-        from squadron.agent_manager import AgentManager
+        record = MagicMock(agent_id="test-no-activity", tool_call_count=0, turn_count=0)
 
-        mgr = MagicMock(spec=AgentManager)
-        mgr.registry = MagicMock()
-        # Simulate an agent with 0 tool calls / 0 turns
-        mock_agent = MagicMock()
-        mock_agent.tool_call_count = 0
-        mock_agent.turn_count = 0
-        mgr.registry.get_agent = AsyncMock(return_value=mock_agent)
-        mgr._log_activity = AsyncMock()
+        with caplog.at_level(logging.WARNING, logger="squadron.supervisor"):
+            supervisor = self._beat_after(record, 130)
+            with supervisor._cond:
+                supervisor._beat(record.agent_id)  # alerts only once
 
-        loop = asyncio.new_event_loop()
-        stop_event = threading.Event()
-
-        # We need to simulate elapsed >= 120s. We'll monkey-patch time.monotonic
-        # to fast-forward time. The thread uses `stop_event.wait(timeout=60)` which
-        # we can't easily accelerate, so we use a different approach: signal stop
-        # after a short delay and verify the warning happens for elapsed >= 120s.
-        #
-        # Instead, directly test the logic by calling _heartbeat_thread with a mock
-        # that makes time.monotonic return values > 120s ahead.
-        original_monotonic = time.monotonic
-        call_count = 0
-
-        def fake_wait(timeout=None):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                # After first iteration, stop
-                stop_event.set()
-                return True
-            # First call: simulate that 60s passed (returns False = not stopped)
-            return False
-
-        # Patch the stop_event.wait to not actually wait
-        stop_event.wait = fake_wait
-
-        # Patch time.monotonic to simulate 130s elapsed
-        start_time = original_monotonic()
-
-        def fast_monotonic():
-            if call_count >= 1:
-                return start_time + 130  # 130s elapsed
-            return start_time
-
-        with (
-            caplog.at_level(logging.WARNING, logger="squadron.agent_manager"),
-            patch("time.monotonic", side_effect=fast_monotonic),
-        ):
-            AgentManager._heartbeat_thread(mgr, "test-no-activity", 1, None, stop_event, loop)
-
-        # Should have logged a NO-ACTIVITY ALERT warning
         warnings = [
             r
             for r in caplog.records
             if r.levelno >= logging.WARNING and "NO-ACTIVITY ALERT" in r.message
         ]
-        assert len(warnings) >= 1
+        assert len(warnings) == 1
         assert "test-no-activity" in warnings[0].message
-
-        loop.close()
+        assert supervisor.stats()["no_activity"] == ["test-no-activity"]
 
     def test_no_activity_warning_not_fired_when_active(self, caplog):
         """No warning if the agent has non-zero tool calls."""
-        import asyncio
-        import logging
-        import threading
-        import time
-
-        from squadron.agent_manager import AgentManager
-
-        mgr = MagicMock(spec=AgentManager)
-        mgr.registry = MagicMock()
-        mock_agent = MagicMock()
-        mock_agent.tool_call_count = 5
-        mock_agent.turn_count = 2
-        mgr.registry.get_agent = AsyncMock(return_value=mock_agent)
-        mgr._log_activity = AsyncMock()
-
-        loop = asyncio.new_event_loop()
-        stop_event = threading.Event()
-
-        original_monotonic = time.monotonic
-        call_count = 0
-
-        def fake_wait(timeout=None):
-            nonlocal call_count
-            call_count += 1
-            if call_count >= 2:
-                stop_event.set()
-                return True
-            return False
-
-        stop_event.wait = fake_wait
+        record = MagicMock(agent_id="test-active-agent", tool_call_count=5, turn_count=2)
 
-        start_time = original_monotonic()
+        with caplog.at_level(logging.WARNING, logger="squadron.supervisor"):
+            self._beat_after(record, 130)
 
-        def fast_monotonic():
-            if call_count >= 1:
-                return start_time + 130
-            return start_time
-
-        # Run the event loop in a background thread so that
-        # run_coroutine_threadsafe can actually execute coroutines.
-        loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
-        loop_thread.start()
-
-        try:
-            with (
-                caplog.at_level(logging.WARNING, logger="squadron.agent_manager"),
-                patch("time.monotonic", side_effect=fast_monotonic),
-            ):
-                AgentManager._heartbeat_thread(mgr, "test-active-agent", 1, None, stop_event, loop)
-
-            # Should NOT have a NO-ACTIVITY ALERT (agent has tool_call_count=5)
-            warnings = [r for r in caplog.records if "NO-ACTIVITY ALERT" in r.message]
-            assert len(warnings) == 0
-        finally:
-            loop.call_soon_threadsafe(loop.stop)
-            loop_thread.join(timeout=2)
-            loop.close()
+        warnings = [r for r in caplog.records if "NO-ACTIVITY ALERT" in r.message]
+        assert len(warnings) == 0
 
 
 class TestCleanupAgentStderrCapture:
@@ -740,7 +650,10 @@ class TestCleanupAgentStderrCapture:
         mgr._watchdog_enforced = set()
         mgr.agent_mail_queues = {}
         mgr.agent_inboxes = {}
-        mgr._heartbeat_stops = {}
+        mgr._supervisor = MagicMock()
+        mgr._keepalive = MagicMock()
+        mgr._wake_started = {}
+        mgr._admission = MagicMock()
         mgr._stop_heartbeat = lambda aid: AgentManager._stop_heartbeat(mgr, aid)
         mgr._sandbox = MagicMock()
         mgr._sandbox.teardown_session = AsyncMock()
@@ -777,7 +690,10 @@ class TestCleanupAgentStderrCapture:
         mgr._watchdog_enforced = set()
         mgr.agent_mail_queues = {}
         mgr.agent_inboxes = {}
-        mgr._heartbeat_stops = {}
+        mgr._supervisor = MagicMock()
+        mgr._keepalive = MagicMock()
+        mgr._wake_started = {}
+        mgr._admission = MagicMock()
         mgr._stop_heartbeat = lambda aid: AgentManager._stop_heartbeat(mgr, aid)
         mgr._sandbox = MagicMock()
         mgr._sandbox.teardown_session = AsyncMock()
@@ -808,7 +724,10 @@ class TestCleanupAgentStderrCapture:
         mgr._watchdog_enforced = set()
         mgr.agent_mail_queues = {}
         mgr.agent_inboxes = {}
-        mgr._heartbeat_stops = {}
+        mgr._supervisor = MagicMock()
+        mgr._keepalive = MagicMock()
+        mgr._wake_started = {}
+        mgr._admission = MagicMock()
         mgr._stop_heartbeat = lambda aid: AgentManager._stop_heartbeat(mgr, aid)
         mgr._sandbox = MagicMock()
         mgr._sandbox.teardown_session = AsyncMock()
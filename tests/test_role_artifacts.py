@@ -0,0 +1,204 @@
+"""Tests for per-role compiled session artifacts and compiled Squadron tools.
+
+Covers:
+- Artifacts compiled once per role and reused across spawns
+- Recompilation when the agent definition or config changes (config reload)
+- Prompt rendering binds per-issue values on top of role-level values
+- Tool schemas compiled once; bound tools dispatch to the calling agent
+- Warm preparation is much cheaper than the first (cold) one
+"""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from copilot import define_tool
+
+from squadron.config import (
+    AgentDefinition,
+    AgentRoleConfig,
+    CircuitBreakerConfig,
+    ProjectConfig,
+    SquadronConfig,
+)
+from squadron.models import AgentRecord, AgentStatus, SquadronEvent, SquadronEventType
+from squadron.tools.squadron_tools import ALL_TOOL_NAMES, SquadronTools
+
+PROMPT = (
+    "You work on {project_name} issue #{issue_number} ({issue_title}) "
+    "on {branch_name}, max {max_tool_calls} tool calls."
+)
+
+
+def _manager(prompt: str = PROMPT, **config_overrides):
+    from squadron.agent_manager import AgentManager
+
+    config = SquadronConfig(
+        project=ProjectConfig(name="squadron", owner="o", repo="r"),
+        agent_roles={
+            "feat-dev": AgentRoleConfig(agent_definition="feat-dev.md", subagents=["helper"])
+        },
+        **config_overrides,
+    )
+    definitions = {
+        "feat-dev": AgentDefinition(
+            role="feat-dev",
+            raw_content=prompt,
+            prompt=prompt,
+            tools=["comment_on_issue", "report_complete", "bash"],
+        ),
+        "helper": AgentDefinition(role="helper", raw_content="Help.", prompt="Help."),
+    }
+    return AgentManager(
+        config=config,
+        registry=AsyncMock(),
+        github=AsyncMock(),
+        router=MagicMock(),
+        agent_definitions=definitions,
+        repo_root=Path("/tmp/test"),
+    )
+
+
+def _record(issue_number: int = 42) -> AgentRecord:
+    return AgentRecord(
+        agent_id=f"feat-dev-issue-{issue_number}",
+        role="feat-dev",
+        issue_number=issue_number,
+        status=AgentStatus.ACTIVE,
+        branch=f"feat/issue-{issue_number}",
+    )
+
+
+def _event(title: str) -> SquadronEvent:
+    return SquadronEvent(
+        event_type=SquadronEventType.ISSUE_ASSIGNED,
+        data={"payload": {"issue": {"title": title, "body": ""}}},
+    )
+
+
+class TestRoleArtifactCache:
+    def test_compiled_once_per_role(self):
+        manager = _manager()
+        with patch.object(
+            manager, "_build_custom_agents", wraps=manager._build_custom_agents
+        ) as build:
+            first = manager._role_artifacts_for("feat-dev")
+            for _ in range(5):
+                assert manager._role_artifacts_for("feat-dev") is first
+        build.assert_called_once()
+        assert manager.role_artifact_stats() == {"roles": ["feat-dev"], "hits": 5, "compiles": 1}
+
+        assert first.custom_tool_names == ["comment_on_issue", "report_complete"]
+        assert first.available_tools == ["comment_on_issue", "report_complete", "bash"]
+        assert [a["name"] for a in first.custom_agents] == ["helper"]
+
+    def test_definition_change_recompiles(self):
+        manager = _manager()
+        first = manager._role_artifacts_for("feat-dev")
+        # Config reload swaps in freshly parsed definitions
+        manager.agent_definitions = {
+            **manager.agent_definitions,
+            "feat-dev": AgentDefinition(role="feat-dev", raw_content="New", prompt="New"),
+        }
+        second = manager._role_artifacts_for("feat-dev")
+        assert second is not first
+        assert second.prompt_template == "New"
+        assert second.fingerprint != first.fingerprint
+
+    def test_subagent_and_config_changes_recompile(self):
+        manager = _manager()
+        first = manager._role_artifacts_for("feat-dev")
+        manager.agent_definitions["helper"] = AgentDefinition(
+            role="helper", raw_content="Help more.", prompt="Help more."
+        )
+        second = manager._role_artifacts_for("feat-dev")
+        assert second is not first
+
+        manager.config = manager.config.model_copy(
+            update={
+                "circuit_breakers": CircuitBreakerConfig(roles={"feat-dev": {"max_tool_calls": 7}})
+            }
+        )
+        third = manager._role_artifacts_for("feat-dev")
+        assert third.cb_limits.max_tool_calls == 7
+        assert third.prompt_values["max_tool_calls"] == "7"
+
+
+class TestPromptRendering:
+    def test_binds_issue_values(self):
+        manager = _manager()
+        artifacts = manager._role_artifacts_for("feat-dev")
+        record = _record(7)
+        rendered = artifacts.render_prompt(
+            manager._issue_prompt_values(record, _event("Fix login"))
+        )
+        assert rendered == (
+            "You work on squadron issue #7 (Fix login) on feat/issue-7, max 200 tool calls."
+        )
+        # Same result as the uncached interpolation
+        assert rendered == manager._interpolate_agent_def(PROMPT, record, _event("Fix login"))
+
+    def test_same_artifacts_serve_different_issues(self):
+        manager = _manager()
+        artifacts = manager._role_artifacts_for("feat-dev")
+        a = artifacts.render_prompt(manager._issue_prompt_values(_record(1), None))
+        b = artifacts.render_prompt(manager._issue_prompt_values(_record(2), None))
+        assert "#1" in a and "#2" in b
+
+    @pytest.mark.parametrize("prompt", ["Plain prompt without fields", "Broken {brace"])
+    def test_uninterpolated_prompts_are_returned_verbatim(self, prompt):
+        manager = _manager(prompt=prompt)
+        artifacts = manager._role_artifacts_for("feat-dev")
+        assert artifacts.interpolate is False
+        assert artifacts.render_prompt({"issue_number": "1"}) == prompt
+
+
+class TestCompiledTools:
+    def _tools(self) -> SquadronTools:
+        return SquadronTools(
+            registry=AsyncMock(), github=AsyncMock(), agent_inboxes={}, owner="o", repo="r"
+        )
+
+    def test_schemas_generated_once(self):
+        tools = self._tools()
+        with patch("squadron.tools.squadron_tools.define_tool", wraps=define_tool) as spy:
+            tools.get_tools("agent-1", ALL_TOOL_NAMES)
+            tools.get_tools("agent-2", ALL_TOOL_NAMES)
+        assert spy.call_count == len(ALL_TOOL_NAMES)
+
+    async def test_bound_tool_dispatches_to_its_agent(self):
+        tools = self._tools()
+        calls = []
+
+        async def check_for_events(agent_id, params):
+            calls.append(agent_id)
+            return "ok"
+
+        tools.check_for_events = check_for_events
+        (a,) = tools.get_tools("agent-a", ["check_for_events"])
+        (b,) = tools.get_tools("agent-b", ["check_for_events"])
+        assert a.parameters is b.parameters  # shared schema
+
+        invocation = {"session_id": "s", "tool_call_id": "1", "tool_name": "x", "arguments": {}}
+        result = await b.handler(invocation)
+        await a.handler(invocation)
+        assert result["resultType"] == "success"
+        assert calls == ["agent-b", "agent-a"]
+
+    def test_warm_preparation_is_cheaper(self):
+        manager = _manager()
+        record = _record()
+
+        def prepare():
+            started = time.perf_counter()
+            artifacts = manager._role_artifacts_for("feat-dev")
+            artifacts.render_prompt(manager._issue_prompt_values(record, None))
+            manager._tools.get_tools(record.agent_id, ALL_TOOL_NAMES)
+            return time.perf_counter() - started
+
+        cold = prepare()
+        warm = min(prepare() for _ in range(5))
+        assert warm < cold / 3
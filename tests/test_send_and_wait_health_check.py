@@ -3,13 +3,17 @@
 The SDK's send_and_wait() blocks on an asyncio.Event that only fires when
 the CLI emits SESSION_IDLE.  If the CLI process crashes before emitting
 that event, send_and_wait blocks until the circuit-breaker timeout (up to
-1800s).  The health-check wrapper polls the CLI process and raises
-immediately when it exits.
+1800s).  The health-check wrapper watches the CLI process (a pidfd on
+Linux, polling elsewhere) and raises immediately when it exits.
 """
 
 from __future__ import annotations
 
 import asyncio
+import os
+import subprocess
+import sys
+import time
 from unittest.mock import MagicMock
 
 import pytest
@@ -346,3 +350,80 @@ class TestHealthCheckRaceCondition:
             poll_interval=0.01,
         )
         assert result is sentinel
+
+
+# ── Tests: Event-driven exit detection ───────────────────────────────────────
+
+
+def _fake_cli(script: str) -> subprocess.Popen:
+    """Spawn a stand-in for the Copilot CLI the way the SDK does (plain Popen)."""
+    return subprocess.Popen([sys.executable, "-c", script], stdin=subprocess.PIPE)
+
+
+def _copilot_for(process: subprocess.Popen, stderr: str = ""):
+    copilot, _ = _make_copilot()
+    copilot._client._client.process = process
+    copilot.get_cli_stderr.return_value = stderr
+    return copilot
+
+
+@pytest.mark.skipif(not hasattr(os, "pidfd_open"), reason="pidfd requires Linux")
+class TestHealthCheckExitLatency:
+    """A real CLI crash is observed through the loop, not on the next poll."""
+
+    @pytest.mark.asyncio
+    async def test_crash_fails_send_and_wait(self):
+        """A CLI that exits on its own fails the pending call with its stderr."""
+        mgr = _make_manager()
+        process = _fake_cli("import sys, time; time.sleep(0.2); sys.exit(3)")
+        copilot = _copilot_for(process, stderr="panic: model API unreachable")
+        session = _make_session(hang_forever=True)
+
+        with pytest.raises(RuntimeError, match="code 3.*model API unreachable"):
+            await mgr._send_and_wait_with_health_check(
+                session, copilot, "test prompt", timeout=60.0, agent_id="test-agent"
+            )
+        assert process.returncode == 3  # reaped
+
+    @pytest.mark.asyncio
+    async def test_crash_latency_below_poll_interval(self):
+        """Kill-to-failure latency stays far below the 5s fallback poll interval."""
+        mgr = _make_manager()
+        process = _fake_cli("import time; time.sleep(60)")
+        copilot = _copilot_for(process)
+        session = _make_session(hang_forever=True)
+        killed_at = 0.0
+
+        async def _kill_soon():
+            nonlocal killed_at
+            await asyncio.sleep(0.1)
+            killed_at = time.monotonic()
+            process.kill()
+
+        killer = asyncio.create_task(_kill_soon())
+        with pytest.raises(RuntimeError, match="CLI process exited"):
+            await mgr._send_and_wait_with_health_check(
+                session, copilot, "test prompt", timeout=60.0, agent_id="test-agent"
+            )
+        latency = time.monotonic() - killed_at
+        await killer
+        assert latency < 0.5
+
+    @pytest.mark.asyncio
+    async def test_live_process_does_not_interfere(self):
+        """The watcher is torn down cleanly when send_and_wait finishes first."""
+        mgr = _make_manager()
+        process = _fake_cli("import time; time.sleep(60)")
+        try:
+            copilot = _copilot_for(process)
+            sentinel = object()
+            session = _make_session(result=sentinel, delay=0.05)
+
+            result = await mgr._send_and_wait_with_health_check(
+                session, copilot, "test prompt", timeout=60.0, agent_id="test-agent"
+            )
+            assert result is sentinel
+            assert process.poll() is None
+        finally:
+            process.kill()
+            process.wait()
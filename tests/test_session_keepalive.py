@@ -0,0 +1,329 @@
+"""Tests for keeping sleeping agents' CLI clients hot (SessionKeepAlive).
+
+Covers:
+- Blocker-type prediction and per-blocker TTLs (TTL 0 stops the CLI)
+- LRU eviction at max_sessions, when slots are needed and under memory pressure
+- Idle TTL expiry and disconnected hot clients
+- AgentManager sleep/wake reusing the hot client instead of starting a CLI
+- Wake latency with and without keep-alive (marker: benchmark)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from squadron.config import (
+    AgentDefinition,
+    AgentRoleConfig,
+    ProjectConfig,
+    RuntimeConfig,
+    SessionKeepAliveConfig,
+    SquadronConfig,
+)
+from squadron.models import AgentRecord, AgentStatus, SquadronEvent, SquadronEventType
+from squadron.resource_monitor import PressureSample
+from squadron.session_keepalive import (
+    ISSUE,
+    OTHER,
+    PR_REVIEW,
+    PREEMPTED,
+    SessionKeepAlive,
+    blocker_type,
+)
+
+
+class FakeCopilotAgent:
+    def __init__(self):
+        self.client = MagicMock()
+        self.client.get_state.return_value = "connected"
+        self.stopped = False
+        self.working_directory = None
+
+    async def stop(self):
+        self.stopped = True
+
+
+async def _keepalive(**kwargs) -> SessionKeepAlive:
+    keepalive = SessionKeepAlive(SessionKeepAliveConfig(enabled=True, **kwargs))
+    await keepalive.start()
+    return keepalive
+
+
+async def _settle() -> None:
+    await asyncio.sleep(0)
+
+
+def _record(agent_id: str = "feat-dev-issue-1", **kwargs) -> AgentRecord:
+    return AgentRecord(
+        agent_id=agent_id,
+        role="feat-dev",
+        issue_number=1,
+        status=AgentStatus.SLEEPING,
+        **kwargs,
+    )
+
+
+class TestPolicy:
+    def test_blocker_type(self):
+        assert blocker_type(_record(pr_number=5, blocked_by=[9])) == PR_REVIEW
+        assert blocker_type(_record(blocked_by=[9])) == ISSUE
+        assert blocker_type(_record()) == OTHER
+
+    async def test_ttl_per_blocker(self):
+        keepalive = await _keepalive(idle_ttl=60, blocker_ttls={PR_REVIEW: 900, ISSUE: 0})
+        assert keepalive.ttl_for(PR_REVIEW) == 900
+        assert keepalive.ttl_for(OTHER) == 60
+
+        long_sleep = FakeCopilotAgent()
+        assert keepalive.park("a", long_sleep, ISSUE) is False
+        assert keepalive.park("b", FakeCopilotAgent(), PR_REVIEW) is True
+        assert keepalive.stats()["hot"] == {"b": PR_REVIEW}
+        await keepalive.stop()
+
+    async def test_disabled_never_parks(self):
+        keepalive = SessionKeepAlive(SessionKeepAliveConfig())
+        await keepalive.start()
+        assert keepalive.park("a", FakeCopilotAgent(), PR_REVIEW) is False
+        await keepalive.stop()
+
+    async def test_take_returns_client_once(self):
+        keepalive = await _keepalive()
+        client = FakeCopilotAgent()
+        keepalive.park("a", client, PREEMPTED)
+        assert keepalive.take("a") is client
+        assert keepalive.take("a") is None
+        assert keepalive.stats()["hits"] == 1
+        assert client.stopped is False
+        await keepalive.stop()
+
+    async def test_disconnected_client_is_not_reused(self):
+        keepalive = await _keepalive()
+        client = FakeCopilotAgent()
+        keepalive.park("a", client, PR_REVIEW)
+        client.client.get_state.return_value = "disconnected"
+        assert keepalive.take("a") is None
+        await _settle()
+        assert client.stopped is True
+        await keepalive.stop()
+
+
+class TestEviction:
+    async def test_lru_evicted_at_max_sessions(self):
+        keepalive = await _keepalive(max_sessions=2)
+        clients = {name: FakeCopilotAgent() for name in "abc"}
+        for name, client in clients.items():
+            keepalive.park(name, client, PR_REVIEW)
+        await _settle()
+        assert list(keepalive.stats()["hot"]) == ["b", "c"]
+        assert clients["a"].stopped is True
+        assert keepalive.stats()["evicted"] == 1
+        await keepalive.stop()
+
+    async def test_make_room_for_running_agents(self):
+        keepalive = await _keepalive(max_sessions=4)
+        for name in "abc":
+            keepalive.park(name, FakeCopilotAgent(), PR_REVIEW)
+
+        keepalive.make_room(in_use=3, limit=4)
+        assert list(keepalive.stats()["hot"]) == ["c"]
+        keepalive.make_room(in_use=100, limit=0)  # unlimited concurrency
+        assert keepalive.is_hot("c")
+        await keepalive.stop()
+
+    async def test_idle_ttl_expires(self):
+        keepalive = await _keepalive(blocker_ttls={PREEMPTED: 1})
+        client = FakeCopilotAgent()
+        keepalive.park("a", client, PREEMPTED)
+        keepalive.park("b", FakeCopilotAgent(), PR_REVIEW)
+        keepalive._hot["a"].expires_at = time.monotonic() - 1
+        keepalive.expire()
+        await _settle()
+        assert client.stopped is True
+        assert list(keepalive.stats()["hot"]) == ["b"]
+        assert keepalive.stats()["expired"] == 1
+        await keepalive.stop()
+
+    async def test_memory_pressure_evicts_half(self):
+        keepalive = await _keepalive(interval=0.01, memory_available_low=15.0)
+        monitor = MagicMock()
+        monitor.pressure = AsyncMock(return_value=PressureSample(memory_available_percent=5.0))
+        keepalive.set_resource_monitor(monitor)
+        for name in "abcd":
+            keepalive.park(name, FakeCopilotAgent(), PR_REVIEW)
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if not keepalive.stats()["hot"]:
+                break
+        assert keepalive.stats()["hot"] == {}
+        assert keepalive.stats()["evicted"] == 4
+        await keepalive.stop()
+
+    async def test_stop_stops_hot_clients(self):
+        keepalive = await _keepalive()
+        client = FakeCopilotAgent()
+        keepalive.park("a", client, PR_REVIEW)
+        await keepalive.stop()
+        assert client.stopped is True
+
+
+class TestWakeLatencyStats:
+    def test_hot_and_cold_summaries(self):
+        keepalive = SessionKeepAlive(SessionKeepAliveConfig())
+        for seconds in (0.01, 0.02, 0.03):
+            keepalive.record_wake(True, seconds)
+        keepalive.record_wake(False, 2.0)
+        latency = keepalive.stats()["wake_latency_ms"]
+        assert latency["hot"] == {"count": 3, "p50": 20.0, "p90": 30.0, "max": 30.0}
+        assert latency["cold"]["count"] == 1 and latency["cold"]["p50"] == 2000.0
+
+
+# ── AgentManager integration ─────────────────────────────────────────────────
+
+
+def _manager(tmp_path: Path, **keepalive):
+    from squadron.agent_manager import AgentManager
+
+    config = SquadronConfig(
+        project=ProjectConfig(name="squadron", owner="o", repo="r"),
+        agent_roles={"feat-dev": AgentRoleConfig(agent_definition="feat-dev.md")},
+        runtime=RuntimeConfig(session_keepalive=SessionKeepAliveConfig(enabled=True, **keepalive)),
+    )
+    manager = AgentManager(
+        config=config,
+        registry=AsyncMock(),
+        github=AsyncMock(),
+        router=MagicMock(),
+        agent_definitions={
+            "feat-dev": AgentDefinition(role="feat-dev", raw_content="Dev", prompt="Dev")
+        },
+        repo_root=tmp_path,
+    )
+    manager._run_agent = AsyncMock()
+    manager._start_watchdog = MagicMock()
+    return manager
+
+
+def _wake_event() -> SquadronEvent:
+    return SquadronEvent(event_type=SquadronEventType.PR_REVIEW_SUBMITTED, pr_number=5)
+
+
+class TestAgentManagerKeepAlive:
+    async def test_sleep_parks_and_wake_reuses_client(self, tmp_path):
+        manager = _manager(tmp_path)
+        await manager._keepalive.start()
+        record = _record(pr_number=5, worktree_path=str(tmp_path))
+        client = FakeCopilotAgent()
+        manager._copilot_agents[record.agent_id] = client
+
+        await manager._sleep_copilot(record.agent_id, blocker_type(record))
+        assert client.stopped is False
+        assert record.agent_id not in manager._copilot_agents
+
+        manager.registry.get_agent.return_value = record
+        manager._start_copilot = AsyncMock()
+        await manager.wake_agent(record.agent_id, _wake_event())
+        await asyncio.gather(*manager._agent_tasks.values())
+
+        assert manager._copilot_agents[record.agent_id] is client
+        manager._start_copilot.assert_not_awaited()
+        assert manager._wake_started[record.agent_id][1] is True
+        await manager._keepalive.stop()
+
+    async def test_failed_cold_start_leaves_no_wake_marker(self, tmp_path):
+        manager = _manager(tmp_path)
+        record = _record(worktree_path=str(tmp_path))
+        manager.registry.get_agent.return_value = record
+        manager._start_copilot = AsyncMock(side_effect=RuntimeError("cli failed to start"))
+        with pytest.raises(RuntimeError):
+            await manager.wake_agent(record.agent_id, _wake_event())
+        assert record.agent_id not in manager._wake_started
+
+    async def test_failed_resume_clears_wake_marker(self, tmp_path):
+        from squadron.agent_manager import AgentManager
+
+        manager = _manager(tmp_path)
+        manager._run_agent = AgentManager._run_agent.__get__(manager)
+        record = _record(worktree_path=str(tmp_path))
+        manager.registry.get_agent.return_value = record
+        client = FakeCopilotAgent()
+        client.resume_session = AsyncMock(side_effect=RuntimeError("session gone"))
+        manager._start_copilot = AsyncMock(return_value=client)
+        await manager.wake_agent(record.agent_id, _wake_event())
+        await asyncio.gather(*manager._agent_tasks.values(), return_exceptions=True)
+        client.resume_session.assert_awaited()
+        assert record.agent_id not in manager._wake_started
+
+    async def test_long_sleep_stops_client(self, tmp_path):
+        manager = _manager(tmp_path)
+        await manager._keepalive.start()
+        client = FakeCopilotAgent()
+        manager._copilot_agents["a"] = client
+        await manager._sleep_copilot("a", ISSUE)
+        assert client.stopped is True
+        await manager._keepalive.stop()
+
+    async def test_cleanup_discards_hot_client(self, tmp_path):
+        manager = _manager(tmp_path)
+        await manager._keepalive.start()
+        client = FakeCopilotAgent()
+        manager._keepalive.park("a", client, PR_REVIEW)
+        await manager._cleanup_agent("a", destroy_session=False)
+        await _settle()
+        assert client.stopped is True
+        assert not manager._keepalive.is_hot("a")
+        await manager._keepalive.stop()
+
+
+# ── Wake latency benchmark ───────────────────────────────────────────────────
+
+BENCH_WAKES = 20
+# Simulated CLI spawn + ping; real cold starts take seconds
+CLI_START_SECONDS = 0.02
+
+
+@pytest.mark.benchmark
+async def test_wake_latency_with_and_without_keepalive(tmp_path, bench_history):
+    """Wake latency (wake_agent → client ready) for hot vs. cold wakes.
+
+    Set ``SQUADRON_BENCH_HISTORY=path.jsonl`` to append the result.
+    """
+    manager = _manager(tmp_path)
+    await manager._keepalive.start()
+
+    async def cold_start(role, working_directory, *, sandboxed=False):
+        await asyncio.sleep(CLI_START_SECONDS)
+        return FakeCopilotAgent()
+
+    manager._start_copilot = cold_start
+
+    for i in range(BENCH_WAKES):
+        hot = i % 2 == 0
+        record = _record(agent_id=f"agent-{i}", pr_number=i + 1 if hot else None, blocked_by=[99])
+        manager._copilot_agents[record.agent_id] = FakeCopilotAgent()
+        await manager._sleep_copilot(record.agent_id, blocker_type(record))
+
+        manager.registry.get_agent.return_value = record
+        started = time.perf_counter()
+        await manager.wake_agent(record.agent_id, _wake_event())
+        manager._keepalive.record_wake(
+            manager._wake_started.pop(record.agent_id)[1], time.perf_counter() - started
+        )
+        record.status = AgentStatus.SLEEPING
+        manager._admission.release(record.agent_id)
+    await asyncio.gather(*manager._agent_tasks.values())
+
+    latency = manager.session_keepalive_stats()["wake_latency_ms"]
+    await manager._keepalive.stop()
+    assert latency["hot"]["count"] == latency["cold"]["count"] == BENCH_WAKES // 2
+    bench_history(
+        "wake_latency",
+        wakes=BENCH_WAKES,
+        **{f"{mode}_ms": summary for mode, summary in latency.items()},
+    )
+    assert latency["hot"]["p50"] < latency["cold"]["p50"]
@@ -0,0 +1,221 @@
+"""Tests for the shared agent supervisor (heartbeats + duration watchdogs).
+
+Covers:
+- Heartbeats updating liveness from the live record and flushing it to the registry
+- The one-shot NO-ACTIVITY alert
+- Watchdog firing on the event loop, disarm and re-arm
+- Beats continuing while the event loop is blocked
+- Liveness surfaced by /dashboard/agents
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import MagicMock
+
+import pytest_asyncio
+
+from squadron.models import AgentRecord, AgentStatus
+from squadron.registry import AgentRegistry
+from squadron.supervisor import AgentSupervisor, Liveness
+
+
+@pytest_asyncio.fixture
+async def registry(tmp_path):
+    reg = AgentRegistry(str(tmp_path / "registry.db"))
+    await reg.initialize()
+    yield reg
+    await reg.close()
+
+
+def _record(agent_id: str = "feat-dev-issue-1", **kwargs) -> AgentRecord:
+    return AgentRecord(
+        agent_id=agent_id, role="feat-dev", issue_number=1, status=AgentStatus.ACTIVE, **kwargs
+    )
+
+
+async def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        await asyncio.sleep(0.01)
+
+
+class TestHeartbeat:
+    async def test_beat_reads_live_record_and_flushes(self, registry):
+        fired = []
+        supervisor = AgentSupervisor(
+            registry, on_watchdog=lambda *a: fired.append(a), heartbeat_interval=0.05
+        )
+        await supervisor.start()
+        try:
+            record = _record()
+            supervisor.track(record)
+            record.tool_call_count = 3
+            record.turn_count = 1
+            await _wait_for(lambda: supervisor.liveness()[record.agent_id].last_beat)
+            await _wait_for(lambda: not supervisor._flush_pending)
+        finally:
+            await supervisor.stop()
+
+        row = await registry.get_liveness(record.agent_id)
+        assert row["tool_call_count"] == 3
+        assert row["turn_count"] == 1
+        assert row["no_activity_alert"] is False
+
+    async def test_no_activity_alert_fires_once(self):
+        alerts = []
+
+        async def on_no_activity(record, elapsed):
+            alerts.append(record.agent_id)
+
+        supervisor = AgentSupervisor(
+            MagicMock(upsert_liveness=MagicMock(side_effect=lambda rows: asyncio.sleep(0))),
+            on_watchdog=lambda *a: None,
+            on_no_activity=on_no_activity,
+            heartbeat_interval=0.02,
+            no_activity_after=0.05,
+        )
+        await supervisor.start()
+        try:
+            supervisor.track(_record("idle"))
+            await _wait_for(lambda: alerts)
+            await asyncio.sleep(0.1)
+        finally:
+            await supervisor.stop()
+        assert alerts == ["idle"]
+        assert supervisor.stats()["no_activity"] == ["idle"]
+
+    async def test_untrack_stops_beats(self):
+        supervisor = AgentSupervisor(MagicMock(), on_watchdog=lambda *a: None)
+        supervisor.track(_record())
+        supervisor.untrack("feat-dev-issue-1")
+        assert supervisor.liveness() == {}
+        assert supervisor.stats()["tracked"] == 0
+
+    async def test_beats_continue_while_loop_is_blocked(self):
+        supervisor = AgentSupervisor(
+            MagicMock(), on_watchdog=lambda *a: None, heartbeat_interval=0.05
+        )
+        await supervisor.start()
+        try:
+            record = _record()
+            supervisor.track(record)
+            record.tool_call_count = 7
+            time.sleep(0.3)  # e.g. a blocking SDK call
+            live = supervisor.liveness()[record.agent_id]
+            assert live.tool_call_count == 7
+            assert live.last_beat is not None
+        finally:
+            await supervisor.stop()
+
+
+class TestWatchdog:
+    async def test_fires_on_loop(self):
+        fired = []
+        supervisor = AgentSupervisor(MagicMock(), on_watchdog=lambda *a: fired.append(a))
+        await supervisor.start()
+        try:
+            supervisor.arm_watchdog("a", 0)
+            await _wait_for(lambda: fired)
+        finally:
+            await supervisor.stop()
+        assert fired == [("a", 0)]
+        assert not supervisor.has_watchdog("a")
+        assert supervisor.stats()["watchdogs_fired"] == 1
+
+    async def test_disarm_prevents_firing(self):
+        fired = []
+        supervisor = AgentSupervisor(MagicMock(), on_watchdog=lambda *a: fired.append(a))
+        await supervisor.start()
+        try:
+            supervisor.arm_watchdog("a", 1)
+            supervisor.disarm_watchdog("a")
+            # Wait past the original deadline
+            await asyncio.sleep(1.1)
+        finally:
+            await supervisor.stop()
+        assert fired == []
+
+    async def test_rearm_supersedes_old_deadline(self):
+        fired = []
+        supervisor = AgentSupervisor(MagicMock(), on_watchdog=lambda *a: fired.append(a))
+        await supervisor.start()
+        try:
+            supervisor.arm_watchdog("a", 0)
+            supervisor.arm_watchdog("a", 3600)
+            await asyncio.sleep(0.1)
+            assert fired == []
+            assert supervisor.has_watchdog("a")
+        finally:
+            await supervisor.stop()
+
+    def test_superseded_entries_are_compacted(self):
+        supervisor = AgentSupervisor(MagicMock(), on_watchdog=lambda *a: None)
+        for _ in range(200):
+            supervisor.arm_watchdog("a", 3600)
+        assert len(supervisor._heap) <= 64
+
+
+class TestRegistryLiveness:
+    async def test_upsert_replaces_row(self, registry):
+        await registry.upsert_liveness([Liveness("a", 0.0, "t1", 60, 0, 0)])
+        await registry.upsert_liveness([Liveness("a", 0.0, "t2", 120, 0, 0, True)])
+        row = await registry.get_liveness("a")
+        assert row["last_beat"] == "t2"
+        assert row["elapsed_seconds"] == 120
+        assert row["no_activity_alert"] is True
+        assert await registry.get_liveness("missing") is None
+
+    async def test_all_liveness_by_agent(self, registry):
+        await registry.upsert_liveness(
+            [Liveness("a", 0.0, "t1", 60, 2, 1), Liveness("b", 0.0, "t1", 180, 0, 0, True)]
+        )
+        rows = await registry.get_all_liveness()
+        assert set(rows) == {"a", "b"}
+        assert rows["b"]["no_activity_alert"] is True
+
+    async def test_terminal_update_drops_row(self, registry):
+        record = _record("a")
+        await registry.create_agent(record)
+        await registry.upsert_liveness([Liveness("a", 0.0, "t1", 60, 2, 1)])
+        record.status = AgentStatus.SLEEPING
+        await registry.update_agent(record)
+        assert await registry.get_liveness("a") is not None
+        record.status = AgentStatus.COMPLETED
+        await registry.update_agent(record)
+        assert await registry.get_liveness("a") is None
+
+    async def test_prune_drops_rows_of_finished_agents(self, registry):
+        await registry.create_agent(_record("alive"))
+        done = _record("done")
+        done.status = AgentStatus.FAILED
+        await registry.create_agent(done)
+        # A late flush can land after the terminal update
+        await registry.upsert_liveness(
+            [Liveness(a, 0.0, "t1", 60, 0, 0) for a in ("alive", "done", "deleted")]
+        )
+        assert await registry.prune_liveness() == 2
+        assert set(await registry.get_all_liveness()) == {"alive"}
+
+
+async def test_dashboard_agents_include_liveness(registry):
+    import squadron.dashboard as dashboard_mod
+
+    await registry.create_agent(_record("alive"))
+    await registry.create_agent(_record("silent"))
+    beat = "2026-01-01T00:00:00+00:00"
+    await registry.upsert_liveness([Liveness("alive", 0.0, beat, 60, 4, 2)])
+    dashboard_mod.configure(MagicMock(), registry)
+
+    data = await dashboard_mod.list_agents(_=True)
+    liveness = {a["agent_id"]: a["liveness"] for a in data["active_agents"]}
+    assert liveness["alive"] == {
+        "last_beat": beat,
+        "elapsed_seconds": 60,
+        "turn_count": 2,
+        "no_activity_alert": False,
+    }
+    assert liveness["silent"] is None
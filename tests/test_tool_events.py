@@ -0,0 +1,242 @@
+"""Tests for non-blocking tool-use hooks and the ToolEventRecorder.
+
+Covers:
+- Hooks return without waiting on the activity log or the registry
+- Background enrichment (truncation, timestamps captured at hook time)
+- Coalesced counter persistence and flush ordering
+- Circuit breaker Layer 1 still denies synchronously
+- Bounded queue drops activity events, never counter persistence
+- Micro-benchmark of hook overhead per tool call (marker: benchmark)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from squadron.activity import ActivityEventType
+from squadron.config import CircuitBreakerDefaults
+from squadron.models import AgentRecord, AgentStatus
+from squadron.tool_events import ToolEventRecorder
+
+
+class SlowActivityLogger:
+    """Activity logger whose writes take ``delay`` seconds (a busy SQLite)."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.events = []
+
+    async def log(self, event):
+        await asyncio.sleep(self.delay)
+        self.events.append(event)
+        return event
+
+
+def _record(**kwargs) -> AgentRecord:
+    return AgentRecord(
+        agent_id="feat-dev-issue-1",
+        role="feat-dev",
+        issue_number=1,
+        status=AgentStatus.ACTIVE,
+        **kwargs,
+    )
+
+
+def _hooks(recorder: ToolEventRecorder, record: AgentRecord, **limits):
+    from squadron.agent_manager import AgentManager
+
+    manager = AgentManager.__new__(AgentManager)
+    manager.registry = recorder.registry
+    manager.activity_logger = recorder.activity_logger
+    manager._tool_events = recorder
+    hooks = manager._build_hooks(record, CircuitBreakerDefaults(**limits))
+    return hooks["on_pre_tool_use"], hooks["on_post_tool_use"]
+
+
+async def _recorder(delay: float = 0.0, **kwargs) -> ToolEventRecorder:
+    recorder = ToolEventRecorder(AsyncMock(), SlowActivityLogger(delay), **kwargs)
+    await recorder.start()
+    return recorder
+
+
+class TestHooksDoNotBlock:
+    async def test_hooks_return_before_activity_is_written(self):
+        recorder = await _recorder(delay=0.2)
+        record = _record()
+        pre, post = _hooks(recorder, record)
+
+        started = time.monotonic()
+        decision = await pre({"toolName": "bash", "toolArgs": {}, "toolUseId": "t1"}, {})
+        await post({"toolName": "bash", "result": "ok", "toolUseId": "t1"}, {})
+        assert time.monotonic() - started < 0.05
+        assert decision == {"permissionDecision": "allow"}
+        assert recorder.activity_logger.events == []
+
+        await recorder.flush()
+        types = [e.event_type for e in recorder.activity_logger.events]
+        assert types == [ActivityEventType.TOOL_CALL_START, ActivityEventType.TOOL_CALL_END]
+        await recorder.stop()
+
+    async def test_enrichment_happens_off_path(self):
+        recorder = await _recorder(delay=0.05)
+        record = _record(pr_number=7)
+        pre, post = _hooks(recorder, record)
+
+        before = datetime.now(timezone.utc)
+        await pre({"toolName": "edit", "toolArgs": {"text": "x" * 2000}, "toolUseId": "t"}, {})
+        await post({"toolName": "edit", "result": "y" * 5000, "error": None, "toolUseId": "t"}, {})
+        await recorder.flush()
+
+        start, end = recorder.activity_logger.events
+        assert start.tool_args["text"].endswith("...") and len(start.tool_args["text"]) == 503
+        assert start.metadata == {"tool_call_count": 1}
+        assert end.tool_result.endswith("(truncated)")
+        assert end.tool_success is True and end.pr_number == 7
+        # Timestamp is when the tool ran, not when the writer got to it
+        assert 0 <= (start.timestamp - before).total_seconds() < 0.04
+        await recorder.stop()
+
+    async def test_counter_persistence_is_coalesced(self):
+        recorder = await _recorder(delay=0.01)
+        record = _record()
+        pre, _ = _hooks(recorder, record)
+
+        for i in range(30):
+            await pre({"toolName": "bash", "toolUseId": f"t{i}"}, {})
+        recorder.registry.update_agent.assert_not_awaited()
+
+        await recorder.flush()
+        # Three persistence points (10, 20, 30) collapse into at most three writes
+        assert 1 <= recorder.registry.update_agent.await_count <= 3
+        recorder.registry.update_agent.assert_awaited_with(record)
+        assert recorder.stats()["pending_persist"] == 0
+        await recorder.stop()
+
+
+class TestCircuitBreaker:
+    async def test_limit_exceeded_denies_and_escalates(self):
+        recorder = await _recorder()
+        record = _record()
+        pre, _ = _hooks(recorder, record, max_tool_calls=2)
+
+        for _ in range(2):
+            assert (await pre({"toolName": "bash"}, {}))["permissionDecision"] == "allow"
+        decision = await pre({"toolName": "bash"}, {})
+        assert decision["permissionDecision"] == "deny"
+        assert record.status == AgentStatus.ESCALATED
+        recorder.registry.update_agent.assert_awaited_with(record)
+
+        await recorder.flush()
+        types = [e.event_type for e in recorder.activity_logger.events]
+        assert ActivityEventType.CIRCUIT_BREAKER_TRIGGERED in types
+        await recorder.stop()
+
+    async def test_warning_threshold_event(self):
+        recorder = await _recorder()
+        record = _record()
+        pre, _ = _hooks(recorder, record, max_tool_calls=10, warning_threshold=0.5)
+
+        for _ in range(5):
+            await pre({"toolName": "bash"}, {})
+        await recorder.flush()
+        warnings = [
+            e
+            for e in recorder.activity_logger.events
+            if e.event_type == ActivityEventType.CIRCUIT_BREAKER_WARNING
+        ]
+        assert len(warnings) == 1
+        assert warnings[0].content == "Approaching tool call limit (5/10)"
+        await recorder.stop()
+
+
+class TestRecorder:
+    async def test_full_queue_drops_events_but_keeps_counters(self):
+        recorder = ToolEventRecorder(AsyncMock(), SlowActivityLogger(), maxsize=2)
+        record = _record()
+        for _ in range(5):
+            recorder.tool_started(record, "bash", {})
+        recorder.persist(record)
+        assert recorder.stats()["dropped"] == 3
+
+        await recorder.start()
+        await recorder.flush()
+        recorder.registry.update_agent.assert_awaited_once_with(record)
+        assert recorder.stats()["recorded"] == 2
+        await recorder.stop()
+
+    async def test_write_failures_are_counted(self):
+        activity_logger = MagicMock()
+        activity_logger.log = AsyncMock(side_effect=RuntimeError("DB locked"))
+        recorder = ToolEventRecorder(AsyncMock(), activity_logger)
+        await recorder.start()
+        recorder.tool_started(_record(), "bash", {})
+        await recorder.flush()
+        assert recorder.stats()["failed"] == 1
+        await recorder.stop()
+
+    async def test_no_activity_logger_still_persists(self):
+        recorder = ToolEventRecorder(AsyncMock(), activity_logger=None)
+        await recorder.start()
+        record = _record()
+        recorder.tool_started(record, "bash", {})
+        recorder.persist(record)
+        await recorder.stop()  # drains before stopping
+        recorder.registry.update_agent.assert_awaited_once_with(record)
+
+    async def test_flush_returns_when_the_batch_fails(self):
+        recorder = await _recorder()
+        recorder._persist_dirty = AsyncMock(side_effect=RuntimeError("boom"))
+        recorder.persist(_record())
+        await asyncio.wait_for(recorder.flush(), timeout=1)
+        recorder._persist_dirty = AsyncMock()
+        await asyncio.wait_for(recorder.flush(), timeout=1)  # writer still alive
+        await recorder.stop()
+
+    async def test_flush_without_writer_returns(self):
+        recorder = ToolEventRecorder(AsyncMock())
+        await asyncio.wait_for(recorder.flush(), timeout=1)
+
+
+# ── Micro-benchmark ──────────────────────────────────────────────────────────
+
+BENCH_CALLS = 2000
+# Generous CI budget; the hooks should cost a few microseconds per call
+BENCH_BUDGET_US = 250.0
+
+
+@pytest.mark.benchmark
+async def test_hook_overhead_per_tool_call(bench_history):
+    """Mean pre+post hook time per tool call, with the writer running behind it.
+
+    Set ``SQUADRON_BENCH_HISTORY=path.jsonl`` to append the result so the
+    overhead can be tracked across commits.
+    """
+    recorder = await _recorder(maxsize=BENCH_CALLS * 3)
+    record = _record()
+    pre, post = _hooks(recorder, record, max_tool_calls=BENCH_CALLS * 2)
+    args = {"command": "pytest -q", "description": "run tests"}
+
+    timings = []
+    for i in range(BENCH_CALLS):
+        tool_id = f"t{i}"
+        started = time.perf_counter()
+        await pre({"toolName": "bash", "toolArgs": args, "toolUseId": tool_id}, {})
+        await post({"toolName": "bash", "result": "ok", "toolUseId": tool_id}, {})
+        timings.append(time.perf_counter() - started)
+    await recorder.stop()
+
+    timings.sort()
+    mean_us = sum(timings) / len(timings) * 1e6
+    p99_us = timings[int(len(timings) * 0.99)] * 1e6
+    bench_history(
+        "tool_hook_overhead",
+        calls=BENCH_CALLS,
+        mean_us=round(mean_us, 2),
+        p99_us=round(p99_us, 2),
+    )
+    assert mean_us < BENCH_BUDGET_US
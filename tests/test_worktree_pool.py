@@ -0,0 +1,251 @@
+"""Tests for the pool of pre-materialized, recycled git worktrees.
+
+Uses real git repositories (a bare "origin" plus a clone) so checkout,
+clean, move and reset behave exactly as they do in production.
+
+Covers:
+- Background pre-warming up to the demand-driven target size
+- acquire(): fresh branch from the default branch, tracking a remote
+  branch, reusing a local branch, and pool misses
+- release(): recycled worktrees come back clean and detached
+- Shrinking when demand drops, adopting leftovers after a restart
+- AgentManager._create_worktree integration
+"""
+
+from __future__ import annotations
+
+import asyncio
+import subprocess
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from squadron.config import WorktreePoolConfig
+from squadron.git_fetcher import GitFetcher
+from squadron.worktree_pool import WorktreePool
+
+
+def _git(cwd: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True, text=True
+    ).stdout.strip()
+
+
+async def _run_git(cwd: Path, *args: str, timeout: int = 60) -> tuple[int, str, str]:
+    proc = await asyncio.create_subprocess_exec(
+        "git",
+        *args,
+        cwd=str(cwd),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+    return proc.returncode or 0, stdout.decode(), stderr.decode()
+
+
+@pytest.fixture
+def repo(tmp_path) -> Path:
+    """A clone of a bare origin with ``main`` and a ``feature/existing`` branch."""
+    origin = tmp_path / "origin.git"
+    seed = tmp_path / "seed"
+    _git(tmp_path, "init", "--bare", "-b", "main", str(origin))
+    _git(tmp_path, "init", "-b", "main", str(seed))
+    for args in (("config", "user.email", "t@example.com"), ("config", "user.name", "t")):
+        _git(seed, *args)
+    (seed / "README.md").write_text("hello\n")
+    (seed / ".gitignore").write_text("build/\n")
+    _git(seed, "add", ".")
+    _git(seed, "commit", "-m", "init")
+    _git(seed, "checkout", "-b", "feature/existing")
+    (seed / "feature.txt").write_text("feature\n")
+    _git(seed, "add", ".")
+    _git(seed, "commit", "-m", "feature")
+    _git(seed, "remote", "add", "origin", str(origin))
+    _git(seed, "push", "origin", "main", "feature/existing")
+
+    clone = tmp_path / "repo"
+    _git(tmp_path, "clone", str(origin), str(clone))
+    return clone
+
+
+def _pool(repo: Path, **kwargs) -> WorktreePool:
+    config = WorktreePoolConfig(enabled=True, **{"min_size": 1, "max_size": 4, **kwargs})
+    return WorktreePool(
+        config=config,
+        repo_root=repo,
+        pool_dir=repo.parent / "worktree-pool",
+        default_branch="main",
+        run_git=_run_git,
+    )
+
+
+async def _warm(pool: WorktreePool) -> None:
+    await pool.start()
+    await pool._fill_task
+
+
+async def _stop(pool: WorktreePool) -> None:
+    # Let background git commands finish so no subprocess outlives the test loop
+    if pool._fill_task:
+        await pool._fill_task
+    await pool.stop()
+
+
+class TestAcquire:
+    async def test_start_prewarms_min_size(self, repo):
+        pool = _pool(repo, min_size=2)
+        await _warm(pool)
+        try:
+            assert pool.stats()["idle"] == 2
+            assert len(list(pool.pool_dir.iterdir())) == 2
+        finally:
+            await _stop(pool)
+
+    async def test_fresh_branch_from_default(self, repo):
+        pool = _pool(repo)
+        await _warm(pool)
+        try:
+            target = repo.parent / "worktrees" / "issue-1"
+            target.parent.mkdir()
+            assert await pool.acquire("feat/issue-1", target)
+            assert _git(target, "rev-parse", "--abbrev-ref", "HEAD") == "feat/issue-1"
+            assert _git(target, "rev-parse", "HEAD") == _git(repo, "rev-parse", "origin/main")
+            assert pool.stats()["hits"] == 1
+        finally:
+            await _stop(pool)
+
+    async def test_tracks_existing_remote_branch(self, repo):
+        pool = _pool(repo)
+        await _warm(pool)
+        try:
+            target = repo.parent / "issue-2"
+            assert await pool.acquire("feature/existing", target, track_remote=True)
+            assert (target / "feature.txt").exists()
+            upstream = _git(target, "rev-parse", "--abbrev-ref", "@{upstream}")
+            assert upstream == "origin/feature/existing"
+        finally:
+            await _stop(pool)
+
+    async def test_reuses_local_branch(self, repo):
+        _git(repo, "branch", "feat/issue-9", "origin/feature/existing")
+        pool = _pool(repo)
+        await _warm(pool)
+        try:
+            target = repo.parent / "issue-9"
+            assert await pool.acquire("feat/issue-9", target)
+            # The local branch keeps its commits rather than being reset
+            assert (target / "feature.txt").exists()
+        finally:
+            await _stop(pool)
+
+    async def test_miss_when_empty(self, repo):
+        pool = _pool(repo)
+        pool._running = True
+        try:
+            assert not await pool.acquire("feat/issue-3", repo.parent / "issue-3")
+            assert pool.stats()["misses"] == 1
+        finally:
+            await _stop(pool)
+
+
+class TestRelease:
+    async def test_recycled_worktree_is_clean_and_detached(self, repo):
+        pool = _pool(repo)
+        await _warm(pool)
+        try:
+            target = repo.parent / "issue-4"
+            assert await pool.acquire("feat/issue-4", target)
+            (target / "README.md").write_text("dirty\n")
+            (target / "scratch.txt").write_text("untracked\n")
+            (target / "build").mkdir()
+            (target / "build" / "out.o").write_text("ignored\n")
+
+            assert await pool.release(target)
+            assert not target.exists()
+            assert pool.stats()["recycled"] == 1
+
+            path = pool._idle[-1]
+            assert _git(path, "status", "--porcelain", "--ignored") == ""
+            assert _git(path, "rev-parse", "--abbrev-ref", "HEAD") == "HEAD"
+            # The agent's branch is free for another worktree again
+            assert await pool.acquire("feat/issue-4", repo.parent / "issue-4b")
+        finally:
+            await _stop(pool)
+
+    async def test_release_declined_when_full(self, repo):
+        pool = _pool(repo, min_size=1, max_size=1)
+        await _warm(pool)
+        try:
+            assert not await pool.release(repo.parent / "anything")
+        finally:
+            await _stop(pool)
+
+
+class TestSizing:
+    async def test_target_follows_recent_checkouts(self, repo):
+        pool = _pool(repo, min_size=1, max_size=3, rate_window=60)
+        assert pool.target_size == 1
+        now = time.monotonic()
+        pool._checkouts.extend([now - 120, now - 1, now])
+        assert pool.target_size == 2
+        pool._checkouts.extend([now] * 10)
+        assert pool.target_size == 3
+
+    async def test_trim_removes_surplus(self, repo):
+        pool = _pool(repo, min_size=1, max_size=3)
+        pool._checkouts.extend([time.monotonic()] * 3)
+        await _warm(pool)
+        try:
+            assert pool.stats()["idle"] == 3
+            pool._checkouts.clear()
+            await pool._trim()
+            assert pool.stats()["idle"] == 1
+            assert len(list(pool.pool_dir.iterdir())) == 1
+        finally:
+            await _stop(pool)
+
+    async def test_restart_adopts_idle_worktrees(self, repo):
+        first = _pool(repo, min_size=2)
+        await _warm(first)
+        await _stop(first)
+        paths = set(first._idle)
+
+        second = _pool(repo, min_size=2)
+        await _warm(second)
+        try:
+            assert set(second._idle) == paths
+            assert second.stats()["created"] == 0
+        finally:
+            await _stop(second)
+
+
+class TestAgentManagerIntegration:
+    async def test_create_and_cleanup_go_through_pool(self, repo, tmp_path):
+        from squadron.agent_manager import AgentManager
+        from squadron.config import RuntimeConfig
+        from squadron.models import AgentRecord
+
+        pool = _pool(repo)
+        await _warm(pool)
+
+        manager = AgentManager.__new__(AgentManager)
+        manager.config = MagicMock()
+        manager.config.runtime = RuntimeConfig(worktree_dir=str(tmp_path / "worktrees"))
+        manager.repo_root = repo
+        manager._worktree_pool = pool
+        manager._git_fetcher = GitFetcher(repo, _run_git)
+        manager._run_git = AsyncMock(side_effect=AssertionError("pool should be used"))
+        try:
+            record = AgentRecord(
+                agent_id="feat-dev-issue-5", role="feat-dev", issue_number=5, branch="feat/issue-5"
+            )
+            path = await manager._create_worktree(record)
+            assert path == tmp_path / "worktrees" / "issue-5"
+            assert _git(path, "rev-parse", "--abbrev-ref", "HEAD") == "feat/issue-5"
+
+            assert await pool.release(path)
+            assert not path.exists()
+        finally:
+            await _stop(pool)